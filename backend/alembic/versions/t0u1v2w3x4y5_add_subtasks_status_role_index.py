@@ -0,0 +1,52 @@
+"""add subtasks status role index
+
+Revision ID: t0u1v2w3x4y5
+Revises: b3e4a166ba91
+Create Date: 2026-10-17 10:00:00.000000+08:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: Union[str, Sequence[str], None] = "b3e4a166ba91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_subtasks_status_role_task_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table("subtasks"):
+        return
+
+    existing_indexes = {idx.get("name") for idx in inspector.get_indexes("subtasks")}
+    if INDEX_NAME in existing_indexes:
+        return
+
+    # Used by the task dispatch queue to find tasks with PENDING subtasks
+    op.create_index(INDEX_NAME, "subtasks", ["status", "role", "task_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table("subtasks"):
+        return
+
+    existing_indexes = {idx.get("name") for idx in inspector.get_indexes("subtasks")}
+    if INDEX_NAME not in existing_indexes:
+        return
+
+    op.drop_index(INDEX_NAME, table_name="subtasks")
@@ -0,0 +1,73 @@
+"""add task_list_items table
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-17 11:00:00.000000+08:00
+
+Denormalized projection of the task sidebar fields. Rows are filled by the
+application (mapper hooks on task writes, backfill at startup).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: Union[str, Sequence[str], None] = "t0u1v2w3x4y5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if inspector.has_table("task_list_items"):
+        return
+
+    op.create_table(
+        "task_list_items",
+        sa.Column("task_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column(
+            "user_id", sa.Integer(), nullable=False, default=0, comment="Task owner"
+        ),
+        sa.Column("title", sa.String(length=512), nullable=False, default=""),
+        sa.Column("status", sa.String(length=50), nullable=False, default="PENDING"),
+        sa.Column("type", sa.String(length=50), nullable=False, default="online"),
+        sa.Column("task_type", sa.String(length=50), nullable=False, default="chat"),
+        sa.Column("source", sa.String(length=100), nullable=False, default=""),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column("git_repo", sa.String(length=512), nullable=True),
+        sa.Column("is_group_chat", sa.Boolean(), nullable=False, default=False),
+        sa.Column("is_visible", sa.Boolean(), nullable=False, default=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("status_created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("task_id"),
+        mysql_charset="utf8mb4",
+        mysql_collate="utf8mb4_unicode_ci",
+    )
+    op.create_index(
+        "ix_task_list_items_user_visible_created",
+        "task_list_items",
+        ["user_id", "is_visible", "created_at", "task_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table("task_list_items"):
+        return
+
+    op.drop_index(
+        "ix_task_list_items_user_visible_created", table_name="task_list_items"
+    )
+    op.drop_table("task_list_items")
@@ -0,0 +1,80 @@
+"""add knowledge base index statistics
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-17 14:00:00.000000+08:00
+
+Adds per-document index statistics (chunk_count, token_count, text_bytes)
+to knowledge_documents and the knowledge_base_stats table aggregating them.
+Documents indexed earlier keep NULL statistics; the aggregate of their
+knowledge base is rebuilt by the application from the vector store.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2w3x4y5z6a7"
+down_revision: Union[str, Sequence[str], None] = "u1v2w3x4y5z6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DOCUMENT_COLUMNS = ("chunk_count", "token_count", "text_bytes")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    existing = {c["name"] for c in inspector.get_columns("knowledge_documents")}
+    if "chunk_count" not in existing:
+        op.add_column(
+            "knowledge_documents",
+            sa.Column("chunk_count", sa.Integer(), nullable=True),
+        )
+    if "token_count" not in existing:
+        op.add_column(
+            "knowledge_documents",
+            sa.Column("token_count", sa.BigInteger(), nullable=True),
+        )
+    if "text_bytes" not in existing:
+        op.add_column(
+            "knowledge_documents",
+            sa.Column("text_bytes", sa.BigInteger(), nullable=True),
+        )
+
+    if inspector.has_table("knowledge_base_stats"):
+        return
+
+    op.create_table(
+        "knowledge_base_stats",
+        sa.Column("kind_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("document_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("chunk_count", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("token_count", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("text_bytes", sa.BigInteger(), nullable=False, default=0),
+        sa.Column("is_complete", sa.Boolean(), nullable=False, default=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("kind_id"),
+        mysql_charset="utf8mb4",
+        mysql_collate="utf8mb4_unicode_ci",
+        comment="Knowledge base index statistics",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if inspector.has_table("knowledge_base_stats"):
+        op.drop_table("knowledge_base_stats")
+
+    existing = {c["name"] for c in inspector.get_columns("knowledge_documents")}
+    for column in _DOCUMENT_COLUMNS:
+        if column in existing:
+            op.drop_column("knowledge_documents", column)
@@ -0,0 +1,77 @@
+"""add team and workspace references to task_list_items
+
+Revision ID: w3x4y5z6a7b8
+Revises: v2w3x4y5z6a7
+Create Date: 2026-10-17 16:00:00.000000+08:00
+
+Stores each task's teamRef and workspaceRef in task_list_items so team_id
+and git_repo can be refreshed when the referenced Team or Workspace changes.
+Existing rows are cleared; the application rebuilds them with the
+references at startup (backfill_task_list_items).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "w3x4y5z6a7b8"
+down_revision: Union[str, Sequence[str], None] = "v2w3x4y5z6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_REFERENCE_COLUMNS = (
+    ("team_name", ""),
+    ("team_namespace", "default"),
+    ("workspace_name", ""),
+    ("workspace_namespace", "default"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table("task_list_items"):
+        return
+
+    existing = {c["name"] for c in inspector.get_columns("task_list_items")}
+    if "team_name" in existing:
+        return
+
+    op.execute("DELETE FROM task_list_items")
+    for name, default in _REFERENCE_COLUMNS:
+        op.add_column(
+            "task_list_items",
+            sa.Column(
+                name,
+                sa.String(length=100),
+                nullable=False,
+                server_default=default,
+            ),
+        )
+    op.create_index(
+        "ix_task_list_items_team_ref",
+        "task_list_items",
+        ["team_name", "team_namespace"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if not inspector.has_table("task_list_items"):
+        return
+
+    existing = {c["name"] for c in inspector.get_columns("task_list_items")}
+    if "team_name" not in existing:
+        return
+
+    op.drop_index("ix_task_list_items_team_ref", table_name="task_list_items")
+    for name, _ in _REFERENCE_COLUMNS:
+        op.drop_column("task_list_items", name)
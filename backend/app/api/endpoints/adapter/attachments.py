@@ -8,12 +8,15 @@ Attachment API endpoints for file upload and management.
 Uses the unified context service for managing attachments as subtask contexts.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import os
+import re
+from typing import Optional, Tuple
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_db
@@ -32,6 +35,90 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(
+    range_header: Optional[str], file_size: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header.
+
+    Returns:
+        (start, end) with end exclusive, or None to serve the whole file
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        # Malformed or multi-range requests get the whole file
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last) + 1, file_size) if last else file_size
+    else:
+        # Suffix range: the last N bytes
+        start = max(file_size - int(last), 0)
+        end = file_size
+
+    if start >= end:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, end
+
+
+def _stream_attachment(
+    db: Session, context, range_header: Optional[str]
+) -> StreamingResponse:
+    """Stream an attachment's original file, honoring a Range header."""
+    file_size = context.file_size
+    byte_range = _parse_range(range_header, file_size) if file_size else None
+    start, end = byte_range or (0, None)
+
+    # Get the data stream from the appropriate storage backend
+    stream = context_service.open_attachment_stream(
+        db=db, context=context, start=start, end=end
+    )
+    if stream is None:
+        logger.error(
+            f"Failed to retrieve binary data for attachment {context.id}, "
+            f"storage_backend={context.storage_backend}, "
+            f"storage_key={context.storage_key}"
+        )
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve attachment data"
+        )
+
+    # Encode filename for Content-Disposition header to support non-ASCII characters
+    # Use RFC 5987 encoding: filename*=UTF-8''encoded_filename
+    encoded_filename = quote(context.original_filename)
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
+        "Accept-Ranges": "bytes",
+    }
+    status_code = 200
+    if byte_range:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{file_size}"
+        headers["Content-Length"] = str(end - start)
+    elif file_size:
+        headers["Content-Length"] = str(file_size)
+
+    return StreamingResponse(
+        stream,
+        status_code=status_code,
+        media_type=context.mime_type,
+        headers=headers,
+    )
+
 
 @router.post("/upload", response_model=AttachmentResponse)
 async def upload_attachment(
@@ -65,9 +152,12 @@ async def upload_attachment(
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
-    # Read file content
+    # The upload is already spooled to a temporary file by the framework;
+    # pass the file object on so the content is streamed to storage
+    # instead of being read into memory here
     try:
-        binary_data = await file.read()
+        file_size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
     except Exception as e:
         logger.error(f"Error reading uploaded file: {e}")
         raise HTTPException(
@@ -75,7 +165,7 @@ async def upload_attachment(
         ) from e
 
     # Validate file size before processing
-    if not DocumentParser.validate_file_size(len(binary_data)):
+    if not DocumentParser.validate_file_size(file_size):
         max_size_mb = DocumentParser.get_max_file_size() / (1024 * 1024)
         raise HTTPException(
             status_code=400,
@@ -83,11 +173,13 @@ async def upload_attachment(
         )
 
     try:
-        context, truncation_info = context_service.upload_attachment(
+        # Storage and parsing block; keep them off the event loop
+        context, truncation_info = await asyncio.to_thread(
+            context_service.upload_attachment,
             db=db,
             user_id=current_user.id,
             filename=file.filename,
-            binary_data=binary_data,
+            binary_data=file.file,
         )
 
         # Build truncation info for response
@@ -209,14 +301,17 @@ async def get_attachment(
 @router.get("/{attachment_id}/download")
 async def download_attachment(
     attachment_id: int,
+    range_header: Optional[str] = Header(default=None, alias="Range"),
     db: Session = Depends(get_db),
     current_user: User = Depends(security.get_current_user),
 ):
     """
     Download the original file.
 
+    Supports single-range requests (Range: bytes=start-end).
+
     Returns:
-        File binary data with appropriate content type
+        File binary data with appropriate content type, streamed from storage
     """
     # Get context without user_id filter first
     context = context_service.get_context_optional(
@@ -272,38 +367,13 @@ async def download_attachment(
     if not has_access:
         raise HTTPException(status_code=404, detail="Attachment not found")
 
-    # Get binary data from the appropriate storage backend
-    binary_data = context_service.get_attachment_binary_data(
-        db=db,
-        context=context,
-    )
-
-    if binary_data is None:
-        logger.error(
-            f"Failed to retrieve binary data for attachment {attachment_id}, "
-            f"storage_backend={context.storage_backend}, "
-            f"storage_key={context.storage_key}"
-        )
-        raise HTTPException(
-            status_code=500, detail="Failed to retrieve attachment data"
-        )
-
-    # Encode filename for Content-Disposition header to support non-ASCII characters
-    # Use RFC 5987 encoding: filename*=UTF-8''encoded_filename
-    encoded_filename = quote(context.original_filename)
-
-    return Response(
-        content=binary_data,
-        media_type=context.mime_type,
-        headers={
-            "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
-        },
-    )
+    return _stream_attachment(db, context, range_header)
 
 
 @router.get("/{attachment_id}/executor-download")
 async def executor_download_attachment(
     attachment_id: int,
+    range_header: Optional[str] = Header(default=None, alias="Range"),
     db: Session = Depends(get_db),
     current_user: User = Depends(security.get_current_user),
 ):
@@ -315,7 +385,7 @@ async def executor_download_attachment(
     that the attachment belongs to the current user.
 
     Returns:
-        File binary data with appropriate content type
+        File binary data with appropriate content type, streamed from storage
     """
     # Get context and verify ownership
     context = context_service.get_context_optional(
@@ -331,32 +401,7 @@ async def executor_download_attachment(
     if context.context_type != ContextType.ATTACHMENT.value:
         raise HTTPException(status_code=404, detail="Attachment not found")
 
-    # Get binary data from the appropriate storage backend
-    binary_data = context_service.get_attachment_binary_data(
-        db=db,
-        context=context,
-    )
-
-    if binary_data is None:
-        logger.error(
-            f"Failed to retrieve binary data for attachment {attachment_id}, "
-            f"storage_backend={context.storage_backend}, "
-            f"storage_key={context.storage_key}"
-        )
-        raise HTTPException(
-            status_code=500, detail="Failed to retrieve attachment data"
-        )
-
-    # Encode filename for Content-Disposition header
-    encoded_filename = quote(context.original_filename)
-
-    return Response(
-        content=binary_data,
-        media_type=context.mime_type,
-        headers={
-            "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
-        },
-    )
+    return _stream_attachment(db, context, range_header)
 
 
 @router.delete("/{attachment_id}")
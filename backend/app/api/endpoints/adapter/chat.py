@@ -244,11 +244,11 @@ async def correct_response(
     # Get the correction model config using chat's unified model resolver
     # This handles: env var placeholders, decryption, default_headers, etc.
     from app.services.chat.config.model_resolver import (
-        _find_model,
         extract_and_process_model_config,
+        find_model,
     )
 
-    model_spec = _find_model(db, request.correction_model_id, current_user.id)
+    model_spec = find_model(db, request.correction_model_id, current_user.id)
     if not model_spec:
         raise HTTPException(
             status_code=400,
@@ -26,6 +26,11 @@ async def dispatch_tasks(
         default=None, description="Optional task IDs to filter by, comma separated"
     ),
     type: str = Query(default="online", description="online or offline"),
+    wait: float = Query(
+        default=0,
+        ge=0,
+        description="Long-poll timeout in seconds when no task is available",
+    ),
     db: Session = Depends(get_db),
 ):
     """Task dispatch interface with subtask support using kinds table
@@ -35,6 +40,8 @@ async def dispatch_tasks(
         limit: Maximum number of subtasks to return
         task_ids: Optional task IDs to filter by, comma separated. If not provided, will search across all tasks
         type: Task type to filter by (default: "online")
+        wait: Long-poll timeout in seconds; the request returns as soon as a task
+            is queued (default: 0, return immediately)
 
     Returns:
         List of subtasks with aggregated context from previous subtasks
@@ -48,7 +55,12 @@ async def dispatch_tasks(
             task_id_list = None
 
     return await executor_kinds_service.dispatch_tasks(
-        db=db, status=task_status, limit=limit, task_ids=task_id_list, type=type
+        db=db,
+        status=task_status,
+        limit=limit,
+        task_ids=task_id_list,
+        type=type,
+        wait=wait,
     )
 
 
@@ -116,13 +116,21 @@ def get_tasks(
 def get_tasks_lite(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    before_id: Optional[int] = Query(
+        None,
+        description="Return tasks after this task ID (keyset pagination, overrides page)",
+    ),
     current_user: User = Depends(security.get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get current user's lightweight task list (paginated) for fast loading, excluding DELETE status tasks"""
     skip = (page - 1) * limit
     items, total = task_kinds_service.get_user_tasks_lite(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
+        db=db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        before_task_id=before_id,
     )
     return {"total": total, "items": items}
 
@@ -51,6 +51,56 @@ class InternalRetrieveResponse(BaseModel):
     total: int
 
 
+class FederatedRetrieveRequest(BaseModel):
+    """Retrieve request spanning several knowledge bases."""
+
+    query: str = Field(..., description="Search query")
+    knowledge_base_ids: list[int] = Field(..., description="Knowledge base IDs")
+    max_results: int = Field(
+        default=20, description="Maximum results to return in total"
+    )
+    document_ids: Optional[list[int]] = Field(
+        default=None,
+        description="Optional list of document IDs to filter. Only chunks from these documents will be returned.",
+    )
+
+
+class FederatedRetrieveRecord(RetrieveRecord):
+    """Retrieval record with the knowledge base it came from."""
+
+    knowledge_base_id: int
+    fusion_score: float
+
+
+class FederatedRetrieveResponse(BaseModel):
+    """Response from federated retrieve endpoint."""
+
+    records: list[FederatedRetrieveRecord]
+    total: int
+    failed_knowledge_base_ids: list[int] = Field(
+        default_factory=list,
+        description="Knowledge bases left out because they failed or timed out",
+    )
+
+
+def _build_document_filter(document_ids: Optional[list[int]]) -> Optional[dict]:
+    """Build metadata_condition restricting retrieval to the given documents."""
+    if not document_ids:
+        return None
+    # Convert document IDs to doc_ref format (stored as strings in vector DB)
+    doc_refs = [str(doc_id) for doc_id in document_ids]
+    return {
+        "operator": "and",
+        "conditions": [
+            {
+                "key": "doc_ref",
+                "operator": "in",
+                "value": doc_refs,
+            }
+        ],
+    }
+
+
 @router.post("/retrieve", response_model=InternalRetrieveResponse)
 async def internal_retrieve(
     request: InternalRetrieveRequest,
@@ -76,20 +126,8 @@ async def internal_retrieve(
         retrieval_service = RetrievalService()
 
         # Build metadata_condition for document filtering
-        metadata_condition = None
-        if request.document_ids:
-            # Convert document IDs to doc_ref format (stored as strings in vector DB)
-            doc_refs = [str(doc_id) for doc_id in request.document_ids]
-            metadata_condition = {
-                "operator": "and",
-                "conditions": [
-                    {
-                        "key": "doc_ref",
-                        "operator": "in",
-                        "value": doc_refs,
-                    }
-                ],
-            }
+        metadata_condition = _build_document_filter(request.document_ids)
+        if metadata_condition:
             logger.info(
                 "[internal_rag] Filtering by %d documents: %s",
                 len(request.document_ids),
@@ -151,6 +189,62 @@ async def internal_retrieve(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/retrieve/federated", response_model=FederatedRetrieveResponse)
+async def internal_retrieve_federated(
+    request: FederatedRetrieveRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Federated RAG retrieval across several knowledge bases for chat_shell.
+
+    Knowledge bases are queried concurrently with a per-KB timeout and the
+    results are merged into a single ranked list. Knowledge bases that fail
+    or time out are reported in failed_knowledge_base_ids.
+
+    Args:
+        request: Federated retrieve request
+        db: Database session
+
+    Returns:
+        Fused retrieval results
+    """
+    try:
+        from app.services.rag.retrieval_service import RetrievalService
+
+        # Permission is validated at task level before reaching chat_shell
+        result = await RetrievalService().retrieve_from_knowledge_bases_internal(
+            query=request.query,
+            knowledge_base_ids=request.knowledge_base_ids,
+            db=db,
+            metadata_condition=_build_document_filter(request.document_ids),
+            top_k=request.max_results,
+        )
+
+        records = result["records"]
+        return FederatedRetrieveResponse(
+            records=[
+                FederatedRetrieveRecord(
+                    content=r.get("content", ""),
+                    score=r.get("score") or 0.0,
+                    title=r.get("title", "Unknown"),
+                    metadata=r.get("metadata"),
+                    knowledge_base_id=r["knowledge_base_id"],
+                    fusion_score=r["fusion_score"],
+                )
+                for r in records
+            ],
+            total=len(records),
+            failed_knowledge_base_ids=result["failed_knowledge_base_ids"],
+        )
+
+    except ValueError as e:
+        logger.warning("[internal_rag] Federated retrieval error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("[internal_rag] Federated retrieval failed: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 class KnowledgeBaseSizeRequest(BaseModel):
     """Request for getting knowledge base size."""
 
@@ -163,7 +257,11 @@ class KnowledgeBaseSizeInfo(BaseModel):
     id: int
     total_file_size: int  # Total file size in bytes
     document_count: int  # Number of active documents
-    estimated_tokens: int  # Estimated token count (file_size / 4)
+    estimated_tokens: int  # Token count (exact if is_exact, else file_size / 4)
+    chunk_count: Optional[int] = None  # Number of indexed chunks
+    token_count: Optional[int] = None  # Tokens of all indexed chunks
+    text_bytes: Optional[int] = None  # UTF-8 size of all indexed chunks
+    is_exact: bool = False  # Whether maintained index statistics were used
 
 
 class KnowledgeBaseSizeResponse(BaseModel):
@@ -182,9 +280,10 @@ async def get_knowledge_base_size(
     """
     Get size information for knowledge bases.
 
-    This endpoint returns the total file size and estimated token count
-    for the specified knowledge bases. Used by chat_shell to decide
-    whether to use direct injection or RAG retrieval.
+    This endpoint returns the total size and token count for the specified
+    knowledge bases, read from the maintained index statistics (estimated
+    from file sizes for knowledge bases without complete statistics). Used
+    by chat_shell to decide whether to use direct injection or RAG retrieval.
 
     Args:
         request: Request with knowledge base IDs
@@ -193,62 +292,42 @@ async def get_knowledge_base_size(
     Returns:
         Size information for each knowledge base
     """
-    from app.services.knowledge import KnowledgeService
+    from app.services.rag.kb_stats import KnowledgeBaseStatsService
 
-    items = []
-    total_file_size = 0
-    total_estimated_tokens = 0
-
-    for kb_id in request.knowledge_base_ids:
-        try:
-            file_size = KnowledgeService.get_total_file_size(db, kb_id)
-            doc_count = KnowledgeService.get_active_document_count(db, kb_id)
-            # Estimate tokens: approximately 4 characters per token for most models
-            estimated_tokens = file_size // 4
-
-            items.append(
-                KnowledgeBaseSizeInfo(
-                    id=kb_id,
-                    total_file_size=file_size,
-                    document_count=doc_count,
-                    estimated_tokens=estimated_tokens,
-                )
-            )
-
-            total_file_size += file_size
-            total_estimated_tokens += estimated_tokens
-
-            logger.info(
-                "[internal_rag] KB %d size: %d bytes, %d docs, ~%d tokens",
-                kb_id,
-                file_size,
-                doc_count,
-                estimated_tokens,
-            )
-
-        except Exception as e:
-            logger.warning("[internal_rag] Failed to get size for KB %d: %s", kb_id, e)
-            # Add zero values for failed KBs
-            items.append(
+    try:
+        size_info = KnowledgeBaseStatsService.get_size_info(
+            db, request.knowledge_base_ids
+        )
+    except Exception as e:
+        logger.warning(
+            "[internal_rag] Failed to get size for KBs %s: %s",
+            request.knowledge_base_ids,
+            e,
+        )
+        # Report zero values for failed KBs
+        return KnowledgeBaseSizeResponse(
+            items=[
                 KnowledgeBaseSizeInfo(
-                    id=kb_id,
-                    total_file_size=0,
-                    document_count=0,
-                    estimated_tokens=0,
+                    id=kb_id, total_file_size=0, document_count=0, estimated_tokens=0
                 )
-            )
+                for kb_id in request.knowledge_base_ids
+            ],
+            total_file_size=0,
+            total_estimated_tokens=0,
+        )
 
     logger.info(
-        "[internal_rag] Total KB size: %d bytes, ~%d tokens for %d KBs",
-        total_file_size,
-        total_estimated_tokens,
+        "[internal_rag] Total KB size: %d bytes, ~%d tokens for %d KBs (%d exact)",
+        size_info["total_file_size"],
+        size_info["total_estimated_tokens"],
         len(request.knowledge_base_ids),
+        sum(1 for item in size_info["items"] if item["is_exact"]),
     )
 
     return KnowledgeBaseSizeResponse(
-        items=items,
-        total_file_size=total_file_size,
-        total_estimated_tokens=total_estimated_tokens,
+        items=[KnowledgeBaseSizeInfo(**item) for item in size_info["items"]],
+        total_file_size=size_info["total_file_size"],
+        total_estimated_tokens=size_info["total_estimated_tokens"],
     )
 
 
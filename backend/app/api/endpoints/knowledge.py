@@ -30,6 +30,7 @@ from app.schemas.knowledge import (
     KnowledgeBaseCreate,
     KnowledgeBaseListResponse,
     KnowledgeBaseResponse,
+    KnowledgeBaseStatsResponse,
     KnowledgeBaseUpdate,
     KnowledgeDocumentCreate,
     KnowledgeDocumentListResponse,
@@ -46,6 +47,7 @@ from app.services.knowledge import (
     knowledge_base_qa_service,
 )
 from app.services.rag.document_service import DocumentService
+from app.services.rag.kb_stats import KnowledgeBaseStatsService
 from app.services.rag.storage.factory import create_storage_backend
 
 logger = logging.getLogger(__name__)
@@ -259,6 +261,40 @@ def delete_knowledge_base(
         )
 
 
+@router.get(
+    "/{knowledge_base_id}/stats",
+    response_model=KnowledgeBaseStatsResponse,
+)
+def get_knowledge_base_stats(
+    knowledge_base_id: int,
+    current_user: User = Depends(security.get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get index statistics (chunks, tokens, bytes) of a knowledge base."""
+    knowledge_base = KnowledgeService.get_knowledge_base(
+        db=db,
+        knowledge_base_id=knowledge_base_id,
+        user_id=current_user.id,
+    )
+
+    if not knowledge_base:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Knowledge base not found or access denied",
+        )
+
+    item = KnowledgeBaseStatsService.get_size_info(db, [knowledge_base.id])["items"][0]
+    return KnowledgeBaseStatsResponse(
+        knowledge_base_id=knowledge_base.id,
+        document_count=item["document_count"],
+        chunk_count=item["chunk_count"],
+        token_count=item["token_count"],
+        text_bytes=item["text_bytes"],
+        estimated_tokens=item["estimated_tokens"],
+        is_exact=item["is_exact"],
+    )
+
+
 # ============== Knowledge Document Endpoints ==============
 
 
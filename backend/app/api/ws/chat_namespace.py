@@ -18,7 +18,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import socketio
 from shared.telemetry.context import (
@@ -43,6 +43,7 @@ from app.api.ws.events import (
     TaskJoinPayload,
     TaskLeavePayload,
 )
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models.kind import Kind
 from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
@@ -67,6 +68,7 @@ from app.services.chat.operations import (
 )
 from app.services.chat.rag import process_context_and_rag
 from app.services.chat.storage import session_manager
+from app.services.chat.storage.db import run_in_db_executor
 
 logger = logging.getLogger(__name__)
 
@@ -1453,12 +1455,13 @@ class ChatNamespace(socketio.AsyncNamespace):
         task_room = f"task:{payload.task_id}"
         await self.enter_room(sid, task_room)
 
-        # Get cached content
-        cached_content = await session_manager.get_streaming_content(payload.subtask_id)
+        # Get cached content produced after the client's offset
+        remaining = await session_manager.get_streaming_content(
+            payload.subtask_id, offset=payload.offset
+        )
 
-        if cached_content and payload.offset < len(cached_content):
+        if remaining:
             # Send remaining content
-            remaining = cached_content[payload.offset :]
             from app.api.ws.events import ServerEvents
 
             await self.emit(
@@ -1480,10 +1483,10 @@ class ChatNamespace(socketio.AsyncNamespace):
 
         Args:
             sid: Socket ID
-            data: {"task_id": int, "after_message_id": int}
+            data: {"task_id": int, "after_message_id": int, "limit": int}
 
         Returns:
-            {"messages": [...]} or {"error": "..."}
+            {"messages": [...], "has_more": bool} or {"error": "..."}
         """
         payload = data  # Already validated by decorator
 
@@ -1497,39 +1500,16 @@ class ChatNamespace(socketio.AsyncNamespace):
         if not await can_access_task(user_id, payload.task_id):
             return {"error": "Access denied"}
 
-        db = SessionLocal()
-        try:
-            # Get messages after the specified ID
-            subtasks = (
-                db.query(Subtask)
-                .filter(
-                    Subtask.task_id == payload.task_id,
-                    Subtask.message_id > payload.after_message_id,
-                )
-                .order_by(Subtask.message_id.asc())
-                .all()
-            )
-
-            messages = []
-            for st in subtasks:
-                msg = {
-                    "subtask_id": st.id,
-                    "message_id": st.message_id,
-                    "role": st.role.value,
-                    "content": (
-                        st.prompt
-                        if st.role == SubtaskRole.USER
-                        else (st.result.get("value", "") if st.result else "")
-                    ),
-                    "status": st.status.value,
-                    "created_at": st.created_at.isoformat() if st.created_at else None,
-                }
-                messages.append(msg)
-
-            return {"messages": messages}
+        # Keyset page: reconnecting clients pass the last message_id they
+        # have and repeat the call while has_more is set
+        limit = settings.CHAT_HISTORY_SYNC_MAX_MESSAGES
+        if payload.limit:
+            limit = min(payload.limit, limit)
 
-        finally:
-            db.close()
+        messages = await run_in_db_executor(
+            _load_history_after, payload.task_id, payload.after_message_id, limit + 1
+        )
+        return {"messages": messages[:limit], "has_more": len(messages) > limit}
 
     # ============================================================
     # Generic Skill Events
@@ -1598,6 +1578,42 @@ class ChatNamespace(socketio.AsyncNamespace):
         return {"success": True}
 
 
+def _load_history_after(
+    task_id: int, after_message_id: int, limit: int
+) -> List[Dict[str, Any]]:
+    """Load up to limit messages of a task after a message ID (runs in a thread)."""
+    db = SessionLocal()
+    try:
+        subtasks = (
+            db.query(Subtask)
+            .filter(
+                Subtask.task_id == task_id,
+                Subtask.message_id > after_message_id,
+            )
+            .order_by(Subtask.message_id.asc())
+            .limit(limit)
+            .all()
+        )
+
+        return [
+            {
+                "subtask_id": st.id,
+                "message_id": st.message_id,
+                "role": st.role.value,
+                "content": (
+                    st.prompt
+                    if st.role == SubtaskRole.USER
+                    else (st.result.get("value", "") if st.result else "")
+                ),
+                "status": st.status.value,
+                "created_at": st.created_at.isoformat() if st.created_at else None,
+            }
+            for st in subtasks
+        ]
+    finally:
+        db.close()
+
+
 def register_chat_namespace(sio: socketio.AsyncServer):
     """
     Register the chat namespace with the Socket.IO server.
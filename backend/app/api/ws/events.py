@@ -209,6 +209,11 @@ class HistorySyncPayload(BaseModel):
 
     task_id: int = Field(..., description="Task ID")
     after_message_id: int = Field(..., description="Get messages after this ID")
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum messages to return (capped by the server)",
+    )
 
 
 # ============================================================
@@ -511,6 +516,9 @@ class HistorySyncAck(BaseModel):
     """ACK response for history:sync event."""
 
     messages: List[Dict[str, Any]] = Field(default_factory=list)
+    has_more: bool = Field(
+        False, description="More messages follow the last returned message_id"
+    )
     error: Optional[str] = None
 
 
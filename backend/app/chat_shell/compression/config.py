@@ -128,7 +128,7 @@ def get_model_context_config(
     Args:
         model_id: Model identifier (e.g., "claude-3-5-sonnet-20241022")
         model_config: Optional model configuration from Model CRD spec
-                     (from model_resolver._extract_model_config)
+                     (from model_resolver.extract_model_config)
 
     Returns:
         ModelContextConfig for the model
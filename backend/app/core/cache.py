@@ -4,11 +4,17 @@
 
 import asyncio
 import logging
-from typing import Any, Optional
+import threading
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import orjson
+from redis import ConnectionPool as SyncConnectionPool
 from redis import Redis as SyncRedis
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
 
 from app.core.config import settings
 
@@ -24,39 +30,167 @@ class RedisCache:
         self._connection_params = {
             "encoding": "utf-8",
             "decode_responses": False,
-            "max_connections": 10,
+            "max_connections": settings.REDIS_MAX_CONNECTIONS,
             "socket_timeout": 5.0,
             "socket_connect_timeout": 2.0,
             "retry_on_timeout": True,
         }
+        # asyncio connections cannot be shared between event loops, so each
+        # loop (main app loop, worker threads running asyncio.run) gets its
+        # own pooled client. Entries go away with their loop.
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._sync_client: Optional[SyncRedis] = None
+        self._lock = threading.Lock()
 
     async def _get_client(self) -> Redis:
         """
-        Get Redis client, simply and directly create new connection
+        Get the pooled Redis client bound to the running event loop.
+
+        The client is shared; callers must not close it.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(loop)
+                if client is None:
+                    pool = BlockingConnectionPool.from_url(
+                        self._url,
+                        timeout=settings.REDIS_POOL_TIMEOUT,
+                        **self._connection_params,
+                    )
+                    client = Redis(connection_pool=pool)
+                    self._clients[loop] = client
+        return client
+
+    def _get_sync_client(self) -> SyncRedis:
+        """Get the pooled synchronous Redis client shared by all threads."""
+        if self._sync_client is None:
+            with self._lock:
+                if self._sync_client is None:
+                    pool = SyncConnectionPool.from_url(
+                        self._url, **self._connection_params
+                    )
+                    self._sync_client = SyncRedis(connection_pool=pool)
+        return self._sync_client
+
+    def create_client(self) -> Redis:
+        """
+        Create a dedicated (non-pooled) Redis client.
+
+        Use this for long-lived connections such as Pub/Sub subscriptions,
+        which would otherwise hold a pooled connection for the whole stream.
+        The caller is responsible for closing it.
         """
-        # Create new client every time to avoid event loop closure issues
         return Redis.from_url(self._url, **self._connection_params)
 
+    async def close(self) -> None:
+        """Disconnect all pooled connections (call on application shutdown)."""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            sync_client = self._sync_client
+            self._sync_client = None
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for loop, client in clients:
+            # Connections of other loops can only be dropped, not awaited
+            if loop is current_loop:
+                try:
+                    await client.connection_pool.disconnect()
+                except Exception as e:
+                    logger.warning(f"Error closing Redis connection pool: {str(e)}")
+
+        if sync_client is not None:
+            try:
+                sync_client.connection_pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing sync Redis connection pool: {str(e)}")
+
     def generate_full_cache_key(self, user_id: int, git_domain: str) -> str:
         """Generate cache key for full user repositories list"""
         # Keep the raw key without hashing, as requested
         return f"git_repos:{user_id}:{git_domain}"
 
+    def generate_version_cache_key(self, user_id: int, git_domain: str) -> str:
+        """Generate key of the version of the full user repositories list"""
+        return f"git_repos_version:{user_id}:{git_domain}"
+
+    async def set_user_repositories(
+        self,
+        user_id: int,
+        git_domain: str,
+        repos: List[Dict[str, Any]],
+        expire: int = settings.REPO_CACHE_EXPIRED_TIME,
+    ) -> Optional[str]:
+        """
+        Cache the full repository list of a user together with a new version.
+
+        The version lets readers (see app.repository.search_index) detect a
+        changed list without loading it.
+
+        Returns:
+            The new version, or None on error
+        """
+        version = uuid.uuid4().hex
+        try:
+            async with self.pipeline() as pipe:
+                pipe.set(
+                    self.generate_full_cache_key(user_id, git_domain),
+                    orjson.dumps(repos),
+                    ex=expire,
+                )
+                pipe.set(
+                    self.generate_version_cache_key(user_id, git_domain),
+                    version,
+                    ex=expire,
+                )
+                await pipe.execute()
+            return version
+        except Exception as e:
+            logger.error(
+                f"Error caching repositories for user {user_id}, domain {git_domain}: {str(e)}"
+            )
+            return None
+
+    async def get_user_repositories_version(
+        self, user_id: int, git_domain: str
+    ) -> Optional[str]:
+        """Get the version of a user's cached repository list (None if unknown)"""
+        data = await self.get_raw(self.generate_version_cache_key(user_id, git_domain))
+        return data.decode() if isinstance(data, bytes) else data
+
+    async def delete_user_repositories(self, user_id: int, git_domain: str) -> bool:
+        """Delete a user's cached repository list and its version"""
+        try:
+            client = await self._get_client()
+            deleted = await client.delete(
+                self.generate_full_cache_key(user_id, git_domain),
+                self.generate_version_cache_key(user_id, git_domain),
+            )
+            return deleted > 0
+        except Exception as e:
+            logger.error(
+                f"Error deleting repositories of user {user_id}, domain {git_domain}: {str(e)}"
+            )
+            return False
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         try:
             client = await self._get_client()
+            data = await client.get(key)
+            if data is None:
+                return None
             try:
-                data = await client.get(key)
-                if data is None:
-                    return None
-                try:
-                    return orjson.loads(data)
-                except Exception:
-                    # If value was stored as plain bytes/string
-                    return data
-            finally:
-                await client.aclose()
+                return orjson.loads(data)
+            except Exception:
+                # If value was stored as plain bytes/string
+                return data
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {str(e)}")
             return None
@@ -64,24 +198,14 @@ class RedisCache:
     def get_sync(self, key: str) -> Optional[Any]:
         """Get value from cache synchronously"""
         try:
-            client = SyncRedis.from_url(
-                self._url,
-                encoding="utf-8",
-                decode_responses=False,
-                socket_timeout=5.0,
-                socket_connect_timeout=2.0,
-            )
+            data = self._get_sync_client().get(key)
+            if data is None:
+                return None
             try:
-                data = client.get(key)
-                if data is None:
-                    return None
-                try:
-                    return orjson.loads(data)
-                except Exception:
-                    # If value was stored as plain bytes/string
-                    return data
-            finally:
-                client.close()
+                return orjson.loads(data)
+            except Exception:
+                # If value was stored as plain bytes/string
+                return data
         except Exception as e:
             logger.error(f"Error getting cache key {key} (sync): {str(e)}")
             return None
@@ -108,45 +232,253 @@ class RedisCache:
         """Set value to cache with expiration (seconds)"""
         try:
             client = await self._get_client()
-            try:
-                payload = orjson.dumps(value)
-                ok = await client.set(key, payload, ex=expire)
-                return bool(ok)
-            finally:
-                await client.aclose()
+            ok = await client.set(key, orjson.dumps(value), ex=expire)
+            return bool(ok)
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {str(e)}")
             return False
 
+    def set_sync(
+        self, key: str, value: Any, expire: int = settings.REPO_CACHE_EXPIRED_TIME
+    ) -> bool:
+        """Set value to cache with expiration (seconds) synchronously"""
+        try:
+            ok = self._get_sync_client().set(key, orjson.dumps(value), ex=expire)
+            return bool(ok)
+        except Exception as e:
+            logger.error(f"Error setting cache key {key} (sync): {str(e)}")
+            return False
+
+    def publish_sync(self, channel: str, message: Any) -> bool:
+        """Publish a message on a Pub/Sub channel synchronously"""
+        try:
+            self._get_sync_client().publish(channel, orjson.dumps(message))
+            return True
+        except Exception as e:
+            logger.error(f"Error publishing to channel {channel} (sync): {str(e)}")
+            return False
+
+    def hincrby_many_sync(
+        self, key: str, fields: List[str], expire: Optional[int] = None
+    ) -> bool:
+        """Increment several hash fields by one in a single round trip"""
+        try:
+            with self._get_sync_client().pipeline(transaction=False) as pipe:
+                for field in fields:
+                    pipe.hincrby(key, field, 1)
+                if expire:
+                    pipe.expire(key, expire)
+                pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error incrementing hash {key} (sync): {str(e)}")
+            return False
+
+    def hincrby_counts_sync(
+        self, key: str, counts: Dict[str, int], expire: Optional[int] = None
+    ) -> bool:
+        """Increment hash fields by the given amounts in a single round trip"""
+        try:
+            with self._get_sync_client().pipeline(transaction=False) as pipe:
+                for field, amount in counts.items():
+                    pipe.hincrby(key, field, amount)
+                if expire:
+                    pipe.expire(key, expire)
+                pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error incrementing hash {key} (sync): {str(e)}")
+            return False
+
+    def hmget_sync(self, key: str, fields: List[str]) -> Optional[List[Any]]:
+        """Get several hash fields synchronously (None if Redis is unavailable)"""
+        try:
+            return self._get_sync_client().hmget(key, fields)
+        except Exception as e:
+            logger.error(f"Error getting hash {key} (sync): {str(e)}")
+            return None
+
+    async def hget_raw(self, key: str, field: str) -> Optional[bytes]:
+        """Get a raw hash field without JSON decoding"""
+        try:
+            client = await self._get_client()
+            return await client.hget(key, field)
+        except Exception as e:
+            logger.error(f"Error getting hash field {key}.{field}: {str(e)}")
+            return None
+
+    async def hset_raw(
+        self,
+        key: str,
+        field: str,
+        value: bytes,
+        expire: int = settings.REPO_CACHE_EXPIRED_TIME,
+    ) -> bool:
+        """Set a raw hash field and refresh the expiration of the hash"""
+        try:
+            async with self.pipeline(transaction=False) as pipe:
+                pipe.hset(key, field, value)
+                pipe.expire(key, expire)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error setting hash field {key}.{field}: {str(e)}")
+            return False
+
+    def expire_sync(self, key: str, expire: int) -> bool:
+        """Refresh the expiration (seconds) of an existing key synchronously"""
+        try:
+            return bool(self._get_sync_client().expire(key, expire))
+        except Exception as e:
+            logger.error(f"Error setting expiration of {key} (sync): {str(e)}")
+            return False
+
+    def delete_sync(self, key: str) -> bool:
+        """Delete key from cache synchronously"""
+        try:
+            return self._get_sync_client().delete(key) > 0
+        except Exception as e:
+            logger.error(f"Error deleting cache key {key} (sync): {str(e)}")
+            return False
+
     async def setnx(
         self, key: str, value: Any, expire: int = settings.REPO_CACHE_EXPIRED_TIME
     ) -> bool:
         """Set value to cache only if key doesn't exist (SETNX operation)"""
         try:
             client = await self._get_client()
-            try:
-                payload = orjson.dumps(value)
-                ok = await client.set(key, payload, ex=expire, nx=True)
-                return bool(ok)
-            finally:
-                await client.aclose()
+            ok = await client.set(key, orjson.dumps(value), ex=expire, nx=True)
+            return bool(ok)
         except Exception as e:
             logger.error(f"Error setting cache key {key} with SETNX: {str(e)}")
             return False
 
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Get raw bytes from cache without JSON decoding"""
+        try:
+            client = await self._get_client()
+            return await client.get(key)
+        except Exception as e:
+            logger.error(f"Error getting raw cache key {key}: {str(e)}")
+            return None
+
+    async def set_raw(
+        self, key: str, value: bytes, expire: int = settings.REPO_CACHE_EXPIRED_TIME
+    ) -> bool:
+        """Set raw bytes to cache without JSON encoding"""
+        try:
+            client = await self._get_client()
+            ok = await client.set(key, value, ex=expire)
+            return bool(ok)
+        except Exception as e:
+            logger.error(f"Error setting raw cache key {key}: {str(e)}")
+            return False
+
+    async def append(
+        self, key: str, value: bytes, expire: int = settings.REPO_CACHE_EXPIRED_TIME
+    ) -> Optional[int]:
+        """Append raw bytes to a key and refresh its expiration.
+
+        Returns:
+            New length of the value in bytes, or None on error
+        """
+        try:
+            async with self.pipeline() as pipe:
+                pipe.append(key, value)
+                pipe.expire(key, expire)
+                length, _ = await pipe.execute()
+            return int(length)
+        except Exception as e:
+            logger.error(f"Error appending to cache key {key}: {str(e)}")
+            return None
+
+    async def getrange(self, key: str, start: int, end: int = -1) -> Optional[bytes]:
+        """Get a byte range of a raw value (GETRANGE, end inclusive)"""
+        try:
+            client = await self._get_client()
+            return await client.getrange(key, start, end)
+        except Exception as e:
+            logger.error(f"Error getting range of cache key {key}: {str(e)}")
+            return None
+
+    async def zfloor(self, key: str, score: float) -> Optional[bytes]:
+        """Get the sorted set member with the highest score not above score"""
+        try:
+            client = await self._get_client()
+            members = await client.zrevrangebyscore(key, score, "-inf", start=0, num=1)
+            return members[0] if members else None
+        except Exception as e:
+            logger.error(f"Error getting floor member of {key}: {str(e)}")
+            return None
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
             client = await self._get_client()
-            try:
-                deleted = await client.delete(key)
-                return deleted > 0
-            finally:
-                await client.aclose()
+            deleted = await client.delete(key)
+            return deleted > 0
         except Exception as e:
             logger.error(f"Error deleting cache key {key}: {str(e)}")
             return False
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in a single round trip.
+
+        Returns:
+            Values in the order of keys (None for missing keys or on error)
+        """
+        if not keys:
+            return []
+        try:
+            client = await self._get_client()
+            values = await client.mget(keys)
+        except Exception as e:
+            logger.error(f"Error getting cache keys {keys}: {str(e)}")
+            return [None] * len(keys)
+
+        result: List[Optional[Any]] = []
+        for data in values:
+            if data is None:
+                result.append(None)
+                continue
+            try:
+                result.append(orjson.loads(data))
+            except Exception:
+                result.append(data)
+        return result
+
+    async def mset(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = settings.REPO_CACHE_EXPIRED_TIME,
+    ) -> bool:
+        """Set multiple values with a common expiration in a single round trip"""
+        if not mapping:
+            return True
+        try:
+            async with self.pipeline() as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, orjson.dumps(value), ex=expire)
+                results = await pipe.execute()
+            return all(results)
+        except Exception as e:
+            logger.error(f"Error setting cache keys {list(mapping)}: {str(e)}")
+            return False
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> AsyncIterator[Pipeline]:
+        """Open a pipeline on the pooled client.
+
+        Example:
+            async with cache_manager.pipeline() as pipe:
+                pipe.set("a", b"1")
+                pipe.expire("a", 60)
+                await pipe.execute()
+        """
+        client = await self._get_client()
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
     async def cleanup_expired(self):
         """No-op: Redis handles expiration via TTL."""
         return None
@@ -155,10 +487,7 @@ class RedisCache:
         """Get approximate number of keys in current DB"""
         try:
             client = await self._get_client()
-            try:
-                return await client.dbsize()
-            finally:
-                await client.aclose()
+            return await client.dbsize()
         except Exception as e:
             logger.error(f"Error getting cache size: {str(e)}")
             return 0
@@ -184,13 +513,62 @@ class RedisCache:
             if building:
                 return await self.set(build_key, True, expire=300)  # 5 minutes timeout
             else:
-                return await self.delete(build_key)
+                deleted = await self.delete(build_key)
+                # Wake up requests waiting in wait_until_built()
+                client = await self._get_client()
+                await client.publish(f"built:{user_id}:{git_domain}", b"1")
+                return deleted
         except Exception as e:
             logger.error(
                 f"Error setting building status for user {user_id}, domain {git_domain}: {str(e)}"
             )
             return False
 
+    async def wait_until_built(
+        self, user_id: int, git_domain: str, timeout: float
+    ) -> bool:
+        """
+        Wait until a running repository build of a user finishes.
+
+        Waits for the notification published by set_building(False) instead
+        of polling. The building flag is still re-checked every few seconds
+        in case the builder died and its flag expired.
+
+        Args:
+            user_id: User ID
+            git_domain: Git domain
+            timeout: Maximum wait in seconds
+
+        Returns:
+            True if no build is running anymore, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        client = self.create_client()
+        pubsub = client.pubsub()
+        try:
+            # Subscribe before checking so a build finishing in between is seen
+            await pubsub.subscribe(f"built:{user_id}:{git_domain}")
+            while await self.is_building(user_id, git_domain):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=min(remaining, 5.0)
+                )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error waiting for build of user {user_id}, domain {git_domain}: {str(e)}"
+            )
+            return not await self.is_building(user_id, git_domain)
+        finally:
+            try:
+                await pubsub.aclose()
+                await client.aclose()
+            except Exception:
+                pass
+
 
 # Global cache instance
 cache_manager = RedisCache(settings.get_redis_url())
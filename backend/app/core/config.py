@@ -79,6 +79,12 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 7 * 24 * 60  # 7 days in minutes
 
+    # API key authentication cache (per worker, revoked over Redis Pub/Sub)
+    API_KEY_AUTH_CACHE_TTL_SECONDS: int = 60  # 0 disables the cache
+    # last_used_at and per-key request counters are written behind in batches
+    API_KEY_USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0
+    API_KEY_REQUEST_COUNTER_WINDOW_SECONDS: int = 60  # Request counter window
+
     # OIDC state configuration
     OIDC_STATE_SECRET_KEY: str = "test"
     OIDC_STATE_EXPIRE_SECONDS: int = 10 * 60  # 10 minutes, unit: seconds
@@ -86,6 +92,24 @@ class Settings(BaseSettings):
     # Cache configuration
     REPO_CACHE_EXPIRED_TIME: int = 7200  # 2 hour in seconds
     REPO_UPDATE_INTERVAL_SECONDS: int = 3600  # 1 hour in seconds
+    # In-process repository search indexes (one per user and git domain)
+    REPO_SEARCH_INDEX_MAX_ENTRIES: int = 1024
+
+    # Shared async HTTP client of the git providers (app/repository/http_client.py)
+    GIT_API_MAX_CONNECTIONS: int = 100
+    GIT_API_MAX_KEEPALIVE: int = 20
+    GIT_API_TIMEOUT_SECONDS: float = 30.0
+    # Pages fetched in parallel once the number of pages is known
+    GIT_API_PAGE_CONCURRENCY: int = 8
+    # Retries of rate limited requests; longer waits than the cap fail instead
+    GIT_API_MAX_RETRIES: int = 3
+    GIT_API_MAX_BACKOFF_SECONDS: float = 60.0
+    # Conditional requests: responses with an ETag/Last-Modified are cached in
+    # Redis and revalidated with If-None-Match/If-Modified-Since (304 responses
+    # do not count against the GitHub rate limit)
+    GIT_API_ETAG_CACHE_ENABLED: bool = True
+    GIT_API_ETAG_CACHE_TTL_SECONDS: int = 24 * 3600
+    GIT_API_ETAG_CACHE_MAX_BYTES: int = 2 * 1024 * 1024  # Larger bodies not cached
 
     # PR operator / PR Action Gateway (write operations are disabled by default)
     PR_ACTION_WRITE_ENABLED: bool = False
@@ -133,6 +157,16 @@ class Settings(BaseSettings):
     STREAMING_DB_SAVE_INTERVAL: float = 5.0  # Database save interval (seconds)
     STREAMING_REDIS_TTL: int = 300  # Redis streaming cache TTL (seconds)
     STREAMING_MIN_CHARS_TO_SAVE: int = 50  # Minimum characters to save on disconnect
+    # Chunk coalescing for WebSocket emission (0 window disables coalescing)
+    STREAMING_COALESCE_WINDOW: float = 0.05  # Max chunk delay (seconds)
+    STREAMING_COALESCE_MAX_BYTES: int = 4096  # Flush once buffered content reaches this
+
+    # WebSocket chat namespace database access
+    CHAT_DB_EXECUTOR_WORKERS: int = 10  # Threads running chat DB queries off the loop
+    # Task access decisions are cached in Redis per (task, user) and dropped when
+    # task membership or sharing changes (0 disables the cache)
+    CHAT_TASK_ACCESS_CACHE_TTL: int = 300
+    CHAT_HISTORY_SYNC_MAX_MESSAGES: int = 200  # Page size cap of history:sync
 
     # Task append expiration (hours)
     APPEND_CHAT_TASK_EXPIRE_HOURS: int = 2
@@ -146,6 +180,14 @@ class Settings(BaseSettings):
     # Cleanup scanning interval seconds
     TASK_EXECUTOR_CLEANUP_INTERVAL_SECONDS: int = 600
 
+    # Executor task dispatch queue (Redis sorted set filled when subtasks become
+    # PENDING; executor managers long-poll it instead of scanning the tasks table)
+    TASK_DISPATCH_QUEUE_ENABLED: bool = True
+    TASK_DISPATCH_MAX_WAIT_SECONDS: float = 60.0  # Upper bound for long-poll wait
+    TASK_DISPATCH_QUEUE_SCAN_SIZE: int = 50  # Queued tasks read per page
+    # Interval for re-enqueueing PENDING subtasks missed by the queue
+    TASK_DISPATCH_RECONCILE_INTERVAL_SECONDS: int = 60
+
     # Frontend URL configuration
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -159,6 +201,10 @@ class Settings(BaseSettings):
     # Redis configuration
     REDIS_URL: str = "redis://127.0.0.1:6379/0"
     REDIS_PASSWORD: str | None = None
+    # Connection pool size per event loop for the shared cache client
+    REDIS_MAX_CONNECTIONS: int = 50
+    # Seconds to wait for a free pooled connection before failing
+    REDIS_POOL_TIMEOUT: float = 5.0
 
     def get_redis_url(self) -> str:
         """
@@ -278,11 +324,20 @@ class Settings(BaseSettings):
     # File upload configuration
     MAX_UPLOAD_FILE_SIZE_MB: int = 100  # Maximum file size in MB
     MAX_EXTRACTED_TEXT_LENGTH: int = 500000  # Maximum extracted text length
+    # Worker processes for attachment parsing (0 parses in the request thread)
+    ATTACHMENT_PARSE_WORKERS: int = 4
+    # Minimum PDF pages / PPTX slides per parallel extraction task
+    ATTACHMENT_PARSE_PAGES_PER_TASK: int = 32
+    # Cache parse results by content hash for this long (seconds, 0 disables)
+    ATTACHMENT_PARSE_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
 
     # Attachment storage backend configuration
-    # Supported backends: "mysql" (default), "s3", "minio"
+    # Built-in backends: "mysql" (default), "filesystem"; plugins may add "s3", "minio"
     # If not configured or set to "mysql", binary data is stored in MySQL database
     ATTACHMENT_STORAGE_BACKEND: str = "mysql"
+    # Root directory for the content-addressed "filesystem" backend
+    # Identical files are stored once (SHA-256 addressed) and streamed in chunks
+    ATTACHMENT_FILESYSTEM_ROOT: str = "/app/data/attachments"
     # S3/MinIO configuration (only used when ATTACHMENT_STORAGE_BACKEND is "s3" or "minio")
     ATTACHMENT_S3_ENDPOINT: str = (
         ""  # e.g., "https://s3.amazonaws.com" or "http://minio:9000"
@@ -390,6 +445,42 @@ class Settings(BaseSettings):
     # Enable/disable automatic summary generation after document indexing
     SUMMARY_ENABLED: bool = True
 
+    # Kind reader cache (in-process LRU of CRD rows read through kindReader;
+    # writes invalidate other workers via Redis Pub/Sub)
+    KIND_READER_CACHE_ENABLED: bool = True
+    KIND_READER_CACHE_MAX_SIZE: int = 4096  # Maximum cached lookups per process
+    KIND_READER_CACHE_TTL_SECONDS: int = 300  # Upper bound on staleness (seconds)
+    # Lifetime of the kinds:revisions counters since the last write or reader
+    # (seconds); must not be shorter than any cache entry validated by them
+    KIND_REVISIONS_TTL_SECONDS: int = 86400
+
+    # Compiled team snapshots for chat (resolved Bot/Ghost/Shell/Model/Skills,
+    # cached in-process and in Redis until one of the CRDs changes)
+    CHAT_TEAM_SNAPSHOT_ENABLED: bool = True
+    CHAT_TEAM_SNAPSHOT_CACHE_MAX_SIZE: int = 1024  # Maximum in-process snapshots
+    CHAT_TEAM_SNAPSHOT_TTL_SECONDS: int = 3600  # Entry lifetime (seconds)
+
+    # RAG resource cache (storage backends and embedding models built from CRDs)
+    RAG_RESOURCE_CACHE_TTL_SECONDS: int = 300  # Entry lifetime (seconds)
+    RAG_RESOURCE_CACHE_MAX_SIZE: int = 64  # Maximum cached instances per type
+
+    # RAG query cache (query embeddings and retrieval results, in-process + Redis)
+    RAG_QUERY_CACHE_ENABLED: bool = True
+    RAG_QUERY_CACHE_MAX_SIZE: int = 1024  # Maximum in-process entries per type
+    RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 86400  # Query embedding TTL (1 day)
+    RAG_QUERY_RESULT_CACHE_TTL_SECONDS: int = 300  # Retrieval result TTL (5 minutes)
+
+    # Federated retrieval across several knowledge bases (queried concurrently,
+    # results merged into a single top-k)
+    RAG_FEDERATED_KB_TIMEOUT_SECONDS: float = 10.0  # Slower KBs are skipped
+    RAG_FEDERATED_FUSION_METHOD: str = "rrf"  # "rrf" (reciprocal rank) or "score"
+    RAG_FEDERATED_RRF_K: int = 60  # Rank constant for reciprocal rank fusion
+
+    # Full knowledge base context (all chunks, used for direct injection), cached
+    # compressed in Redis per index version so it is only loaded once per change
+    RAG_KB_CONTEXT_CACHE_TTL_SECONDS: int = 3600  # Entry lifetime (seconds)
+    RAG_KB_CONTEXT_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # Larger blobs not cached
+
     # OpenTelemetry configuration is centralized in shared/telemetry/config.py
     # Use: from shared.telemetry.config import get_otel_config
     # All OTEL_* environment variables are read from there
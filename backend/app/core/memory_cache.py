@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+In-process TTL + LRU cache.
+
+Used for objects that are expensive to build and cannot be serialized to
+Redis (client instances, compiled configurations, etc.). Thread-safe so it
+can be shared between the event loop and worker threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLLRUCache(Generic[V]):
+    """Bounded LRU cache whose entries also expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries; least recently used are evicted first
+            ttl: Entry lifetime in seconds (<= 0 disables expiry)
+        """
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - stored_at > self.ttl
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return cached value for key, or default if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            stored_at, value = entry
+            if self._is_expired(stored_at, now):
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """
+        Return cached value for key, building it with factory on a miss.
+
+        The factory runs outside the lock so slow constructors do not block
+        unrelated lookups; concurrent misses for the same key may both build,
+        and the last one wins.
+        """
+        value = self.get(key, _MISSING)  # type: ignore[arg-type]
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        value = factory()
+        self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """Remove key and return its value if present."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry else None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove all entries whose key matches predicate.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def invalidate_items_where(self, predicate: Callable[[Hashable, V], bool]) -> int:
+        """
+        Remove all entries whose key and value match predicate.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            keys = [
+                key for key, (_, value) in self._data.items() if predicate(key, value)
+            ]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss statistics for monitoring."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -24,9 +24,10 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_db
 from app.core.config import settings
-from app.models.api_key import KEY_TYPE_PERSONAL, KEY_TYPE_SERVICE, APIKey
+from app.models.api_key import KEY_TYPE_PERSONAL, KEY_TYPE_SERVICE
 from app.models.user import User
 from app.schemas.user import TokenData
+from app.services.api_key_cache import api_key_auth_cache
 from app.services.k_batch import apply_default_resources_sync
 from app.services.readers.users import userReader
 from app.services.user import user_service
@@ -476,14 +477,7 @@ def get_auth_context(
                 span.set_attribute(SpanAttributes.AUTH_SOURCE, "api_key_header")
 
         key_hash = hashlib.sha256(actual_api_key.encode()).hexdigest()
-        api_key_record = (
-            db.query(APIKey)
-            .filter(
-                APIKey.key_hash == key_hash,
-                APIKey.is_active == True,
-            )
-            .first()
-        )
+        api_key_record = api_key_auth_cache.get(db, key_hash)
 
         if not api_key_record:
             if is_telemetry_enabled():
@@ -515,9 +509,8 @@ def get_auth_context(
                 detail="API key has expired",
             )
 
-        # Update last_used_at
-        api_key_record.last_used_at = datetime.utcnow()
-        db.commit()
+        # last_used_at and request counters are written behind in batches
+        api_key_auth_cache.record_use(api_key_record.id)
 
         # Personal key: return the key owner directly
         if api_key_record.key_type == KEY_TYPE_PERSONAL:
@@ -198,6 +198,21 @@ async def lifespan(app: FastAPI):
             finally:
                 db.close()
 
+            # Step 3: Project tasks missing from the task list projection
+            db = SessionLocal()
+            try:
+                from app.services.task_list_projection import (
+                    backfill_task_list_items,
+                )
+
+                count = backfill_task_list_items(db)
+                logger.info(f"✓ Task list projection backfill completed ({count})")
+            except Exception as e:
+                db.rollback()
+                logger.error(f"✗ Failed to backfill task list projection: {e}")
+            finally:
+                db.close()
+
         except Exception as e:
             logger.error(f"✗ Startup initialization failed: {e}")
         finally:
@@ -230,6 +245,18 @@ async def lifespan(app: FastAPI):
     await get_pending_request_registry()
     logger.info("✓ PendingRequestRegistry initialized")
 
+    # Apply Kind changes made by other workers to this worker's kind cache
+    from app.services.readers.kinds import kind_invalidation_listener
+
+    await kind_invalidation_listener.start()
+    logger.info("✓ Kind invalidation listener started")
+
+    # Drop API keys disabled or deleted in other workers from the auth cache
+    from app.services.api_key_cache import api_key_auth_cache
+
+    await api_key_auth_cache.start()
+    logger.info("✓ API key revocation listener started")
+
     logger.info("=" * 60)
     logger.info("Application startup completed successfully!")
     logger.info("=" * 60)
@@ -287,7 +314,35 @@ async def lifespan(app: FastAPI):
     await shutdown_pending_request_registry()
     logger.info("✓ PendingRequestRegistry shutdown completed")
 
-    # Step 5: Shutdown OpenTelemetry
+    # Step 5: Stop kind invalidation listener
+    from app.services.readers.kinds import kind_invalidation_listener
+
+    await kind_invalidation_listener.stop()
+    logger.info("✓ Kind invalidation listener stopped")
+
+    from app.services.api_key_cache import api_key_auth_cache
+
+    await api_key_auth_cache.stop()
+    logger.info("✓ API key revocation listener stopped")
+
+    # Step 6: Close pooled Redis connections
+    from app.core.cache import cache_manager
+
+    await cache_manager.close()
+    logger.info("✓ Redis connection pools closed")
+
+    from app.repository.http_client import git_api_client
+
+    await git_api_client.close()
+    logger.info("✓ Git provider HTTP connections closed")
+
+    # Step 7: Stop attachment parse workers
+    from app.services.attachment.parse_pipeline import parse_pipeline
+
+    parse_pipeline.shutdown()
+    logger.info("✓ Attachment parse workers stopped")
+
+    # Step 8: Shutdown OpenTelemetry
     from shared.telemetry.config import get_otel_config
     from shared.telemetry.core import is_telemetry_enabled, shutdown_telemetry
 
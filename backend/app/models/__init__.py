@@ -8,9 +8,10 @@ Models package
 Note: Import order matters for SQLAlchemy relationship resolution.
 Models with relationships should be imported after their related models.
 """
+
 from app.models.api_key import APIKey
 from app.models.kind import Kind
-from app.models.knowledge import KnowledgeDocument
+from app.models.knowledge import KnowledgeBaseStats, KnowledgeDocument
 from app.models.namespace import Namespace
 from app.models.namespace_member import NamespaceMember
 from app.models.pr_action_audit import PRActionAudit
@@ -21,6 +22,7 @@ from app.models.subtask import Subtask
 from app.models.subtask_context import SubtaskContext
 from app.models.system_config import SystemConfig
 from app.models.task import TaskResource
+from app.models.task_list_item import TaskListItem
 from app.models.task_member import TaskMember
 
 # Do NOT import Base here to avoid conflicts with app.db.base.Base
@@ -42,6 +44,8 @@ __all__ = [
     "NamespaceMember",
     "APIKey",
     "TaskMember",
+    "TaskListItem",
     "KnowledgeDocument",
+    "KnowledgeBaseStats",
     "PRActionAudit",
 ]
@@ -88,6 +88,11 @@ class KnowledgeDocument(Base):
         JSON, nullable=False, default={}
     )  # Source configuration (e.g., {"url": "..."} for table)
     summary = Column(JSON, nullable=True)  # Document summary information (JSON)
+    # Index statistics, maintained by DocumentService
+    # NULL if the document was indexed before statistics were recorded
+    chunk_count = Column(Integer, nullable=True)
+    token_count = Column(BigInteger, nullable=True)
+    text_bytes = Column(BigInteger, nullable=True)  # UTF-8 size of all chunk texts
     created_at = Column(DateTime, nullable=False, default=func.now())
     updated_at = Column(
         DateTime, nullable=False, default=func.now(), onupdate=func.now()
@@ -111,3 +116,36 @@ class KnowledgeDocument(Base):
             "comment": "Knowledge document table for file metadata",
         },
     )
+
+
+class KnowledgeBaseStats(Base):
+    """
+    Aggregated index statistics of a knowledge base.
+
+    Maintained incrementally from the per-document statistics whenever a
+    document is indexed or deleted, so the size of a knowledge base can be
+    read without scanning its documents or its vector store.
+    Note: kind_id references kinds.id (Kind='KnowledgeBase')
+    """
+
+    __tablename__ = "knowledge_base_stats"
+
+    kind_id = Column(Integer, primary_key=True, autoincrement=False)
+    document_count = Column(Integer, nullable=False, default=0)
+    chunk_count = Column(BigInteger, nullable=False, default=0)
+    token_count = Column(BigInteger, nullable=False, default=0)
+    text_bytes = Column(BigInteger, nullable=False, default=0)
+    # False while documents indexed before statistics existed are not counted
+    is_complete = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        {
+            "mysql_engine": "InnoDB",
+            "mysql_charset": "utf8mb4",
+            "mysql_collate": "utf8mb4_unicode_ci",
+            "comment": "Knowledge base index statistics",
+        },
+    )
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Task list projection model.
+
+Denormalized copy of the fields shown in the task sidebar, maintained on
+task, task member, team and workspace writes (see app.services.task_list_projection), so the
+list can be served by a single indexed query without parsing task JSON.
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
+
+from app.db.base import Base
+
+
+class TaskListItem(Base):
+    """One row per Task resource in the tasks table."""
+
+    __tablename__ = "task_list_items"
+
+    task_id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False, default=0, comment="Task owner")
+    title = Column(String(512), nullable=False, default="")
+    status = Column(String(50), nullable=False, default="PENDING")
+    type = Column(String(50), nullable=False, default="online")
+    task_type = Column(String(50), nullable=False, default="chat")
+    source = Column(String(100), nullable=False, default="")
+    # Task's teamRef and workspaceRef, kept to refresh team_id and git_repo
+    # when the referenced Team or Workspace changes
+    team_name = Column(String(100), nullable=False, default="")
+    team_namespace = Column(String(100), nullable=False, default="default")
+    workspace_name = Column(String(100), nullable=False, default="")
+    workspace_namespace = Column(String(100), nullable=False, default="default")
+    team_id = Column(Integer, nullable=True)
+    git_repo = Column(String(512), nullable=True)
+    is_group_chat = Column(Boolean, nullable=False, default=False)
+    # False for inactive, DELETE, system namespace and background tasks
+    is_visible = Column(Boolean, nullable=False, default=True)
+    # Sort key: tasks.created_at
+    created_at = Column(DateTime, nullable=False)
+    # Display timestamps from the task status (fall back to the task row)
+    status_created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_task_list_items_user_visible_created",
+            "user_id",
+            "is_visible",
+            "created_at",
+            "task_id",
+        ),
+        Index("ix_task_list_items_team_ref", "team_name", "team_namespace"),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
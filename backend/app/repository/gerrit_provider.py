@@ -5,6 +5,7 @@
 """
 Gerrit repository provider implementation
 """
+
 import asyncio
 import base64
 import hashlib
@@ -12,6 +13,7 @@ import logging
 import re
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
 from fastapi import HTTPException
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
@@ -19,9 +21,10 @@ from shared.utils.sensitive_data_masker import mask_string
 from shared.utils.url_util import build_url
 
 from app.core.cache import cache_manager
-from app.core.config import settings
 from app.models.user import User
+from app.repository.http_client import GitApiResponse, git_api_client
 from app.repository.interfaces.repository_provider import RepositoryProvider
+from app.repository.search_index import repository_search_index
 from app.schemas.github import Branch, Repository
 
 
@@ -186,9 +189,10 @@ class GerritProvider(RepositoryProvider):
         params: Dict[str, Any] = None,
         json_data: Dict[str, Any] = None,
         **kwargs,
-    ) -> requests.Response:
+    ) -> GitApiResponse:
         """
-        Async version of _make_request with HTTP Digest or Basic Authentication
+        Async version of _make_request with HTTP Digest or Basic Authentication,
+        sent through the shared async git API client
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -198,21 +202,23 @@ class GerritProvider(RepositoryProvider):
             auth_type: Authentication type ('digest' or 'basic'), defaults to 'digest'
             params: Query parameters
             json_data: JSON payload
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments for GitApiClient.request
 
         Returns:
             Response object
+
+        Raises:
+            requests.exceptions.RequestException: If request fails
         """
         # Select authentication method based on auth_type
         if auth_type == "basic":
-            auth = HTTPBasicAuth(username, http_password)
+            auth = httpx.BasicAuth(username, http_password)
         else:
-            auth = HTTPDigestAuth(username, http_password)
+            auth = httpx.DigestAuth(username, http_password)
 
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
-        response = await asyncio.to_thread(
-            requests.request,
+        response = await git_api_client.request(
             method,
             url,
             auth=auth,
@@ -283,7 +289,7 @@ class GerritProvider(RepositoryProvider):
             try:
                 # Gerrit API: List projects
                 # GET /projects/?d to list all projects with descriptions
-                response = self._make_request(
+                response = await self._make_request_async(
                     method="GET",
                     url=f"{api_base_url}/projects/",
                     username=user_name,
@@ -327,10 +333,7 @@ class GerritProvider(RepositoryProvider):
                 repos.sort(key=lambda x: x["full_name"])
 
                 # Cache if all projects are retrieved (Gerrit returns all in one call)
-                cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-                await cache_manager.set(
-                    cache_key, repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-                )
+                await repository_search_index.store(user.id, git_domain, repos)
 
                 # Apply pagination
                 start_idx = (page - 1) * limit
@@ -395,14 +398,19 @@ class GerritProvider(RepositoryProvider):
             # URL encode project name (replace / with %2F)
             encoded_project = requests.utils.quote(repo_name, safe="")
 
-            # Get branches from Gerrit API
+            # Get branches from Gerrit API and the default branch (HEAD ref)
             # GET /projects/{project-name}/branches/
-            response = self._make_request(
-                method="GET",
-                url=f"{api_base_url}/projects/{encoded_project}/branches/",
-                username=user_name,
-                http_password=git_token,
-                auth_type=auth_type,
+            response, default_branch_name = await asyncio.gather(
+                self._make_request_async(
+                    method="GET",
+                    url=f"{api_base_url}/projects/{encoded_project}/branches/",
+                    username=user_name,
+                    http_password=git_token,
+                    auth_type=auth_type,
+                ),
+                self._get_default_branch(
+                    repo_name, git_domain, user_name, git_token, auth_type
+                ),
             )
 
             # Parse response and strip XSSI prefix
@@ -413,11 +421,6 @@ class GerritProvider(RepositoryProvider):
                 else []
             )
 
-            # Get default branch (HEAD ref)
-            default_branch_name = self._get_default_branch(
-                repo_name, git_domain, user_name, git_token, auth_type
-            )
-
             branches = []
             for branch in branches_data:
                 branch_name = branch.get("ref", "").replace("refs/heads/", "")
@@ -436,7 +439,7 @@ class GerritProvider(RepositoryProvider):
             self.logger.error(f"Failed to get branches for {repo_name}: {str(e)}")
             raise HTTPException(status_code=502, detail=f"Gerrit API error: {str(e)}")
 
-    def _get_default_branch(
+    async def _get_default_branch(
         self,
         repo_name: str,
         git_domain: str,
@@ -462,7 +465,7 @@ class GerritProvider(RepositoryProvider):
 
         try:
             # Get HEAD reference
-            response = self._make_request(
+            response = await self._make_request_async(
                 method="GET",
                 url=f"{api_base_url}/projects/{encoded_project}/HEAD",
                 username=user_name,
@@ -583,9 +586,6 @@ class GerritProvider(RepositoryProvider):
         Raises:
             HTTPException: Raised when search fails
         """
-        # Normalize query, case-insensitive
-        query_lower = query.lower()
-
         # Iterate all gerrit entries for this user (may be multiple domains)
         entries = self._get_git_infos(user)
         all_results: List[Dict[str, Any]] = []
@@ -601,22 +601,10 @@ class GerritProvider(RepositoryProvider):
                 continue
 
             # 1) Try to get from full cache first (per domain)
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -634,36 +622,20 @@ class GerritProvider(RepositoryProvider):
                 continue
 
             # 2) If cache is being built for this domain, wait (with timeout)
-            is_building = await cache_manager.is_building(user.id, git_domain)
-            if is_building:
-                start_time = asyncio.get_event_loop().time()
-                while await cache_manager.is_building(user.id, git_domain):
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        raise HTTPException(
-                            status_code=408,
-                            detail="Timeout waiting for repository data to be ready",
-                        )
-                    await asyncio.sleep(1)
+            if await cache_manager.is_building(user.id, git_domain):
+                if not await cache_manager.wait_until_built(
+                    user.id, git_domain, timeout
+                ):
+                    raise HTTPException(
+                        status_code=408,
+                        detail="Timeout waiting for repository data to be ready",
+                    )
 
                 # Try cache again
-                full_cached = await self._get_all_repositories_from_cache(
-                    user, git_domain
+                filtered_repos = await repository_search_index.search(
+                    user.id, git_domain, query, fullmatch
                 )
-                if full_cached:
-                    if fullmatch:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower == repo["name"].lower()
-                            or query_lower == repo["full_name"].lower()
-                        ]
-                    else:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower in repo["name"].lower()
-                            or query_lower in repo["full_name"].lower()
-                        ]
+                if filtered_repos is not None:
                     all_results.extend(
                         [
                             Repository(
@@ -686,22 +658,10 @@ class GerritProvider(RepositoryProvider):
             )
 
             # 4) Try cache after building
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -789,10 +749,7 @@ class GerritProvider(RepositoryProvider):
             all_repos.sort(key=lambda x: x["full_name"])
 
             # Cache complete repository list
-            cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-            await cache_manager.set(
-                cache_key, all_repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-            )
+            await repository_search_index.store(user.id, git_domain, all_repos)
             self.logger.info(
                 f"Cache complete repository list for user gerrit {user.user_name}"
             )
@@ -973,7 +930,7 @@ class GerritProvider(RepositoryProvider):
             if topic:
                 change_input["topic"] = topic
 
-            response = self._make_request(
+            response = await self._make_request_async(
                 method="POST",
                 url=f"{api_base_url}/changes/",
                 username=user_name,
@@ -5,9 +5,9 @@
 """
 Gitea repository provider implementation
 """
+
 import asyncio
 import logging
-from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -16,9 +16,10 @@ from shared.utils.sensitive_data_masker import mask_string
 from shared.utils.url_util import build_url
 
 from app.core.cache import cache_manager
-from app.core.config import settings
 from app.models.user import User
+from app.repository.http_client import fetch_all_pages, git_api_client
 from app.repository.interfaces.repository_provider import RepositoryProvider
+from app.repository.search_index import filter_repositories, repository_search_index
 from app.schemas.github import Branch, Repository
 
 
@@ -157,7 +158,7 @@ class GiteaProvider(RepositoryProvider):
 
             try:
                 headers = self._build_headers(git_token)
-                response = requests.get(
+                response = await git_api_client.get(
                     f"{api_base_url}/user/repos",
                     headers=headers,
                     params={"limit": limit, "page": page, "sort": "updated"},
@@ -194,13 +195,8 @@ class GiteaProvider(RepositoryProvider):
                     has_more = len(mapped_repos) >= limit
 
                 if not has_more:
-                    cache_key = cache_manager.generate_full_cache_key(
-                        user.id, git_domain
-                    )
-                    await cache_manager.set(
-                        cache_key,
-                        mapped_repos,
-                        expire=settings.REPO_CACHE_EXPIRED_TIME,
+                    await repository_search_index.store(
+                        user.id, git_domain, mapped_repos
                     )
                 else:
                     asyncio.create_task(
@@ -255,31 +251,20 @@ class GiteaProvider(RepositoryProvider):
         try:
             headers = self._build_headers(git_token)
 
-            default_branch_name = self._get_default_branch(
-                repo_name, git_domain, git_token
-            )
-
-            all_branches = []
-            page = 1
             per_page = 100
 
-            while True:
-                response = requests.get(
-                    f"{api_base_url}/repos/{repo_name}/branches",
-                    headers=headers,
-                    params={"limit": per_page, "page": page},
-                )
-                response.raise_for_status()
-
-                branches = response.json()
-                if not branches:
-                    break
-
-                all_branches.extend(branches)
-                page += 1
-
-                if page > 50:
-                    break
+            default_branch_name, all_branches = await asyncio.gather(
+                self._get_default_branch(repo_name, git_domain, git_token),
+                fetch_all_pages(
+                    lambda page: git_api_client.get(
+                        f"{api_base_url}/repos/{repo_name}/branches",
+                        headers=headers,
+                        params={"limit": per_page, "page": page},
+                    ),
+                    per_page=per_page,
+                    max_pages=50,
+                ),
+            )
 
             return [
                 Branch(
@@ -293,15 +278,14 @@ class GiteaProvider(RepositoryProvider):
         except requests.exceptions.RequestException as e:
             raise HTTPException(status_code=502, detail=f"Gitea API error: {str(e)}")
 
-    @lru_cache(maxsize=100)
-    def _get_default_branch(
+    async def _get_default_branch(
         self, repo_name: str, git_domain: str, git_token: str
     ) -> str:
         api_base_url = self._get_api_base_url(git_domain)
         headers = self._build_headers(git_token)
 
         try:
-            response = requests.get(
+            response = await git_api_client.get(
                 f"{api_base_url}/repos/{repo_name}", headers=headers
             )
             response.raise_for_status()
@@ -395,8 +379,6 @@ class GiteaProvider(RepositoryProvider):
         Raises:
             HTTPException: Raised when search fails
         """
-        query_lower = query.lower()
-
         entries = self._get_git_infos(user)
         all_results: List[Dict[str, Any]] = []
 
@@ -406,22 +388,10 @@ class GiteaProvider(RepositoryProvider):
             if not git_token:
                 continue
 
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -438,35 +408,19 @@ class GiteaProvider(RepositoryProvider):
                 )
                 continue
 
-            is_building = await cache_manager.is_building(user.id, git_domain)
-            if is_building:
-                start_time = asyncio.get_event_loop().time()
-                while await cache_manager.is_building(user.id, git_domain):
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        raise HTTPException(
-                            status_code=408,
-                            detail="Timeout waiting for repository data to be ready",
-                        )
-                    await asyncio.sleep(1)
-
-                full_cached = await self._get_all_repositories_from_cache(
-                    user, git_domain
+            if await cache_manager.is_building(user.id, git_domain):
+                if not await cache_manager.wait_until_built(
+                    user.id, git_domain, timeout
+                ):
+                    raise HTTPException(
+                        status_code=408,
+                        detail="Timeout waiting for repository data to be ready",
+                    )
+
+                filtered_repos = await repository_search_index.search(
+                    user.id, git_domain, query, fullmatch
                 )
-                if full_cached:
-                    if fullmatch:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower == repo["name"].lower()
-                            or query_lower == repo["full_name"].lower()
-                        ]
-                    else:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower in repo["name"].lower()
-                            or query_lower in repo["full_name"].lower()
-                        ]
+                if filtered_repos is not None:
                     all_results.extend(
                         [
                             Repository(
@@ -485,22 +439,10 @@ class GiteaProvider(RepositoryProvider):
 
             await self._fetch_all_repositories_async(user, git_token, git_domain)
 
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -520,7 +462,7 @@ class GiteaProvider(RepositoryProvider):
             try:
                 api_base_url = self._get_api_base_url(git_domain)
                 headers = self._build_headers(git_token)
-                response = requests.get(
+                response = await git_api_client.get(
                     f"{api_base_url}/user/repos",
                     headers=headers,
                     params={"limit": 100, "page": 1, "sort": "updated"},
@@ -539,20 +481,7 @@ class GiteaProvider(RepositoryProvider):
                     }
                     for repo in repos
                 ]
-                if fullmatch:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower == r["name"].lower()
-                        or query_lower == r["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower in r["name"].lower()
-                        or query_lower in r["full_name"].lower()
-                    ]
+                filtered_repos = filter_repositories(mapped, query, fullmatch)
                 all_results.extend(
                     [
                         Repository(
@@ -593,8 +522,6 @@ class GiteaProvider(RepositoryProvider):
             api_base_url = self._get_api_base_url(git_domain)
             headers = self._build_headers(git_token)
 
-            all_repos = []
-            page = 1
             # Gitea servers may have MAX_RESPONSE_ITEMS configured (default 50)
             # We request 50 to be safe and rely on pagination
             per_page = 50
@@ -603,61 +530,32 @@ class GiteaProvider(RepositoryProvider):
                 f"Fetching gitea all repositories for user {user.user_name}"
             )
 
-            while True:
-                response = await asyncio.to_thread(
-                    requests.get,
+            # The number of pages follows from the X-Total-Count header; without
+            # (or with a malformed) header pages are read until a short page
+            repos = await fetch_all_pages(
+                lambda page: git_api_client.get(
                     f"{api_base_url}/user/repos",
                     headers=headers,
                     params={"limit": per_page, "page": page, "sort": "updated"},
-                )
-                response.raise_for_status()
-
-                repos = response.json()
-                if not repos:
-                    break
-
-                mapped_repos = [
-                    {
-                        "id": repo["id"],
-                        "name": repo["name"],
-                        "full_name": repo.get("full_name", repo.get("name", "")),
-                        "clone_url": repo.get("clone_url") or repo.get("html_url", ""),
-                        "git_domain": git_domain,
-                        "type": self.type,
-                        "private": repo.get("private", False),
-                    }
-                    for repo in repos
-                ]
-                all_repos.extend(mapped_repos)
+                ),
+                per_page=per_page,
+                max_pages=100,
+            )
 
-                # Check if there are more pages using X-Total-Count header
-                # or fall back to checking if we got fewer items than requested
-                total_count = response.headers.get("X-Total-Count")
-                if total_count:
-                    try:
-                        total = int(total_count)
-                        if len(all_repos) >= total:
-                            break
-                    except (ValueError, TypeError):
-                        # Malformed header, fall back to checking response size
-                        if len(repos) < per_page:
-                            break
-                elif len(repos) < per_page:
-                    # No header available, fall back to old logic
-                    break
-
-                page += 1
-
-                if page > 100:
-                    self.logger.warning(
-                        f"Reached maximum page limit (100) for user {user.id}"
-                    )
-                    break
+            all_repos = [
+                {
+                    "id": repo["id"],
+                    "name": repo["name"],
+                    "full_name": repo.get("full_name", repo.get("name", "")),
+                    "clone_url": repo.get("clone_url") or repo.get("html_url", ""),
+                    "git_domain": git_domain,
+                    "type": self.type,
+                    "private": repo.get("private", False),
+                }
+                for repo in repos
+            ]
 
-            cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-            await cache_manager.set(
-                cache_key, all_repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-            )
+            await repository_search_index.store(user.id, git_domain, all_repos)
             self.logger.info(
                 f"Cache complete repository list for user gitea {user.user_name}"
             )
@@ -725,7 +623,7 @@ class GiteaProvider(RepositoryProvider):
             self.logger.info(
                 f"Comparing {repo_name}: {target_branch}...{source_branch}"
             )
-            response = requests.get(
+            response = await git_api_client.get(
                 f"{api_base_url}/repos/{repo_name}/compare/{target_branch}...{source_branch}",
                 headers=headers,
             )
@@ -5,9 +5,9 @@
 """
 Gitee repository provider implementation
 """
+
 import asyncio
 import logging
-from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -16,9 +16,10 @@ from shared.utils.sensitive_data_masker import mask_string
 from shared.utils.url_util import build_url
 
 from app.core.cache import cache_manager
-from app.core.config import settings
 from app.models.user import User
+from app.repository.http_client import fetch_all_pages, git_api_client
 from app.repository.interfaces.repository_provider import RepositoryProvider
+from app.repository.search_index import filter_repositories, repository_search_index
 from app.schemas.github import Branch, Repository
 
 
@@ -154,7 +155,7 @@ class GiteeProvider(RepositoryProvider):
 
             try:
                 # Gitee uses access_token as query parameter
-                response = requests.get(
+                response = await git_api_client.get(
                     f"{api_base_url}/user/repos",
                     params={
                         "access_token": git_token,
@@ -169,12 +170,7 @@ class GiteeProvider(RepositoryProvider):
                 repos = response.json()
 
                 if len(repos) < limit:
-                    cache_key = cache_manager.generate_full_cache_key(
-                        user.id, git_domain
-                    )
-                    await cache_manager.set(
-                        cache_key, repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-                    )
+                    await repository_search_index.store(user.id, git_domain, repos)
                 else:
                     asyncio.create_task(
                         self._fetch_all_repositories_async(user, git_token, git_domain)
@@ -228,36 +224,25 @@ class GiteeProvider(RepositoryProvider):
         api_base_url = self._get_api_base_url(git_domain)
 
         try:
-            # Get the actual default branch name
-            default_branch_name = self._get_default_branch(
-                repo_name, git_domain, git_token
-            )
-
-            all_branches = []
-            page = 1
             per_page = 100
 
-            while True:
-                response = requests.get(
-                    f"{api_base_url}/repos/{repo_name}/branches",
-                    params={
-                        "access_token": git_token,
-                        "per_page": per_page,
-                        "page": page,
-                    },
-                )
-                response.raise_for_status()
-
-                branches = response.json()
-                if not branches:
-                    break
-
-                all_branches.extend(branches)
-                page += 1
-
-                # Prevent infinite loop, set maximum page limit
-                if page > 50:  # Maximum 5000 branches
-                    break
+            # Get the actual default branch name while the pages are fetched
+            # (maximum 50 pages, i.e. 5000 branches)
+            default_branch_name, all_branches = await asyncio.gather(
+                self._get_default_branch(repo_name, git_domain, git_token),
+                fetch_all_pages(
+                    lambda page: git_api_client.get(
+                        f"{api_base_url}/repos/{repo_name}/branches",
+                        params={
+                            "access_token": git_token,
+                            "per_page": per_page,
+                            "page": page,
+                        },
+                    ),
+                    per_page=per_page,
+                    max_pages=50,
+                ),
+            )
 
             return [
                 Branch(
@@ -271,14 +256,13 @@ class GiteeProvider(RepositoryProvider):
         except requests.exceptions.RequestException as e:
             raise HTTPException(status_code=502, detail=f"Gitee API error: {str(e)}")
 
-    @lru_cache(maxsize=100)
-    def _get_default_branch(
+    async def _get_default_branch(
         self, repo_name: str, git_domain: str, git_token: str
     ) -> str:
         api_base_url = self._get_api_base_url(git_domain)
 
         try:
-            response = requests.get(
+            response = await git_api_client.get(
                 f"{api_base_url}/repos/{repo_name}", params={"access_token": git_token}
             )
             response.raise_for_status()
@@ -373,9 +357,6 @@ class GiteeProvider(RepositoryProvider):
         Raises:
             HTTPException: Raised when search fails
         """
-        # Normalize query, case-insensitive
-        query_lower = query.lower()
-
         # Iterate all gitee entries for this user (may be multiple domains)
         entries = self._get_git_infos(user)
         all_results: List[Dict[str, Any]] = []
@@ -388,22 +369,10 @@ class GiteeProvider(RepositoryProvider):
                 continue
 
             # 1) Try to get from full cache first (per domain)
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -421,36 +390,20 @@ class GiteeProvider(RepositoryProvider):
                 continue
 
             # 2) If cache is being built for this domain, wait (with timeout)
-            is_building = await cache_manager.is_building(user.id, git_domain)
-            if is_building:
-                start_time = asyncio.get_event_loop().time()
-                while await cache_manager.is_building(user.id, git_domain):
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        raise HTTPException(
-                            status_code=408,
-                            detail="Timeout waiting for repository data to be ready",
-                        )
-                    await asyncio.sleep(1)
+            if await cache_manager.is_building(user.id, git_domain):
+                if not await cache_manager.wait_until_built(
+                    user.id, git_domain, timeout
+                ):
+                    raise HTTPException(
+                        status_code=408,
+                        detail="Timeout waiting for repository data to be ready",
+                    )
 
                 # try cache again
-                full_cached = await self._get_all_repositories_from_cache(
-                    user, git_domain
+                filtered_repos = await repository_search_index.search(
+                    user.id, git_domain, query, fullmatch
                 )
-                if full_cached:
-                    if fullmatch:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower == repo["name"].lower()
-                            or query_lower == repo["full_name"].lower()
-                        ]
-                    else:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower in repo["name"].lower()
-                            or query_lower in repo["full_name"].lower()
-                        ]
+                if filtered_repos is not None:
                     all_results.extend(
                         [
                             Repository(
@@ -471,22 +424,10 @@ class GiteeProvider(RepositoryProvider):
             await self._fetch_all_repositories_async(user, git_token, git_domain)
 
             # 4) Try cache after building
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -506,7 +447,7 @@ class GiteeProvider(RepositoryProvider):
             # 5) Fallback: fetch first page for this domain only (avoid cross-domain aggregation)
             try:
                 api_base_url = self._get_api_base_url(git_domain)
-                response = requests.get(
+                response = await git_api_client.get(
                     f"{api_base_url}/user/repos",
                     params={
                         "access_token": git_token,
@@ -530,20 +471,7 @@ class GiteeProvider(RepositoryProvider):
                     }
                     for repo in repos
                 ]
-                if fullmatch:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower == r["name"].lower()
-                        or query_lower == r["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower in r["name"].lower()
-                        or query_lower in r["full_name"].lower()
-                    ]
+                filtered_repos = filter_repositories(mapped, query, fullmatch)
                 all_results.extend(
                     [
                         Repository(
@@ -586,17 +514,15 @@ class GiteeProvider(RepositoryProvider):
             # Get API base URL based on git domain
             api_base_url = self._get_api_base_url(git_domain)
 
-            all_repos = []
-            page = 1
             per_page = 100
 
             self.logger.info(
                 f"Fetching gitee all repositories for user {user.user_name}"
             )
 
-            while True:
-                response = await asyncio.to_thread(
-                    requests.get,
+            # Maximum 50 pages, i.e. 5000 repositories
+            repos = await fetch_all_pages(
+                lambda page: git_api_client.get(
                     f"{api_base_url}/user/repos",
                     params={
                         "access_token": git_token,
@@ -605,46 +531,27 @@ class GiteeProvider(RepositoryProvider):
                         "sort": "updated",
                         "affiliation": "owner,collaborator",
                     },
-                )
-                response.raise_for_status()
-
-                repos = response.json()
-                if not repos:
-                    break
-
-                # Map Gitee API response to standard format
-                mapped_repos = [
-                    {
-                        "id": repo["id"],
-                        "name": repo["name"],
-                        "full_name": repo["full_name"],
-                        "clone_url": repo.get("html_url", ""),
-                        "git_domain": git_domain,
-                        "type": "gitee",
-                        "private": repo.get("private", False),
-                    }
-                    for repo in repos
-                ]
-                all_repos.extend(mapped_repos)
-
-                # If the number of retrieved repos is less than per_page, we've reached the end
-                if len(repos) < per_page:
-                    break
-
-                page += 1
+                ),
+                per_page=per_page,
+                max_pages=50,
+            )
 
-                # Prevent infinite loop, set maximum page limit
-                if page > 50:  # Maximum 5000 repositories
-                    self.logger.warning(
-                        f"Reached maximum page limit (50) for user {user.id}"
-                    )
-                    break
+            # Map Gitee API response to standard format
+            all_repos = [
+                {
+                    "id": repo["id"],
+                    "name": repo["name"],
+                    "full_name": repo["full_name"],
+                    "clone_url": repo.get("html_url", ""),
+                    "git_domain": git_domain,
+                    "type": "gitee",
+                    "private": repo.get("private", False),
+                }
+                for repo in repos
+            ]
 
             # Cache complete repository list
-            cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-            await cache_manager.set(
-                cache_key, all_repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-            )
+            await repository_search_index.store(user.id, git_domain, all_repos)
             self.logger.info(
                 f"Cache complete repository list for user gitee {user.user_name}"
             )
@@ -716,7 +623,7 @@ class GiteeProvider(RepositoryProvider):
             self.logger.info(
                 f"Comparing {repo_name}: {target_branch}...{source_branch}"
             )
-            response = requests.get(
+            response = await git_api_client.get(
                 f"{api_base_url}/repos/{repo_name}/compare/{target_branch}...{source_branch}",
                 params={"access_token": git_token},
             )
@@ -5,6 +5,7 @@
 """
 GitLab repository provider implementation
 """
+
 import asyncio
 import logging
 from typing import Any, Dict, List, Optional
@@ -14,9 +15,10 @@ from fastapi import HTTPException
 from shared.utils.url_util import build_url
 
 from app.core.cache import cache_manager
-from app.core.config import settings
 from app.models.user import User
+from app.repository.http_client import GitApiResponse, fetch_all_pages, git_api_client
 from app.repository.interfaces.repository_provider import RepositoryProvider
+from app.repository.search_index import filter_repositories, repository_search_index
 from app.schemas.github import Branch, Repository
 
 
@@ -145,17 +147,18 @@ class GitLabProvider(RepositoryProvider):
 
     async def _make_request_with_auth_retry_async(
         self, method: str, url: str, token: str, params: Dict[str, Any] = None, **kwargs
-    ) -> requests.Response:
+    ) -> GitApiResponse:
         """
         Async version of _make_request_with_auth_retry.
-        Make HTTP request with authentication retry logic in async context.
+        Make HTTP request with authentication retry logic through the shared
+        async git API client.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL
             token: GitLab token
             params: Query parameters
-            **kwargs: Additional arguments for requests
+            **kwargs: Additional arguments for GitApiClient.request
 
         Returns:
             Response object
@@ -166,25 +169,19 @@ class GitLabProvider(RepositoryProvider):
         # Try Bearer token first (for OAuth tokens)
         headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
 
-        try:
-            response = await asyncio.to_thread(
-                requests.request, method, url, headers=headers, params=params, **kwargs
-            )
-            if response.status_code != 401:
-                response.raise_for_status()
-                return response
-        except requests.exceptions.RequestException as e:
-            if not (
-                hasattr(e, "response") and e.response and e.response.status_code == 401
-            ):
-                raise
+        response = await git_api_client.request(
+            method, url, headers=headers, params=params, **kwargs
+        )
+        if response.status_code != 401:
+            response.raise_for_status()
+            return response
 
         # If 401, retry with Private-Token (for Personal Access Tokens)
         self.logger.info(f"Bearer auth failed with 401, retrying with Private-Token")
         headers = {"Private-Token": token, "Accept": "application/json"}
 
-        response = await asyncio.to_thread(
-            requests.request, method, url, headers=headers, params=params, **kwargs
+        response = await git_api_client.request(
+            method, url, headers=headers, params=params, **kwargs
         )
         response.raise_for_status()
         return response
@@ -243,7 +240,7 @@ class GitLabProvider(RepositoryProvider):
                 continue
 
             try:
-                response = self._make_request_with_auth_retry(
+                response = await self._make_request_with_auth_retry_async(
                     method="GET",
                     url=f"{api_base_url}/projects",
                     token=git_token,
@@ -274,12 +271,7 @@ class GitLabProvider(RepositoryProvider):
 
                 # domain-level caching
                 if len(all_repos) < limit:
-                    cache_key = cache_manager.generate_full_cache_key(
-                        user.id, git_domain
-                    )
-                    await cache_manager.set(
-                        cache_key, all_repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-                    )
+                    await repository_search_index.store(user.id, git_domain, all_repos)
                 else:
                     asyncio.create_task(
                         self._fetch_all_repositories_async(user, git_token, git_domain)
@@ -321,28 +313,19 @@ class GitLabProvider(RepositoryProvider):
             # First, get the project ID from the repo name
             encoded_repo_name = repo_name.replace("/", "%2F")
 
-            all_branches = []
-            page = 1
             per_page = 100
 
-            while True:
-                response = self._make_request_with_auth_retry(
+            # Maximum 50 pages, i.e. 5000 branches
+            all_branches = await fetch_all_pages(
+                lambda page: self._make_request_with_auth_retry_async(
                     method="GET",
                     url=f"{api_base_url}/projects/{encoded_repo_name}/repository/branches",
                     token=git_token,
                     params={"per_page": per_page, "page": page},
-                )
-
-                branches = response.json()
-                if not branches:
-                    break
-
-                all_branches.extend(branches)
-                page += 1
-
-                # Prevent infinite loop, set maximum page limit
-                if page > 50:  # Maximum 5000 branches
-                    break
+                ),
+                per_page=per_page,
+                max_pages=50,
+            )
 
             return [
                 Branch(
@@ -440,9 +423,6 @@ class GitLabProvider(RepositoryProvider):
         Raises:
             HTTPException: Raised when search fails
         """
-        # Normalize query, case-insensitive
-        query_lower = query.lower()
-
         # Iterate all gitlab entries for this user (may be multiple domains)
         entries = self._get_git_infos(user)
         all_results: List[Dict[str, Any]] = []
@@ -455,22 +435,10 @@ class GitLabProvider(RepositoryProvider):
                 continue
 
             # 1) Try to get from full cache first (per domain)
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -488,36 +456,20 @@ class GitLabProvider(RepositoryProvider):
                 continue
 
             # 2) If cache is being built for this domain, wait (with timeout)
-            is_building = await cache_manager.is_building(user.id, git_domain)
-            if is_building:
-                start_time = asyncio.get_event_loop().time()
-                while await cache_manager.is_building(user.id, git_domain):
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        raise HTTPException(
-                            status_code=408,
-                            detail="Timeout waiting for repository data to be ready",
-                        )
-                    await asyncio.sleep(1)
+            if await cache_manager.is_building(user.id, git_domain):
+                if not await cache_manager.wait_until_built(
+                    user.id, git_domain, timeout
+                ):
+                    raise HTTPException(
+                        status_code=408,
+                        detail="Timeout waiting for repository data to be ready",
+                    )
 
                 # try cache again
-                full_cached = await self._get_all_repositories_from_cache(
-                    user, git_domain
+                filtered_repos = await repository_search_index.search(
+                    user.id, git_domain, query, fullmatch
                 )
-                if full_cached:
-                    if fullmatch:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower == repo["name"].lower()
-                            or query_lower == repo["full_name"].lower()
-                        ]
-                    else:
-                        filtered_repos = [
-                            repo
-                            for repo in full_cached
-                            if query_lower in repo["name"].lower()
-                            or query_lower in repo["full_name"].lower()
-                        ]
+                if filtered_repos is not None:
                     all_results.extend(
                         [
                             Repository(
@@ -538,22 +490,10 @@ class GitLabProvider(RepositoryProvider):
             await self._fetch_all_repositories_async(user, git_token, git_domain)
 
             # 4) Try cache after building
-            full_cached = await self._get_all_repositories_from_cache(user, git_domain)
-            if full_cached:
-                if fullmatch:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower == repo["name"].lower()
-                        or query_lower == repo["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        repo
-                        for repo in full_cached
-                        if query_lower in repo["name"].lower()
-                        or query_lower in repo["full_name"].lower()
-                    ]
+            filtered_repos = await repository_search_index.search(
+                user.id, git_domain, query, fullmatch
+            )
+            if filtered_repos is not None:
                 all_results.extend(
                     [
                         Repository(
@@ -573,7 +513,7 @@ class GitLabProvider(RepositoryProvider):
             # 5) Fallback: fetch first page for this domain only (avoid cross-domain aggregation)
             try:
                 api_base_url = self._get_api_base_url(git_domain)
-                response = self._make_request_with_auth_retry(
+                response = await self._make_request_with_auth_retry_async(
                     method="GET",
                     url=f"{api_base_url}/projects",
                     token=git_token,
@@ -597,20 +537,7 @@ class GitLabProvider(RepositoryProvider):
                     }
                     for repo in repos
                 ]
-                if fullmatch:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower == r["name"].lower()
-                        or query_lower == r["full_name"].lower()
-                    ]
-                else:
-                    filtered_repos = [
-                        r
-                        for r in mapped
-                        if query_lower in r["name"].lower()
-                        or query_lower in r["full_name"].lower()
-                    ]
+                filtered_repos = filter_repositories(mapped, query, fullmatch)
                 all_results.extend(
                     [
                         Repository(
@@ -652,16 +579,16 @@ class GitLabProvider(RepositoryProvider):
             # Get API base URL based on git domain
             api_base_url = self._get_api_base_url(git_domain)
 
-            all_repos = []
-            page = 1
             per_page = 100
 
             self.logger.info(
                 f"Fetching gitlab all repositories for user {user.user_name}"
             )
 
-            while True:
-                response = await self._make_request_with_auth_retry_async(
+            # Maximum 50 pages, i.e. 5000 repositories; GitLab announces the
+            # number of pages in X-Total-Pages so they are fetched concurrently
+            repos = await fetch_all_pages(
+                lambda page: self._make_request_with_auth_retry_async(
                     method="GET",
                     url=f"{api_base_url}/projects",
                     token=git_token,
@@ -671,45 +598,27 @@ class GitLabProvider(RepositoryProvider):
                         "order_by": "last_activity_at",
                         "membership": "true",
                     },
-                )
-
-                repos = response.json()
-                if not repos:
-                    break
-
-                # Map GitLab API response to standard format
-                mapped_repos = [
-                    {
-                        "id": repo["id"],
-                        "name": repo["name"],
-                        "full_name": repo["path_with_namespace"],
-                        "clone_url": repo["http_url_to_repo"],
-                        "git_domain": git_domain,
-                        "type": "gitlab",
-                        "private": repo["visibility"] == "private",
-                    }
-                    for repo in repos
-                ]
-                all_repos.extend(mapped_repos)
-
-                # If the number of retrieved repos is less than per_page, we've reached the end
-                if len(repos) < per_page:
-                    break
-
-                page += 1
+                ),
+                per_page=per_page,
+                max_pages=50,
+            )
 
-                # Prevent infinite loop, set maximum page limit
-                if page > 50:  # Maximum 5000 repositories
-                    self.logger.warning(
-                        f"Reached maximum page limit (50) for user {user.id}"
-                    )
-                    break
+            # Map GitLab API response to standard format
+            all_repos = [
+                {
+                    "id": repo["id"],
+                    "name": repo["name"],
+                    "full_name": repo["path_with_namespace"],
+                    "clone_url": repo["http_url_to_repo"],
+                    "git_domain": git_domain,
+                    "type": "gitlab",
+                    "private": repo["visibility"] == "private",
+                }
+                for repo in repos
+            ]
 
             # Cache complete repository list
-            cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-            await cache_manager.set(
-                cache_key, all_repos, expire=settings.REPO_CACHE_EXPIRED_TIME
-            )
+            await repository_search_index.store(user.id, git_domain, all_repos)
             self.logger.info(
                 f"Cache complete repository list for user gitlab {user.user_name}"
             )
@@ -778,7 +687,7 @@ class GitLabProvider(RepositoryProvider):
         try:
             # Get repository ID first (GitLab API uses project ID)
             encoded_repo_name = requests.utils.quote(repo_name, safe="")
-            repo_response = self._make_request_with_auth_retry(
+            repo_response = await self._make_request_with_auth_retry_async(
                 method="GET",
                 url=f"{api_base_url}/projects/{encoded_repo_name}",
                 token=git_token,
@@ -787,7 +696,7 @@ class GitLabProvider(RepositoryProvider):
             project_id = repo_data["id"]
 
             # Get compare API response
-            response = self._make_request_with_auth_retry(
+            response = await self._make_request_with_auth_retry_async(
                 method="GET",
                 url=f"{api_base_url}/projects/{project_id}/repository/compare",
                 token=git_token,
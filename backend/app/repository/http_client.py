@@ -0,0 +1,419 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Shared async HTTP client of the git repository providers.
+
+All providers send their API requests through one pooled httpx.AsyncClient
+(per event loop) instead of blocking requests calls:
+
+- GET responses carrying an ETag or Last-Modified header are cached in Redis
+  and revalidated with If-None-Match/If-Modified-Since. A 304 answer is
+  served from the cache and, on GitHub, does not count against the rate
+  limit. Entries are keyed by URL, query and request headers (which include
+  the token), so they are never shared between credentials. Requests using
+  an auth object (Gerrit digest/basic auth) are not cached.
+- Rate limited responses (429, or 403 with an exhausted rate limit) are
+  retried after Retry-After/X-RateLimit-Reset, or with exponential backoff.
+- fetch_all_pages() fetches the remaining pages of a list concurrently once
+  the first page reveals how many there are.
+
+Responses mimic requests.Response (status_code, headers, text, json(),
+raise_for_status()) and errors are raised as requests exceptions, so the
+providers' existing error handling applies unchanged.
+"""
+
+import asyncio
+import email.utils
+import hashlib
+import logging
+import math
+import time
+import weakref
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import orjson
+import requests
+
+from app.core.cache import cache_manager
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers revealing the number of pages of a list endpoint
+_TOTAL_PAGES_HEADERS = ("X-Total-Pages", "total_page")  # GitLab, Gitee
+_TOTAL_COUNT_HEADERS = ("X-Total-Count", "X-Total", "total_count")
+
+
+class GitApiResponse:
+    """Response of a git provider API request (requests.Response compatible)."""
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Any,
+        content: bytes,
+        url: str,
+        from_cache: bool = False,
+    ):
+        self.status_code = status_code
+        self.headers = httpx.Headers(headers)
+        self.content = content
+        self.url = url
+        self.from_cache = from_cache
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return orjson.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise requests.exceptions.HTTPError for 4xx/5xx responses."""
+        if self.status_code >= 400:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error for url: {self.url}",
+                response=self,
+            )
+
+
+def total_pages(headers: Any, page_size: int) -> Optional[int]:
+    """
+    Number of pages of a list endpoint as announced by its response headers
+
+    Understands Link rel="last" (GitHub, Gitea), total page headers (GitLab,
+    Gitee) and total item counts (Gitea, GitLab, Gitee).
+
+    Args:
+        headers: Response headers of the first page
+        page_size: Number of items the server returned on the first page
+
+    Returns:
+        Number of pages, or None if the headers do not reveal it
+    """
+    headers = httpx.Headers(headers)
+
+    link = headers.get("Link")
+    if link:
+        for part in link.split(","):
+            if 'rel="last"' not in part:
+                continue
+            url = part.split(";")[0].strip().strip("<>")
+            page = parse_qs(urlparse(url).query).get("page")
+            if page and page[0].isdigit():
+                return int(page[0])
+
+    for name in _TOTAL_PAGES_HEADERS:
+        value = headers.get(name)
+        if value and value.strip().isdigit():
+            return int(value)
+
+    if page_size > 0:
+        for name in _TOTAL_COUNT_HEADERS:
+            value = headers.get(name)
+            if value and value.strip().isdigit():
+                return max(math.ceil(int(value) / page_size), 1)
+
+    return None
+
+
+async def fetch_all_pages(
+    fetch_page: Callable[[int], Awaitable[GitApiResponse]],
+    per_page: int,
+    max_pages: int,
+) -> List[Any]:
+    """
+    Fetch all items of a paginated list endpoint
+
+    The first page is fetched alone. If its headers reveal the number of
+    pages, the remaining pages are fetched concurrently (bounded by
+    GIT_API_PAGE_CONCURRENCY); otherwise pages are walked one after another
+    until an empty or short page.
+
+    Args:
+        fetch_page: Fetches one page (1-based) of the list
+        per_page: Requested page size
+        max_pages: Maximum number of pages fetched
+
+    Returns:
+        Items of all pages in page order
+
+    Raises:
+        requests.exceptions.RequestException: If a page cannot be fetched
+    """
+
+    async def fetch(page: int) -> List[Any]:
+        response = await fetch_page(page)
+        response.raise_for_status()
+        return response.json() or []
+
+    first = await fetch_page(1)
+    first.raise_for_status()
+    items = list(first.json() or [])
+    if not items:
+        return items
+
+    pages = total_pages(first.headers, len(items))
+    if pages is not None:
+        if pages > max_pages:
+            logger.warning(
+                f"[GitAPI] List has {pages} pages, fetching the first {max_pages}"
+            )
+        semaphore = asyncio.Semaphore(settings.GIT_API_PAGE_CONCURRENCY)
+
+        async def fetch_limited(page: int) -> List[Any]:
+            async with semaphore:
+                return await fetch(page)
+
+        results = await asyncio.gather(
+            *(fetch_limited(page) for page in range(2, min(pages, max_pages) + 1))
+        )
+        for page_items in results:
+            items.extend(page_items)
+        return items
+
+    page_items = items
+    for page in range(2, max_pages + 1):
+        if len(page_items) < per_page:
+            break
+        page_items = await fetch(page)
+        if not page_items:
+            break
+        items.extend(page_items)
+    return items
+
+
+def _retry_after_seconds(headers: httpx.Headers) -> Optional[float]:
+    """Seconds to wait according to Retry-After or rate limit reset headers."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+        try:
+            return email.utils.parsedate_to_datetime(retry_after).timestamp() - (
+                time.time()
+            )
+        except (TypeError, ValueError):
+            pass
+
+    reset = headers.get("X-RateLimit-Reset") or headers.get("RateLimit-Reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        # Epoch seconds (GitHub, GitLab) or seconds from now
+        return value - time.time() if value > 1_000_000_000 else value
+    return None
+
+
+def _is_rate_limited(response: GitApiResponse) -> bool:
+    if response.status_code == 429:
+        return True
+    if response.status_code in (403, 503):
+        headers = response.headers
+        return "Retry-After" in headers or (
+            headers.get("X-RateLimit-Remaining") == "0"
+            or headers.get("RateLimit-Remaining") == "0"
+        )
+    return False
+
+
+class GitApiClient:
+    """Pooled async HTTP client with conditional request cache and backoff."""
+
+    def __init__(self):
+        self._loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._loop_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=settings.GIT_API_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.GIT_API_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GIT_API_MAX_KEEPALIVE,
+                ),
+                follow_redirects=True,
+            )
+            self._loop_clients[loop] = client
+        return client
+
+    async def get(self, url: str, **kwargs) -> GitApiResponse:
+        """Send a GET request, see request()."""
+        return await self.request("GET", url, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        auth: Optional[httpx.Auth] = None,
+        timeout: Optional[float] = None,
+    ) -> GitApiResponse:
+        """
+        Send a request to a git provider API
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers (including the token)
+            params: Query parameters
+            json: JSON body
+            auth: httpx auth (disables the conditional request cache)
+            timeout: Timeout in seconds (GIT_API_TIMEOUT_SECONDS by default)
+
+        Returns:
+            Response; error statuses are returned, not raised
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out
+            requests.exceptions.ConnectionError: If the request failed
+        """
+        headers = dict(headers or {})
+        cache_key = None
+        cached = None
+        if (
+            method.upper() == "GET"
+            and auth is None
+            and settings.GIT_API_ETAG_CACHE_ENABLED
+        ):
+            cache_key = self._cache_key(url, params, headers)
+            cached = await self._load_cached(cache_key)
+            if cached is not None:
+                if "ETag" in cached.headers:
+                    headers["If-None-Match"] = cached.headers["ETag"]
+                if "Last-Modified" in cached.headers:
+                    headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        for attempt in range(settings.GIT_API_MAX_RETRIES + 1):
+            response = await self._send(
+                method, url, headers, params, json, auth, timeout
+            )
+            if not _is_rate_limited(response):
+                break
+            delay = _retry_after_seconds(response.headers)
+            if delay is None:
+                delay = float(2**attempt)
+            delay = max(delay, 0.0)
+            if (
+                attempt == settings.GIT_API_MAX_RETRIES
+                or delay > settings.GIT_API_MAX_BACKOFF_SECONDS
+            ):
+                logger.warning(
+                    f"[GitAPI] Rate limited by {urlparse(url).netloc}, "
+                    f"giving up (retry in {delay:.0f}s)"
+                )
+                break
+            logger.warning(
+                f"[GitAPI] Rate limited by {urlparse(url).netloc}, "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+        if response.status_code == 304 and cached is not None:
+            return cached
+        if cache_key is not None and response.status_code == 200:
+            await self._store(cache_key, response)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        auth: Optional[httpx.Auth],
+        timeout: Optional[float],
+    ) -> GitApiResponse:
+        kwargs: Dict[str, Any] = {}
+        if auth is not None:
+            kwargs["auth"] = auth
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        try:
+            response = await self._client().request(
+                method, url, headers=headers, params=params, json=json, **kwargs
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(f"Request to {url} timed out: {e}") from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(
+                f"Request to {url} failed: {e}"
+            ) from e
+        return GitApiResponse(
+            response.status_code,
+            response.headers,
+            response.content,
+            str(response.url),
+        )
+
+    @staticmethod
+    def _cache_key(
+        url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]
+    ) -> str:
+        payload = orjson.dumps(
+            {
+                "url": url,
+                "params": {k: str(v) for k, v in (params or {}).items()},
+                "headers": {k.lower(): v for k, v in headers.items()},
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return f"git_api:etag:{hashlib.sha256(payload).hexdigest()}"
+
+    @staticmethod
+    async def _load_cached(cache_key: str) -> Optional[GitApiResponse]:
+        blob = await cache_manager.get_raw(cache_key)
+        if blob is None:
+            return None
+        try:
+            data = zlib.decompress(blob)
+            meta_size = int.from_bytes(data[:4], "big")
+            meta = orjson.loads(data[4 : 4 + meta_size])
+            return GitApiResponse(
+                200,
+                meta["headers"],
+                data[4 + meta_size :],
+                meta["url"],
+                from_cache=True,
+            )
+        except Exception as e:
+            logger.warning(f"[GitAPI] Dropping unreadable cache entry: {e}")
+            return None
+
+    @staticmethod
+    async def _store(cache_key: str, response: GitApiResponse) -> None:
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return
+        meta = orjson.dumps(
+            {"url": response.url, "headers": list(response.headers.items())}
+        )
+        blob = zlib.compress(len(meta).to_bytes(4, "big") + meta + response.content)
+        if len(blob) <= settings.GIT_API_ETAG_CACHE_MAX_BYTES:
+            await cache_manager.set_raw(
+                cache_key, blob, expire=settings.GIT_API_ETAG_CACHE_TTL_SECONDS
+            )
+
+    async def close(self) -> None:
+        """Close the client of the current event loop."""
+        client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+git_api_client = GitApiClient()
@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-user repository search index
+
+search_repositories used to load a user's whole cached repository list
+(git_repos:{user_id}:{git_domain}) from Redis on every keystroke and scan it
+with substring checks. Instead, each worker keeps a trigram index per user and
+git domain:
+
+- The cached list is written together with a version key
+  (RedisCache.set_user_repositories). A search only reads the version; the
+  list itself is loaded when the version changed, and the index is then
+  updated incrementally (only added, removed or renamed repositories are
+  re-indexed).
+- Queries of three or more characters intersect the trigram posting lists
+  of the query and verify the few candidates; shorter queries scan the
+  pre-lowercased names.
+- Results are ranked by match quality (exact, name prefix, path segment
+  prefix, substring) and then by recency, i.e. the order of the cached list,
+  which the providers fetch sorted by last update.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.cache import cache_manager
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Set[str] = set()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _repo_key(repo: Dict[str, Any]) -> str:
+    return str(repo.get("full_name") or repo.get("name") or repo.get("id"))
+
+
+def _haystack(repo: Dict[str, Any]) -> Tuple[str, str]:
+    name = str(repo.get("name") or "").lower()
+    return name, str(repo.get("full_name") or name).lower()
+
+
+def match_tier(query_lower: str, name_lower: str, full_name_lower: str) -> int:
+    """
+    Relevance tier of a matching repository (lower is better)
+
+    Args:
+        query_lower: Lowercased query
+        name_lower: Lowercased repository name
+        full_name_lower: Lowercased repository full name
+
+    Returns:
+        0 exact match, 1 name prefix, 2 path segment prefix, 3 substring
+    """
+    if query_lower in (name_lower, full_name_lower):
+        return 0
+    if name_lower.startswith(query_lower):
+        return 1
+    if full_name_lower.startswith(query_lower) or any(
+        segment.startswith(query_lower) for segment in full_name_lower.split("/")
+    ):
+        return 2
+    return 3
+
+
+def filter_repositories(
+    repos: Iterable[Dict[str, Any]], query: str, fullmatch: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Filter and rank repositories without an index
+
+    Args:
+        repos: Repositories, most recently updated first
+        query: Search keyword
+        fullmatch: Exact name/full name match instead of substring match
+
+    Returns:
+        Matching repositories, best matches first
+    """
+    query_lower = query.lower()
+    matches = []
+    for position, repo in enumerate(repos):
+        name, full_name = _haystack(repo)
+        if fullmatch:
+            matched = query_lower in (name, full_name)
+        else:
+            matched = query_lower in name or query_lower in full_name
+        if matched:
+            matches.append((match_tier(query_lower, name, full_name), position, repo))
+    matches.sort(key=lambda match: match[:2])
+    return [repo for _, _, repo in matches]
+
+
+class UserRepositoryIndex:
+    """Trigram index over one user's repositories on one git domain."""
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self._repos: Dict[str, Dict[str, Any]] = {}
+        self._haystacks: Dict[str, Tuple[str, str]] = {}
+        self._order: List[str] = []
+        self._rank: Dict[str, int] = {}
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._exact: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def update(self, repos: List[Dict[str, Any]], version: Optional[str]) -> None:
+        """
+        Bring the index in line with a repository list
+
+        Args:
+            repos: Cached repository list, most recently updated first
+            version: Version of the list
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for repo in repos:
+            latest.setdefault(_repo_key(repo), repo)
+
+        for key in self._repos.keys() - latest.keys():
+            self._remove(key)
+        for key, repo in latest.items():
+            if key not in self._repos:
+                self._add(key, repo)
+            elif _haystack(repo) != self._haystacks[key]:
+                self._remove(key)
+                self._add(key, repo)
+            else:
+                self._repos[key] = repo
+
+        self._order = list(latest)
+        self._rank = {key: position for position, key in enumerate(self._order)}
+        self.version = version
+
+    def _add(self, key: str, repo: Dict[str, Any]) -> None:
+        name, full_name = _haystack(repo)
+        self._repos[key] = repo
+        self._haystacks[key] = (name, full_name)
+        for gram in _trigrams(name) | _trigrams(full_name):
+            self._trigrams[gram].add(key)
+        self._exact[name].add(key)
+        self._exact[full_name].add(key)
+
+    def _remove(self, key: str) -> None:
+        name, full_name = self._haystacks.pop(key)
+        del self._repos[key]
+        for gram in _trigrams(name) | _trigrams(full_name):
+            postings = self._trigrams.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._trigrams[gram]
+        for text in (name, full_name):
+            postings = self._exact.get(text)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._exact[text]
+
+    def search(self, query: str, fullmatch: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search the indexed repositories
+
+        Args:
+            query: Search keyword
+            fullmatch: Exact name/full name match instead of substring match
+
+        Returns:
+            Matching repositories, best matches first
+        """
+        query_lower = query.lower()
+        if fullmatch:
+            keys: Iterable[str] = self._exact.get(query_lower, _EMPTY)
+        elif len(query_lower) >= 3:
+            postings = sorted(
+                (self._trigrams.get(gram, _EMPTY) for gram in _trigrams(query_lower)),
+                key=len,
+            )
+            candidates = postings[0].intersection(*postings[1:])
+            keys = [
+                key
+                for key in candidates
+                if query_lower in self._haystacks[key][0]
+                or query_lower in self._haystacks[key][1]
+            ]
+        else:
+            keys = [
+                key
+                for key in self._order
+                if query_lower in self._haystacks[key][0]
+                or query_lower in self._haystacks[key][1]
+            ]
+
+        ranked = sorted(
+            keys,
+            key=lambda key: (
+                match_tier(query_lower, *self._haystacks[key]),
+                self._rank[key],
+            ),
+        )
+        return [self._repos[key] for key in ranked]
+
+
+class RepositorySearchIndex:
+    """Search indexes of the cached repository lists, kept per worker."""
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the index registry
+
+        Args:
+            max_entries: Maximum number of (user, git domain) indexes kept
+        """
+        self.max_entries = max_entries
+        self._indexes: OrderedDict[Tuple[int, str], UserRepositoryIndex] = OrderedDict()
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+
+    async def search(
+        self, user_id: int, git_domain: str, query: str, fullmatch: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Search a user's cached repositories of one git domain
+
+        Args:
+            user_id: User ID
+            git_domain: Git domain
+            query: Search keyword
+            fullmatch: Exact name/full name match instead of substring match
+
+        Returns:
+            Matching repositories (best first), or None if the user's
+            repository list is not cached
+        """
+        key = (user_id, git_domain)
+        version = await cache_manager.get_user_repositories_version(user_id, git_domain)
+        index = self._indexes.get(key)
+        if index is None or version is None or index.version != version:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                index = self._indexes.get(key)
+                if index is None or version is None or index.version != version:
+                    repos = await cache_manager.get(
+                        cache_manager.generate_full_cache_key(user_id, git_domain)
+                    )
+                    if not repos:
+                        self.invalidate(user_id, git_domain)
+                        return None
+                    if version is None:
+                        # Written without a version, nothing to keep an index for
+                        return filter_repositories(repos, query, fullmatch)
+                    index = await self._refresh(key, repos, version)
+
+        self._indexes.move_to_end(key)
+        return index.search(query, fullmatch)
+
+    async def store(
+        self, user_id: int, git_domain: str, repos: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Cache a user's full repository list and index it
+
+        Args:
+            user_id: User ID
+            git_domain: Git domain
+            repos: Repository list, most recently updated first
+        """
+        version = await cache_manager.set_user_repositories(user_id, git_domain, repos)
+        if version is not None and repos:
+            await self._refresh((user_id, git_domain), repos, version)
+
+    def invalidate(self, user_id: int, git_domain: str) -> None:
+        """Drop the index of a user's git domain in this worker"""
+        self._indexes.pop((user_id, git_domain), None)
+        self._locks.pop((user_id, git_domain), None)
+
+    async def _refresh(
+        self, key: Tuple[int, str], repos: List[Dict[str, Any]], version: str
+    ) -> UserRepositoryIndex:
+        index = self._indexes.get(key)
+        if index is None:
+            # Building from scratch is the expensive part, keep it off the loop
+            index = UserRepositoryIndex()
+            await asyncio.to_thread(index.update, repos, version)
+        else:
+            index.update(repos, version)
+
+        self._indexes[key] = index
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self.max_entries:
+            evicted, _ = self._indexes.popitem(last=False)
+            self._locks.pop(evicted, None)
+        logger.debug(f"Indexed {len(index)} repositories of user {key[0]} on {key[1]}")
+        return index
+
+
+repository_search_index = RepositorySearchIndex(
+    max_entries=settings.REPO_SEARCH_INDEX_MAX_ENTRIES
+)
@@ -248,6 +248,18 @@ class KnowledgeDocumentListResponse(BaseModel):
     items: list[KnowledgeDocumentResponse]
 
 
+class KnowledgeBaseStatsResponse(BaseModel):
+    """Schema for knowledge base index statistics."""
+
+    knowledge_base_id: int
+    document_count: int
+    chunk_count: Optional[int] = None
+    token_count: Optional[int] = None
+    text_bytes: Optional[int] = None
+    estimated_tokens: int
+    is_exact: bool  # False if estimated from file sizes
+
+
 # ============== Batch Operation Schemas ==============
 
 
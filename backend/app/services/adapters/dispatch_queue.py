@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Redis-backed dispatch queue for executor tasks.
+
+Executor managers used to find pending work by scanning the tasks table with
+JSON_EXTRACT filters on every poll. Instead, the IDs of tasks that get a
+PENDING assistant subtask are pushed into a Redis sorted set (scored by
+enqueue time, so re-enqueueing is idempotent and FIFO order is kept) as soon
+as the transaction commits, and a wake-up message is published so that
+long-polling dispatch requests return immediately.
+
+The queue only holds candidates: the dispatcher still validates each task
+against the database and claims subtasks with the existing optimistic
+PENDING -> RUNNING update, so a stale or duplicated entry is harmless.
+Entries lost while Redis was unavailable are recovered by reconcile(), which
+re-enqueues tasks that still have PENDING assistant subtasks.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import RedisCache, cache_manager
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_QUEUE_KEY = "executor:dispatch:queue"
+DISPATCH_CHANNEL = "executor:dispatch:wakeup"
+
+# Session.info key collecting task IDs to enqueue once the session commits
+_PENDING_INFO_KEY = "dispatch_queue_task_ids"
+
+
+class _Waiter:
+    """Wake-up subscription used by a long-polling dispatch request."""
+
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until a task is enqueued or the timeout expires.
+
+        Returns:
+            True if a wake-up message was received
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if message is not None:
+                return True
+
+
+class TaskDispatchQueue:
+    """Queue of task IDs waiting to be dispatched to executors."""
+
+    def __init__(self, cache: RedisCache):
+        self._cache = cache
+        self._last_reconcile = 0.0
+
+    def enqueue_sync(self, task_ids: Iterable[int]) -> None:
+        """Add tasks to the queue and wake up waiting dispatchers.
+
+        Called from the SQLAlchemy after_commit hook, hence synchronous.
+        """
+        task_ids = sorted(set(task_ids))
+        if not task_ids:
+            return
+        now = time.time()
+        client = self._cache._get_sync_client()
+        pipe = client.pipeline(transaction=False)
+        # NX keeps the original score so re-enqueueing does not lose its place
+        pipe.zadd(DISPATCH_QUEUE_KEY, {str(tid): now for tid in task_ids}, nx=True)
+        pipe.publish(DISPATCH_CHANNEL, ",".join(str(tid) for tid in task_ids))
+        pipe.execute()
+        logger.debug(f"[DISPATCH] Enqueued tasks {task_ids}")
+
+    async def peek(self, count: int, start: int = 0) -> List[int]:
+        """Return up to count queued task IDs in FIFO order without removing them.
+
+        Args:
+            count: Maximum number of task IDs
+            start: Queue position of the first returned task ID
+        """
+        client = await self._cache._get_client()
+        members = await client.zrange(DISPATCH_QUEUE_KEY, start, start + count - 1)
+        return [int(member) for member in members]
+
+    async def remove(self, task_ids: Iterable[int]) -> None:
+        """Remove tasks from the queue."""
+        members = [str(tid) for tid in task_ids]
+        if not members:
+            return
+        client = await self._cache._get_client()
+        await client.zrem(DISPATCH_QUEUE_KEY, *members)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[_Waiter]:
+        """Subscribe to wake-up messages for the duration of a long poll.
+
+        Subscribe before checking the queue, so that a task enqueued between
+        the check and the wait is not missed.
+        """
+        client = self._cache.create_client()
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(DISPATCH_CHANNEL)
+            yield _Waiter(pubsub)
+        finally:
+            try:
+                await pubsub.unsubscribe(DISPATCH_CHANNEL)
+                await pubsub.aclose()
+            finally:
+                await client.aclose()
+
+    async def reconcile(self, db: Session, interval: float, limit: int = 1000) -> int:
+        """Re-enqueue tasks that still have PENDING assistant subtasks.
+
+        Runs at most once per interval per process. Uses the indexed subtask
+        status column instead of scanning task JSON.
+
+        Returns:
+            Number of task IDs enqueued (0 if skipped)
+        """
+        now = time.monotonic()
+        if now - self._last_reconcile < interval:
+            return 0
+        self._last_reconcile = now
+
+        rows = (
+            db.query(Subtask.task_id)
+            .filter(
+                Subtask.status == SubtaskStatus.PENDING,
+                Subtask.role == SubtaskRole.ASSISTANT,
+            )
+            .distinct()
+            .limit(limit)
+            .all()
+        )
+        task_ids = [row[0] for row in rows]
+        if task_ids:
+            await asyncio.to_thread(self.enqueue_sync, task_ids)
+        return len(task_ids)
+
+
+# Global dispatch queue instance
+dispatch_queue = TaskDispatchQueue(cache_manager)
+
+
+def _track_pending_subtask(mapper, connection, target: Subtask) -> None:
+    """Mapper hook: remember tasks whose assistant subtask became PENDING."""
+    if target.status != SubtaskStatus.PENDING:
+        return
+    # role may still be unset (column default) right after insert
+    if target.role not in (None, SubtaskRole.ASSISTANT):
+        return
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INFO_KEY, set()).add(target.task_id)
+
+
+def _enqueue_after_commit(session: Session) -> None:
+    """Session hook: push collected task IDs once they are visible to others."""
+    task_ids: Optional[set] = session.info.pop(_PENDING_INFO_KEY, None)
+    if not task_ids:
+        return
+    try:
+        dispatch_queue.enqueue_sync(task_ids)
+    except Exception as e:
+        # Reconciliation picks these up later
+        logger.warning(f"[DISPATCH] Failed to enqueue tasks {sorted(task_ids)}: {e}")
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_INFO_KEY, None)
+
+
+for _event_name in ("after_insert", "after_update"):
+    event.listen(Subtask, _event_name, _track_pending_subtask)
+event.listen(Session, "after_commit", _enqueue_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
@@ -7,7 +7,7 @@ import logging
 import threading
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
@@ -20,6 +20,7 @@ from shared.telemetry.context import (
 # Import telemetry utilities
 from shared.telemetry.core import get_tracer, is_telemetry_enabled
 from shared.utils.crypto import decrypt_api_key
+from shared.utils.progress_delta import RESYNC_KEY, apply_progress_delta
 from sqlalchemy import and_, func, text
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.attributes import flag_modified
@@ -31,6 +32,7 @@ from app.models.task import TaskResource
 from app.models.user import User
 from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Team, Workspace
 from app.schemas.subtask import SubtaskExecutorUpdate
+from app.services.adapters.dispatch_queue import dispatch_queue
 from app.services.base import BaseService
 from app.services.context import context_service
 from app.services.webhook_notification import Notification, webhook_notification_service
@@ -129,6 +131,7 @@ class ExecutorKindsService(
         limit: int = 1,
         task_ids: Optional[List[int]] = None,
         type: str = "online",
+        wait: float = 0,
     ) -> Dict[str, List[Dict]]:
         """
         Task dispatch logic with subtask support using tasks table
@@ -138,6 +141,8 @@ class ExecutorKindsService(
             limit: Maximum number of subtasks to return (only used when task_ids is None)
             task_ids: Optional list of task IDs to filter by
             type: Task type to filter by (default: "online")
+            wait: Long-poll timeout in seconds when no task is available
+                (only used when task_ids is None)
         """
         if task_ids:
             # Scenario 1: Specify task ID list, query subtasks for these tasks
@@ -184,8 +189,12 @@ class ExecutorKindsService(
                 if task_subtasks:
                     subtasks.extend(task_subtasks)
         else:
-            # Scenario 2: No task_ids, first query tasks, then query first subtask for each task
-            subtasks = self._get_first_subtasks_for_tasks(db, status, limit, type)
+            # Scenario 2: No task_ids, take the first subtask of queued tasks
+            subtasks = await self._get_dispatchable_subtasks(db, status, limit, type)
+            if not subtasks and wait > 0:
+                subtasks = await self._wait_for_dispatchable_subtasks(
+                    db, status, limit, type, wait
+                )
 
         if not subtasks:
             return {"tasks": []}
@@ -199,6 +208,10 @@ class ExecutorKindsService(
             # otherwise subtasks/tasks may get stuck in RUNNING without an executor.
             result = self._format_subtasks_response(db, updated_subtasks)
             db.commit()
+            if not task_ids and self._use_dispatch_queue(status):
+                await self._remove_from_dispatch_queue(
+                    [subtask.task_id for subtask in updated_subtasks]
+                )
             return result
         except Exception:
             db.rollback()
@@ -223,6 +236,167 @@ class ExecutorKindsService(
             .all()
         )
 
+    @staticmethod
+    def _use_dispatch_queue(status: str) -> bool:
+        """The dispatch queue only tracks PENDING subtasks."""
+        return settings.TASK_DISPATCH_QUEUE_ENABLED and status == SubtaskStatus.PENDING
+
+    async def _get_dispatchable_subtasks(
+        self, db: Session, status: str, limit: int, type: str
+    ) -> List[Subtask]:
+        """Get the first subtask of up to limit dispatchable tasks.
+
+        Uses the dispatch queue when enabled, falling back to scanning the
+        tasks table if Redis is unavailable.
+        """
+        if self._use_dispatch_queue(status):
+            try:
+                await dispatch_queue.reconcile(
+                    db, settings.TASK_DISPATCH_RECONCILE_INTERVAL_SECONDS
+                )
+                return await self._get_first_subtasks_from_queue(
+                    db, status, limit, type
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[DISPATCH] Dispatch queue unavailable, scanning tasks: {e}"
+                )
+        return self._get_first_subtasks_for_tasks(db, status, limit, type)
+
+    async def _wait_for_dispatchable_subtasks(
+        self, db: Session, status: str, limit: int, type: str, wait: float
+    ) -> List[Subtask]:
+        """Long-poll the dispatch queue until a subtask is available or wait expires."""
+        if not self._use_dispatch_queue(status):
+            return []
+
+        wait = min(wait, settings.TASK_DISPATCH_MAX_WAIT_SECONDS)
+        deadline = asyncio.get_running_loop().time() + wait
+        try:
+            async with dispatch_queue.subscribe() as waiter:
+                while True:
+                    # Re-check after subscribing so no wake-up can be missed
+                    subtasks = await self._get_first_subtasks_from_queue(
+                        db, status, limit, type
+                    )
+                    if subtasks:
+                        return subtasks
+                    # Release the DB connection while waiting
+                    db.rollback()
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    if remaining <= 0 or not await waiter.wait(remaining):
+                        return []
+        except Exception as e:
+            logger.warning(f"[DISPATCH] Long-poll on dispatch queue failed: {e}")
+            return []
+
+    async def _get_first_subtasks_from_queue(
+        self, db: Session, status: str, limit: int, type: str
+    ) -> List[Subtask]:
+        """Get the first subtask for queued tasks of the given type.
+
+        The queue is shared by all task types, so it is read page by page
+        until limit subtasks are found or the queue is exhausted; tasks of
+        the other type at the head cannot hide dispatchable tasks behind them.
+        Tasks that can no longer be dispatched are dropped from the queue.
+        """
+        page_size = max(limit * 5, settings.TASK_DISPATCH_QUEUE_SCAN_SIZE)
+        subtasks: List[Subtask] = []
+        stale_ids: List[int] = []
+        start = 0
+        while len(subtasks) < limit:
+            candidate_ids = await dispatch_queue.peek(page_size, start=start)
+            if not candidate_ids:
+                break
+            # Stale entries are only removed at the end, so positions are stable
+            start += len(candidate_ids)
+            page_subtasks, page_stale_ids = self._validate_queued_tasks(
+                db, candidate_ids, status, limit - len(subtasks), type
+            )
+            subtasks.extend(page_subtasks)
+            stale_ids.extend(page_stale_ids)
+            if len(candidate_ids) < page_size:
+                break
+
+        if stale_ids:
+            await self._remove_from_dispatch_queue(stale_ids)
+        return subtasks
+
+    def _validate_queued_tasks(
+        self,
+        db: Session,
+        candidate_ids: List[int],
+        status: str,
+        limit: int,
+        type: str,
+    ) -> Tuple[List[Subtask], List[int]]:
+        """Validate a page of queued tasks against the database in two queries.
+
+        Returns:
+            Up to limit first subtasks of dispatchable tasks of the given type,
+            and the IDs of tasks that can no longer be dispatched (deleted, not
+            pending, chat_shell tasks, no pending subtask). Tasks of the other
+            type are in neither list and stay queued for their own dispatcher.
+        """
+        tasks = (
+            db.query(TaskResource)
+            .filter(
+                TaskResource.id.in_(candidate_ids),
+                TaskResource.kind == "Task",
+                TaskResource.is_active.is_(True),
+            )
+            .all()
+        )
+        tasks_by_id = {task.id: task for task in tasks}
+
+        stale_ids: List[int] = []
+        matching_ids: List[int] = []
+        for task_id in candidate_ids:
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                stale_ids.append(task_id)
+                continue
+            task_json = task.json or {}
+            labels = (task_json.get("metadata") or {}).get("labels") or {}
+            task_status = (task_json.get("status") or {}).get("status")
+            if labels.get("source") == "chat_shell" or task_status != status:
+                stale_ids.append(task_id)
+                continue
+            task_type = labels.get("type") or "online"
+            if task_type == type:
+                matching_ids.append(task_id)
+
+        subtasks: List[Subtask] = []
+        if matching_ids:
+            pending = (
+                db.query(Subtask)
+                .filter(
+                    Subtask.task_id.in_(matching_ids),
+                    Subtask.role == SubtaskRole.ASSISTANT,
+                    Subtask.status == status,
+                )
+                .order_by(Subtask.message_id.asc(), Subtask.created_at.asc())
+                .all()
+            )
+            first_by_task: Dict[int, Subtask] = {}
+            for subtask in pending:
+                first_by_task.setdefault(subtask.task_id, subtask)
+
+            for task_id in matching_ids:
+                subtask = first_by_task.get(task_id)
+                if subtask is None:
+                    stale_ids.append(task_id)
+                elif len(subtasks) < limit:
+                    subtasks.append(subtask)
+
+        return subtasks, stale_ids
+
+    async def _remove_from_dispatch_queue(self, task_ids: List[int]) -> None:
+        try:
+            await dispatch_queue.remove(task_ids)
+        except Exception as e:
+            logger.warning(f"[DISPATCH] Failed to remove tasks from queue: {e}")
+
     def _get_first_subtasks_for_tasks(
         self, db: Session, status: str, limit: int, type: str
     ) -> List[Subtask]:
@@ -1413,6 +1587,10 @@ class ExecutorKindsService(
         For streaming support:
         - When status is RUNNING and result contains content, emit chat:chunk events
         - Track previous content length to send only incremental updates
+
+        Delta-encoded results (only new thinking steps and changed workbench
+        fields) are rebuilt against the persisted result first; on a sequence
+        gap the response asks the executor for a full resync.
         """
         logger.info(
             f"update subtask subtask_id={subtask_update.subtask_id}, subtask_status={subtask_update.status}, subtask_progress={subtask_update.progress}"
@@ -1423,6 +1601,17 @@ class ExecutorKindsService(
         if not subtask:
             raise HTTPException(status_code=404, detail="Subtask not found")
 
+        # Rebuild full thinking/workbench before anything reads the result
+        resync = False
+        if subtask_update.result is not None:
+            subtask_update.result, resync = apply_progress_delta(
+                subtask.result, subtask_update.result
+            )
+            if resync:
+                logger.info(
+                    f"Progress delta gap for subtask_id={subtask.id}, requesting resync"
+                )
+
         # Track previous content for streaming chunk calculation
         # IMPORTANT: Must capture this BEFORE updating subtask fields
         previous_content = ""
@@ -1546,13 +1735,16 @@ class ExecutorKindsService(
 
         db.commit()
 
-        return {
+        response = {
             "subtask_id": subtask.id,
             "task_id": subtask.task_id,
             "status": subtask.status,
             "progress": subtask.progress,
             "message": "Subtask updated successfully",
         }
+        if resync:
+            response[RESYNC_KEY] = True
+        return response
 
     def _update_task_status_based_on_subtasks(self, db: Session, task_id: int) -> None:
         """Update task status based on subtask status using tasks table"""
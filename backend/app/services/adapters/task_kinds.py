@@ -10,7 +10,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import func, text
+from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -18,6 +18,7 @@ from app.core.config import settings
 from app.models.kind import Kind
 from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
 from app.models.task import TaskResource
+from app.models.task_list_item import TaskListItem
 from app.models.user import User
 from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Team, Workspace
 from app.schemas.task import TaskCreate, TaskDetail, TaskInDB, TaskStatus, TaskUpdate
@@ -25,8 +26,10 @@ from app.services.adapters.executor_kinds import executor_kinds_service
 from app.services.adapters.pipeline_stage import pipeline_stage_service
 from app.services.adapters.team_kinds import team_kinds_service
 from app.services.base import BaseService
+from app.services.chat.access import invalidate_task_access
 from app.services.readers.kinds import KindType, kindReader
 from app.services.readers.users import userReader
+from app.services.task_list_projection import is_background_task
 
 logger = logging.getLogger(__name__)
 
@@ -425,226 +428,97 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         return result, total
 
     def get_user_tasks_lite(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        before_task_id: Optional[int] = None,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get user's Task list with pagination (lightweight version for list display)
-        Only returns essential fields without JOIN queries for better performance.
         Includes tasks owned by user AND tasks user is a member of (group chats).
 
-        Uses raw SQL to avoid MySQL "Out of sort memory" errors caused by
-        JSON_EXTRACT in WHERE clause combined with ORDER BY.
-        """
-        # Get task IDs where user is owner OR member
-        # Use raw SQL with UNION for efficiency
-        # Exclude system namespace tasks (background tasks)
-        count_sql = text(
-            """
-            SELECT COUNT(DISTINCT k.id)
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.namespace != 'system'
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-        """
-        )
-        total_result = db.execute(count_sql, {"user_id": user_id}).scalar()
-
-        # Get task IDs sorted by created_at, including both owned and member tasks
-        # Exclude system namespace tasks (background tasks)
-        ids_sql = text(
-            """
-            SELECT DISTINCT k.id, k.created_at
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.namespace != 'system'
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-            ORDER BY k.created_at DESC
-            LIMIT :limit OFFSET :skip
-        """
-        )
-        task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "limit": limit + 50, "skip": skip}
-        ).fetchall()
-        task_ids = [row[0] for row in task_id_rows]
-
-        if not task_ids:
-            return [], 0
-
-        # Load full task data for the selected IDs
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter out DELETE status tasks in application layer and restore order
-        # Also filter out background tasks (source=background_executor)
-        id_to_task = {}
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE" and not self._is_background_task(task_crd):
-                id_to_task[t.id] = t
-
-        # Restore the original order and apply limit
-        tasks = []
-        for tid in task_ids:
-            if tid in id_to_task:
-                tasks.append(id_to_task[tid])
-                if len(tasks) >= limit:
-                    break
+        Reads the task_list_items projection, so the page is a single indexed
+        query without JSON parsing. DELETE, system namespace and background
+        tasks are excluded by the projection's is_visible flag.
 
-        # Recalculate total excluding DELETE status (approximate)
-        total = total_result if total_result else 0
+        Args:
+            db: Database session
+            user_id: Current user ID
+            skip: Offset pagination (ignored when before_task_id is given)
+            limit: Page size
+            before_task_id: Keyset pagination; return tasks listed after this
+                task (the last item of the previous page). Raises 400 if the
+                task no longer exists.
 
-        # Get task member counts in batch for is_group_chat detection
+        Returns:
+            Tuple of (task items, total visible tasks)
+        """
         from app.models.task_member import MemberStatus, TaskMember
 
-        task_ids_for_members = [t.id for t in tasks]
-        member_counts = {}
-        if task_ids_for_members:
-            member_count_results = (
-                db.query(TaskMember.task_id, func.count(TaskMember.id).label("count"))
-                .filter(
-                    TaskMember.task_id.in_(task_ids_for_members),
-                    TaskMember.status == MemberStatus.ACTIVE,
-                )
-                .group_by(TaskMember.task_id)
-                .all()
-            )
-            member_counts = {row[0]: row[1] for row in member_count_results}
+        member_task_ids = select(TaskMember.task_id).where(
+            TaskMember.user_id == user_id,
+            TaskMember.status == MemberStatus.ACTIVE.value,
+        )
+        visible = and_(
+            TaskListItem.is_visible.is_(True),
+            or_(
+                TaskListItem.user_id == user_id,
+                TaskListItem.task_id.in_(member_task_ids),
+            ),
+        )
 
-        # Build lightweight result without expensive JOIN operations
-        result = []
-        for task in tasks:
-            task_crd = Task.model_validate(task.json)
+        total = db.query(func.count(TaskListItem.task_id)).filter(visible).scalar() or 0
 
-            # Extract basic fields from task JSON
-            task_type = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("taskType")
-                or "chat"
-            )
-            type_value = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("type")
-                or "online"
+        query = db.query(TaskListItem).filter(visible)
+        if before_task_id is not None:
+            anchor = (
+                db.query(TaskListItem.created_at)
+                .filter(TaskListItem.task_id == before_task_id)
+                .scalar()
             )
-            status = task_crd.status.status if task_crd.status else "PENDING"
-
-            # Parse timestamps
-            created_at = task.created_at
-            updated_at = task.updated_at
-            completed_at = None
-            if task_crd.status:
-                try:
-                    if task_crd.status.createdAt:
-                        created_at = task_crd.status.createdAt
-                    if task_crd.status.updatedAt:
-                        updated_at = task_crd.status.updatedAt
-                    if task_crd.status.completedAt:
-                        completed_at = task_crd.status.completedAt
-                except:
-                    pass
-
-            # Get team_id using direct SQL query (more efficient than ORM)
-            team_name = task_crd.spec.teamRef.name
-            team_namespace = task_crd.spec.teamRef.namespace
-            team_result = db.execute(
-                text(
-                    """
-                    SELECT id FROM kinds
-                    WHERE user_id = :user_id
-                    AND kind = 'Team'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {"user_id": user_id, "name": team_name, "namespace": team_namespace},
-            ).fetchone()
-
-            # If not found in user's teams, check shared teams
-            team_id = team_result[0] if team_result else None
-            if not team_id:
-                shared_team_result = db.execute(
-                    text(
-                        """
-                        SELECT k.id FROM kinds k
-                        INNER JOIN shared_teams st ON k.user_id = st.original_user_id
-                        WHERE st.user_id = :user_id
-                        AND st.is_active = true
-                        AND k.kind = 'Team'
-                        AND k.name = :name
-                        AND k.namespace = :namespace
-                        AND k.is_active = true
-                        LIMIT 1
-                    """
+            if anchor is None:
+                # The anchor task was deleted; falling back to offset paging
+                # would silently restart the list, so let the client reload
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Task {before_task_id} used as page anchor no longer exists",
+                )
+            query = query.filter(
+                or_(
+                    TaskListItem.created_at < anchor,
+                    and_(
+                        TaskListItem.created_at == anchor,
+                        TaskListItem.task_id < before_task_id,
                     ),
-                    {
-                        "user_id": user_id,
-                        "name": team_name,
-                        "namespace": team_namespace,
-                    },
-                ).fetchone()
-                team_id = shared_team_result[0] if shared_team_result else None
-
-            # Get git_repo from workspace using direct SQL query
-            workspace_name = task_crd.spec.workspaceRef.name
-            workspace_namespace = task_crd.spec.workspaceRef.namespace
-            workspace_result = db.execute(
-                text(
-                    """
-                    SELECT JSON_EXTRACT(json, '$.spec.repository.gitRepo') as git_repo
-                    FROM tasks
-                    WHERE user_id = :user_id
-                    AND kind = 'Workspace'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {
-                    "user_id": user_id,
-                    "name": workspace_name,
-                    "namespace": workspace_namespace,
-                },
-            ).fetchone()
-
-            git_repo = None
-            if workspace_result and workspace_result[0]:
-                # Remove JSON quotes from extracted value
-                git_repo = (
-                    workspace_result[0].strip('"')
-                    if isinstance(workspace_result[0], str)
-                    else workspace_result[0]
                 )
+            )
+        query = query.order_by(
+            TaskListItem.created_at.desc(), TaskListItem.task_id.desc()
+        )
+        if before_task_id is None:
+            query = query.offset(skip)
 
-            # Check if this is a group chat
-            # First check task.json.spec.is_group_chat, fallback to member count
-            task_json = task.json or {}
-            is_group_chat = task_json.get("spec", {}).get("is_group_chat", False)
-            # Fallback: if not explicitly set, check member count
-            if not is_group_chat:
-                is_group_chat = member_counts.get(task.id, 0) > 0
+        items = query.limit(limit).all()
 
-            result.append(
-                {
-                    "id": task.id,
-                    "title": task_crd.spec.title,
-                    "status": status,
-                    "task_type": task_type,
-                    "type": type_value,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "completed_at": completed_at,
-                    "team_id": team_id,
-                    "git_repo": git_repo,
-                    "is_group_chat": is_group_chat,
-                }
-            )
+        result = [
+            {
+                "id": item.task_id,
+                "title": item.title,
+                "status": item.status,
+                "task_type": item.task_type,
+                "type": item.type,
+                "created_at": item.status_created_at or item.created_at,
+                "updated_at": item.updated_at or item.created_at,
+                "completed_at": item.completed_at,
+                "team_id": item.team_id,
+                "git_repo": item.git_repo,
+                "is_group_chat": item.is_group_chat,
+            }
+            for item in items
+        ]
 
         return result, total
 
@@ -1791,6 +1665,7 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
             task_member.status = MemberStatus.REMOVED
             task_member.removed_at = datetime.now()
             db.commit()
+            invalidate_task_access(task_id)
             return
 
         # Get all subtasks for the task
@@ -1841,6 +1716,7 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         flag_modified(task, "json")
 
         db.commit()
+        invalidate_task_access(task_id)
 
     async def cancel_task(
         self,
@@ -2872,21 +2748,11 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         """
         Check if a task is a background task that should be hidden from user task lists.
 
-        Background tasks include:
-        - Summary generation tasks (taskType=summary)
-        - Tasks created by background_executor (source=background_executor)
+        Same rule as the task list projection's is_visible flag, see
+        app.services.task_list_projection.is_background_task.
         """
         try:
-            labels = task_crd.metadata.labels
-            if not labels:
-                return False
-
-            # Check for background task indicators
-            return (
-                labels.get("taskType") == "summary"
-                or labels.get("source") == "background_executor"
-                or labels.get("type") == "background"
-            )
+            return is_background_task(task_crd.metadata.labels)
         except Exception:
             return False
 
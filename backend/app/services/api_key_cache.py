@@ -0,0 +1,313 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cached API key authentication with write-behind usage tracking
+
+get_auth_context used to query api_keys and commit a last_used_at update on
+every OpenAPI request, turning reads into writes that contend on the same row
+for busy service keys. Instead:
+
+- Active keys are cached per worker by key hash for
+  API_KEY_AUTH_CACHE_TTL_SECONDS. Committed changes to a key (disabled,
+  deleted, edited) are broadcast on API_KEY_REVOCATION_CHANNEL so every
+  worker drops it immediately.
+- Each use is only counted in memory. A background job periodically writes
+  the latest last_used_at of each key in one batch, and adds the request
+  counts to Redis counters per API_KEY_REQUEST_COUNTER_WINDOW_SECONDS window,
+  which request_count() exposes for rate limiting.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy import bindparam, event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import cache_manager
+from app.core.config import settings
+from app.models.api_key import APIKey
+
+logger = logging.getLogger(__name__)
+
+API_KEY_REVOCATION_CHANNEL = "api_keys:revoke"
+
+# session.info key collecting changed key hashes until commit/rollback
+_CHANGED_INFO_KEY = "api_key_changes"
+
+
+@dataclass(frozen=True)
+class CachedAPIKey:
+    """Columns of an active api_keys row needed to authenticate a request."""
+
+    id: int
+    user_id: int
+    name: str
+    key_type: str
+    expires_at: datetime
+
+
+class APIKeyAuthCache:
+    """Per-worker API key cache and usage buffer."""
+
+    def __init__(self, ttl_seconds: int, counter_window_seconds: int):
+        """
+        Initialize the cache
+
+        Args:
+            ttl_seconds: Lifetime of cached keys, 0 disables caching
+            counter_window_seconds: Window of the per-key request counters
+        """
+        self.ttl_seconds = ttl_seconds
+        self.counter_window_seconds = max(1, counter_window_seconds)
+        # Auth runs in FastAPI's threadpool, the flush in a background thread
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[CachedAPIKey, float]] = {}
+        # Bumped on every invalidation so in-flight lookups don't cache old rows
+        self._generation = 0
+        self._last_used: Dict[int, datetime] = {}
+        self._request_counts: Counter = Counter()
+        self._listener_task: Optional[asyncio.Task] = None
+
+    def get(self, db: Session, key_hash: str) -> Optional[CachedAPIKey]:
+        """
+        Look up an active API key by hash
+
+        Args:
+            db: Database session, used on cache misses
+            key_hash: SHA256 hex digest of the key
+
+        Returns:
+            The key, or None if no active key has this hash
+        """
+        if self.ttl_seconds > 0:
+            with self._lock:
+                entry = self._entries.get(key_hash)
+                generation = self._generation
+            if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+                return entry[0]
+
+        record = (
+            db.query(APIKey)
+            .filter(
+                APIKey.key_hash == key_hash,
+                APIKey.is_active == True,
+            )
+            .first()
+        )
+        if record is None:
+            return None
+
+        api_key = CachedAPIKey(
+            id=record.id,
+            user_id=record.user_id,
+            name=record.name,
+            key_type=record.key_type,
+            expires_at=record.expires_at,
+        )
+        if self.ttl_seconds > 0:
+            with self._lock:
+                if self._generation == generation:
+                    self._entries[key_hash] = (api_key, time.monotonic())
+        return api_key
+
+    def invalidate(self, key_hashes: Optional[Iterable[str]] = None) -> None:
+        """Drop the given keys from this worker's cache (all keys if None)"""
+        with self._lock:
+            self._generation += 1
+            if key_hashes is None:
+                self._entries.clear()
+            else:
+                for key_hash in key_hashes:
+                    self._entries.pop(key_hash, None)
+
+    def record_use(self, api_key_id: int) -> None:
+        """Count an authenticated request, written behind by flush()"""
+        window = int(time.time()) // self.counter_window_seconds
+        with self._lock:
+            self._last_used[api_key_id] = datetime.utcnow()
+            self._request_counts[(api_key_id, window)] += 1
+
+    def request_count(self, api_key_id: int) -> int:
+        """
+        Requests made with a key in the current counter window
+
+        Counts flushed by all workers plus this worker's unflushed requests,
+        so the value lags other workers by up to one flush interval.
+
+        Args:
+            api_key_id: API key ID
+
+        Returns:
+            Number of requests in the current window
+        """
+        window = int(time.time()) // self.counter_window_seconds
+        with self._lock:
+            pending = self._request_counts.get((api_key_id, window), 0)
+        values = cache_manager.hmget_sync(self._counter_key(window), [str(api_key_id)])
+        flushed = int(values[0]) if values and values[0] else 0
+        return flushed + pending
+
+    def flush(self) -> None:
+        """Write buffered usage to Redis and the database (blocking)"""
+        with self._lock:
+            last_used, self._last_used = self._last_used, {}
+            counts, self._request_counts = self._request_counts, Counter()
+            self._prune_expired()
+
+        windows: Dict[int, Dict[str, int]] = {}
+        for (api_key_id, window), count in counts.items():
+            windows.setdefault(window, {})[str(api_key_id)] = count
+        for window, window_counts in windows.items():
+            cache_manager.hincrby_counts_sync(
+                self._counter_key(window),
+                window_counts,
+                expire=2 * self.counter_window_seconds,
+            )
+
+        if last_used:
+            try:
+                self._write_last_used(last_used)
+            except Exception as e:
+                logger.error(f"[APIKey] Failed to flush last_used_at: {e}")
+                with self._lock:
+                    for api_key_id, used_at in last_used.items():
+                        current = self._last_used.get(api_key_id)
+                        if current is None or current < used_at:
+                            self._last_used[api_key_id] = used_at
+
+    def _write_last_used(self, last_used: Dict[int, datetime]) -> None:
+        from app.db.session import SessionLocal
+
+        table = APIKey.__table__
+        # Core executemany: no ORM events, and never moves last_used_at back
+        # when several workers flush the same key
+        stmt = (
+            table.update()
+            .where(
+                table.c.id == bindparam("key_id"),
+                table.c.last_used_at < bindparam("used_at"),
+            )
+            .values(last_used_at=bindparam("used_at"))
+        )
+        db = SessionLocal()
+        try:
+            db.execute(
+                stmt,
+                [
+                    {"key_id": api_key_id, "used_at": used_at}
+                    for api_key_id, used_at in last_used.items()
+                ],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _prune_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for key_hash in [h for h, (_, at) in self._entries.items() if at < cutoff]:
+            del self._entries[key_hash]
+
+    @staticmethod
+    def _counter_key(window: int) -> str:
+        return f"api_keys:requests:{window}"
+
+    async def start(self) -> None:
+        """Start applying revocations from other workers (call on startup)."""
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info("[APIKey] Started API key revocation listener")
+
+    async def stop(self) -> None:
+        """Stop the revocation listener (call on shutdown)."""
+        task, self._listener_task = self._listener_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.info("[APIKey] Stopped API key revocation listener")
+
+    async def _listen(self) -> None:
+        while True:
+            client = cache_manager.create_client()
+            try:
+                pubsub = client.pubsub()
+                await pubsub.subscribe(API_KEY_REVOCATION_CHANNEL)
+                # Revocations published while disconnected are lost
+                self.invalidate()
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is None:
+                        continue
+                    try:
+                        self.invalidate(orjson.loads(message["data"])["key_hashes"])
+                    except Exception as e:
+                        logger.error(f"[APIKey] Invalid revocation message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[APIKey] Revocation listener error, retrying: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+
+
+api_key_auth_cache = APIKeyAuthCache(
+    ttl_seconds=settings.API_KEY_AUTH_CACHE_TTL_SECONDS,
+    counter_window_seconds=settings.API_KEY_REQUEST_COUNTER_WINDOW_SECONDS,
+)
+
+
+# =============================================================================
+# Change Tracking
+# =============================================================================
+
+
+def _track_api_key_change(mapper, connection, target: APIKey) -> None:
+    """Mapper hook: invalidate a changed key, also under its previous hash."""
+    state = inspect(target)
+    key_hashes: Set[str] = {target.key_hash, *state.attrs.key_hash.history.deleted}
+    api_key_auth_cache.invalidate(key_hashes)
+    if state.session is not None:
+        state.session.info.setdefault(_CHANGED_INFO_KEY, set()).update(key_hashes)
+
+
+def _publish_after_commit(session: Session) -> None:
+    """Session hook: revoke committed key changes in all workers."""
+    key_hashes: Optional[set] = session.info.pop(_CHANGED_INFO_KEY, None)
+    if not key_hashes:
+        return
+    api_key_auth_cache.invalidate(key_hashes)
+    # If publishing fails, other workers pick up the change when entries expire
+    cache_manager.publish_sync(
+        API_KEY_REVOCATION_CHANNEL, {"key_hashes": sorted(key_hashes)}
+    )
+
+
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_INFO_KEY, None)
+
+
+event.listen(APIKey, "after_update", _track_api_key_change)
+event.listen(APIKey, "after_delete", _track_api_key_change)
+event.listen(Session, "after_commit", _publish_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
@@ -8,6 +8,7 @@ Storage backend module for file attachments.
 This module provides:
 - StorageBackend: Abstract interface for pluggable storage backends
 - MySQLStorageBackend: Default MySQL-based storage implementation
+- FilesystemStorageBackend: Content-addressed storage on a filesystem
 - DocumentParser: Document parsing utilities
 - Registry-based storage backend factory for extensibility
 
@@ -35,6 +36,7 @@ Storage Backend Registration:
     ```
 """
 
+from app.services.attachment.filesystem_storage import FilesystemStorageBackend
 from app.services.attachment.mysql_storage import MySQLStorageBackend
 from app.services.attachment.parser import DocumentParser
 from app.services.attachment.storage_backend import (
@@ -57,6 +59,7 @@ __all__ = [
     "StorageBackend",
     "StorageError",
     "MySQLStorageBackend",
+    "FilesystemStorageBackend",
     "DocumentParser",
     # Factory functions
     "get_storage_backend",
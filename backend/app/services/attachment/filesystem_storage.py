@@ -0,0 +1,344 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Content-addressed filesystem storage backend.
+
+Keeps attachment data out of MySQL rows. Blobs are stored once per content
+address (SHA-256), so the same file uploaded by different users or in
+different conversations occupies storage only once:
+
+    {root}/blobs/{aa}/{bb}/{content_id}          blob data
+    {root}/blobs/{aa}/{bb}/{content_id}.refs/    one marker per storage key
+    {root}/refs/attachments/{name}               storage key -> content_id
+    {root}/tmp/                                  in-progress uploads
+    {root}/locks/{aa}.lock                       per-shard flock
+
+A blob is removed when its last reference is deleted. Linking and unlinking
+are serialized with a per-shard file lock, so this is safe across worker
+processes sharing the same root (use a filesystem with working flock when
+the root is shared between hosts).
+
+As with all storage backends, data is stored as given: encryption happens
+in the context service before data reaches the backend.
+"""
+
+import fcntl
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.attachment.storage_backend import (
+    STREAM_CHUNK_SIZE,
+    StorageBackend,
+    StorageError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FilesystemStorageBackend(StorageBackend):
+    """
+    Content-addressed storage on a local or mounted filesystem.
+
+    If metadata contains "content_id" (computed by the context service from
+    the plain file content), an existing blob with that address is linked
+    without consuming the data stream. Otherwise the SHA-256 of the stored
+    bytes is used as the address.
+    """
+
+    BACKEND_TYPE = "filesystem"
+
+    def __init__(self, db: Session, root: Optional[str] = None):
+        """
+        Initialize filesystem storage backend.
+
+        Args:
+            db: SQLAlchemy database session (unused, kept for factory signature)
+            root: Storage root directory (defaults to ATTACHMENT_FILESYSTEM_ROOT)
+        """
+        self._db = db
+        self._root = os.path.abspath(root or settings.ATTACHMENT_FILESYSTEM_ROOT)
+        for name in ("blobs", "refs", "tmp", "locks"):
+            os.makedirs(os.path.join(self._root, name), exist_ok=True)
+
+    @property
+    def backend_type(self) -> str:
+        """Get the backend type identifier."""
+        return self.BACKEND_TYPE
+
+    def save(self, key: str, data: bytes, metadata: Dict) -> str:
+        """Save file data (see save_stream)."""
+        return self.save_stream(key, [data], metadata)
+
+    def save_stream(self, key: str, chunks: Iterable[bytes], metadata: Dict) -> str:
+        """
+        Save file data from a stream of chunks.
+
+        Args:
+            key: Storage key (format: attachments/{...})
+            chunks: File binary data (already encrypted if encryption is enabled)
+            metadata: Additional metadata, optionally including content_id
+
+        Returns:
+            The storage key
+
+        Raises:
+            StorageError: If save fails
+        """
+        ref_path = self._ref_path(key)
+        content_id = metadata.get("content_id")
+        try:
+            if content_id:
+                blob_name = self._blob_name(content_id)
+                with self._locked(blob_name):
+                    deduplicated = os.path.exists(self._blob_path(blob_name))
+                    if deduplicated:
+                        previous = self._link(key, ref_path, blob_name)
+                if deduplicated:
+                    self._release_previous(key, previous)
+                    logger.debug(f"Deduplicated {key} -> {blob_name}")
+                    return key
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.join(self._root, "tmp"))
+            try:
+                digest = hashlib.sha256()
+                with os.fdopen(fd, "wb") as tmp_file:
+                    for chunk in chunks:
+                        digest.update(chunk)
+                        tmp_file.write(chunk)
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+
+                blob_name = self._blob_name(content_id or digest.hexdigest())
+                blob_path = self._blob_path(blob_name)
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                with self._locked(blob_name):
+                    if os.path.exists(blob_path):
+                        os.unlink(tmp_path)
+                    else:
+                        os.replace(tmp_path, blob_path)
+                    previous = self._link(key, ref_path, blob_name)
+                self._release_previous(key, previous)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+            logger.debug(f"Saved {key} -> {blob_name}")
+            return key
+
+        except StorageError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to save to filesystem storage: {e}")
+            raise StorageError(f"Failed to save data: {e}", key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get file data.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            File binary data (raw, may be encrypted), or None if not found
+        """
+        stream = self.open_stream(key)
+        if stream is None:
+            return None
+        return b"".join(stream)
+
+    def open_stream(
+        self, key: str, start: int = 0, end: Optional[int] = None
+    ) -> Optional[Iterator[bytes]]:
+        """
+        Read stored data as a stream of chunks.
+
+        The blob is opened before returning, so a concurrent delete does not
+        interrupt a read in progress.
+
+        Args:
+            key: Storage key
+            start: First byte offset to read
+            end: Byte offset to stop at (exclusive), None for end of data
+
+        Returns:
+            Iterator over the requested bytes, or None if not found
+        """
+        try:
+            blob_name = self._read_ref(self._ref_path(key))
+            if blob_name is None:
+                return None
+            blob_file = open(self._blob_path(blob_name), "rb")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to open from filesystem storage: {e}")
+            return None
+
+        return self._iter_file(blob_file, start, end)
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete the reference of a storage key.
+
+        The blob itself is removed once no storage key references it.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        try:
+            ref_path = self._ref_path(key)
+            blob_name = self._read_ref(ref_path)
+            if blob_name is None:
+                return False
+            with self._locked(blob_name):
+                self._unlink(key, ref_path, blob_name)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete from filesystem storage: {e}")
+            return False
+
+    def exists(self, key: str) -> bool:
+        """
+        Check if file exists.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            True if the key references an existing blob, False otherwise
+        """
+        try:
+            blob_name = self._read_ref(self._ref_path(key))
+            return blob_name is not None and os.path.exists(self._blob_path(blob_name))
+        except Exception as e:
+            logger.error(f"Failed to check existence in filesystem storage: {e}")
+            return False
+
+    @staticmethod
+    def _iter_file(blob_file, start: int, end: Optional[int]) -> Iterator[bytes]:
+        with blob_file:
+            blob_file.seek(start)
+            remaining = None if end is None else max(end - start, 0)
+            while remaining is None or remaining > 0:
+                size = (
+                    STREAM_CHUNK_SIZE
+                    if remaining is None
+                    else min(remaining, STREAM_CHUNK_SIZE)
+                )
+                chunk = blob_file.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def _link(self, key: str, ref_path: str, blob_name: str) -> Optional[str]:
+        """
+        Point key at blob_name. Caller must hold the blob_name lock.
+
+        Returns:
+            The blob name referenced before, if it was a different one
+        """
+        previous = self._read_ref(ref_path)
+        if previous == blob_name:
+            return None
+
+        os.makedirs(self._marker_dir(blob_name), exist_ok=True)
+        with open(self._marker_path(key, blob_name), "wb"):
+            pass
+
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        tmp_ref = f"{ref_path}.tmp"
+        with open(tmp_ref, "w") as f:
+            f.write(blob_name)
+        os.replace(tmp_ref, ref_path)
+        return previous
+
+    def _release_previous(self, key: str, previous: Optional[str]) -> None:
+        """Release the blob a re-saved key referenced before."""
+        if previous is not None:
+            with self._locked(previous):
+                self._release(key, previous)
+
+    def _unlink(self, key: str, ref_path: str, blob_name: str) -> None:
+        """Remove key's reference. Caller must hold the blob_name lock."""
+        try:
+            os.unlink(ref_path)
+        except FileNotFoundError:
+            pass
+        self._release(key, blob_name)
+
+    def _release(self, key: str, blob_name: str) -> None:
+        """Drop key's marker and remove the blob if it was the last one."""
+        try:
+            os.unlink(self._marker_path(key, blob_name))
+        except FileNotFoundError:
+            pass
+        marker_dir = self._marker_dir(blob_name)
+        try:
+            os.rmdir(marker_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Still referenced by other keys
+            return
+        try:
+            os.unlink(self._blob_path(blob_name))
+            logger.debug(f"Removed unreferenced blob {blob_name}")
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def _locked(self, blob_name: str) -> Iterator[None]:
+        lock_path = os.path.join(self._root, "locks", f"{blob_name[:2]}.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_ref(ref_path: str) -> Optional[str]:
+        try:
+            with open(ref_path) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _blob_name(content_id: str) -> str:
+        """Validate a content id (hex digest, optionally with a format suffix)."""
+        if len(content_id) < 4 or not all(c.isalnum() or c in "-_" for c in content_id):
+            raise StorageError(f"Invalid content id: {content_id}")
+        return content_id
+
+    def _blob_path(self, blob_name: str) -> str:
+        return os.path.join(
+            self._root, "blobs", blob_name[:2], blob_name[2:4], blob_name
+        )
+
+    def _marker_dir(self, blob_name: str) -> str:
+        return f"{self._blob_path(blob_name)}.refs"
+
+    def _marker_path(self, key: str, blob_name: str) -> str:
+        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._marker_dir(blob_name), key_hash)
+
+    def _ref_path(self, key: str) -> str:
+        parts = key.split("/")
+        if not key or key.startswith("/") or any(p in ("", ".", "..") for p in parts):
+            raise StorageError(f"Invalid storage key format: {key}", key)
+        return os.path.join(self._root, "refs", *parts)
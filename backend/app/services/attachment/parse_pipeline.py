@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Parse pipeline for attachment uploads.
+
+Document parsing is CPU bound (PyPDF2, python-pptx, openpyxl are pure
+Python), so running it in the web worker blocks every other request handled
+by that process. The pipeline runs it in a shared process pool instead:
+
+- Large PDFs and PPTX files are split into page/slide ranges that are
+  extracted in parallel; smart truncation is applied once all ranges are in.
+- Other formats are parsed by a single pool worker.
+- Results are cached in Redis by content hash, so re-uploading or sharing
+  the same file never parses it twice.
+
+With ATTACHMENT_PARSE_WORKERS=0, or if the pool breaks, documents are parsed
+in the calling thread as before.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from typing import List, Optional
+
+from app.core.cache import cache_manager
+from app.core.config import settings
+from app.services.attachment.parser import (
+    DocumentParseError,
+    DocumentParser,
+    ParseResult,
+    TruncationInfo,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when parser output changes to invalidate cached results
+PARSE_CACHE_VERSION = 1
+PARSE_CACHE_PREFIX = f"attachment:parse:v{PARSE_CACHE_VERSION}"
+
+# Formats whose pages can be extracted independently
+_PAGED_EXTENSIONS = {".pdf", ".pptx"}
+# Image results carry the whole file as base64 and are cheap to produce
+_UNCACHED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
+
+
+# Worker functions are module level so they can be pickled for the pool
+
+
+def _parse_document(binary_data: bytes, extension: str) -> ParseResult:
+    return DocumentParser().parse(binary_data, extension)
+
+
+def _extract_page_range(
+    binary_data: bytes, extension: str, start: int, end: int
+) -> List[str]:
+    if extension == ".pdf":
+        reader = DocumentParser.open_pdf(binary_data)
+        return DocumentParser.extract_pdf_pages(reader, start, end)
+    prs = DocumentParser.open_pptx(binary_data)
+    return DocumentParser.extract_pptx_slides(prs, start, end)
+
+
+class ParsePipeline:
+    """Off-thread, cached document parsing for attachment uploads."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the parse pipeline.
+
+        Args:
+            max_workers: Worker processes (defaults to ATTACHMENT_PARSE_WORKERS)
+        """
+        self._max_workers = (
+            settings.ATTACHMENT_PARSE_WORKERS if max_workers is None else max_workers
+        )
+        self._parser = DocumentParser()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create the process pool on first use (None if disabled)."""
+        if self._max_workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork a process holding DB/Redis connections
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(
+                    f"[PARSE] Started parse pool with {self._max_workers} workers"
+                )
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def parse(
+        self,
+        binary_data: bytes,
+        extension: str,
+        content_hash: Optional[str] = None,
+    ) -> ParseResult:
+        """
+        Parse a document with smart truncation.
+
+        Blocks the calling thread until the workers are done; call it via
+        asyncio.to_thread() from async code.
+
+        Args:
+            binary_data: File binary data
+            extension: File extension (e.g., '.pdf', '.docx')
+            content_hash: SHA-256 hex digest of binary_data, if already known
+
+        Returns:
+            ParseResult, identical to DocumentParser.parse()
+
+        Raises:
+            DocumentParseError: If parsing fails
+        """
+        extension = extension.lower()
+        cache_key = None
+        if (
+            settings.ATTACHMENT_PARSE_CACHE_TTL_SECONDS > 0
+            and extension not in _UNCACHED_EXTENSIONS
+        ):
+            content_hash = content_hash or hashlib.sha256(binary_data).hexdigest()
+            cache_key = (
+                f"{PARSE_CACHE_PREFIX}:{content_hash}:{extension}:"
+                f"{self._parser.get_max_text_length()}"
+            )
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                logger.info(f"[PARSE] Cache hit for {content_hash}{extension}")
+                return cached
+
+        executor = self._get_executor()
+        if executor is None:
+            result = self._parser.parse(binary_data, extension)
+        else:
+            try:
+                result = self._parse_in_pool(executor, binary_data, extension)
+            except BrokenProcessPool as e:
+                logger.warning(f"[PARSE] Parse pool broken, parsing inline: {e}")
+                self._reset_executor()
+                result = self._parser.parse(binary_data, extension)
+
+        if cache_key is not None:
+            self._set_cached(cache_key, result)
+        return result
+
+    def _parse_in_pool(
+        self, executor: ProcessPoolExecutor, binary_data: bytes, extension: str
+    ) -> ParseResult:
+        if extension in _PAGED_EXTENSIONS:
+            try:
+                return self._parse_paged(executor, binary_data, extension)
+            except (DocumentParseError, BrokenProcessPool):
+                raise
+            except Exception as e:
+                logger.error(f"Error parsing document: {e}", exc_info=True)
+                raise DocumentParseError(
+                    f"Failed to parse document: {str(e)}",
+                    DocumentParseError.PARSE_FAILED,
+                ) from e
+        return executor.submit(_parse_document, binary_data, extension).result()
+
+    def _parse_paged(
+        self, executor: ProcessPoolExecutor, binary_data: bytes, extension: str
+    ) -> ParseResult:
+        """Extract page ranges in parallel, then truncate in this process."""
+        if extension == ".pdf":
+            page_count = len(DocumentParser.open_pdf(binary_data).pages)
+        else:
+            page_count = len(DocumentParser.open_pptx(binary_data).slides)
+
+        # One range per worker at most: every task receives a copy of the file
+        pages_per_task = max(
+            settings.ATTACHMENT_PARSE_PAGES_PER_TASK,
+            -(-page_count // self._max_workers),
+        )
+        futures = [
+            executor.submit(
+                _extract_page_range,
+                binary_data,
+                extension,
+                start,
+                min(start + pages_per_task, page_count),
+            )
+            for start in range(0, page_count, pages_per_task)
+        ]
+        pages_text = [text for future in futures for text in future.result()]
+
+        max_length = self._parser.get_max_text_length()
+        if extension == ".pdf":
+            text, truncation_info = self._parser.truncate_pdf_pages(
+                pages_text, max_length
+            )
+        else:
+            text, truncation_info = self._parser.truncate_pptx_slides(
+                pages_text, max_length
+            )
+
+        logger.info(
+            f"[PARSE] Extracted {page_count} pages of {extension} "
+            f"in {len(futures)} parallel ranges"
+        )
+        return ParseResult(
+            text=text, text_length=len(text), truncation_info=truncation_info
+        )
+
+    @staticmethod
+    def _get_cached(cache_key: str) -> Optional[ParseResult]:
+        data = cache_manager.get_sync(cache_key)
+        if not isinstance(data, dict):
+            return None
+        try:
+            truncation_info = data.get("truncation_info")
+            return ParseResult(
+                text=data["text"],
+                text_length=data["text_length"],
+                image_base64=data.get("image_base64"),
+                truncation_info=(
+                    TruncationInfo(**truncation_info) if truncation_info else None
+                ),
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"[PARSE] Ignoring malformed cache entry {cache_key}: {e}")
+            return None
+
+    @staticmethod
+    def _set_cached(cache_key: str, result: ParseResult) -> None:
+        cache_manager.set_sync(
+            cache_key,
+            asdict(result),
+            expire=settings.ATTACHMENT_PARSE_CACHE_TTL_SECONDS,
+        )
+
+
+# Global parse pipeline instance
+parse_pipeline = ParsePipeline()
@@ -197,6 +197,10 @@ class DocumentParseError(Exception):
         super().__init__(message)
         self.error_code = error_code or self.PARSE_FAILED
 
+    def __reduce__(self):
+        # Keep error_code when raised in a parse worker process
+        return (self.__class__, (str(self), self.error_code))
+
 
 class DocumentParser:
     """
@@ -835,34 +839,13 @@ class DocumentParser:
         Keeps first N pages + last M pages, omits middle pages.
         """
         try:
-            from PyPDF2 import PdfReader
-
-            pdf_file = io.BytesIO(binary_data)
-            reader = PdfReader(pdf_file)
-
-            if reader.is_encrypted:
-                raise DocumentParseError(
-                    "Cannot parse encrypted PDF file",
-                    DocumentParseError.ENCRYPTED_PDF,
-                )
+            reader = self.open_pdf(binary_data)
 
             # Extract text per page
-            pages_text = []
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    pages_text.append(page_text)
+            pages_text = self.extract_pdf_pages(reader)
 
             # Apply smart truncation
-            text, smart_info = self.truncation_manager.truncate_pdf(
-                pages_text, max_length
-            )
-
-            truncation_info = None
-            if smart_info.is_truncated:
-                truncation_info = TruncationInfo.from_smart_info(smart_info)
-
-            return text, truncation_info
+            return self.truncate_pdf_pages(pages_text, max_length)
 
         except DocumentParseError:
             raise
@@ -873,6 +856,101 @@ class DocumentParser:
                 DocumentParseError.PARSE_FAILED,
             ) from e
 
+    # ==================== Page-Level Extraction ====================
+    # Used by the smart parsers and by the parse pipeline, which extracts
+    # page ranges of large documents in parallel worker processes.
+
+    @staticmethod
+    def open_pdf(binary_data: bytes):
+        """
+        Open a PDF for page extraction.
+
+        Raises:
+            DocumentParseError: If the PDF is encrypted
+        """
+        from PyPDF2 import PdfReader
+
+        reader = PdfReader(io.BytesIO(binary_data))
+        if reader.is_encrypted:
+            raise DocumentParseError(
+                "Cannot parse encrypted PDF file",
+                DocumentParseError.ENCRYPTED_PDF,
+            )
+        return reader
+
+    @staticmethod
+    def extract_pdf_pages(
+        reader, start: int = 0, end: Optional[int] = None
+    ) -> List[str]:
+        """Extract the text of pages [start, end), skipping empty pages."""
+        end = len(reader.pages) if end is None else min(end, len(reader.pages))
+        pages_text = []
+        for index in range(start, end):
+            page_text = reader.pages[index].extract_text()
+            if page_text:
+                pages_text.append(page_text)
+        return pages_text
+
+    def truncate_pdf_pages(
+        self, pages_text: List[str], max_length: int
+    ) -> Tuple[str, Optional[TruncationInfo]]:
+        """Apply smart page-based truncation to extracted PDF pages."""
+        text, smart_info = self.truncation_manager.truncate_pdf(pages_text, max_length)
+
+        truncation_info = None
+        if smart_info.is_truncated:
+            truncation_info = TruncationInfo.from_smart_info(smart_info)
+
+        return text, truncation_info
+
+    @staticmethod
+    def open_pptx(binary_data: bytes):
+        """Open a PowerPoint (.pptx) presentation for slide extraction."""
+        from pptx import Presentation
+
+        return Presentation(io.BytesIO(binary_data))
+
+    @staticmethod
+    def extract_pptx_slides(
+        prs, start: int = 0, end: Optional[int] = None
+    ) -> List[str]:
+        """Extract the text of slides [start, end), skipping empty slides."""
+        slides = list(prs.slides)[start:end]
+        slides_text = []
+        for slide_num, slide in enumerate(slides, start + 1):
+            slide_content = [f"--- Slide {slide_num} ---"]
+
+            for shape in slide.shapes:
+                if hasattr(shape, "text") and shape.text.strip():
+                    slide_content.append(shape.text)
+
+                if shape.has_table:
+                    for row in shape.table.rows:
+                        row_text = []
+                        for cell in row.cells:
+                            if cell.text.strip():
+                                row_text.append(cell.text.strip())
+                        if row_text:
+                            slide_content.append(" | ".join(row_text))
+
+            if len(slide_content) > 1:
+                slides_text.append("\n".join(slide_content))
+        return slides_text
+
+    def truncate_pptx_slides(
+        self, slides_text: List[str], max_length: int
+    ) -> Tuple[str, Optional[TruncationInfo]]:
+        """Apply smart slide-based truncation to extracted slides."""
+        text, smart_info = self.truncation_manager.truncate_powerpoint(
+            slides_text, max_length
+        )
+
+        truncation_info = None
+        if smart_info.is_truncated:
+            truncation_info = TruncationInfo.from_smart_info(smart_info)
+
+        return text, truncation_info
+
     def _parse_word_smart(
         self, binary_data: bytes, extension: str, max_length: int
     ) -> Tuple[str, Optional[TruncationInfo]]:
@@ -946,42 +1024,13 @@ class DocumentParser:
                     DocumentParseError.LEGACY_PPT,
                 )
 
-            from pptx import Presentation
-
-            ppt_file = io.BytesIO(binary_data)
-            prs = Presentation(ppt_file)
+            prs = self.open_pptx(binary_data)
 
             # Extract text per slide
-            slides_text = []
-            for slide_num, slide in enumerate(prs.slides, 1):
-                slide_content = [f"--- Slide {slide_num} ---"]
-
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        slide_content.append(shape.text)
-
-                    if shape.has_table:
-                        for row in shape.table.rows:
-                            row_text = []
-                            for cell in row.cells:
-                                if cell.text.strip():
-                                    row_text.append(cell.text.strip())
-                            if row_text:
-                                slide_content.append(" | ".join(row_text))
-
-                if len(slide_content) > 1:
-                    slides_text.append("\n".join(slide_content))
+            slides_text = self.extract_pptx_slides(prs)
 
             # Apply smart truncation
-            text, smart_info = self.truncation_manager.truncate_powerpoint(
-                slides_text, max_length
-            )
-
-            truncation_info = None
-            if smart_info.is_truncated:
-                truncation_info = TruncationInfo.from_smart_info(smart_info)
-
-            return text, truncation_info
+            return self.truncate_pptx_slides(slides_text, max_length)
 
         except DocumentParseError:
             raise
@@ -20,10 +20,13 @@ import logging
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming attachment data to and from storage backends
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class StorageBackend(ABC):
     """
@@ -89,6 +92,49 @@ class StorageBackend(ABC):
             True if file exists, False otherwise
         """
 
+    def save_stream(self, key: str, chunks: Iterable[bytes], metadata: Dict) -> str:
+        """
+        Save file data provided as a stream of chunks.
+
+        The default implementation collects the chunks and calls save().
+        Backends that can write incrementally should override this so that
+        large files never have to be held in memory.
+
+        Args:
+            key: Unique storage key (format: attachments/{attachment_id})
+            chunks: File binary data, in order
+            metadata: Additional metadata (filename, mime_type, content_id, etc.)
+
+        Returns:
+            The storage key after saving
+
+        Raises:
+            StorageError: If save operation fails
+        """
+        return self.save(key, b"".join(chunks), metadata)
+
+    def open_stream(
+        self, key: str, start: int = 0, end: Optional[int] = None
+    ) -> Optional[Iterator[bytes]]:
+        """
+        Read stored data as a stream of chunks.
+
+        The default implementation slices the result of get(). Backends that
+        support ranged reads should override this.
+
+        Args:
+            key: Storage key to retrieve
+            start: First byte offset to read
+            end: Byte offset to stop at (exclusive), None for end of data
+
+        Returns:
+            Iterator over the requested bytes, or None if not found
+        """
+        data = self.get(key)
+        if data is None:
+            return None
+        return iter([data[start:end]])
+
     def get_url(self, key: str, expires: int = 3600) -> Optional[str]:
         """
         Get a URL for accessing the file.
@@ -75,11 +75,13 @@ class StorageBackendRegistry:
         self._register_default_backends()
 
     def _register_default_backends(self) -> None:
-        """Register the default MySQL backend."""
+        """Register the built-in MySQL and filesystem backends."""
         # Import here to avoid circular imports
+        from app.services.attachment.filesystem_storage import FilesystemStorageBackend
         from app.services.attachment.mysql_storage import MySQLStorageBackend
 
         self.register("mysql", lambda db: MySQLStorageBackend(db))
+        self.register("filesystem", lambda db: FilesystemStorageBackend(db))
 
     def register(
         self,
@@ -10,7 +10,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +104,34 @@ class BaseTruncationStrategy(ABC):
         """Estimate the length of text."""
         return len(text)
 
+    @staticmethod
+    def _joined_length(parts: Iterable[str], separator: str = "\n\n") -> int:
+        """Length of separator.join(parts) without building the string."""
+        total = 0
+        count = 0
+        for part in parts:
+            total += len(part)
+            count += 1
+        return total + len(separator) * max(count - 1, 0)
+
+    @staticmethod
+    def _join_prefix(parts: Iterable[str], limit: int, separator: str = "\n\n") -> str:
+        """
+        Return separator.join(parts)[:limit], consuming parts only until
+        limit characters have been produced.
+        """
+        pieces: List[str] = []
+        length = 0
+        for i, part in enumerate(parts):
+            if i:
+                pieces.append(separator)
+                length += len(separator)
+            pieces.append(part)
+            length += len(part)
+            if length >= limit:
+                break
+        return "".join(pieces)[:limit]
+
     def _uniform_sample_indices(
         self, total: int, sample_count: int, include_endpoints: bool = True
     ) -> List[int]:
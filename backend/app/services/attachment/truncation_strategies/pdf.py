@@ -42,12 +42,13 @@ class PDFTruncationStrategy(BaseTruncationStrategy):
 
         total_pages = len(pages_text)
 
-        # Format all pages with headers
-        full_parts = []
-        for i, page_text in enumerate(pages_text, 1):
-            full_parts.append(f"--- Page {i} ---\n{page_text}")
-        original_text = "\n\n".join(full_parts)
-        original_length = len(original_text)
+        # Format all pages with headers. The full text is only built when it
+        # fits or is cut; otherwise just its length is needed.
+        def full_parts():
+            for i, page_text in enumerate(pages_text, 1):
+                yield f"--- Page {i} ---\n{page_text}"
+
+        original_length = self._joined_length(full_parts())
 
         info.original_structure = {
             "total_pages": total_pages,
@@ -59,7 +60,7 @@ class PDFTruncationStrategy(BaseTruncationStrategy):
             info.truncation_type = TruncationType.NONE
             info.is_truncated = False
             info.truncated_length = original_length
-            return original_text, info
+            return "\n\n".join(full_parts()), info
 
         # Calculate how many pages we can keep based on max_length
         avg_page_len = original_length / max(1, total_pages)
@@ -69,7 +70,7 @@ class PDFTruncationStrategy(BaseTruncationStrategy):
 
         # Ensure we don't exceed total pages
         if max_pages_to_keep >= total_pages:
-            truncated = original_text[:max_length]
+            truncated = self._join_prefix(full_parts(), max_length)
             info.truncation_type = TruncationType.SIMPLE
             info.is_truncated = True
             info.original_length = original_length
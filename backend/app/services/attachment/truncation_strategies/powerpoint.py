@@ -41,8 +41,8 @@ class PowerPointTruncationStrategy(BaseTruncationStrategy):
         info = SmartTruncationInfo(truncation_type=TruncationType.SMART)
 
         total_slides = len(slides_text)
-        original_text = "\n\n".join(slides_text)
-        original_length = len(original_text)
+        # The full text is only built when it fits or is cut
+        original_length = self._joined_length(slides_text)
 
         info.original_structure = {
             "total_slides": total_slides,
@@ -54,7 +54,7 @@ class PowerPointTruncationStrategy(BaseTruncationStrategy):
             info.truncation_type = TruncationType.NONE
             info.is_truncated = False
             info.truncated_length = original_length
-            return original_text, info
+            return "\n\n".join(slides_text), info
 
         # Calculate how many slides we can keep based on max_length
         avg_slide_len = original_length / max(1, total_slides)
@@ -64,7 +64,7 @@ class PowerPointTruncationStrategy(BaseTruncationStrategy):
 
         # Ensure we don't exceed total slides
         if max_slides_to_keep >= total_slides:
-            truncated = original_text[:max_length]
+            truncated = self._join_prefix(slides_text, max_length)
             info.truncation_type = TruncationType.SIMPLE
             info.is_truncated = True
             info.original_length = original_length
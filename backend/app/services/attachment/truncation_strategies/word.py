@@ -41,8 +41,8 @@ class WordTruncationStrategy(BaseTruncationStrategy):
         info = SmartTruncationInfo(truncation_type=TruncationType.SMART)
 
         total_paragraphs = len(paragraphs)
-        original_text = "\n\n".join(paragraphs)
-        original_length = len(original_text)
+        # The full text is only built when it fits or is cut
+        original_length = self._joined_length(paragraphs)
 
         info.original_structure = {
             "total_paragraphs": total_paragraphs,
@@ -54,7 +54,7 @@ class WordTruncationStrategy(BaseTruncationStrategy):
             info.truncation_type = TruncationType.NONE
             info.is_truncated = False
             info.truncated_length = original_length
-            return original_text, info
+            return "\n\n".join(paragraphs), info
 
         # Calculate how many paragraphs we can keep based on max_length
         avg_para_len = original_length / max(1, total_paragraphs)
@@ -64,7 +64,7 @@ class WordTruncationStrategy(BaseTruncationStrategy):
 
         # Ensure we don't exceed total paragraphs
         if max_paras_to_keep >= total_paragraphs:
-            truncated = original_text[:max_length]
+            truncated = self._join_prefix(paragraphs, max_length)
             info.truncation_type = TruncationType.SIMPLE
             info.is_truncated = True
             info.original_length = original_length
@@ -9,7 +9,12 @@ and JWT authentication.
 """
 
 from .auth import get_token_expiry, is_token_expired, verify_jwt_token
-from .permissions import can_access_task, can_access_task_sync, get_active_streaming
+from .permissions import (
+    can_access_task,
+    can_access_task_sync,
+    get_active_streaming,
+    invalidate_task_access,
+)
 
 __all__ = [
     "verify_jwt_token",
@@ -18,4 +23,5 @@ __all__ = [
     "can_access_task",
     "can_access_task_sync",
     "get_active_streaming",
+    "invalidate_task_access",
 ]
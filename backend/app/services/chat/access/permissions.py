@@ -6,6 +6,11 @@
 
 This module provides utilities for checking task access permissions,
 including ownership and group membership checks.
+
+Access decisions are cached in Redis (one hash per task, one field per user)
+because every task:join, chat:resume and history:sync checks them. Code that
+changes task ownership, sharing or membership must call
+invalidate_task_access() after committing.
 """
 
 import logging
@@ -13,12 +18,34 @@ from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_manager
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
 from app.models.task import TaskResource
 
 logger = logging.getLogger(__name__)
 
+_ALLOWED = b"1"
+_DENIED = b"0"
+
+
+def _task_access_cache_key(task_id: int) -> str:
+    return f"chat:task_access:{task_id}"
+
+
+def invalidate_task_access(task_id: int) -> None:
+    """
+    Drop cached access decisions of all users for a task.
+
+    Call after committing a change of task ownership, sharing or membership.
+
+    Args:
+        task_id: Task ID
+    """
+    if settings.CHAT_TASK_ACCESS_CACHE_TTL > 0:
+        cache_manager.delete_sync(_task_access_cache_key(task_id))
+
 
 async def can_access_task(user_id: int, task_id: int) -> bool:
     """
@@ -36,6 +63,29 @@ async def can_access_task(user_id: int, task_id: int) -> bool:
     Returns:
         True if user can access the task
     """
+    from app.services.chat.storage.db import run_in_db_executor
+
+    cache_key = _task_access_cache_key(task_id)
+    if settings.CHAT_TASK_ACCESS_CACHE_TTL > 0:
+        cached = await cache_manager.hget_raw(cache_key, str(user_id))
+        if cached is not None:
+            return cached == _ALLOWED
+
+    allowed = await run_in_db_executor(
+        _can_access_task_in_new_session, user_id, task_id
+    )
+
+    if settings.CHAT_TASK_ACCESS_CACHE_TTL > 0:
+        await cache_manager.hset_raw(
+            cache_key,
+            str(user_id),
+            _ALLOWED if allowed else _DENIED,
+            expire=settings.CHAT_TASK_ACCESS_CACHE_TTL,
+        )
+    return allowed
+
+
+def _can_access_task_in_new_session(user_id: int, task_id: int) -> bool:
     db = SessionLocal()
     try:
         return can_access_task_sync(db, user_id, task_id)
@@ -146,6 +196,23 @@ async def get_active_streaming(task_id: int) -> Optional[Dict[str, Any]]:
     logger.info(
         f"[get_active_streaming] No Redis status, falling back to DB query for task_id={task_id}"
     )
+    from app.services.chat.storage.db import run_in_db_executor
+
+    streaming = await run_in_db_executor(_get_running_assistant_subtask, task_id)
+    if streaming:
+        logger.info(
+            f"[get_active_streaming] Found DB streaming subtask for task {task_id}: "
+            f"subtask_id={streaming['subtask_id']}"
+        )
+        return streaming
+
+    logger.info(
+        f"[get_active_streaming] No active streaming found for task_id={task_id}"
+    )
+    return None
+
+
+def _get_running_assistant_subtask(task_id: int) -> Optional[Dict[str, Any]]:
     db = SessionLocal()
     try:
         # Find running assistant subtask
@@ -159,24 +226,15 @@ async def get_active_streaming(task_id: int) -> Optional[Dict[str, Any]]:
             .order_by(Subtask.id.desc())
             .first()
         )
-
-        if subtask:
-            logger.info(
-                f"[get_active_streaming] Found DB streaming subtask for task {task_id}: "
-                f"subtask_id={subtask.id}, status={subtask.status}"
-            )
-            return {
-                "subtask_id": subtask.id,
-                "user_id": subtask.user_id,
-                "started_at": (
-                    subtask.created_at.isoformat() if subtask.created_at else None
-                ),
-            }
-
-        logger.info(
-            f"[get_active_streaming] No active streaming found for task_id={task_id}"
-        )
-        return None
-
+        if not subtask:
+            return None
+
+        return {
+            "subtask_id": subtask.id,
+            "user_id": subtask.user_id,
+            "started_at": (
+                subtask.created_at.isoformat() if subtask.created_at else None
+            ),
+        }
     finally:
         db.close()
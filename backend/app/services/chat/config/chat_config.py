@@ -6,16 +6,27 @@
 
 This module centralizes the configuration preparation logic for chat sessions,
 including Bot, Model, Ghost resolution and system prompt building.
+
+The resolved Team -> Bot -> Ghost -> Shell -> Model -> Skill graph is compiled
+into a TeamSnapshot that is cached per team revision (see team_snapshot.py).
 """
 
+import copy
 import logging
 from dataclasses import dataclass, field
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.kind import Kind
-from app.schemas.kind import Bot, Team
+from app.schemas.kind import Bot, Ghost, Team
+from app.services.chat.config.team_snapshot import (
+    Dependency,
+    TeamSnapshot,
+    team_snapshot_cache,
+)
+from app.services.readers.kinds import KindType, kindReader
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +73,9 @@ class ChatConfig:
     # Preload skills list (resolved from Ghost CRD + frontend override)
     preload_skills: list[str] = field(default_factory=list)
 
+    # MCP servers declared in the bot's Ghost CRD
+    bot_mcp_servers: dict[str, Any] = field(default_factory=dict)
+
     # Prompt enhancement options (handled internally by chat_shell)
     enable_clarification: bool = False
     enable_deep_thinking: bool = True
@@ -104,9 +118,6 @@ class ChatConfigBuilder:
         # Parse team CRD
         self._team_crd = Team.model_validate(team.json)
 
-        # Cache shell_type for the first bot to avoid repeated database queries
-        self._cached_shell_type: str | None = None
-
     def build(
         self,
         override_model_name: str | None = None,
@@ -131,48 +142,41 @@ class ChatConfigBuilder:
         Returns:
             Complete ChatConfig ready for streaming
         """
-        # Get first bot from team
-        bot = self._get_first_bot()
-        if not bot:
-            raise ValueError(f"No bot found for team {self.team.name}")
+        snapshot = self.get_snapshot()
 
         # Get model config
         model_config = self._get_model_config(
-            bot,
+            snapshot,
             override_model_name,
             force_override,
             task_id,
         )
 
-        # Get skills for the bot (needed for load_skill tool and prompt enhancement)
-        # Also get preload_skills from Ghost CRD
-        skills, resolved_preload_skills = self._get_bot_skills(
-            bot, preload_skills=preload_skills or []
-        )
+        # Skills are needed for load_skill tool and prompt enhancement.
+        # SECURITY: Only public skills (user_id=0) can be preloaded
+        skills = copy.deepcopy(snapshot.skills)
+        preload_set = set(snapshot.preload_skills) | set(preload_skills or [])
+        resolved_preload_skills = [
+            s["name"]
+            for s in skills
+            if s["name"] in preload_set and s["skill_user_id"] == 0
+        ]
 
         skill_names = [s["name"] for s in skills]
 
         # Get base system prompt (without enhancements - those are handled by chat_shell)
-        system_prompt = self._get_base_system_prompt(bot, team_member_prompt)
+        system_prompt = self._get_base_system_prompt(snapshot, team_member_prompt)
 
         # Get agent config
-        bot_spec = bot.json.get("spec", {}) if bot.json else {}
-        agent_config = bot_spec.get("agent_config", {})
-
-        # Parse bot CRD for name/namespace
-        bot_crd = Bot.model_validate(bot.json)
-
-        # Get shell_type from cache or query database (only once per builder instance)
-        if self._cached_shell_type is None:
-            self._cached_shell_type = self._resolve_shell_type(bot_crd)
-        shell_type = self._cached_shell_type
+        bot_spec = snapshot.bot_json.get("spec", {})
+        agent_config = copy.deepcopy(bot_spec.get("agent_config", {}))
 
         return ChatConfig(
             model_config=model_config,
             system_prompt=system_prompt,
-            bot_name=bot_crd.metadata.name if bot_crd.metadata else bot.name,
-            bot_namespace=bot_crd.metadata.namespace if bot_crd.metadata else "default",
-            shell_type=shell_type,
+            bot_name=snapshot.bot_name,
+            bot_namespace=snapshot.bot_namespace,
+            shell_type=snapshot.shell_type,
             agent_config=agent_config,
             user_id=self.user_id,
             user_name=self.user_name,
@@ -183,6 +187,97 @@ class ChatConfigBuilder:
             preload_skills=resolved_preload_skills,  # Resolved from Ghost CRD + frontend
             enable_clarification=enable_clarification,
             enable_deep_thinking=enable_deep_thinking,
+            bot_mcp_servers=copy.deepcopy(snapshot.mcp_servers),
+        )
+
+    def get_snapshot(self) -> TeamSnapshot:
+        """Get the compiled snapshot of the team, compiling it on a cache miss.
+
+        Returns:
+            TeamSnapshot of the team's first bot
+
+        Raises:
+            ValueError: If the team has no resolvable bot
+        """
+        if not settings.CHAT_TEAM_SNAPSHOT_ENABLED:
+            return self._compile_snapshot()
+        return team_snapshot_cache.get_or_compile(
+            self.team.id, self.user_id, self._compile_snapshot
+        )
+
+    def _compile_snapshot(self) -> TeamSnapshot:
+        """Resolve the team's first bot and everything it references.
+
+        Returns:
+            New TeamSnapshot
+
+        Raises:
+            ValueError: If the team has no resolvable bot
+        """
+        from app.services.chat.config.model_resolver import (
+            find_model,
+            resolve_bot_model_name,
+        )
+
+        # Get first bot from team
+        bot = self._get_first_bot()
+        if not bot:
+            raise ValueError(f"No bot found for team {self.team.name}")
+
+        bot_crd = Bot.model_validate(bot.json)
+        team_namespace = self.team.namespace or "default"
+        dependencies: list[Dependency] = [
+            ("Team", team_namespace, self.team.name),
+            ("Bot", bot.namespace, bot.name),
+        ]
+
+        ghost_crd = None
+        if bot_crd.spec and bot_crd.spec.ghostRef:
+            ghost_ref = bot_crd.spec.ghostRef
+            dependencies.append(("Ghost", ghost_ref.namespace, ghost_ref.name))
+            ghost = self._get_ghost(bot_crd)
+            if ghost and ghost.json:
+                ghost_crd = Ghost.model_validate(ghost.json)
+
+        # Get skills for the bot, with the Ghost CRD preload_skills validated
+        skills, preload_skills = self._get_bot_skills(bot)
+        skill_refs = ghost_crd.spec.skills if ghost_crd else None
+        for skill_name in skill_refs or []:
+            dependencies.append(("Skill", "default", skill_name))
+            if team_namespace != "default":
+                dependencies.append(("Skill", team_namespace, skill_name))
+
+        if bot_crd.spec and bot_crd.spec.shellRef:
+            shell_ref = bot_crd.spec.shellRef
+            dependencies.append(("Shell", shell_ref.namespace, shell_ref.name))
+
+        # Model used unless the request overrides it
+        model_name = resolve_bot_model_name(bot.json)
+        model_spec = None
+        if model_name:
+            dependencies.append(("Model", "default", model_name))
+            model_spec = find_model(self.db, model_name, self.team.user_id)
+
+        return TeamSnapshot.create(
+            team_id=self.team.id,
+            bot_name=bot_crd.metadata.name if bot_crd.metadata else bot.name,
+            bot_namespace=(
+                bot_crd.metadata.namespace if bot_crd.metadata else "default"
+            ),
+            bot_json=bot.json or {},
+            shell_type=self._resolve_shell_type(bot_crd),
+            ghost_system_prompt=(
+                ghost_crd.spec.systemPrompt or "" if ghost_crd else ""
+            ),
+            member_prompt=self.get_first_member_prompt(),
+            mcp_servers=(
+                ghost_crd.spec.mcpServers or {} if ghost_crd and ghost_crd.spec else {}
+            ),
+            skills=skills,
+            preload_skills=preload_skills,
+            model_name=model_name,
+            model_spec=model_spec,
+            dependencies=dependencies,
         )
 
     def _get_first_bot(self) -> Kind | None:
@@ -197,16 +292,12 @@ class ChatConfigBuilder:
 
         first_member = self._team_crd.spec.members[0]
 
-        bot = (
-            self.db.query(Kind)
-            .filter(
-                Kind.user_id == self.team.user_id,
-                Kind.kind == "Bot",
-                Kind.name == first_member.botRef.name,
-                Kind.namespace == first_member.botRef.namespace,
-                Kind.is_active,
-            )
-            .first()
+        bot = kindReader.get_by_name_and_namespace(
+            self.db,
+            self.team.user_id,
+            KindType.BOT,
+            first_member.botRef.namespace,
+            first_member.botRef.name,
         )
 
         if not bot:
@@ -220,7 +311,7 @@ class ChatConfigBuilder:
 
     def _get_model_config(
         self,
-        bot: Kind,
+        snapshot: TeamSnapshot,
         override_model_name: str | None,
         force_override: bool,
         task_id: int,
@@ -228,30 +319,41 @@ class ChatConfigBuilder:
         """Get model configuration for the bot.
 
         Args:
-            bot: Bot Kind object
+            snapshot: Compiled team snapshot
             override_model_name: Optional model name override
             force_override: Whether override takes priority
             task_id: Task ID for placeholder replacement
 
         Returns:
             Model configuration dictionary
+
+        Raises:
+            ValueError: If no model is configured or model not found
         """
         from app.services.chat.config.model_resolver import (
             _process_model_config_placeholders,
-            get_model_config_for_bot,
+            extract_model_config,
+            find_model,
+            resolve_bot_model_name,
         )
 
-        # Get base model config (extracts from DB and handles env placeholders + decryption)
-        model_config = get_model_config_for_bot(
-            self.db,
-            bot,
-            self.team.user_id,
-            override_model_name=override_model_name,
-            force_override=force_override,
+        model_name = resolve_bot_model_name(
+            snapshot.bot_json, override_model_name, force_override
         )
+        if not model_name:
+            raise ValueError(f"Bot {snapshot.bot_name} has no model configured")
+
+        if model_name == snapshot.model_name and snapshot.model_config is not None:
+            # Already decrypted and env placeholders resolved
+            model_config = copy.deepcopy(snapshot.model_config)
+        else:
+            model_spec = find_model(self.db, model_name, self.team.user_id)
+            if not model_spec:
+                raise ValueError(f"Model {model_name} not found")
+            model_config = extract_model_config(model_spec)
 
         # Build agent_config and task_data for placeholder replacement
-        bot_spec = bot.json.get("spec", {}) if bot.json else {}
+        bot_spec = snapshot.bot_json.get("spec", {})
         agent_config = bot_spec.get("agent_config", {})
         user_info = {"id": self.user_id, "name": self.user_name}
         task_data = {
@@ -273,7 +375,7 @@ class ChatConfigBuilder:
 
     def _get_base_system_prompt(
         self,
-        bot: Kind,
+        snapshot: TeamSnapshot,
         team_member_prompt: str | None,
     ) -> str:
         """Get base system prompt for the bot (without enhancements).
@@ -283,25 +385,26 @@ class ChatConfigBuilder:
         internally by chat_shell based on the enable_* flags in ChatConfig.
 
         Args:
-            bot: Bot Kind object
+            snapshot: Compiled team snapshot
             team_member_prompt: Optional additional prompt from team member
 
         Returns:
             Base system prompt (Ghost prompt + team member prompt)
         """
-        from app.services.chat.config.model_resolver import get_bot_system_prompt
+        system_prompt = snapshot.ghost_system_prompt
 
         # Get team member prompt from first member if not provided
-        if team_member_prompt is None and self._team_crd.spec.members:
-            team_member_prompt = self._team_crd.spec.members[0].prompt
+        if team_member_prompt is None:
+            team_member_prompt = snapshot.member_prompt
 
-        # Get base system prompt (no enhancements applied here)
-        return get_bot_system_prompt(
-            self.db,
-            bot,
-            self.team.user_id,
-            team_member_prompt,
-        )
+        # Append team member prompt if provided
+        if team_member_prompt:
+            if system_prompt:
+                system_prompt = f"{system_prompt}\n\n{team_member_prompt}"
+            else:
+                system_prompt = team_member_prompt
+
+        return system_prompt
 
     def get_first_member_prompt(self) -> str | None:
         """Get the prompt from the first team member.
@@ -317,7 +420,7 @@ class ChatConfigBuilder:
         """Resolve shell_type from bot's shellRef.
 
         This method queries the Shell CRD to get the shell_type.
-        It's called once per builder instance and the result is cached.
+        It's called when compiling the team snapshot.
 
         Args:
             bot_crd: Parsed Bot CRD
@@ -335,32 +438,15 @@ class ChatConfigBuilder:
 
         shell_ref = bot_crd.spec.shellRef
 
-        # Query user's private shell first
-        shell = (
-            self.db.query(Kind)
-            .filter(
-                Kind.user_id == self.user_id,
-                Kind.kind == "Shell",
-                Kind.name == shell_ref.name,
-                Kind.namespace == shell_ref.namespace,
-                Kind.is_active,
-            )
-            .first()
+        # User's private shell first, then public shells (user_id = 0)
+        shell = kindReader.get_by_name_and_namespace(
+            self.db,
+            self.user_id,
+            KindType.SHELL,
+            shell_ref.namespace,
+            shell_ref.name,
         )
 
-        # If not found in user's shells, try public shells (user_id = 0)
-        if not shell:
-            shell = (
-                self.db.query(Kind)
-                .filter(
-                    Kind.user_id == 0,
-                    Kind.kind == "Shell",
-                    Kind.name == shell_ref.name,
-                    Kind.is_active,
-                )
-                .first()
-            )
-
         # Extract shell_type from Shell CRD
         if shell and shell.json:
             shell_crd = Shell.model_validate(shell.json)
@@ -397,7 +483,7 @@ class ChatConfigBuilder:
         Returns:
             Tuple of (skills, preload_skills)
         """
-        from app.schemas.kind import Ghost, Skill
+        from app.schemas.kind import Skill
 
         bot_crd = Bot.model_validate(bot.json)
         logger.info(
@@ -411,19 +497,7 @@ class ChatConfigBuilder:
             )
             return [], []
 
-        # Query Ghost
-        ghost = (
-            self.db.query(Kind)
-            .filter(
-                Kind.user_id == self.team.user_id,
-                Kind.kind == "Ghost",
-                Kind.name == bot_crd.spec.ghostRef.name,
-                Kind.namespace == bot_crd.spec.ghostRef.namespace,
-                Kind.is_active == True,  # noqa: E712
-            )
-            .first()
-        )
-
+        ghost = self._get_ghost(bot_crd)
         if not ghost or not ghost.json:
             logger.warning(
                 "[_get_bot_skills] Ghost not found: name=%s, namespace=%s",
@@ -523,6 +597,23 @@ class ChatConfigBuilder:
         )
         return skills, validated_preload_skills
 
+    def _get_ghost(self, bot_crd: Bot) -> Kind | None:
+        """Get the Ghost referenced by the bot.
+
+        Args:
+            bot_crd: Parsed Bot CRD with a ghostRef
+
+        Returns:
+            Ghost Kind object or None
+        """
+        return kindReader.get_by_name_and_namespace(
+            self.db,
+            self.team.user_id,
+            KindType.GHOST,
+            bot_crd.spec.ghostRef.namespace,
+            bot_crd.spec.ghostRef.name,
+        )
+
     def _find_skill(self, skill_name: str) -> Kind | None:
         """Find skill by name.
 
@@ -535,46 +626,21 @@ class ChatConfigBuilder:
         team_namespace = self.team.namespace if self.team.namespace else "default"
 
         # 1. User's personal skill (default namespace)
-        skill = (
-            self.db.query(Kind)
-            .filter(
-                Kind.user_id == self.team.user_id,
-                Kind.kind == "Skill",
-                Kind.name == skill_name,
-                Kind.namespace == "default",
-                Kind.is_active == True,  # noqa: E712
+        if self.team.user_id != 0:
+            skill = kindReader.get_personal(
+                self.db, self.team.user_id, KindType.SKILL, "default", skill_name
             )
-            .first()
-        )
-
-        if skill:
-            return skill
+            if skill:
+                return skill
 
         # 2. Group-level skill (team's namespace) - search ALL skills in namespace
         # This allows any team member's skill to be used by other members
         if team_namespace != "default":
-            skill = (
-                self.db.query(Kind)
-                .filter(
-                    Kind.kind == "Skill",
-                    Kind.name == skill_name,
-                    Kind.namespace == team_namespace,
-                    Kind.is_active == True,  # noqa: E712
-                )
-                .first()
+            skill = kindReader.get_group(
+                self.db, KindType.SKILL, team_namespace, skill_name
             )
-
             if skill:
                 return skill
 
         # 3. Public skill (user_id=0)
-        return (
-            self.db.query(Kind)
-            .filter(
-                Kind.user_id == 0,
-                Kind.kind == "Skill",
-                Kind.name == skill_name,
-                Kind.is_active == True,  # noqa: E712
-            )
-            .first()
-        )
+        return kindReader.get_public(self.db, KindType.SKILL, "default", skill_name)
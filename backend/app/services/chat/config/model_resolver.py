@@ -20,6 +20,7 @@ from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.models.kind import Kind
 from app.schemas.kind import Bot, Model
+from app.services.readers.kinds import KindType, kindReader
 
 logger = logging.getLogger(__name__)
 
@@ -235,7 +236,7 @@ def _process_model_config_placeholders(
     Handles placeholders like ${user.user_name}, ${agent_config.env.xxx}, etc.
 
     Args:
-        model_config: Model configuration dict from _extract_model_config
+        model_config: Model configuration dict from extract_model_config
         user_id: Current user's ID
         user_name: Current user's username
         agent_config: Optional agent config from bot (for chat mode)
@@ -299,7 +300,7 @@ def extract_and_process_model_config(
     """
     Extract model configuration from spec and process all placeholders.
 
-    This is the main public function that combines _extract_model_config
+    This is the main public function that combines extract_model_config
     and _process_model_config_placeholders into a single call.
 
     Used by both chat and wizard to get a fully processed model config.
@@ -322,7 +323,7 @@ def extract_and_process_model_config(
         }
     """
     # Step 1: Extract basic model config (handles env var placeholders and decryption)
-    model_config = _extract_model_config(model_spec)
+    model_config = extract_model_config(model_spec)
 
     # Step 2: Process data source placeholders (${user.xxx}, ${agent_config.xxx}, etc.)
     model_config = _process_model_config_placeholders(
@@ -336,6 +337,60 @@ def extract_and_process_model_config(
     return model_config
 
 
+def resolve_bot_model_name(
+    bot_json: Optional[Dict[str, Any]],
+    override_model_name: Optional[str] = None,
+    force_override: bool = False,
+) -> Optional[str]:
+    """
+    Resolve the name of the model a Bot runs with.
+
+    Resolution priority:
+    1. override_model_name with force_override=True (task-level override)
+    2. bot.spec.agent_config.bind_model (bot-level binding)
+    3. bot.spec.modelRef (legacy reference)
+    4. override_model_name without force_override (fallback)
+
+    Args:
+        bot_json: The Bot CRD JSON
+        override_model_name: Optional model name to override
+        force_override: If True, override_model_name takes highest priority
+
+    Returns:
+        Model name, or None if no model is configured
+    """
+    # Priority 1: Force override from task
+    if force_override and override_model_name:
+        logger.info(f"Using task model (force override): {override_model_name}")
+        return override_model_name
+
+    # Priority 2: Bot's agent_config.bind_model
+    # Note: Bot CRD doesn't have agent_config directly, check if it's in the JSON
+    bot_json = bot_json or {}
+    spec = bot_json.get("spec", {})
+    agent_config = spec.get("agent_config", {})
+    bind_model = agent_config.get("bind_model")
+
+    if bind_model and isinstance(bind_model, str) and bind_model.strip():
+        model_name = bind_model.strip()
+        logger.info(f"Using bot bound model: {model_name}")
+        return model_name
+
+    # Priority 3: Bot's modelRef (legacy)
+    bot_crd = Bot.model_validate(bot_json)
+    if bot_crd.spec.modelRef:
+        model_name = bot_crd.spec.modelRef.name
+        logger.info(f"Using bot modelRef: {model_name}")
+        return model_name
+
+    # Priority 4: Task-level override (fallback)
+    if override_model_name:
+        logger.info(f"Using task model (fallback): {override_model_name}")
+        return override_model_name
+
+    return None
+
+
 def get_model_config_for_bot(
     db: Session,
     bot: Kind,
@@ -346,11 +401,7 @@ def get_model_config_for_bot(
     """
     Get model configuration for a Bot.
 
-    Resolution priority:
-    1. override_model_name with force_override=True (task-level override)
-    2. bot.spec.agent_config.bind_model (bot-level binding)
-    3. bot.spec.modelRef (legacy reference)
-    4. override_model_name without force_override (fallback)
+    The model is chosen by resolve_bot_model_name().
 
     Args:
         db: Database session
@@ -371,48 +422,20 @@ def get_model_config_for_bot(
     Raises:
         ValueError: If no model is configured or model not found
     """
-    bot_crd = Bot.model_validate(bot.json)
-    model_name = None
-
-    # Priority 1: Force override from task
-    if force_override and override_model_name:
-        model_name = override_model_name
-        logger.info(f"Using task model (force override): {model_name}")
-    else:
-        # Priority 2: Bot's agent_config.bind_model
-        # Note: Bot CRD doesn't have agent_config directly, check if it's in the JSON
-        bot_json = bot.json or {}
-        spec = bot_json.get("spec", {})
-        agent_config = spec.get("agent_config", {})
-        bind_model = agent_config.get("bind_model")
-
-        if bind_model and isinstance(bind_model, str) and bind_model.strip():
-            model_name = bind_model.strip()
-            logger.info(f"Using bot bound model: {model_name}")
-
-        # Priority 3: Bot's modelRef (legacy)
-        if not model_name and bot_crd.spec.modelRef:
-            model_name = bot_crd.spec.modelRef.name
-            logger.info(f"Using bot modelRef: {model_name}")
-
-        # Priority 4: Task-level override (fallback)
-        if not model_name and override_model_name:
-            model_name = override_model_name
-            logger.info(f"Using task model (fallback): {model_name}")
-
+    model_name = resolve_bot_model_name(bot.json, override_model_name, force_override)
     if not model_name:
         raise ValueError(f"Bot {bot.name} has no model configured")
 
     # Find the model
-    model_spec = _find_model(db, model_name, user_id)
+    model_spec = find_model(db, model_name, user_id)
     if not model_spec:
         raise ValueError(f"Model {model_name} not found")
 
     # Extract and return configuration
-    return _extract_model_config(model_spec)
+    return extract_model_config(model_spec)
 
 
-def _find_model(db: Session, model_name: str, user_id: int) -> Optional[Dict[str, Any]]:
+def find_model(db: Session, model_name: str, user_id: int) -> Optional[Dict[str, Any]]:
     """
     Find model by name.
 
@@ -428,34 +451,15 @@ def _find_model(db: Session, model_name: str, user_id: int) -> Optional[Dict[str
     Returns:
         Model spec dictionary or None if not found
     """
-    # Search user's private models first
-    user_model = (
-        db.query(Kind)
-        .filter(
-            Kind.kind == "Model",
-            Kind.user_id == user_id,
-            Kind.name == model_name,
-            Kind.is_active == True,
-        )
-        .first()
-    )
+    # Search user's private models first (in any namespace)
+    user_model = kindReader.get_owned(db, user_id, KindType.MODEL, model_name)
 
     if user_model and user_model.json:
         logger.info(f"Found model '{model_name}' in user's private models")
         return user_model.json.get("spec", {})
 
     # Search public models
-    public_model = (
-        db.query(Kind)
-        .filter(
-            Kind.user_id == 0,
-            Kind.kind == "Model",
-            Kind.name == model_name,
-            Kind.namespace == "default",
-            Kind.is_active == True,
-        )
-        .first()
-    )
+    public_model = kindReader.get_public(db, KindType.MODEL, "default", model_name)
 
     if public_model and public_model.json:
         logger.info(f"Found model '{model_name}' in public models")
@@ -465,7 +469,7 @@ def _find_model(db: Session, model_name: str, user_id: int) -> Optional[Dict[str
     return None
 
 
-def _extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
+def extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract API configuration from model spec.
 
@@ -476,17 +480,17 @@ def _extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
         Dict with api_key, base_url, model_id, model type, and default_headers
     """
     logger.info(
-        f"[model_resolver] _extract_model_config: model_spec keys = {list(model_spec.keys())}"
+        f"[model_resolver] extract_model_config: model_spec keys = {list(model_spec.keys())}"
     )
 
     model_config = model_spec.get("modelConfig", {})
     logger.info(
-        f"[model_resolver] _extract_model_config: modelConfig keys = {list(model_config.keys()) if model_config else 'empty'}"
+        f"[model_resolver] extract_model_config: modelConfig keys = {list(model_config.keys()) if model_config else 'empty'}"
     )
 
     env = model_config.get("env", {})
     logger.info(
-        f"[model_resolver] _extract_model_config: env keys = {list(env.keys()) if env else 'empty'}"
+        f"[model_resolver] extract_model_config: env keys = {list(env.keys()) if env else 'empty'}"
     )
 
     # Get raw values with defaults
@@ -537,7 +541,7 @@ def _extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
             default_headers = {}
 
     logger.info(
-        f"[model_resolver] _extract_model_config: DEFAULT_HEADERS keys = {list(default_headers.keys()) if default_headers else 'empty'}"
+        f"[model_resolver] extract_model_config: DEFAULT_HEADERS keys = {list(default_headers.keys()) if default_headers else 'empty'}"
     )
 
     # Log extracted values (do NOT log any API key material)
@@ -548,7 +552,7 @@ def _extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
     else:
         api_key_state = "SET"
     logger.info(
-        f"[model_resolver] _extract_model_config: api_key={api_key_state}, base_url={base_url}, model_id={model_id}, model_type={model_type}"
+        f"[model_resolver] extract_model_config: api_key={api_key_state}, base_url={base_url}, model_id={model_id}, model_type={model_type}"
     )
 
     # Decrypt API key if encrypted (only if it doesn't look like a placeholder)
@@ -569,7 +573,7 @@ def _extract_model_config(model_spec: Dict[str, Any]) -> Dict[str, Any]:
     if not api_format and protocol == "openai-responses":
         api_format = "responses"
         logger.info(
-            f"[model_resolver] _extract_model_config: using responses API from protocol={protocol}"
+            f"[model_resolver] extract_model_config: using responses API from protocol={protocol}"
         )
 
     # Context window and output token limits from modelConfig
@@ -612,16 +616,12 @@ def get_bot_system_prompt(
     system_prompt = ""
 
     # Get Ghost for system prompt
-    ghost = (
-        db.query(Kind)
-        .filter(
-            Kind.user_id == user_id,
-            Kind.kind == "Ghost",
-            Kind.name == bot_crd.spec.ghostRef.name,
-            Kind.namespace == bot_crd.spec.ghostRef.namespace,
-            Kind.is_active == True,
-        )
-        .first()
+    ghost = kindReader.get_by_name_and_namespace(
+        db,
+        user_id,
+        KindType.GHOST,
+        bot_crd.spec.ghostRef.namespace,
+        bot_crd.spec.ghostRef.name,
     )
 
     if ghost and ghost.json:
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compiled team snapshots for chat requests.
+
+Building a chat configuration walks Team -> Bot -> Ghost -> Shell -> Model ->
+Skill and decrypts the model API key. None of this depends on the message, so
+ChatConfigBuilder compiles it once per team revision into an immutable
+TeamSnapshot and only applies per-request values (model override,
+placeholders, preload skills) on top.
+
+Snapshots are cached at two levels:
+- In-process: an entry is dropped as soon as one of the CRDs it was compiled
+  from changes in any worker (kind change listener).
+- Redis: an entry stores the kinds:revisions counters of those CRDs and is
+  discarded on load if any counter moved, so other workers can reuse it
+  without querying MySQL. Entries never outlive the counters hash, whose
+  expiration is refreshed whenever an entry is saved.
+
+The Redis copy keeps the model spec as stored in the database (API key still
+encrypted); it is decrypted once per process when the entry is loaded.
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional, Set, Tuple
+
+import orjson
+
+from app.core.cache import cache_manager
+from app.core.config import settings
+from app.core.memory_cache import TTLLRUCache
+from app.services.readers.kinds import (
+    KIND_REVISION_ALL,
+    KIND_REVISIONS_KEY,
+    add_kind_change_listener,
+    kind_revision_field,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes to invalidate cached entries
+SNAPSHOT_CACHE_VERSION = 1
+SNAPSHOT_KEY_PREFIX = f"chat:team_snapshot:v{SNAPSHOT_CACHE_VERSION}"
+
+# (kind, namespace, name) of a CRD a snapshot was compiled from
+Dependency = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class TeamSnapshot:
+    """Resolved configuration of a team's first bot.
+
+    Treat all fields as read-only; ChatConfigBuilder hands out copies.
+    """
+
+    # Content hash of the compiled CRD data
+    version: str
+
+    team_id: int
+    bot_name: str
+    bot_namespace: str
+    bot_json: dict[str, Any]
+    shell_type: str
+
+    # Ghost configuration
+    ghost_system_prompt: str
+    member_prompt: str | None
+    mcp_servers: dict[str, Any]
+
+    # Skill configurations and the Ghost preload skills that passed validation
+    skills: list[dict[str, Any]]
+    preload_skills: list[str]
+
+    # Model the bot runs with when the request does not override it
+    model_name: str | None
+    model_spec: dict[str, Any] | None
+
+    dependencies: tuple[Dependency, ...]
+
+    # Decrypted model config; in-process only, never written to Redis
+    model_config: dict[str, Any] | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def create(cls, **fields: Any) -> "TeamSnapshot":
+        """Create a snapshot, computing its version and decrypted model config."""
+        fields["dependencies"] = tuple(sorted(set(fields["dependencies"])))
+        payload = orjson.dumps(fields, option=orjson.OPT_SORT_KEYS)
+        return cls._with_model_config(
+            version=hashlib.sha256(payload).hexdigest(), **fields
+        )
+
+    @classmethod
+    def from_cache(cls, data: dict[str, Any]) -> "TeamSnapshot":
+        """Rebuild a snapshot from its Redis representation."""
+        data = dict(data)
+        data["dependencies"] = tuple(tuple(d) for d in data["dependencies"])
+        return cls._with_model_config(**data)
+
+    def to_cache(self) -> dict[str, Any]:
+        """Return the Redis representation (without the decrypted model config)."""
+        data = asdict(self)
+        del data["model_config"]
+        return data
+
+    @classmethod
+    def _with_model_config(cls, **fields: Any) -> "TeamSnapshot":
+        from app.services.chat.config.model_resolver import extract_model_config
+
+        model_spec = fields.get("model_spec")
+        model_config = extract_model_config(model_spec) if model_spec else None
+        return cls(model_config=model_config, **fields)
+
+
+class TeamSnapshotCache:
+    """In-process + Redis cache of TeamSnapshots keyed by (team_id, user_id)."""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600):
+        """
+        Initialize the snapshot cache.
+
+        Args:
+            maxsize: Maximum number of in-process snapshots
+            ttl: Lifetime of in-process and Redis entries in seconds, capped
+                at KIND_REVISIONS_TTL_SECONDS for Redis entries
+        """
+        self._ttl = ttl
+        self._redis_ttl = min(ttl, settings.KIND_REVISIONS_TTL_SECONDS)
+        self._cache: TTLLRUCache[TeamSnapshot] = TTLLRUCache(maxsize=maxsize, ttl=ttl)
+        # Bumped on every invalidation, see CachingKindReader
+        self._generation = 0
+        self._lock = threading.Lock()
+        add_kind_change_listener(self._on_kinds_changed)
+
+    def get_or_compile(
+        self, team_id: int, user_id: int, compile: Callable[[], TeamSnapshot]
+    ) -> TeamSnapshot:
+        """
+        Return the snapshot of a team, compiling it on a miss.
+
+        Args:
+            team_id: Team ID
+            user_id: Requesting user ID (shell lookup is per user)
+            compile: Builds the snapshot from the database
+
+        Returns:
+            Cached or freshly compiled snapshot
+        """
+        key = (team_id, user_id)
+        snapshot = self._cache.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        generation = self._generation
+        redis_key = f"{SNAPSHOT_KEY_PREFIX}:{team_id}:{user_id}"
+        snapshot = self._load(redis_key)
+        if snapshot is None:
+            snapshot = compile()
+            self._save(redis_key, snapshot, generation)
+            logger.info(
+                f"[TeamSnapshot] Compiled team {team_id} for user {user_id}, "
+                f"version={snapshot.version[:12]}"
+            )
+
+        with self._lock:
+            if generation == self._generation:
+                self._cache.set(key, snapshot)
+        return snapshot
+
+    def stats(self) -> dict:
+        """Return hit/miss statistics of the in-process cache."""
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        """Drop all in-process snapshots."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def _on_kinds_changed(self, resources: Optional[Set[Dependency]]) -> None:
+        with self._lock:
+            self._generation += 1
+            if resources is None:
+                self._cache.invalidate_items_where(lambda key, value: True)
+                return
+            self._cache.invalidate_items_where(
+                lambda key, snapshot: not resources.isdisjoint(snapshot.dependencies)
+            )
+
+    @staticmethod
+    def _revision_fields(snapshot: TeamSnapshot) -> list[str]:
+        return [KIND_REVISION_ALL] + [
+            kind_revision_field(*dependency) for dependency in snapshot.dependencies
+        ]
+
+    @staticmethod
+    def _read_revisions(fields: list[str]) -> Optional[list[int]]:
+        values = cache_manager.hmget_sync(KIND_REVISIONS_KEY, fields)
+        if values is None:
+            return None
+        return [int(value or 0) for value in values]
+
+    def _load(self, redis_key: str) -> Optional[TeamSnapshot]:
+        data = cache_manager.get_sync(redis_key)
+        if not isinstance(data, dict):
+            return None
+        try:
+            snapshot = TeamSnapshot.from_cache(data["snapshot"])
+        except Exception as e:
+            logger.warning(f"[TeamSnapshot] Ignoring cache entry {redis_key}: {e}")
+            return None
+
+        revisions = self._read_revisions(self._revision_fields(snapshot))
+        if revisions is None or revisions != data.get("revisions"):
+            return None
+        return snapshot
+
+    def _save(self, redis_key: str, snapshot: TeamSnapshot, generation: int) -> None:
+        # Revisions can only be read once the dependencies are known. Skip
+        # saving if a change arrived while compiling; a change this worker has
+        # not received yet can leave a stale entry until it expires.
+        revisions = self._read_revisions(self._revision_fields(snapshot))
+        if revisions is None or generation != self._generation:
+            return
+        # Keep the counters at least as long as the entry validated by them
+        cache_manager.expire_sync(
+            KIND_REVISIONS_KEY, settings.KIND_REVISIONS_TTL_SECONDS
+        )
+        cache_manager.set_sync(
+            redis_key,
+            {"revisions": revisions, "snapshot": snapshot.to_cache()},
+            expire=self._redis_ttl,
+        )
+
+
+# Global team snapshot cache instance
+team_snapshot_cache = TeamSnapshotCache(
+    maxsize=settings.CHAT_TEAM_SNAPSHOT_CACHE_MAX_SIZE,
+    ttl=settings.CHAT_TEAM_SNAPSHOT_TTL_SECONDS,
+)
@@ -14,10 +14,14 @@ from typing import Any, Callable, Generator, Optional, TypeVar
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # Thread pool for database operations
-_db_executor = ThreadPoolExecutor(max_workers=10)
+_db_executor = ThreadPoolExecutor(
+    max_workers=settings.CHAT_DB_EXECUTOR_WORKERS, thread_name_prefix="chat-db"
+)
 
 # Terminal statuses that mark completion
 _TERMINAL_STATUSES = frozenset(["COMPLETED", "FAILED", "CANCELLED"])
@@ -25,6 +29,24 @@ _TERMINAL_STATUSES = frozenset(["COMPLETED", "FAILED", "CANCELLED"])
 T = TypeVar("T")
 
 
+async def run_in_db_executor(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking database function on the bounded chat DB thread pool.
+
+    Keeps synchronous SQLAlchemy queries off the event loop while capping
+    how many of them run at once, so bursts of WebSocket events queue up
+    here instead of stalling every socket served by the worker.
+
+    Args:
+        func: Synchronous function, typically opening its own session
+        *args: Arguments passed to func
+
+    Returns:
+        The function's return value
+    """
+    return await asyncio.get_running_loop().run_in_executor(_db_executor, func, *args)
+
+
 async def emit_task_status_update(
     user_id: int,
     task_id: int,
@@ -85,7 +107,7 @@ class DatabaseHandler:
 
     async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
         """Run a synchronous function in the thread pool executor."""
-        return await asyncio.get_event_loop().run_in_executor(_db_executor, func, *args)
+        return await run_in_db_executor(func, *args)
 
     async def update_subtask_status(
         self,
@@ -285,6 +307,71 @@ class DatabaseHandler:
         except Exception:
             logger.exception("Error saving partial response for subtask %s", subtask_id)
 
+    async def save_streaming_checkpoint(
+        self,
+        subtask_id: int,
+        delta: str,
+        offset: int,
+        result: dict[str, Any],
+    ) -> bool:
+        """Append a streaming content delta to the subtask result.
+
+        Args:
+            subtask_id: The subtask ID
+            delta: Content produced since the previous checkpoint
+            offset: Character offset where delta starts
+            result: Result fields other than 'value' (thinking, sources, ...)
+
+        Returns:
+            True if the checkpoint was stored, False if the stored value does
+            not reach offset (caller should resend from offset 0)
+        """
+        return await self._run_in_executor(
+            self._save_streaming_checkpoint_sync, subtask_id, delta, offset, result
+        )
+
+    def _save_streaming_checkpoint_sync(
+        self,
+        subtask_id: int,
+        delta: str,
+        offset: int,
+        result: dict[str, Any],
+    ) -> bool:
+        """Synchronous streaming checkpoint save.
+
+        The subtask result is a single JSON column that also carries the
+        thinking steps and sources, so the row is rewritten as a whole; what
+        stays incremental is the content handed over from the stream. The
+        stored value is read to check that it reaches offset.
+        """
+        from app.models.subtask import Subtask, SubtaskStatus
+
+        try:
+            with _db_session() as db:
+                subtask = db.get(Subtask, subtask_id)
+                if not subtask:
+                    return False
+
+                previous = subtask.result if isinstance(subtask.result, dict) else {}
+                value = previous.get("value") if offset > 0 else ""
+                if not isinstance(value, str) or len(value) < offset:
+                    return False
+
+                subtask.result = {
+                    **result,
+                    "value": value[:offset] + delta,
+                    "streaming": True,
+                    "offset": offset + len(delta),
+                }
+                subtask.status = SubtaskStatus.RUNNING
+                subtask.updated_at = datetime.now()
+                return True
+        except Exception:
+            logger.exception(
+                "Error saving streaming checkpoint for subtask %s", subtask_id
+            )
+            return False
+
     async def get_subtask_message_id(self, subtask_id: int) -> int | None:
         """Get the message_id for a subtask.
 
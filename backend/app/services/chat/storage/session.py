@@ -26,8 +26,11 @@ CANCEL_KEY_PREFIX = "chat:cancel:"
 # Cancellation flag TTL in seconds (5 minutes should be enough for any chat)
 CANCEL_FLAG_TTL = 300
 
-# Redis key prefix for streaming content cache
-STREAMING_KEY_PREFIX = "chat:streaming:"
+# Redis key prefix for streaming content cache (raw UTF-8, append-only)
+STREAMING_KEY_PREFIX = "chat:streaming_buf:"
+# Suffix of the sorted set mapping character offsets of the streaming content
+# to byte offsets, so reads from an offset can use GETRANGE
+STREAMING_OFFSETS_SUFFIX = ":offsets"
 # Redis Pub/Sub channel prefix for streaming updates
 STREAMING_CHANNEL_PREFIX = "chat:stream_channel:"
 # Redis key prefix for task-level streaming status (for group chat)
@@ -344,6 +347,10 @@ class SessionManager:
         """Generate Redis key for streaming content cache."""
         return f"{STREAMING_KEY_PREFIX}{subtask_id}"
 
+    def _get_streaming_offsets_key(self, subtask_id: int) -> str:
+        """Generate Redis key for the character to byte offset checkpoints."""
+        return f"{STREAMING_KEY_PREFIX}{subtask_id}{STREAMING_OFFSETS_SUFFIX}"
+
     async def save_streaming_content(
         self, subtask_id: int, content: str, expire: int = None
     ) -> bool:
@@ -351,7 +358,8 @@ class SessionManager:
         Save streaming content to Redis (temporary cache).
 
         This is used for fast recovery when user refreshes during streaming.
-        Content is saved frequently (every 1 second) to minimize data loss.
+        Overwrites any previously cached content; use append_streaming_content
+        for incremental saves.
 
         Args:
             subtask_id: Subtask ID
@@ -363,15 +371,71 @@ class SessionManager:
         """
         try:
             key = self._get_streaming_key(subtask_id)
+            offsets_key = self._get_streaming_offsets_key(subtask_id)
             expire_time = expire or settings.STREAMING_REDIS_TTL
-            return await self._cache.set(key, content, expire=expire_time)
+            data = content.encode("utf-8")
+            async with self._cache.pipeline() as pipe:
+                pipe.set(key, data, ex=expire_time)
+                pipe.delete(offsets_key)
+                pipe.zadd(offsets_key, {f"{len(content)}:{len(data)}": len(content)})
+                pipe.expire(offsets_key, expire_time)
+                results = await pipe.execute()
+            return bool(results[0])
         except Exception as e:
             logger.error(
                 f"Error saving streaming content for subtask {subtask_id}: {e}"
             )
             return False
 
-    async def get_streaming_content(self, subtask_id: int) -> Optional[str]:
+    async def append_streaming_content(
+        self, subtask_id: int, delta: str, offset: int, expire: int = None
+    ) -> bool:
+        """
+        Append new content to the streaming content cache.
+
+        Uses Redis APPEND so each save only transfers the content produced
+        since the previous save, and records the character/byte offsets of
+        the new end for get_streaming_content.
+
+        Args:
+            subtask_id: Subtask ID
+            delta: Content produced since the last save
+            offset: Character offset where delta starts
+            expire: Expiration time in seconds (default from settings)
+
+        Returns:
+            bool: True if append was successful, False on error or if the
+            cached content before offset has expired (resave everything)
+        """
+        if not delta:
+            return True
+        try:
+            key = self._get_streaming_key(subtask_id)
+            offsets_key = self._get_streaming_offsets_key(subtask_id)
+            expire_time = expire or settings.STREAMING_REDIS_TTL
+            data = delta.encode("utf-8")
+            length = await self._cache.append(key, data, expire=expire_time)
+            if length is None:
+                return False
+            if offset > 0 and length == len(data):
+                # The key expired and APPEND created it with the delta only
+                return False
+
+            end = offset + len(delta)
+            async with self._cache.pipeline(transaction=False) as pipe:
+                pipe.zadd(offsets_key, {f"{end}:{length}": end})
+                pipe.expire(offsets_key, expire_time)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error appending streaming content for subtask {subtask_id}: {e}"
+            )
+            return False
+
+    async def get_streaming_content(
+        self, subtask_id: int, offset: int = 0
+    ) -> Optional[str]:
         """
         Get streaming content from Redis cache.
 
@@ -379,16 +443,32 @@ class SessionManager:
 
         Args:
             subtask_id: Subtask ID
+            offset: Character offset to read from (0 returns the full content)
 
         Returns:
-            str or None: Cached streaming content, or None if not found
+            str or None: Cached streaming content from offset, or None if not found
         """
         try:
             key = self._get_streaming_key(subtask_id)
-            content = await self._cache.get(key)
-            if content is not None and isinstance(content, str):
-                return content
-            return None
+            checkpoint = None
+            if offset > 0:
+                checkpoint = await self._cache.zfloor(
+                    self._get_streaming_offsets_key(subtask_id), offset
+                )
+            if checkpoint is None:
+                data = await self._cache.get_raw(key)
+                if data is None:
+                    return None
+                content = data.decode("utf-8", errors="replace")
+                return content[offset:] if offset > 0 else content
+
+            # Only fetch the bytes from the nearest checkpoint before offset
+            char_start, byte_start = (int(v) for v in checkpoint.split(b":"))
+            data = await self._cache.getrange(key, byte_start, -1)
+            if data is None:
+                return None
+            content = data.decode("utf-8", errors="replace")
+            return content[offset - char_start :]
         except Exception as e:
             logger.error(
                 f"Error getting streaming content for subtask {subtask_id}: {e}"
@@ -408,8 +488,13 @@ class SessionManager:
             bool: True if delete was successful
         """
         try:
-            key = self._get_streaming_key(subtask_id)
-            return await self._cache.delete(key)
+            async with self._cache.pipeline(transaction=False) as pipe:
+                pipe.delete(
+                    self._get_streaming_key(subtask_id),
+                    self._get_streaming_offsets_key(subtask_id),
+                )
+                (deleted,) = await pipe.execute()
+            return deleted > 0
         except Exception as e:
             logger.error(
                 f"Error deleting streaming content for subtask {subtask_id}: {e}"
@@ -436,13 +521,9 @@ class SessionManager:
         """
         try:
             channel = self._get_channel_key(subtask_id)
-            # Get a Redis client for pub/sub
             redis_client = await self._cache._get_client()
-            try:
-                await redis_client.publish(channel, chunk)
-                return True
-            finally:
-                await redis_client.aclose()
+            await redis_client.publish(channel, chunk)
+            return True
         except Exception as e:
             logger.error(
                 f"Error publishing streaming chunk for subtask {subtask_id}: {e}"
@@ -469,13 +550,10 @@ class SessionManager:
         try:
             channel = self._get_channel_key(subtask_id)
             redis_client = await self._cache._get_client()
-            try:
-                # Encode done signal with result data
-                done_message = json.dumps({"__type__": "STREAM_DONE", "result": result})
-                await redis_client.publish(channel, done_message)
-                return True
-            finally:
-                await redis_client.aclose()
+            # Encode done signal with result data
+            done_message = json.dumps({"__type__": "STREAM_DONE", "result": result})
+            await redis_client.publish(channel, done_message)
+            return True
         except Exception as e:
             logger.error(f"Error publishing stream done for subtask {subtask_id}: {e}")
             return False
@@ -493,7 +571,9 @@ class SessionManager:
         """
         try:
             channel = self._get_channel_key(subtask_id)
-            redis_client = await self._cache._get_client()
+            # Subscriptions are long-lived; use a dedicated connection so they
+            # do not hold on to the shared pool
+            redis_client = self._cache.create_client()
             pubsub = redis_client.pubsub()
             await pubsub.subscribe(channel)
             # Return both client and pubsub so caller can close client when done
@@ -220,7 +220,9 @@ class WebSocketStreamingHandler:
             )
 
             # Create tool event handler
-            handle_tool_event = create_tool_event_handler(state, emitter, agent_builder)
+            handle_tool_event = create_tool_event_handler(
+                state, core.emitter, agent_builder
+            )
 
             # Stream tokens
             token_count = 0
@@ -36,6 +36,7 @@ from app.db.session import SessionLocal
 from app.models.kind import Kind
 from app.models.subtask import Subtask
 from app.models.user import User
+from app.services.readers.kinds import KindType, kindReader
 
 logger = logging.getLogger(__name__)
 
@@ -304,15 +305,7 @@ async def _stream_chat_response(
         )
 
         # Get team Kind object from database
-        team = (
-            db.query(Kind)
-            .filter(
-                Kind.id == stream_data.team_id,
-                Kind.kind == "Team",
-                Kind.is_active,
-            )
-            .first()
-        )
+        team = kindReader.get_by_id(db, KindType.TEAM, stream_data.team_id)
 
         if not team:
             error_msg = "Team not found"
@@ -541,6 +534,7 @@ async def _stream_chat_response(
                 is_user_selected_kb=is_user_selected_kb,
                 preload_skills=chat_config.preload_skills,  # Use resolved from ChatConfig
                 user_subtask_id=user_subtask_id,  # Pass user subtask ID for RAG persistence
+                bot_mcp_servers=chat_config.bot_mcp_servers,
             )
         elif streaming_mode == "bridge":
             # New architecture: StreamingCore publishes to Redis, WebSocketBridge forwards
@@ -594,6 +588,34 @@ async def _stream_chat_response(
         db.close()
 
 
+async def _save_streaming_delta(
+    session_manager: Any, subtask_id: int, buffer: Any, saved_offset: int
+) -> int:
+    """Save content streamed since saved_offset to the Redis streaming cache.
+
+    Args:
+        session_manager: Session manager holding the streaming cache
+        subtask_id: Subtask ID
+        buffer: StreamBuffer with the response so far
+        saved_offset: Character offset already saved to Redis
+
+    Returns:
+        New saved offset (0 if the next save must rewrite the whole value)
+    """
+    end = len(buffer)
+    if end == saved_offset:
+        return saved_offset
+    if saved_offset == 0:
+        saved = await session_manager.save_streaming_content(
+            subtask_id, buffer.getvalue()
+        )
+    else:
+        saved = await session_manager.append_streaming_content(
+            subtask_id, buffer.since(saved_offset), saved_offset
+        )
+    return end if saved else 0
+
+
 async def _stream_with_http_adapter(
     stream_data: StreamTaskData,
     message: str,
@@ -609,6 +631,7 @@ async def _stream_with_http_adapter(
     is_user_selected_kb: bool = True,
     preload_skills: list = None,
     user_subtask_id: Optional[int] = None,
+    bot_mcp_servers: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Stream using HTTP adapter to call remote chat_shell service.
 
@@ -635,12 +658,15 @@ async def _stream_with_http_adapter(
         preload_skills: List of skill names to preload into system prompt
         user_subtask_id: User subtask ID for RAG result persistence (different from
             stream_data.subtask_id which is AI response's subtask)
+        bot_mcp_servers: Bot MCP servers already resolved from the Ghost CRD;
+            looked up by bot name if not provided
     """
     from app.core.config import settings
     from app.services.chat.adapters.http import HTTPAdapter
     from app.services.chat.adapters.interface import ChatEventType, ChatRequest
     from app.services.chat.storage import session_manager
     from app.services.chat.ws_emitter import get_ws_emitter
+    from app.services.streaming.buffer import StreamBuffer
 
     task_id = ws_config.task_id
     subtask_id = ws_config.subtask_id
@@ -686,7 +712,7 @@ async def _stream_with_http_adapter(
 
     # Parse MCP servers with separate span (includes variable substitution)
     mcp_servers = _append_mcp_servers(
-        ws_config.bot_name, ws_config.bot_namespace, task_data
+        ws_config.bot_name, ws_config.bot_namespace, task_data, bot_mcp_servers
     )
 
     # Append skills with separate span
@@ -779,7 +805,7 @@ async def _stream_with_http_adapter(
     ws_emitter = get_ws_emitter()
 
     # Track full response and offset for WebSocket events
-    full_response = ""
+    response = StreamBuffer()
     offset = 0
     # Track thinking steps for tool events (to match frontend expectations)
     thinking_steps: list[dict] = []
@@ -788,6 +814,8 @@ async def _stream_with_http_adapter(
     # Track last Redis save time for periodic saves (every 1 second)
     last_redis_save = asyncio.get_event_loop().time()
     redis_save_interval = 1.0  # Save to Redis every 1 second
+    # Content up to this offset is already in Redis; only the rest is appended
+    redis_saved_offset = 0
     # Track TTFT (Time To First Token)
     stream_start_time = asyncio.get_event_loop().time()
     first_token_received = False
@@ -828,7 +856,7 @@ async def _stream_with_http_adapter(
                             len(chunk_text),
                         )
 
-                    full_response += chunk_text
+                    response.append(chunk_text)
                     await ws_emitter.emit_chat_chunk(
                         task_id=task_id,
                         subtask_id=subtask_id,
@@ -841,8 +869,8 @@ async def _stream_with_http_adapter(
                     # This allows page refresh to recover streaming content
                     current_time = asyncio.get_event_loop().time()
                     if current_time - last_redis_save >= redis_save_interval:
-                        await session_manager.save_streaming_content(
-                            subtask_id, full_response
+                        redis_saved_offset = await _save_streaming_delta(
+                            session_manager, subtask_id, response, redis_saved_offset
                         )
                         last_redis_save = current_time
 
@@ -984,11 +1012,11 @@ async def _stream_with_http_adapter(
 
             elif event.type == ChatEventType.DONE:
                 # Streaming done - emit done event
-                result = event.data.get("result", {"value": full_response})
+                result = event.data.get("result", {"value": response.getvalue()})
 
                 # Ensure result has 'value' key
                 if "value" not in result:
-                    result["value"] = full_response
+                    result["value"] = response.getvalue()
 
                 # Include thinking steps if any
                 if thinking_steps:
@@ -1028,7 +1056,7 @@ async def _stream_with_http_adapter(
                     user_id=stream_data.user_id,
                     task_id=task_id,
                     subtask_id=subtask_id,
-                    content=full_response,
+                    content=response.getvalue(),
                     result=result,
                 )
 
@@ -1078,7 +1106,7 @@ async def _stream_with_http_adapter(
             from app.services.chat.storage.db import db_handler
 
             # Build partial result
-            result = {"value": full_response, "cancelled": True}
+            result = {"value": response.getvalue(), "cancelled": True}
             if thinking_steps:
                 result["thinking"] = thinking_steps
                 result["shell_type"] = "Chat"
@@ -1101,7 +1129,7 @@ async def _stream_with_http_adapter(
                 "partial_response_len=%d",
                 task_id,
                 subtask_id,
-                len(full_response),
+                len(response),
             )
 
     except Exception as e:
@@ -1326,7 +1354,9 @@ async def _stream_with_bridge(
         )
 
         # Create tool event handler
-        handle_tool_event = create_tool_event_handler(state, emitter, agent_builder)
+        handle_tool_event = create_tool_event_handler(
+            state, core.emitter, agent_builder
+        )
 
         # Stream tokens
         token_count = 0
@@ -1413,6 +1443,7 @@ def _append_mcp_servers(
     bot_name: Optional[str] = None,
     bot_namespace: Optional[str] = None,
     task_data: Optional[Dict[str, Any]] = None,
+    bot_mcp_servers: Optional[Dict[str, Any]] = None,
 ) -> list[Dict[str, Any]]:
     """Append MCP server configuration for HTTP mode.
 
@@ -1423,6 +1454,7 @@ def _append_mcp_servers(
         bot_name: Optional bot name to load Bot MCP servers
         bot_namespace: Optional bot namespace
         task_data: Optional task data for variable substitution (e.g., user.name, user.id)
+        bot_mcp_servers: Optional Bot MCP servers already resolved by the caller
 
     Returns:
         List of MCP server configurations with variables replaced
@@ -1471,9 +1503,10 @@ def _append_mcp_servers(
     # Load Bot MCP servers from Ghost configuration
     if bot_name:
         try:
-            bot_mcp_servers = _get_bot_mcp_servers_for_http(
-                bot_name, bot_namespace or "default"
-            )
+            if bot_mcp_servers is None:
+                bot_mcp_servers = _get_bot_mcp_servers_for_http(
+                    bot_name, bot_namespace or "default"
+                )
             bot_server_count = 0
             for name, server_config in bot_mcp_servers.items():
                 server_type = server_config.get("type", "streamable-http")
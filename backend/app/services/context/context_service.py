@@ -9,11 +9,19 @@ Unified service for handling attachments, knowledge bases, and other
 context types that can be associated with subtasks.
 """
 
+import hashlib
+import io
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from shared.utils.crypto import decrypt_attachment, encrypt_attachment
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from shared.utils.crypto import (
+    ATTACHMENT_CHUNK_SIZE,
+    ATTACHMENT_ENCRYPTED_CHUNK_SIZE,
+    decrypt_attachment,
+    iter_decrypt_attachment,
+    iter_encrypt_attachment,
+)
 from sqlalchemy.orm import Session
 
 from app.models.subtask_context import ContextStatus, ContextType, SubtaskContext
@@ -22,12 +30,17 @@ from app.schemas.subtask_context import (
     SubtaskContextBrief,
     TruncationInfo,
 )
+from app.services.attachment.parse_pipeline import parse_pipeline
 from app.services.attachment.parser import (
     DocumentParseError,
     DocumentParser,
     ParseResult,
 )
-from app.services.attachment.storage_backend import StorageError, generate_storage_key
+from app.services.attachment.storage_backend import (
+    STREAM_CHUNK_SIZE,
+    StorageError,
+    generate_storage_key,
+)
 from app.services.attachment.storage_factory import get_storage_backend
 
 logger = logging.getLogger(__name__)
@@ -38,6 +51,23 @@ def _should_encrypt() -> bool:
     return os.environ.get("ATTACHMENT_ENCRYPTION_ENABLED", "false").lower() == "true"
 
 
+# type_data["encryption_version"] values
+# 1: whole file encrypted with the static attachment IV (legacy)
+# 2: encrypted per ATTACHMENT_CHUNK_SIZE chunk with random IVs (seekable)
+ENCRYPTION_VERSION_WHOLE = 1
+ENCRYPTION_VERSION_CHUNKED = 2
+
+
+def _iter_file(file: BinaryIO) -> Iterator[bytes]:
+    """Read a file object from the start in STREAM_CHUNK_SIZE chunks."""
+    file.seek(0)
+    while True:
+        chunk = file.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
 class NotFoundException(Exception):
     """Exception raised when a context is not found."""
 
@@ -68,17 +98,21 @@ class ContextService:
         db: Session,
         user_id: int,
         filename: str,
-        binary_data: bytes,
+        binary_data: Union[bytes, BinaryIO],
         subtask_id: int = 0,
     ) -> Tuple[SubtaskContext, Optional[TruncationInfo]]:
         """
         Upload and process a file attachment.
 
+        File data may be given as a seekable file object (e.g. the spooled
+        upload file), in which case it is streamed to the storage backend in
+        chunks instead of being copied in memory.
+
         Args:
             db: Database session
             user_id: User ID
             filename: Original filename
-            binary_data: File binary data
+            binary_data: File binary data or a seekable binary file object
             subtask_id: Subtask ID to link to (0 means unlinked)
 
         Returns:
@@ -100,8 +134,14 @@ class ContextService:
                 f"Supported types: {', '.join(self.parser.SUPPORTED_EXTENSIONS.keys())}"
             )
 
+        file = (
+            io.BytesIO(binary_data)
+            if isinstance(binary_data, (bytes, bytearray))
+            else binary_data
+        )
+
         # Validate file size
-        file_size = len(binary_data)
+        file_size = file.seek(0, os.SEEK_END)
         if not self.parser.validate_file_size(file_size):
             max_size_mb = DocumentParser.get_max_file_size() / (1024 * 1024)
             raise ValueError(f"File size exceeds maximum limit ({max_size_mb} MB)")
@@ -151,12 +191,20 @@ class ContextService:
         }
 
         try:
+            # Content address of the plain file, used by content-addressed
+            # backends to store identical files only once
+            digest = hashlib.sha256()
+            for chunk in _iter_file(file):
+                digest.update(chunk)
+
             # Encrypt binary data if encryption is enabled (handled at service layer)
             is_encrypted = _should_encrypt()
-            data_to_store = binary_data
+            chunks = _iter_file(file)
+            content_id = digest.hexdigest()
             if is_encrypted:
-                data_to_store = encrypt_attachment(binary_data)
-                logger.info(f"Encrypted attachment data for context {context.id}")
+                chunks = iter_encrypt_attachment(chunks)
+                content_id = f"{content_id}-enc{ENCRYPTION_VERSION_CHUNKED}"
+                logger.info(f"Encrypting attachment data for context {context.id}")
 
             # Save binary data to storage backend
             metadata = {
@@ -165,14 +213,18 @@ class ContextService:
                 "file_size": file_size,
                 "user_id": user_id,
                 "is_encrypted": is_encrypted,
+                "content_id": content_id,
             }
-            storage_backend.save(storage_key, data_to_store, metadata)
+            storage_backend.save_stream(storage_key, chunks, metadata)
 
             # Update encryption metadata in type_data
             context.type_data = {
                 **context.type_data,
                 "is_encrypted": is_encrypted,
-                "encryption_version": 1 if is_encrypted else 0,
+                "encryption_version": (
+                    ENCRYPTION_VERSION_CHUNKED if is_encrypted else 0
+                ),
+                "sha256": digest.hexdigest(),
             }
         except StorageError as e:
             logger.exception(f"Failed to save context {context.id} to storage: {e}")
@@ -186,7 +238,11 @@ class ContextService:
         # Parse document
         truncation_info = None
         try:
-            parse_result: ParseResult = self.parser.parse(binary_data, extension)
+            # Parsed in the worker pool; cached by content hash
+            file.seek(0)
+            parse_result: ParseResult = parse_pipeline.parse(
+                file.read(), extension, content_hash=digest.hexdigest()
+            )
 
             # Update context with parsed content (use empty string instead of None for NOT NULL fields)
             context.extracted_text = parse_result.text if parse_result.text else ""
@@ -260,16 +316,103 @@ class ContextService:
             return None
 
         # Decrypt at service layer if data is encrypted
-        is_encrypted = False
-        if context.type_data and isinstance(context.type_data, dict):
-            is_encrypted = context.type_data.get("is_encrypted", False)
-
-        if is_encrypted:
+        encryption_version = self._get_encryption_version(context)
+        if encryption_version == ENCRYPTION_VERSION_CHUNKED:
+            logger.debug(f"Decrypting attachment data for context {context.id}")
+            binary_data = b"".join(iter_decrypt_attachment([binary_data]))
+        elif encryption_version:
             logger.debug(f"Decrypting attachment data for context {context.id}")
             binary_data = decrypt_attachment(binary_data)
 
         return binary_data
 
+    def open_attachment_stream(
+        self,
+        db: Session,
+        context: SubtaskContext,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Optional[Iterator[bytes]]:
+        """
+        Stream (a byte range of) an attachment's original file.
+
+        Unencrypted and chunk-encrypted data is read from the storage backend
+        incrementally, fetching and decrypting only the chunks covering the
+        requested range. Legacy whole-file encrypted data is decrypted in
+        memory first.
+
+        Args:
+            db: Database session
+            context: SubtaskContext record
+            start: First byte offset of the original file
+            end: Byte offset to stop at (exclusive), None for end of file
+
+        Returns:
+            Iterator over the requested bytes, or None if not found
+        """
+        if context.context_type != ContextType.ATTACHMENT.value:
+            return None
+
+        storage_key = context.storage_key
+        if not storage_key:
+            logger.warning(
+                f"Context {context.id} has no storage_key for storage backend"
+            )
+            return None
+
+        storage_backend = get_storage_backend(db)
+        encryption_version = self._get_encryption_version(context)
+
+        if not encryption_version:
+            return storage_backend.open_stream(storage_key, start, end)
+
+        if encryption_version != ENCRYPTION_VERSION_CHUNKED:
+            binary_data = self.get_attachment_binary_data(db, context)
+            return None if binary_data is None else iter([binary_data[start:end]])
+
+        first_chunk = start // ATTACHMENT_CHUNK_SIZE
+        stored_end = None
+        if end is not None:
+            last_chunk = (end - 1) // ATTACHMENT_CHUNK_SIZE
+            stored_end = (last_chunk + 1) * ATTACHMENT_ENCRYPTED_CHUNK_SIZE
+        encrypted = storage_backend.open_stream(
+            storage_key, first_chunk * ATTACHMENT_ENCRYPTED_CHUNK_SIZE, stored_end
+        )
+        if encrypted is None:
+            return None
+        return self._slice_stream(
+            iter_decrypt_attachment(encrypted),
+            start - first_chunk * ATTACHMENT_CHUNK_SIZE,
+            None if end is None else end - start,
+        )
+
+    @staticmethod
+    def _get_encryption_version(context: SubtaskContext) -> int:
+        """Return the encryption_version of an attachment (0 if unencrypted)."""
+        type_data = context.type_data if isinstance(context.type_data, dict) else {}
+        if not type_data.get("is_encrypted", False):
+            return 0
+        return type_data.get("encryption_version") or ENCRYPTION_VERSION_WHOLE
+
+    @staticmethod
+    def _slice_stream(
+        chunks: Iterator[bytes], skip: int, length: Optional[int]
+    ) -> Iterator[bytes]:
+        """Drop the first skip bytes of a stream and stop after length bytes."""
+        for chunk in chunks:
+            if skip:
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                chunk, skip = chunk[skip:], 0
+            if length is not None:
+                chunk = chunk[:length]
+                length -= len(chunk)
+            if chunk:
+                yield chunk
+            if length == 0:
+                return
+
     def get_attachment_url(
         self,
         db: Session,
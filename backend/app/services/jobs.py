@@ -17,6 +17,7 @@ from app.core.cache import cache_manager
 from app.core.config import settings
 from app.db.session import SessionLocal
 from app.services.adapters.executor_job import job_service
+from app.services.api_key_cache import api_key_auth_cache
 from app.services.repository_job import repository_job_service
 
 logger = logging.getLogger(__name__)
@@ -152,6 +153,25 @@ def repo_update_worker(stop_event: threading.Event):
         stop_event.wait(timeout=settings.REPO_UPDATE_INTERVAL_SECONDS)
 
 
+def api_key_usage_worker(stop_event: threading.Event):
+    """
+    Background worker flushing buffered API key usage
+
+    Args:
+        stop_event: Event to signal the worker to stop
+    """
+    while not stop_event.wait(timeout=settings.API_KEY_USAGE_FLUSH_INTERVAL_SECONDS):
+        try:
+            api_key_auth_cache.flush()
+        except Exception as e:
+            logger.error(f"[job] API key usage flush error: {e}")
+    # Write what was buffered since the last flush before exiting
+    try:
+        api_key_auth_cache.flush()
+    except Exception as e:
+        logger.error(f"[job] API key usage flush error: {e}")
+
+
 def start_background_jobs(app):
     """
     Start all background jobs
@@ -181,6 +201,17 @@ def start_background_jobs(app):
     app.state.repo_update_thread.start()
     logger.info("[job] repository update worker started")
 
+    # Start API key usage flush thread
+    app.state.api_key_usage_stop_event = threading.Event()
+    app.state.api_key_usage_thread = threading.Thread(
+        target=api_key_usage_worker,
+        args=(app.state.api_key_usage_stop_event,),
+        name="api-key-usage-worker",
+        daemon=True,
+    )
+    app.state.api_key_usage_thread.start()
+    logger.info("[job] API key usage worker started")
+
 
 def stop_background_jobs(app):
     """
@@ -206,3 +237,12 @@ def stop_background_jobs(app):
     if repo_thread:
         repo_thread.join(timeout=5.0)
     logger.info("[job] repository update worker stopped")
+
+    # Stop API key usage thread gracefully (it flushes once more on exit)
+    usage_stop_event = getattr(app.state, "api_key_usage_stop_event", None)
+    usage_thread = getattr(app.state, "api_key_usage_thread", None)
+    if usage_stop_event:
+        usage_stop_event.set()
+    if usage_thread:
+        usage_thread.join(timeout=5.0)
+    logger.info("[job] API key usage worker stopped")
@@ -37,6 +37,7 @@ from app.services.group_permission import (
     get_effective_role_in_group,
     get_user_groups,
 )
+from app.services.rag.kb_stats import KnowledgeBaseStatsService
 
 
 @dataclass
@@ -453,6 +454,7 @@ class KnowledgeService:
             )
 
         # Physically delete the knowledge base
+        KnowledgeBaseStatsService.delete_stats(db, knowledge_base_id)
         db.delete(kb)
         db.commit()
         return True
@@ -788,6 +790,7 @@ class KnowledgeService:
         attachment_id = doc.attachment_id
 
         # Physically delete document from database
+        KnowledgeBaseStatsService.record_document_deleted(db, doc)
         db.delete(doc)
         db.commit()
 
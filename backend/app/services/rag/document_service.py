@@ -9,6 +9,8 @@ Refactored to use modular architecture with pluggable storage backends.
 
 import asyncio
 import logging
+import os
+import tempfile
 import uuid
 from typing import Dict, Optional, Tuple
 
@@ -19,6 +21,8 @@ from app.schemas.rag import SplitterConfig
 from app.services.context import context_service
 from app.services.rag.embedding.factory import create_embedding_model_from_crd
 from app.services.rag.index import DocumentIndexer
+from app.services.rag.kb_stats import ChunkStats, KnowledgeBaseStatsService
+from app.services.rag.retrieval.query_cache import query_cache
 from app.services.rag.storage.base import BaseStorageBackend
 
 logger = logging.getLogger(__name__)
@@ -39,21 +43,20 @@ class DocumentService:
         """
         self.storage_backend = storage_backend
 
-    def _get_attachment_binary(
-        self, db: Session, attachment_id: int
-    ) -> Tuple[bytes, str, str]:
+    def _spool_attachment(self, db: Session, attachment_id: int) -> Tuple[str, str]:
         """
-        Get original binary data and metadata from context (attachment type).
+        Copy an attachment's original file to a local temporary file.
 
-        This method retrieves the original binary data from storage (MySQL or
-        external storage like S3/MinIO) for RAG indexing.
+        The data is streamed from storage (MySQL or external storage) in
+        chunks, so large attachments are never held in memory as a whole.
+        The caller is responsible for deleting the returned file.
 
         Args:
             db: Database session
             attachment_id: Context ID (for attachment type contexts)
 
         Returns:
-            Tuple of (binary_data, filename, file_extension)
+            Tuple of (temporary file path, original filename)
 
         Raises:
             ValueError: If context not found, not ready, or binary data unavailable
@@ -77,13 +80,10 @@ class DocumentService:
                 f"Attachment context {attachment_id} is not ready (status: {context.status})"
             )
 
-        # Get original binary data from storage (supports MySQL and external storage)
-        binary_data = context_service.get_attachment_binary_data(
-            db=db,
-            context=context,
-        )
+        # Stream original data from storage (supports MySQL and external storage)
+        stream = context_service.open_attachment_stream(db=db, context=context)
 
-        if binary_data is None:
+        if stream is None:
             logger.error(
                 f"Failed to retrieve binary data for attachment context {attachment_id}, "
                 f"storage_backend={context.storage_backend}, "
@@ -93,14 +93,25 @@ class DocumentService:
                 f"Attachment context {attachment_id} has no binary data available"
             )
 
+        # Keep the original extension so the reader picks the right parser
+        with tempfile.NamedTemporaryFile(
+            suffix=context.file_extension, delete=False
+        ) as tmp_file:
+            try:
+                for chunk in stream:
+                    tmp_file.write(chunk)
+            except Exception:
+                os.unlink(tmp_file.name)
+                raise
+
         logger.info(
             f"Retrieved binary data for attachment context {attachment_id}: "
             f"filename={context.original_filename}, "
-            f"size={len(binary_data)} bytes, "
+            f"size={context.file_size} bytes, "
             f"extension={context.file_extension}"
         )
 
-        return binary_data, context.original_filename, context.file_extension
+        return tmp_file.name, context.original_filename
 
     def _index_document_sync(
         self,
@@ -157,20 +168,24 @@ class DocumentService:
         )
 
         if attachment_id is not None:
-            # Get original binary data from attachment (supports MySQL and external storage)
-            binary_data, filename, file_extension = self._get_attachment_binary(
-                db, attachment_id
-            )
-
-            # Index from binary data directly (indexer handles parsing)
-            result = indexer.index_from_binary(
-                knowledge_id=knowledge_id,
-                binary_data=binary_data,
-                source_file=filename,
-                file_extension=file_extension,
-                doc_ref=doc_ref,
-                user_id=user_id,
-            )
+            # Copy the original file from attachment storage to a temp file
+            tmp_file_path, filename = self._spool_attachment(db, attachment_id)
+            try:
+                # Index from the local copy (indexer handles parsing)
+                result = indexer.index_from_file(
+                    knowledge_id=knowledge_id,
+                    file_path=tmp_file_path,
+                    source_file=filename,
+                    doc_ref=doc_ref,
+                    user_id=user_id,
+                )
+            finally:
+                try:
+                    os.unlink(tmp_file_path)
+                except OSError as e:
+                    logger.warning(
+                        f"Failed to delete temporary file {tmp_file_path}: {e}"
+                    )
         else:
             # Index from file path
             result = indexer.index_document(
@@ -180,6 +195,28 @@ class DocumentService:
                 user_id=user_id,
             )
 
+        # New chunks change retrieval results for this knowledge base
+        query_cache.invalidate_knowledge(knowledge_id)
+
+        if document_id is not None and knowledge_id.isdigit():
+            try:
+                KnowledgeBaseStatsService.record_document_indexed(
+                    db,
+                    int(knowledge_id),
+                    document_id,
+                    ChunkStats(
+                        chunk_count=result["chunk_count"],
+                        token_count=result["token_count"],
+                        text_bytes=result["text_bytes"],
+                    ),
+                )
+            except Exception as e:
+                # Statistics are an optimization; never fail indexing because of them
+                db.rollback()
+                logger.warning(
+                    f"Failed to record index statistics for document {document_id}: {e}"
+                )
+
         return result
 
     async def index_document(
@@ -214,6 +251,8 @@ class DocumentService:
                 - knowledge_id: Knowledge base ID
                 - source_file: Source filename
                 - chunk_count: Number of chunks created
+                - token_count: Number of tokens of all chunks
+                - text_bytes: UTF-8 size of all chunks
                 - index_name: Index/collection name
                 - status: Indexing status
                 - created_at: Creation timestamp
@@ -256,13 +295,18 @@ class DocumentService:
                 - status: Deletion status
         """
         # Run in thread pool to avoid uvloop conflicts
-        return await asyncio.to_thread(
+        result = await asyncio.to_thread(
             self.storage_backend.delete_document,
             knowledge_id=knowledge_id,
             doc_ref=doc_ref,
             user_id=user_id,
         )
 
+        # Deleted chunks must no longer be served from the query cache
+        await asyncio.to_thread(query_cache.invalidate_knowledge, knowledge_id)
+
+        return result
+
     async def list_documents(
         self,
         knowledge_id: str,
@@ -7,10 +7,13 @@ Custom embedding implementation for external APIs.
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import requests
 from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
@@ -18,6 +21,12 @@ class CustomEmbedding(BaseEmbedding):
     """
     Custom embedding wrapper for external APIs.
     Implements LlamaIndex's BaseEmbedding interface with retry mechanism.
+
+    Texts are sent to the provider in requests of ``embed_batch_size`` texts
+    using an OpenAI-compatible array ``input`` payload. LlamaIndex hands over
+    up to ``max_concurrency`` requests worth of texts per batch; those requests
+    are dispatched concurrently over a pooled HTTP session, and each one is
+    retried independently.
     """
 
     # Declare fields as class attributes for Pydantic compatibility
@@ -25,7 +34,11 @@ class CustomEmbedding(BaseEmbedding):
     model: str
     headers: Dict[str, str]
     api_key: Optional[str] = None
+    max_concurrency: int = 4
+    request_batch_size: int = 10
+    timeout: float = 30
     _dimension: Optional[int] = None
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -34,6 +47,7 @@ class CustomEmbedding(BaseEmbedding):
         headers: Optional[Dict[str, str]] = None,
         api_key: Optional[str] = None,
         embed_batch_size: int = 10,
+        max_concurrency: int = 4,
         **kwargs,
     ):
         # Merge api_key into headers if provided
@@ -41,16 +55,33 @@ class CustomEmbedding(BaseEmbedding):
         if api_key and "Authorization" not in final_headers:
             final_headers["Authorization"] = f"Bearer {api_key}"
 
+        request_batch_size = max(1, embed_batch_size)
+        max_concurrency = max(1, max_concurrency)
+
         super().__init__(
             model_name=model,
-            embed_batch_size=embed_batch_size,
+            # Each LlamaIndex batch is split into concurrent requests
+            embed_batch_size=request_batch_size * max_concurrency,
             api_url=api_url,
             model=model,
             headers=final_headers,
             api_key=api_key,
+            max_concurrency=max_concurrency,
+            request_batch_size=request_batch_size,
             **kwargs,
         )
 
+    def _get_session(self) -> requests.Session:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(self.headers)
+            self._session = session
+        return self._session
+
     def _get_query_embedding(self, query: str) -> List[float]:
         """Get embedding for a query string."""
         return self._call_api(query)
@@ -59,16 +90,47 @@ class CustomEmbedding(BaseEmbedding):
         """Get embedding for a text string."""
         return self._call_api(text)
 
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts using concurrent requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in the same order as ``texts``
+        """
+        if not texts:
+            return []
+
+        size = self.request_batch_size
+        batches = [texts[i : i + size] for i in range(0, len(texts), size)]
+
+        if len(batches) == 1 or self.max_concurrency == 1:
+            results = [self._call_api_batch(batch) for batch in batches]
+        else:
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # executor.map preserves input order
+                results = list(executor.map(self._call_api_batch, batches))
+
+        return [embedding for batch in results for embedding in batch]
+
     async def _aget_query_embedding(self, query: str) -> List[float]:
         """Async version - runs sync call in thread pool to avoid blocking."""
         return await asyncio.to_thread(self._get_query_embedding, query)
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        """Async version - runs sync call in thread pool to avoid blocking."""
+        return await asyncio.to_thread(self._get_text_embedding, text)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Async version - runs sync batch call in thread pool."""
+        return await asyncio.to_thread(self._get_text_embeddings, texts)
+
     def _call_api(self, text: str) -> List[float]:
         """
-        Call external embedding API with retry mechanism.
+        Call external embedding API for a single text.
 
         Args:
             text: Text to embed
@@ -79,16 +141,44 @@ class CustomEmbedding(BaseEmbedding):
         Raises:
             requests.HTTPError: If API call fails after retries
         """
-        response = requests.post(
+        return self._call_api_batch([text])[0]
+
+    @retry(
+        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    def _call_api_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Call external embedding API for a batch of texts with retry mechanism.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in the same order as ``texts``
+
+        Raises:
+            requests.HTTPError: If API call fails after retries
+            ValueError: If the API returns an unexpected number of embeddings
+        """
+        response = self._get_session().post(
             self.api_url,
-            json={"model": self.model, "input": text},
-            headers=self.headers,
-            timeout=30,
+            json={"model": self.model, "input": texts},
+            timeout=self.timeout,
         )
         response.raise_for_status()
-        embedding = response.json()["data"][0]["embedding"]
+        data = response.json()["data"]
+
+        if len(data) != len(texts):
+            raise ValueError(
+                f"Embedding API returned {len(data)} embeddings for {len(texts)} inputs"
+            )
+
+        # OpenAI-compatible APIs include an index per item; order by it when present
+        if all("index" in item for item in data):
+            data = sorted(data, key=lambda item: item["index"])
+        embeddings = [item["embedding"] for item in data]
 
-        if self._dimension is None:
-            self._dimension = len(embedding)
+        if self._dimension is None and embeddings:
+            self._dimension = len(embeddings[0])
 
-        return embedding
+        return embeddings
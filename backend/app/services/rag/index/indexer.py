@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 from llama_index.core import Document, SimpleDirectoryReader
 
 from app.schemas.rag import SplitterConfig
+from app.services.rag.kb_stats import ChunkStats
 from app.services.rag.splitter import SemanticSplitter, SentenceSplitter
 from app.services.rag.splitter.factory import create_splitter
 from app.services.rag.storage.base import BaseStorageBackend
@@ -161,24 +162,11 @@ class DocumentIndexer:
             tmp_file_path = tmp_file.name
 
         try:
-            logger.info(
-                f"Indexing document from binary: source_file={source_file}, "
-                f"extension={file_extension}, size={len(binary_data)} bytes"
-            )
-
-            # Load document using SimpleDirectoryReader
-            documents = SimpleDirectoryReader(input_files=[tmp_file_path]).load_data()
-
-            # Update metadata with original filename (without extension)
-            filename_without_ext = Path(source_file).stem
-            for doc in documents:
-                doc.metadata["filename"] = filename_without_ext
-
-            return self._index_documents(
-                documents=documents,
+            return self.index_from_file(
                 knowledge_id=knowledge_id,
-                doc_ref=doc_ref,
+                file_path=tmp_file_path,
                 source_file=source_file,
+                doc_ref=doc_ref,
                 **kwargs,
             )
         finally:
@@ -188,6 +176,54 @@ class DocumentIndexer:
             except Exception as e:
                 logger.warning(f"Failed to delete temporary file {tmp_file_path}: {e}")
 
+    def index_from_file(
+        self,
+        knowledge_id: str,
+        file_path: str,
+        source_file: str,
+        doc_ref: str,
+        **kwargs,
+    ) -> Dict:
+        """
+        Index a local copy of an uploaded file (synchronous).
+
+        Unlike index_document(), the original filename is used for metadata
+        instead of the (temporary) file name.
+
+        Args:
+            knowledge_id: Knowledge base ID
+            file_path: Path to the file, with the original file extension
+            source_file: Original filename (used for metadata)
+            doc_ref: Document reference ID
+            **kwargs: Additional parameters (e.g., user_id for per_user index strategy)
+
+        Returns:
+            Indexing result dict
+
+        Raises:
+            Exception: If indexing fails
+        """
+        logger.info(
+            f"Indexing document from file: source_file={source_file}, "
+            f"size={Path(file_path).stat().st_size} bytes"
+        )
+
+        # Load document using SimpleDirectoryReader
+        documents = SimpleDirectoryReader(input_files=[file_path]).load_data()
+
+        # Update metadata with original filename (without extension)
+        filename_without_ext = Path(source_file).stem
+        for doc in documents:
+            doc.metadata["filename"] = filename_without_ext
+
+        return self._index_documents(
+            documents=documents,
+            knowledge_id=knowledge_id,
+            doc_ref=doc_ref,
+            source_file=source_file,
+            **kwargs,
+        )
+
     def _index_documents(
         self,
         documents: List[Document],
@@ -231,6 +267,8 @@ class DocumentIndexer:
             **kwargs,
         )
 
+        stats = ChunkStats.from_texts(node.get_content() for node in nodes)
+
         # Add document info to result
         result.update(
             {
@@ -238,6 +276,8 @@ class DocumentIndexer:
                 "knowledge_id": knowledge_id,
                 "source_file": source_file,
                 "chunk_count": len(nodes),
+                "token_count": stats.token_count,
+                "text_bytes": stats.text_bytes,
                 "created_at": created_at,
             }
         )
@@ -0,0 +1,342 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Index statistics of knowledge bases.
+
+Every indexed document records how many chunks it was split into, their
+token count and their UTF-8 size. The knowledge_base_stats row of its
+knowledge base holds the sums and is updated by the same delta whenever a
+document is indexed, re-indexed or deleted. Chat uses it to decide between
+direct injection and RAG retrieval without scanning documents or chunks.
+
+Documents indexed before statistics existed have NULL statistics. A
+knowledge base containing such documents is marked incomplete until its
+statistics are rebuilt from the chunks in its vector store (done on the fly
+whenever all chunks of the knowledge base are loaded anyway).
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.knowledge import KnowledgeBaseStats, KnowledgeDocument
+
+logger = logging.getLogger(__name__)
+
+# Tokenizer used for token counts (same as chat_shell's TokenCounter)
+TOKEN_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        logger.warning(f"[KBStats] tiktoken unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens of a text (about 4 characters per token without tiktoken)."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // 4
+
+
+@dataclass(frozen=True)
+class ChunkStats:
+    """Statistics of a set of chunks."""
+
+    chunk_count: int = 0
+    token_count: int = 0
+    text_bytes: int = 0
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "ChunkStats":
+        """Compute statistics for chunk texts."""
+        chunk_count = token_count = text_bytes = 0
+        for text in texts:
+            text = text or ""
+            chunk_count += 1
+            token_count += count_tokens(text)
+            text_bytes += len(text.encode("utf-8"))
+        return cls(chunk_count, token_count, text_bytes)
+
+    @classmethod
+    def of_document(cls, document: KnowledgeDocument) -> Optional["ChunkStats"]:
+        """Return the recorded statistics of a document (None if unknown)."""
+        if document.chunk_count is None:
+            return None
+        return cls(
+            document.chunk_count, document.token_count or 0, document.text_bytes or 0
+        )
+
+
+class KnowledgeBaseStatsService:
+    """Maintains and reads knowledge_base_stats."""
+
+    @staticmethod
+    def record_document_indexed(
+        db: Session, knowledge_base_id: int, document_id: int, stats: ChunkStats
+    ) -> None:
+        """
+        Record the statistics of a freshly (re-)indexed document and commit.
+
+        Args:
+            db: Database session
+            knowledge_base_id: Knowledge base ID
+            document_id: Document ID (doc_ref of its chunks)
+            stats: Statistics of the chunks written for the document
+        """
+        document = (
+            db.query(KnowledgeDocument)
+            .filter(KnowledgeDocument.id == document_id)
+            .first()
+        )
+        if document is None:
+            return
+
+        previous = ChunkStats.of_document(document)
+        document.chunk_count = stats.chunk_count
+        document.token_count = stats.token_count
+        document.text_bytes = stats.text_bytes
+
+        if previous is None:
+            delta = (1, stats.chunk_count, stats.token_count, stats.text_bytes)
+        else:
+            delta = (
+                0,
+                stats.chunk_count - previous.chunk_count,
+                stats.token_count - previous.token_count,
+                stats.text_bytes - previous.text_bytes,
+            )
+        KnowledgeBaseStatsService._apply_delta(
+            db, knowledge_base_id, delta, exclude_document_id=document_id
+        )
+        db.commit()
+
+    @staticmethod
+    def record_document_deleted(db: Session, document: KnowledgeDocument) -> None:
+        """
+        Subtract a document from its knowledge base statistics.
+
+        Call before deleting the document; the caller commits.
+
+        Args:
+            db: Database session
+            document: Document about to be deleted
+        """
+        stats = ChunkStats.of_document(document)
+        if stats is None:
+            return
+        KnowledgeBaseStatsService._apply_delta(
+            db,
+            document.kind_id,
+            (-1, -stats.chunk_count, -stats.token_count, -stats.text_bytes),
+            exclude_document_id=document.id,
+        )
+
+    @staticmethod
+    def rebuild_from_chunks(
+        db: Session, knowledge_base_id: int, chunks: List[Dict[str, Any]]
+    ) -> KnowledgeBaseStats:
+        """
+        Recompute the statistics of a knowledge base from all of its chunks.
+
+        Args:
+            db: Database session
+            knowledge_base_id: Knowledge base ID
+            chunks: All chunks of the knowledge base (with content and doc_ref)
+
+        Returns:
+            The rebuilt statistics row (committed)
+        """
+        texts_by_doc: Dict[str, List[str]] = defaultdict(list)
+        for chunk in chunks:
+            texts_by_doc[str(chunk.get("doc_ref", ""))].append(chunk.get("content", ""))
+
+        documents = (
+            db.query(KnowledgeDocument)
+            .filter(KnowledgeDocument.kind_id == knowledge_base_id)
+            .all()
+        )
+        totals = [0, 0, 0, 0]
+        for document in documents:
+            texts = texts_by_doc.get(str(document.id))
+            if texts is None:
+                continue
+            stats = ChunkStats.from_texts(texts)
+            document.chunk_count = stats.chunk_count
+            document.token_count = stats.token_count
+            document.text_bytes = stats.text_bytes
+            totals[0] += 1
+            totals[1] += stats.chunk_count
+            totals[2] += stats.token_count
+            totals[3] += stats.text_bytes
+
+        row = db.get(KnowledgeBaseStats, knowledge_base_id)
+        if row is None:
+            row = KnowledgeBaseStats(kind_id=knowledge_base_id)
+            db.add(row)
+        row.document_count, row.chunk_count, row.token_count, row.text_bytes = totals
+        row.is_complete = True
+        db.commit()
+
+        logger.info(
+            f"[KBStats] Rebuilt KB {knowledge_base_id}: {totals[0]} documents, "
+            f"{totals[1]} chunks, {totals[2]} tokens, {totals[3]} bytes"
+        )
+        return row
+
+    @staticmethod
+    def get_stats(
+        db: Session, knowledge_base_ids: List[int]
+    ) -> Dict[int, KnowledgeBaseStats]:
+        """Return the statistics rows of the given knowledge bases (missing ones omitted)."""
+        if not knowledge_base_ids:
+            return {}
+        rows = (
+            db.query(KnowledgeBaseStats)
+            .filter(KnowledgeBaseStats.kind_id.in_(knowledge_base_ids))
+            .all()
+        )
+        return {row.kind_id: row for row in rows}
+
+    @staticmethod
+    def get_size_info(db: Session, knowledge_base_ids: List[int]) -> Dict[str, Any]:
+        """
+        Return size information of knowledge bases for the injection decision.
+
+        Token counts come from the maintained statistics. For knowledge bases
+        without complete statistics they are estimated from the file sizes
+        (about 4 bytes per token) as before.
+
+        Args:
+            db: Database session
+            knowledge_base_ids: Knowledge base IDs
+
+        Returns:
+            Dict with "items" (per KB: id, total_file_size, document_count,
+            estimated_tokens, chunk_count, token_count, text_bytes, is_exact)
+            and the totals total_file_size and total_estimated_tokens
+        """
+        stats = KnowledgeBaseStatsService.get_stats(db, knowledge_base_ids)
+        items = []
+        for kb_id in knowledge_base_ids:
+            row = stats.get(kb_id)
+            if row is not None and row.is_complete:
+                items.append(
+                    {
+                        "id": kb_id,
+                        # Size of the indexed text, which is what gets injected
+                        "total_file_size": row.text_bytes,
+                        "document_count": row.document_count,
+                        "estimated_tokens": row.token_count,
+                        "chunk_count": row.chunk_count,
+                        "token_count": row.token_count,
+                        "text_bytes": row.text_bytes,
+                        "is_exact": True,
+                    }
+                )
+                continue
+
+            from app.services.knowledge import KnowledgeService
+
+            file_size = KnowledgeService.get_total_file_size(db, kb_id)
+            items.append(
+                {
+                    "id": kb_id,
+                    "total_file_size": file_size,
+                    "document_count": KnowledgeService.get_active_document_count(
+                        db, kb_id
+                    ),
+                    "estimated_tokens": file_size // 4,
+                    "chunk_count": None,
+                    "token_count": None,
+                    "text_bytes": None,
+                    "is_exact": False,
+                }
+            )
+
+        return {
+            "items": items,
+            "total_file_size": sum(item["total_file_size"] for item in items),
+            "total_estimated_tokens": sum(item["estimated_tokens"] for item in items),
+        }
+
+    @staticmethod
+    def delete_stats(db: Session, knowledge_base_id: int) -> None:
+        """Delete the statistics of a knowledge base (the caller commits)."""
+        db.query(KnowledgeBaseStats).filter(
+            KnowledgeBaseStats.kind_id == knowledge_base_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def _apply_delta(
+        db: Session,
+        knowledge_base_id: int,
+        delta: tuple,
+        exclude_document_id: int,
+    ) -> None:
+        documents, chunks, tokens, text_bytes = delta
+        updated = (
+            db.query(KnowledgeBaseStats)
+            .filter(KnowledgeBaseStats.kind_id == knowledge_base_id)
+            .update(
+                {
+                    KnowledgeBaseStats.document_count: KnowledgeBaseStats.document_count
+                    + documents,
+                    KnowledgeBaseStats.chunk_count: KnowledgeBaseStats.chunk_count
+                    + chunks,
+                    KnowledgeBaseStats.token_count: KnowledgeBaseStats.token_count
+                    + tokens,
+                    KnowledgeBaseStats.text_bytes: KnowledgeBaseStats.text_bytes
+                    + text_bytes,
+                },
+                synchronize_session=False,
+            )
+        )
+        if updated:
+            return
+
+        # First statistics of this knowledge base: they only cover all of its
+        # documents if none was indexed without statistics
+        has_unknown = db.query(
+            db.query(KnowledgeDocument)
+            .filter(
+                KnowledgeDocument.kind_id == knowledge_base_id,
+                KnowledgeDocument.is_active == True,
+                KnowledgeDocument.chunk_count.is_(None),
+                KnowledgeDocument.id != exclude_document_id,
+            )
+            .exists()
+        ).scalar()
+        try:
+            with db.begin_nested():
+                db.add(
+                    KnowledgeBaseStats(
+                        kind_id=knowledge_base_id,
+                        document_count=max(documents, 0),
+                        chunk_count=max(chunks, 0),
+                        token_count=max(tokens, 0),
+                        text_bytes=max(text_bytes, 0),
+                        is_complete=not has_unknown,
+                    )
+                )
+        except IntegrityError:
+            # Created concurrently; apply the delta to that row
+            KnowledgeBaseStatsService._apply_delta(
+                db, knowledge_base_id, delta, exclude_document_id
+            )
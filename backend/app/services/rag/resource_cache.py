@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-wide cache of storage backends and embedding models for RAG.
+
+Building a storage backend creates a new vector store client and building an
+embedding model re-queries the Model CRD, which dominates the latency of short
+knowledge base queries. Both are cached here with TTL + LRU eviction.
+
+Cache keys:
+- Storage backends: (namespace, name, storage config fingerprint). The
+  fingerprint plays the role of a resourceVersion: any change to the
+  Retriever's storageConfig yields a new key.
+- Embedding models: (owner user_id, namespace, name).
+
+Entries are invalidated when a Retriever or Model row in the kinds table is
+updated or deleted in this process. Changes made by other workers are picked
+up when the entry's TTL expires.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.memory_cache import TTLLRUCache
+from app.models.kind import Kind
+from app.schemas.kind import Retriever
+from app.services.rag.embedding.factory import create_embedding_model_from_crd
+from app.services.rag.storage.base import BaseStorageBackend
+from app.services.rag.storage.factory import create_storage_backend
+
+logger = logging.getLogger(__name__)
+
+_storage_backend_cache: TTLLRUCache[BaseStorageBackend] = TTLLRUCache(
+    maxsize=settings.RAG_RESOURCE_CACHE_MAX_SIZE,
+    ttl=settings.RAG_RESOURCE_CACHE_TTL_SECONDS,
+)
+_embedding_model_cache: TTLLRUCache[Any] = TTLLRUCache(
+    maxsize=settings.RAG_RESOURCE_CACHE_MAX_SIZE,
+    ttl=settings.RAG_RESOURCE_CACHE_TTL_SECONDS,
+)
+
+
+def _storage_config_fingerprint(retriever: Retriever) -> str:
+    """Return a stable hash of the retriever's storage configuration."""
+    storage_config = retriever.spec.storageConfig.model_dump(mode="json")
+    payload = json.dumps(storage_config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_storage_backend(retriever: Retriever) -> BaseStorageBackend:
+    """
+    Get a cached storage backend for a Retriever CRD, creating it on a miss.
+
+    Args:
+        retriever: Retriever CRD instance
+
+    Returns:
+        Storage backend instance shared across requests
+
+    Raises:
+        ValueError: If storage type is not supported
+    """
+    key = (
+        retriever.metadata.namespace or "default",
+        retriever.metadata.name,
+        _storage_config_fingerprint(retriever),
+    )
+    return _storage_backend_cache.get_or_create(
+        key, lambda: create_storage_backend(retriever)
+    )
+
+
+def get_embedding_model(
+    db: Session, user_id: int, model_name: str, model_namespace: str = "default"
+):
+    """
+    Get a cached embedding model, resolving the Model CRD on a miss.
+
+    Args:
+        db: Database session
+        user_id: Owner user ID used for the Model CRD lookup
+        model_name: Model name
+        model_namespace: Model namespace
+
+    Returns:
+        LlamaIndex-compatible embedding model shared across requests
+
+    Raises:
+        ValueError: If model not found or not an embedding model
+    """
+    key = (user_id, model_namespace, model_name)
+    return _embedding_model_cache.get_or_create(
+        key,
+        lambda: create_embedding_model_from_crd(
+            db=db,
+            user_id=user_id,
+            model_name=model_name,
+            model_namespace=model_namespace,
+        ),
+    )
+
+
+def invalidate_retriever(name: str, namespace: Optional[str] = None) -> int:
+    """Drop cached storage backends built from the given Retriever."""
+    return _storage_backend_cache.invalidate_where(
+        lambda key: key[1] == name and (namespace is None or key[0] == namespace)
+    )
+
+
+def invalidate_embedding_model(name: str, namespace: Optional[str] = None) -> int:
+    """Drop cached embedding models built from the given Model."""
+    return _embedding_model_cache.invalidate_where(
+        lambda key: key[2] == name and (namespace is None or key[1] == namespace)
+    )
+
+
+def clear_caches() -> None:
+    """Clear all cached storage backends and embedding models."""
+    _storage_backend_cache.clear()
+    _embedding_model_cache.clear()
+
+
+def get_cache_stats() -> dict:
+    """Return hit/miss statistics of the RAG resource caches."""
+    return {
+        "storage_backends": _storage_backend_cache.stats(),
+        "embedding_models": _embedding_model_cache.stats(),
+    }
+
+
+def _invalidate_for_kind(mapper, connection, target: Kind) -> None:
+    """SQLAlchemy mapper hook: invalidate cache entries for a changed kind row."""
+    try:
+        if target.kind == "Retriever":
+            removed = invalidate_retriever(target.name)
+        elif target.kind == "Model":
+            # Public models (user_id=0) may be cached under any owner, so match
+            # by name across namespaces rather than by the row's owner.
+            removed = invalidate_embedding_model(target.name)
+        else:
+            return
+        if removed:
+            logger.info(
+                f"[RAG] Invalidated {removed} cached {target.kind} resource(s) "
+                f"for {target.namespace}/{target.name}"
+            )
+    except Exception as e:
+        logger.warning(f"[RAG] Failed to invalidate resource cache: {e}")
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Kind, _event_name, _invalidate_for_kind)
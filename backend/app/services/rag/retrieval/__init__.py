@@ -10,10 +10,13 @@ from app.services.rag.retrieval.filters import (
     build_elasticsearch_filters,
     parse_metadata_filters,
 )
+from app.services.rag.retrieval.query_cache import QueryCache, query_cache
 from app.services.rag.retrieval.retriever import DocumentRetriever
 
 __all__ = [
     "DocumentRetriever",
+    "QueryCache",
+    "query_cache",
     "parse_metadata_filters",
     "build_elasticsearch_filters",
 ]
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Rank fusion for results retrieved from several knowledge bases.
+
+Scores of different knowledge bases are not directly comparable: each one may
+use another embedding model, retrieval mode or storage backend. The fusion
+methods below merge per-KB ranked lists into a single ranking.
+
+- rrf: reciprocal rank fusion, score = sum(1 / (k + rank)). Only uses ranks,
+  so it is robust against differently scaled scores.
+- score: min-max normalizes the scores of every list to [0, 1] before merging.
+"""
+
+from typing import Any, Dict, List
+
+FUSION_RRF = "rrf"
+FUSION_SCORE = "score"
+
+# Commonly used RRF constant (Cormack et al.)
+DEFAULT_RRF_K = 60
+
+
+def _record_key(record: Dict[str, Any]) -> tuple:
+    metadata = record.get("metadata") or {}
+    return (
+        record.get("knowledge_base_id"),
+        metadata.get("doc_ref"),
+        record.get("title"),
+        record.get("content"),
+    )
+
+
+def fuse_results(
+    kb_records: Dict[int, List[Dict[str, Any]]],
+    top_k: int,
+    method: str = FUSION_RRF,
+    rrf_k: int = DEFAULT_RRF_K,
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-knowledge-base result lists into one ranked top-k list.
+
+    Args:
+        kb_records: Knowledge base ID -> records ordered by relevance
+        top_k: Maximum number of records to return
+        method: FUSION_RRF or FUSION_SCORE
+        rrf_k: Rank constant for reciprocal rank fusion
+
+    Returns:
+        Records sorted by fused relevance. Each record is a copy with
+        knowledge_base_id and fusion_score set; the original score is kept.
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method not in (FUSION_RRF, FUSION_SCORE):
+        raise ValueError(f"Unknown fusion method: {method}")
+
+    fused: Dict[tuple, Dict[str, Any]] = {}
+    for kb_id, records in kb_records.items():
+        scores = [record.get("score") or 0.0 for record in records]
+        low, high = (min(scores), max(scores)) if scores else (0.0, 0.0)
+
+        for rank, record in enumerate(records, start=1):
+            if method == FUSION_RRF:
+                contribution = 1.0 / (rrf_k + rank)
+            elif high > low:
+                contribution = ((record.get("score") or 0.0) - low) / (high - low)
+            else:
+                contribution = 1.0
+
+            record = {**record, "knowledge_base_id": kb_id}
+            key = _record_key(record)
+            if key in fused:
+                # Same chunk returned twice (e.g. overlapping hybrid results)
+                fused[key]["fusion_score"] += contribution
+            else:
+                fused[key] = {**record, "fusion_score": contribution}
+
+    # Stable sort: ties keep the order of the knowledge bases
+    ranked = sorted(fused.values(), key=lambda r: r["fusion_score"], reverse=True)
+    return ranked[:top_k]
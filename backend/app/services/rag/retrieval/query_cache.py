@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Two-tier cache for query embeddings and retrieval results.
+
+Tier 1 is an in-process LRU (TTLLRUCache), tier 2 is Redis so that entries
+are shared between workers. All methods are synchronous because retrieval
+runs inside asyncio.to_thread().
+
+Keys:
+- Embeddings: (model identity, normalized query)
+- Results: (knowledge_id, index version, normalized query, retrieval settings)
+
+Each knowledge base has an index version counter stored in Redis. Indexing
+or deleting a document bumps the counter, which makes all previously cached
+results for that knowledge base unreachable without scanning keys.
+"""
+
+import copy
+import hashlib
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+import redis
+
+from app.core.config import settings
+from app.core.memory_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_KEY_PREFIX = "rag:qemb"
+RESULT_KEY_PREFIX = "rag:qres"
+KB_VERSION_KEY_PREFIX = "rag:kbver"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookup (trim and collapse whitespace)."""
+    return _WHITESPACE_RE.sub(" ", query or "").strip()
+
+
+def get_model_identity(embed_model) -> str:
+    """Build a stable identity string for an embedding model instance."""
+    # Proxies must not change the identity of the model they wrap
+    while isinstance(embed_model, (CachedQueryEmbedding, SharedQueryEmbedding)):
+        embed_model = embed_model._embed_model
+    parts = [type(embed_model).__name__]
+    for attr in ("api_url", "api_base", "model", "model_name"):
+        value = getattr(embed_model, attr, None)
+        if value:
+            parts.append(f"{attr}={value}")
+    return "|".join(parts)
+
+
+def _hash(*parts: Any) -> str:
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class QueryCache:
+    """Two-tier (in-process LRU + Redis) cache for RAG queries."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        maxsize: int = 1024,
+        embedding_ttl: int = 86400,
+        result_ttl: int = 300,
+    ):
+        self._redis_url = redis_url
+        self._redis: Optional[redis.Redis] = None
+        self._redis_lock = threading.Lock()
+        self.embedding_ttl = embedding_ttl
+        self.result_ttl = result_ttl
+        self._embeddings: TTLLRUCache[List[float]] = TTLLRUCache(
+            maxsize=maxsize, ttl=embedding_ttl
+        )
+        self._results: TTLLRUCache[Dict] = TTLLRUCache(maxsize=maxsize, ttl=result_ttl)
+        # Local fallback when Redis is unavailable
+        self._local_versions: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "embedding_l1_hits": 0,
+            "embedding_l2_hits": 0,
+            "embedding_misses": 0,
+            "result_l1_hits": 0,
+            "result_l2_hits": 0,
+            "result_misses": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Redis helpers
+    # ------------------------------------------------------------------
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        """Return the shared Redis client, or None if Redis is not configured."""
+        if not self._redis_url:
+            return None
+        if self._redis is None:
+            with self._redis_lock:
+                if self._redis is None:
+                    try:
+                        self._redis = redis.from_url(
+                            self._redis_url,
+                            socket_timeout=1.0,
+                            socket_connect_timeout=1.0,
+                        )
+                    except Exception as e:
+                        logger.warning(f"[RAG] Query cache Redis unavailable: {e}")
+                        return None
+        return self._redis
+
+    def _redis_get(self, key: str) -> Optional[Any]:
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            data = client.get(key)
+            return orjson.loads(data) if data is not None else None
+        except Exception as e:
+            logger.debug(f"[RAG] Query cache Redis get failed for {key}: {e}")
+            return None
+
+    def _redis_set(self, key: str, value: Any, ttl: int) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.setex(key, ttl, orjson.dumps(value, default=str))
+        except Exception as e:
+            logger.debug(f"[RAG] Query cache Redis set failed for {key}: {e}")
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    # ------------------------------------------------------------------
+    # Index versions
+    # ------------------------------------------------------------------
+
+    def get_index_version(self, knowledge_id: str) -> int:
+        """Return the current index version for a knowledge base."""
+        client = self._get_redis()
+        if client is not None:
+            try:
+                value = client.get(f"{KB_VERSION_KEY_PREFIX}:{knowledge_id}")
+                return int(value) if value is not None else 0
+            except Exception as e:
+                logger.debug(f"[RAG] Failed to read index version: {e}")
+        return self._local_versions.get(knowledge_id, 0)
+
+    def invalidate_knowledge(self, knowledge_id: str) -> None:
+        """
+        Invalidate cached results for a knowledge base.
+
+        Called after documents are indexed into or deleted from the KB.
+        """
+        knowledge_id = str(knowledge_id)
+        self._local_versions[knowledge_id] = (
+            self._local_versions.get(knowledge_id, 0) + 1
+        )
+        self._results.invalidate_where(lambda key: key[0] == knowledge_id)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.incr(f"{KB_VERSION_KEY_PREFIX}:{knowledge_id}")
+            except Exception as e:
+                logger.warning(
+                    f"[RAG] Failed to bump index version for KB {knowledge_id}: {e}"
+                )
+
+    # ------------------------------------------------------------------
+    # Embeddings
+    # ------------------------------------------------------------------
+
+    def get_query_embedding(
+        self, embed_model, query: str, compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """
+        Return the cached embedding for query, computing it on a miss.
+
+        Args:
+            embed_model: Embedding model (used for the cache key)
+            query: Query text
+            compute: Function computing the embedding for the query
+
+        Returns:
+            Embedding vector
+        """
+        digest = _hash(get_model_identity(embed_model), normalize_query(query))
+        l1_key = ("emb", digest)
+
+        embedding = self._embeddings.get(l1_key)
+        if embedding is not None:
+            self._count("embedding_l1_hits")
+            return embedding
+
+        redis_key = f"{EMBEDDING_KEY_PREFIX}:{digest}"
+        embedding = self._redis_get(redis_key)
+        if embedding is not None:
+            self._count("embedding_l2_hits")
+            self._embeddings.set(l1_key, embedding)
+            return embedding
+
+        self._count("embedding_misses")
+        embedding = compute(query)
+        self._embeddings.set(l1_key, embedding)
+        self._redis_set(redis_key, embedding, self.embedding_ttl)
+        return embedding
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def _result_key(
+        self,
+        knowledge_id: str,
+        query: str,
+        retrieval_setting: Dict[str, Any],
+        extra: Dict[str, Any],
+    ) -> tuple:
+        version = self.get_index_version(knowledge_id)
+        digest = _hash(normalize_query(query), retrieval_setting, extra)
+        return (knowledge_id, version, digest)
+
+    def get_or_retrieve(
+        self,
+        knowledge_id: str,
+        query: str,
+        retrieval_setting: Dict[str, Any],
+        retrieve: Callable[[], Dict],
+        **extra: Any,
+    ) -> Dict:
+        """
+        Return cached retrieval results, running retrieve() on a miss.
+
+        Args:
+            knowledge_id: Knowledge base ID
+            query: Query text
+            retrieval_setting: Retrieval settings (part of the key)
+            retrieve: Function performing the actual retrieval
+            **extra: Additional key material (metadata filters, index owner, ...)
+
+        Returns:
+            Retrieval result dict
+        """
+        knowledge_id = str(knowledge_id)
+        l1_key = self._result_key(knowledge_id, query, retrieval_setting, extra)
+
+        result = self._results.get(l1_key)
+        if result is not None:
+            self._count("result_l1_hits")
+            # Callers may post-process records; never hand out the cached object
+            return copy.deepcopy(result)
+
+        redis_key = f"{RESULT_KEY_PREFIX}:{l1_key[0]}:{l1_key[1]}:{l1_key[2]}"
+        result = self._redis_get(redis_key)
+        if result is not None:
+            self._count("result_l2_hits")
+            self._results.set(l1_key, copy.deepcopy(result))
+            return result
+
+        self._count("result_misses")
+        result = retrieve()
+        self._results.set(l1_key, copy.deepcopy(result))
+        self._redis_set(redis_key, result, self.result_ttl)
+        return result
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and hit rates for both cache types."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        for kind in ("embedding", "result"):
+            hits = stats[f"{kind}_l1_hits"] + stats[f"{kind}_l2_hits"]
+            total = hits + stats[f"{kind}_misses"]
+            stats[f"{kind}_hit_rate"] = (hits / total) if total else 0.0
+
+        stats["embedding_l1_size"] = len(self._embeddings)
+        stats["result_l1_size"] = len(self._results)
+        return stats
+
+    def clear(self) -> None:
+        """Clear the in-process tier and reset counters (Redis is left untouched)."""
+        self._embeddings.clear()
+        self._results.clear()
+        with self._stats_lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+class CachedQueryEmbedding:
+    """
+    Thin proxy around an embedding model that caches query embeddings.
+
+    Storage backends only call get_query_embedding() during retrieval, so the
+    proxy overrides that and delegates everything else to the wrapped model.
+    """
+
+    def __init__(self, embed_model, cache: QueryCache):
+        self._embed_model = embed_model
+        self._cache = cache
+
+    def get_query_embedding(self, query: str) -> List[float]:
+        return self._cache.get_query_embedding(
+            self._embed_model, query, self._embed_model.get_query_embedding
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._embed_model, name)
+
+
+class SharedQueryEmbedding:
+    """
+    Proxy that computes each query embedding once for all its users.
+
+    Federated retrieval hands one instance to every knowledge base that uses
+    the same embedding model. Retrievals run in parallel threads; the first
+    one computes the embedding while the others wait for it.
+    """
+
+    def __init__(self, embed_model):
+        self._embed_model = embed_model
+        self._embeddings: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def get_query_embedding(self, query: str) -> List[float]:
+        with self._lock:
+            embedding = self._embeddings.get(query)
+            if embedding is None:
+                embedding = self._embed_model.get_query_embedding(query)
+                self._embeddings[query] = embedding
+            return embedding
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._embed_model, name)
+
+
+# Global query cache instance
+query_cache = QueryCache(
+    redis_url=settings.get_redis_url(),
+    maxsize=settings.RAG_QUERY_CACHE_MAX_SIZE,
+    embedding_ttl=settings.RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    result_ttl=settings.RAG_QUERY_RESULT_CACHE_TTL_SECONDS,
+)
@@ -8,6 +8,8 @@ Document retrieval orchestration.
 
 from typing import Any, Dict, Optional
 
+from app.core.config import settings
+from app.services.rag.retrieval.query_cache import CachedQueryEmbedding, query_cache
 from app.services.rag.storage.base import BaseStorageBackend
 
 
@@ -54,11 +56,31 @@ class DocumentRetriever:
         Returns:
             Retrieval result dict
         """
-        return self.storage_backend.retrieve(
+        if not settings.RAG_QUERY_CACHE_ENABLED:
+            return self.storage_backend.retrieve(
+                knowledge_id=knowledge_id,
+                query=query,
+                embed_model=self.embed_model,
+                retrieval_setting=retrieval_setting,
+                metadata_condition=metadata_condition,
+                **kwargs,
+            )
+
+        # Query embeddings are cached per (model, query); results per KB index version
+        embed_model = CachedQueryEmbedding(self.embed_model, query_cache)
+        return query_cache.get_or_retrieve(
             knowledge_id=knowledge_id,
             query=query,
-            embed_model=self.embed_model,
             retrieval_setting=retrieval_setting,
+            retrieve=lambda: self.storage_backend.retrieve(
+                knowledge_id=knowledge_id,
+                query=query,
+                embed_model=embed_model,
+                retrieval_setting=retrieval_setting,
+                metadata_condition=metadata_condition,
+                **kwargs,
+            ),
+            storage_url=self.storage_backend.url,
+            index_name=self.storage_backend.get_index_name(knowledge_id, **kwargs),
             metadata_condition=metadata_condition,
-            **kwargs,
         )
@@ -9,16 +9,26 @@ Refactored to use modular architecture with pluggable storage backends.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_manager
+from app.core.config import settings
 from app.services.adapters.retriever_kinds import retriever_kinds_service
 from app.services.knowledge import KnowledgeService
-from app.services.rag.embedding.factory import create_embedding_model_from_crd
+from app.services.rag.kb_stats import KnowledgeBaseStatsService
+from app.services.rag.resource_cache import get_embedding_model, get_storage_backend
+from app.services.rag.retrieval.fusion import fuse_results
+from app.services.rag.retrieval.query_cache import (
+    SharedQueryEmbedding,
+    get_model_identity,
+    query_cache,
+)
 from app.services.rag.retrieval.retriever import DocumentRetriever
 from app.services.rag.storage.base import BaseStorageBackend
-from app.services.rag.storage.factory import create_storage_backend
 
 logger = logging.getLogger(__name__)
 
@@ -67,8 +77,8 @@ class RetrievalService:
         Returns:
             Retrieval result dict
         """
-        # Create embedding model from CRD
-        embed_model = create_embedding_model_from_crd(
+        # Get (cached) embedding model from CRD
+        embed_model = get_embedding_model(
             db=db,
             user_id=user_id,
             model_name=embedding_model_name,
@@ -276,24 +286,138 @@ class RetrievalService:
             metadata_condition=metadata_condition,
         )
 
-    async def _retrieve_from_kb_internal(
+    async def retrieve_from_knowledge_bases_internal(
         self,
         query: str,
-        kb,  # Kind instance
+        knowledge_base_ids: List[int],
         db: Session,
         metadata_condition: Optional[Dict[str, Any]] = None,
+        top_k: int = 20,
+        timeout: Optional[float] = None,
+        fusion_method: Optional[str] = None,
     ) -> Dict:
         """
-        Internal helper method to perform retrieval from a knowledge base.
+        Federated retrieval from several knowledge bases without permission check.
+
+        Knowledge bases are queried concurrently. Those sharing an embedding
+        model share one query embedding. A knowledge base that fails or does
+        not answer within the timeout is left out instead of failing the
+        whole retrieval. The per-KB result lists are merged with rank fusion.
+
+        ⚠️ WARNING: Same permission caveats as retrieve_from_knowledge_base_internal.
 
         Args:
             query: Search query
-            kb: Knowledge base Kind instance
+            knowledge_base_ids: Knowledge base IDs
             db: Database session
             metadata_condition: Optional metadata filtering conditions
+            top_k: Maximum number of fused records to return
+            timeout: Per-KB timeout in seconds (defaults to
+                RAG_FEDERATED_KB_TIMEOUT_SECONDS)
+            fusion_method: "rrf" or "score" (defaults to RAG_FEDERATED_FUSION_METHOD)
 
         Returns:
-            Dict with retrieval results
+            Dict with:
+                {
+                    "records": [...],  # Fused records with knowledge_base_id and fusion_score
+                    "failed_knowledge_base_ids": [...],  # KBs left out (error or timeout)
+                }
+        """
+        from app.models.kind import Kind
+
+        if timeout is None:
+            timeout = settings.RAG_FEDERATED_KB_TIMEOUT_SECONDS
+
+        kbs = {
+            kb.id: kb
+            for kb in db.query(Kind)
+            .filter(
+                Kind.id.in_(knowledge_base_ids),
+                Kind.kind == "KnowledgeBase",
+                Kind.is_active,
+            )
+            .all()
+        }
+
+        failed: List[int] = []
+        shared_embed_models: Dict[str, SharedQueryEmbedding] = {}
+        pending = {}
+        # Resolve CRDs first: the session must not be used from worker threads
+        for kb_id in dict.fromkeys(knowledge_base_ids):
+            kb = kbs.get(kb_id)
+            if kb is None:
+                logger.warning(f"[RAG] Federated: knowledge base {kb_id} not found")
+                failed.append(kb_id)
+                continue
+            try:
+                retriever_instance, retrieval_setting = self._build_kb_retriever(
+                    kb, db, shared_embed_models
+                )
+            except Exception as e:
+                logger.warning(f"[RAG] Federated: skipping KB {kb_id}: {e}")
+                failed.append(kb_id)
+                continue
+            pending[kb_id] = asyncio.wait_for(
+                asyncio.to_thread(
+                    retriever_instance.retrieve,
+                    knowledge_id=str(kb.id),
+                    query=query,
+                    retrieval_setting=retrieval_setting,
+                    metadata_condition=metadata_condition,
+                    user_id=kb.user_id,
+                ),
+                timeout=timeout,
+            )
+
+        # Timed out retrievals keep running in their worker thread until done,
+        # but the tool call no longer waits for them
+        results = await asyncio.gather(*pending.values(), return_exceptions=True)
+
+        kb_records: Dict[int, List[Dict[str, Any]]] = {}
+        for kb_id, result in zip(pending, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(
+                    f"[RAG] Federated: KB {kb_id} timed out after {timeout}s"
+                )
+                failed.append(kb_id)
+            elif isinstance(result, Exception):
+                logger.warning(f"[RAG] Federated: KB {kb_id} failed: {result}")
+                failed.append(kb_id)
+            else:
+                kb_records[kb_id] = result.get("records", [])
+
+        records = fuse_results(
+            kb_records,
+            top_k=top_k,
+            method=fusion_method or settings.RAG_FEDERATED_FUSION_METHOD,
+            rrf_k=settings.RAG_FEDERATED_RRF_K,
+        )
+
+        logger.info(
+            f"[RAG] Federated retrieval: {len(kb_records)}/{len(knowledge_base_ids)} KBs "
+            f"answered, {len(shared_embed_models)} query embeddings, "
+            f"returning {len(records)} records, failed={failed}, query={query[:50]}..."
+        )
+
+        return {"records": records, "failed_knowledge_base_ids": failed}
+
+    def _build_kb_retriever(
+        self,
+        kb,  # Kind instance
+        db: Session,
+        shared_embed_models: Optional[Dict[str, SharedQueryEmbedding]] = None,
+    ) -> Tuple[DocumentRetriever, Dict[str, Any]]:
+        """
+        Build the document retriever of a knowledge base from its configuration.
+
+        Args:
+            kb: Knowledge base Kind instance
+            db: Database session
+            shared_embed_models: Optional model identity -> shared embedding proxy;
+                knowledge bases using the same model get the same proxy
+
+        Returns:
+            Tuple of (DocumentRetriever, retrieval_setting)
 
         Raises:
             ValueError: If configuration is invalid
@@ -338,10 +462,10 @@ class RetrievalService:
                 f"Retriever {retriever_name} (namespace: {retriever_namespace}) not found"
             )
 
-        # Create storage backend from retriever
-        storage_backend = create_storage_backend(retriever)
+        # Get (cached) storage backend for retriever
+        storage_backend = get_storage_backend(retriever)
         logger.info(
-            f"[RAG] Storage backend created: {storage_backend.__class__.__name__}"
+            f"[RAG] Storage backend resolved: {storage_backend.__class__.__name__}"
         )
 
         # Extract embedding model configuration
@@ -392,27 +516,58 @@ class RetrievalService:
             retrieval_setting["vector_weight"] = vector_weight
             retrieval_setting["keyword_weight"] = keyword_weight
 
-        # Create embedding model from CRD
+        # Get (cached) embedding model from CRD
         # Use embedding_owner_user_id for correct resource lookup
         # For group KBs, the embedding model may be created by other users in the same group
-        embed_model = create_embedding_model_from_crd(
+        embed_model = get_embedding_model(
             db=db,
             user_id=embedding_owner_user_id,
             model_name=embedding_model_name,
             model_namespace=embedding_model_namespace,
         )
 
+        if shared_embed_models is not None:
+            identity = get_model_identity(embed_model)
+            if identity not in shared_embed_models:
+                shared_embed_models[identity] = SharedQueryEmbedding(embed_model)
+            embed_model = shared_embed_models[identity]
+
         # Create retriever with storage backend
         retriever_instance = DocumentRetriever(
             storage_backend=storage_backend, embed_model=embed_model
         )
+        return retriever_instance, retrieval_setting
+
+    async def _retrieve_from_kb_internal(
+        self,
+        query: str,
+        kb,  # Kind instance
+        db: Session,
+        metadata_condition: Optional[Dict[str, Any]] = None,
+    ) -> Dict:
+        """
+        Internal helper method to perform retrieval from a knowledge base.
+
+        Args:
+            query: Search query
+            kb: Knowledge base Kind instance
+            db: Database session
+            metadata_condition: Optional metadata filtering conditions
+
+        Returns:
+            Dict with retrieval results
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        retriever_instance, retrieval_setting = self._build_kb_retriever(kb, db)
 
         # Retrieve documents (run in thread pool to avoid event loop conflicts)
         # Use KB creator's user_id for index naming (required for per_user strategy)
         # This ensures consistent index access for all users accessing this KB
         result = await asyncio.to_thread(
             retriever_instance.retrieve,
-            knowledge_id=knowledge_id,
+            knowledge_id=str(kb.id),
             query=query,
             retrieval_setting=retrieval_setting,
             metadata_condition=metadata_condition,
@@ -455,6 +610,11 @@ class RetrievalService:
         This method is used for smart context injection where we need all
         chunks from a knowledge base to determine if direct injection is possible.
 
+        The result is cached compressed in Redis per index version of the
+        knowledge base, so it is only loaded from the storage backend again
+        after documents were indexed or deleted. Loading all chunks also
+        rebuilds incomplete index statistics of the knowledge base.
+
         Args:
             knowledge_base_id: Knowledge base ID
             db: Database session
@@ -512,12 +672,27 @@ class RetrievalService:
                 f"Retriever {retriever_name} (namespace: {retriever_namespace}) not found"
             )
 
-        # Create storage backend from retriever
-        storage_backend = create_storage_backend(retriever)
+        # Get (cached) storage backend for retriever
+        storage_backend = get_storage_backend(retriever)
 
         # Use knowledge base ID as knowledge_id
         knowledge_id = str(kb.id)
 
+        index_version = await asyncio.to_thread(
+            query_cache.get_index_version, knowledge_id
+        )
+        cache_key = f"rag:kbctx:{knowledge_id}:{index_version}:{max_chunks}"
+        cached = await cache_manager.get_raw(cache_key)
+        if cached is not None:
+            try:
+                chunks = orjson.loads(zlib.decompress(cached))
+                logger.info(
+                    f"[RAG] Loaded {len(chunks)} cached chunks of KB {knowledge_base_id}"
+                )
+                return chunks
+            except Exception as e:
+                logger.warning(f"[RAG] Ignoring corrupt KB context cache entry: {e}")
+
         # Get all chunks from storage backend
         # Run in thread pool to avoid event loop conflicts
         chunks = await asyncio.to_thread(
@@ -531,4 +706,22 @@ class RetrievalService:
             f"[RAG] Retrieved {len(chunks)} total chunks from KB {knowledge_base_id}"
         )
 
+        blob = zlib.compress(orjson.dumps(chunks))
+        if len(blob) <= settings.RAG_KB_CONTEXT_CACHE_MAX_BYTES:
+            await cache_manager.set_raw(
+                cache_key, blob, expire=settings.RAG_KB_CONTEXT_CACHE_TTL_SECONDS
+            )
+
+        # All chunks are at hand: fill in statistics missing for old documents
+        if len(chunks) < max_chunks:
+            stats = KnowledgeBaseStatsService.get_stats(db, [kb.id]).get(kb.id)
+            if stats is None or not stats.is_complete:
+                try:
+                    KnowledgeBaseStatsService.rebuild_from_chunks(db, kb.id, chunks)
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(
+                        f"[RAG] Failed to rebuild statistics of KB {kb.id}: {e}"
+                    )
+
         return chunks
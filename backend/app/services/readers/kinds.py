@@ -10,15 +10,27 @@ Usage:
 
     kind = kindReader.get_by_id(db, KindType.BOT, resource_id)
     kind = kindReader.get_by_name_and_namespace(db, user_id, KindType.BOT, "default", "mybot")
+
+Caching:
+    With KIND_READER_CACHE_ENABLED, lookups are served from an in-process LRU
+    (CachingKindReader). Kind rows written through the ORM in any process
+    invalidate the matching entries: locally at flush time, and in every
+    other worker through Redis Pub/Sub once the transaction commits.
 """
 
+import asyncio
+import copy
 import logging
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Optional, Set
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session, make_transient_to_detached
 
+from app.core.memory_cache import TTLLRUCache
 from app.models.kind import Kind
 
 logger = logging.getLogger(__name__)
@@ -95,6 +107,21 @@ class IKindReader(ABC):
         """Get group resource."""
         pass
 
+    def get_owned(
+        self, db: Session, user_id: int, kind: KindType, name: str
+    ) -> Optional[Kind]:
+        """Get resource owned by user by name, in any namespace."""
+        return (
+            db.query(Kind)
+            .filter(
+                Kind.user_id == user_id,
+                Kind.kind == kind.value,
+                Kind.name == name,
+                Kind.is_active == True,
+            )
+            .first()
+        )
+
     def get_by_name_and_namespace(
         self,
         db: Session,
@@ -217,6 +244,10 @@ class IKindReader(ABC):
         """Handle resource change event."""
         pass
 
+    def on_bulk_change(self) -> None:
+        """Handle a change that cannot be attributed to single resources."""
+        pass
+
 
 # =============================================================================
 # Implementation
@@ -325,6 +356,221 @@ class KindReader(IKindReader):
         pass
 
 
+# =============================================================================
+# Caching Implementation
+# =============================================================================
+
+# Marks a cached lookup that found nothing
+_NOT_FOUND = object()
+_MISSING = object()
+
+_KIND_COLUMNS = [column.key for column in Kind.__table__.columns]
+
+
+def _snapshot(resource: Kind) -> Dict[str, Any]:
+    return {key: getattr(resource, key) for key in _KIND_COLUMNS}
+
+
+class CachingKindReader(IKindReader):
+    """
+    Kind reader that keeps recently read resources in an in-process LRU.
+
+    Entries are column snapshots keyed by id and by lookup (personal, owned,
+    public, group). Lookups that find nothing are cached as well, so the public
+    fallback in get_by_name_and_namespace does not query MySQL every time.
+
+    On a hit the caller's session keeps priority: an instance of the row that
+    is already in the session is returned as is, or the lookup is queried if
+    that instance has pending changes, so unflushed edits are never replaced
+    by the snapshot. Otherwise the snapshot is merged into the session without
+    a SELECT (Session.merge with load=False), so the returned object behaves
+    like a queried one and can be updated or deleted.
+    """
+
+    def __init__(self, base: IKindReader, maxsize: int = 4096, ttl: float = 300):
+        """
+        Initialize the caching reader.
+
+        Args:
+            base: Reader used on cache misses
+            maxsize: Maximum number of cached lookups
+            ttl: Entry lifetime in seconds, bounds staleness if an
+                invalidation message is lost
+        """
+        self._base = base
+        self._cache: TTLLRUCache[Any] = TTLLRUCache(maxsize=maxsize, ttl=ttl)
+        # Bumped on every invalidation; a miss only stores its result if no
+        # invalidation happened while it was querying
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_by_id(
+        self, db: Session, kind: KindType, resource_id: int
+    ) -> Optional[Kind]:
+        return self._lookup(
+            db,
+            ("id", kind.value, resource_id),
+            lambda: self._base.get_by_id(db, kind, resource_id),
+            cache_not_found=False,
+        )
+
+    def get_by_ids(
+        self, db: Session, kind: KindType, resource_ids: List[int]
+    ) -> List[Kind]:
+        found: Dict[int, Kind] = {}
+        missing = []
+        for resource_id in resource_ids:
+            snapshot = self._cache.get(("id", kind.value, resource_id), _MISSING)
+            if snapshot is not _MISSING:
+                snapshot = self._attach(db, snapshot)
+            if snapshot is _MISSING:
+                missing.append(resource_id)
+            else:
+                found[resource_id] = snapshot
+
+        if missing:
+            generation = self._generation
+            for resource in self._base.get_by_ids(db, kind, missing):
+                self._store(db, generation, ("id", kind.value, resource.id), resource)
+                found[resource.id] = resource
+
+        return [found[i] for i in dict.fromkeys(resource_ids) if i in found]
+
+    def get_personal(
+        self, db: Session, user_id: int, kind: KindType, namespace: str, name: str
+    ) -> Optional[Kind]:
+        return self._lookup(
+            db,
+            ("personal", kind.value, namespace, name, user_id),
+            lambda: self._base.get_personal(db, user_id, kind, namespace, name),
+        )
+
+    def get_owned(
+        self, db: Session, user_id: int, kind: KindType, name: str
+    ) -> Optional[Kind]:
+        # No namespace in the key; on_change matches it by kind and name
+        return self._lookup(
+            db,
+            ("owned", kind.value, None, name, user_id),
+            lambda: self._base.get_owned(db, user_id, kind, name),
+        )
+
+    def get_public(
+        self, db: Session, kind: KindType, namespace: str, name: str
+    ) -> Optional[Kind]:
+        return self._lookup(
+            db,
+            ("public", kind.value, namespace, name),
+            lambda: self._base.get_public(db, kind, namespace, name),
+        )
+
+    def get_group(
+        self, db: Session, kind: KindType, namespace: str, name: str
+    ) -> Optional[Kind]:
+        return self._lookup(
+            db,
+            ("group", kind.value, namespace, name),
+            lambda: self._base.get_group(db, kind, namespace, name),
+        )
+
+    def on_change(
+        self,
+        kind: KindType,
+        resource_id: int,
+        user_id: int,
+        namespace: str,
+        name: str,
+    ) -> None:
+        kind_value = getattr(kind, "value", kind)
+        target = (kind_value, namespace, name)
+        with self._lock:
+            self._generation += 1
+            self._cache.invalidate_where(
+                lambda key: key == ("id", kind_value, resource_id)
+                or (key[0] != "id" and key[1:4] == target)
+                or (key[0] == "owned" and key[1] == kind_value and key[3] == name)
+            )
+        self._base.on_change(kind, resource_id, user_id, namespace, name)
+
+    def on_bulk_change(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cache.invalidate_where(lambda key: True)
+        self._base.on_bulk_change()
+
+    def stats(self) -> dict:
+        """Return hit/miss statistics of the cache."""
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def _lookup(
+        self,
+        db: Session,
+        key: Tuple[Hashable, ...],
+        load: Callable[[], Optional[Kind]],
+        cache_not_found: bool = True,
+    ) -> Optional[Kind]:
+        snapshot = self._cache.get(key, _MISSING)
+        if snapshot is _NOT_FOUND:
+            return None
+        if snapshot is not _MISSING:
+            resource = self._attach(db, snapshot)
+            if resource is not _MISSING:
+                return resource
+
+        generation = self._generation
+        resource = load()
+        if resource is not None or cache_not_found:
+            self._store(db, generation, key, resource)
+        return resource
+
+    def _store(
+        self,
+        db: Session,
+        generation: int,
+        key: Tuple[Hashable, ...],
+        resource: Optional[Kind],
+    ) -> None:
+        # A session with uncommitted kind writes may read its own changes
+        if db.info.get(_CHANGED_INFO_KEY):
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if resource is None:
+                self._cache.set(key, _NOT_FOUND)
+                return
+            snapshot = _snapshot(resource)
+            self._cache.set(key, snapshot)
+            self._cache.set(("id", resource.kind, resource.id), snapshot)
+
+    @staticmethod
+    def _attach(db: Session, snapshot: Dict[str, Any]) -> Any:
+        """
+        Return the caller's session instance of a cached row.
+
+        Returns _MISSING if the session holds pending changes to the row; the
+        lookup must then be queried so that autoflush applies them.
+        """
+        existing = db.identity_map.get(db.identity_key(Kind, snapshot["id"]))
+        if existing is not None:
+            if existing in db.deleted or db.is_modified(existing):
+                return _MISSING
+            return existing
+
+        values = dict(snapshot)
+        # Callers may modify json in place before assigning it back
+        values["json"] = copy.deepcopy(values["json"])
+        resource = Kind(**values)
+        make_transient_to_detached(resource)
+        return db.merge(resource, load=False)
+
+
 # =============================================================================
 # Lazy Singleton
 # =============================================================================
@@ -334,7 +580,13 @@ def _create_reader() -> IKindReader:
     """Create and initialize the reader."""
     from app.core.config import settings
 
-    base = KindReader()
+    base: IKindReader = KindReader()
+    if settings.KIND_READER_CACHE_ENABLED:
+        base = CachingKindReader(
+            base,
+            maxsize=settings.KIND_READER_CACHE_MAX_SIZE,
+            ttl=settings.KIND_READER_CACHE_TTL_SECONDS,
+        )
 
     if settings.SERVICE_EXTENSION:
         try:
@@ -370,3 +622,203 @@ class _LazyReader:
 # =============================================================================
 
 kindReader: IKindReader = _LazyReader()  # type: ignore
+
+
+# =============================================================================
+# Change Tracking
+# =============================================================================
+
+KIND_INVALIDATION_CHANNEL = "kinds:invalidate"
+# Redis hash of per-resource revision counters, bumped on every committed change.
+# The hash expires after KIND_REVISIONS_TTL_SECONDS without writes or readers
+# refreshing it, so fields of deleted resources do not accumulate forever.
+# Readers must refresh the expiration whenever they store revisions and never
+# keep them longer than that, otherwise counters restarting from zero could
+# match revisions stored before the hash expired.
+KIND_REVISIONS_KEY = "kinds:revisions"
+# Revision field bumped by changes that cannot be attributed to single resources
+KIND_REVISION_ALL = "*"
+
+# session.info key collecting kind changes until commit/rollback
+_CHANGED_INFO_KEY = "kind_reader_changes"
+# Change entry for writes whose rows are unknown (bulk UPDATE/DELETE)
+_ALL_CHANGED = ("*",)
+
+_TRACKED_ATTRIBUTES = ("kind", "id", "user_id", "namespace", "name")
+
+# Callbacks for caches derived from kind rows, see add_kind_change_listener()
+_change_listeners: List[Callable[[Optional[Set[Tuple[str, str, str]]]], None]] = []
+
+
+def kind_revision_field(kind: str, namespace: str, name: str) -> str:
+    """Return the KIND_REVISIONS_KEY field of a resource."""
+    return f"{getattr(kind, 'value', kind)}/{namespace}/{name}"
+
+
+def add_kind_change_listener(
+    listener: Callable[[Optional[Set[Tuple[str, str, str]]]], None],
+) -> None:
+    """
+    Register a callback for kind changes in any worker.
+
+    The listener receives the changed (kind, namespace, name) triples, or
+    None when any resource may have changed. It runs in the writing process
+    at flush and commit time, and in other processes when the change is
+    received over Pub/Sub, so it must be fast and must not raise.
+    """
+    _change_listeners.append(listener)
+
+
+def _apply_changes(changes: Iterable[Tuple[Any, ...]]) -> None:
+    """Invalidate this process' reader and listeners for the given changes."""
+    changes = [tuple(change) for change in changes]
+    reader = kindReader._instance  # type: ignore[attr-defined]
+    # reader is None if nothing has been read (and cached) in this process yet
+    if reader is not None:
+        for change in changes:
+            if change == _ALL_CHANGED:
+                reader.on_bulk_change()
+            else:
+                kind, resource_id, user_id, namespace, name = change
+                reader.on_change(kind, resource_id, user_id, namespace, name)
+
+    if _change_listeners:
+        resources: Optional[Set[Tuple[str, str, str]]] = None
+        if _ALL_CHANGED not in changes:
+            resources = {(c[0], c[3], c[4]) for c in changes}
+        for listener in _change_listeners:
+            try:
+                listener(resources)
+            except Exception as e:
+                logger.warning(f"[KindReader] Kind change listener failed: {e}")
+
+
+def _track_kind_change(mapper, connection, target: Kind) -> None:
+    """Mapper hook: invalidate a written kind row, also under its old values."""
+    state = inspect(target)
+    current = tuple(getattr(target, attr) for attr in _TRACKED_ATTRIBUTES)
+    previous = tuple(
+        (state.attrs[attr].history.deleted or [value])[0]
+        for attr, value in zip(_TRACKED_ATTRIBUTES, current)
+    )
+    changes = {current, previous}
+
+    # Invalidate now so this session never reads stale entries, and again
+    # after commit/rollback in case another session cached the old row
+    _apply_changes(changes)
+    if state.session is not None:
+        state.session.info.setdefault(_CHANGED_INFO_KEY, set()).update(changes)
+
+
+def _track_bulk_kind_write(orm_execute_state: ORMExecuteState) -> None:
+    """Session hook: bulk UPDATE/DELETE on kinds bypasses mapper events."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not Kind:
+        return
+    _apply_changes([_ALL_CHANGED])
+    orm_execute_state.session.info.setdefault(_CHANGED_INFO_KEY, set()).add(
+        _ALL_CHANGED
+    )
+
+
+def _publish_after_commit(session: Session) -> None:
+    """Session hook: broadcast committed kind changes to all workers."""
+    changes: Optional[set] = session.info.pop(_CHANGED_INFO_KEY, None)
+    if not changes:
+        return
+    _apply_changes(changes)
+
+    from app.core.cache import cache_manager
+    from app.core.config import settings
+
+    fields = [
+        (
+            KIND_REVISION_ALL
+            if change == _ALL_CHANGED
+            else kind_revision_field(change[0], change[3], change[4])
+        )
+        for change in changes
+    ]
+    cache_manager.hincrby_many_sync(
+        KIND_REVISIONS_KEY, fields, expire=settings.KIND_REVISIONS_TTL_SECONDS
+    )
+    # If publishing fails, other workers refresh when their entries expire
+    cache_manager.publish_sync(
+        KIND_INVALIDATION_CHANNEL, {"changes": [list(c) for c in changes]}
+    )
+
+
+def _discard_after_rollback(session: Session) -> None:
+    changes: Optional[set] = session.info.pop(_CHANGED_INFO_KEY, None)
+    if changes:
+        _apply_changes(changes)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Kind, _event_name, _track_kind_change)
+event.listen(Session, "do_orm_execute", _track_bulk_kind_write)
+event.listen(Session, "after_commit", _publish_after_commit)
+event.listen(Session, "after_rollback", _discard_after_rollback)
+
+
+class KindInvalidationListener:
+    """Applies kind changes published by other workers to this process."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start listening (call once on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+            logger.info("[KindReader] Started kind invalidation listener")
+
+    async def stop(self) -> None:
+        """Stop listening (call on application shutdown)."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.info("[KindReader] Stopped kind invalidation listener")
+
+    async def _listen(self) -> None:
+        from app.core.cache import cache_manager
+
+        while True:
+            client = cache_manager.create_client()
+            try:
+                pubsub = client.pubsub()
+                await pubsub.subscribe(KIND_INVALIDATION_CHANNEL)
+                # Changes published while disconnected are lost
+                _apply_changes([_ALL_CHANGED])
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is None:
+                        continue
+                    try:
+                        _apply_changes(orjson.loads(message["data"])["changes"])
+                    except Exception as e:
+                        logger.error(
+                            f"[KindReader] Invalid kind invalidation message: {e}"
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"[KindReader] Invalidation listener error: {e}, "
+                    "reconnecting in 1s..."
+                )
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+kind_invalidation_listener = KindInvalidationListener()
@@ -17,6 +17,7 @@ from app.repository.gitea_provider import GiteaProvider
 from app.repository.gitee_provider import GiteeProvider
 from app.repository.github_provider import GitHubProvider
 from app.repository.gitlab_provider import GitLabProvider
+from app.repository.search_index import match_tier, repository_search_index
 
 
 class RepositoryService:
@@ -243,15 +244,12 @@ class RepositoryService:
                 )
                 continue
 
-        # Sort by relevance (basic sorting by name match)
+        # Sort by relevance across providers; the sort is stable, so each
+        # provider's recency order is kept within a relevance tier
         query_lower = query.lower()
         all_results.sort(
-            key=lambda x: (
-                not (
-                    query_lower in x["name"].lower()
-                    or query_lower in x["full_name"].lower()
-                ),
-                -len(x["name"]),
+            key=lambda x: match_tier(
+                query_lower, x["name"].lower(), x["full_name"].lower()
             )
         )
 
@@ -277,8 +275,10 @@ class RepositoryService:
         for git_info in user.git_info:
             git_domain = git_info.get("git_domain", "")
             if git_domain:
-                cache_key = cache_manager.generate_full_cache_key(user.id, git_domain)
-                deleted = await cache_manager.delete(cache_key)
+                deleted = await cache_manager.delete_user_repositories(
+                    user.id, git_domain
+                )
+                repository_search_index.invalidate(user.id, git_domain)
                 if deleted:
                     cleared_domains.append(git_domain)
                     self.logger.info(
@@ -30,6 +30,7 @@ from app.schemas.shared_task import (
     TaskShareInfo,
     TaskShareResponse,
 )
+from app.services.chat.access import invalidate_task_access
 
 logger = logging.getLogger(__name__)
 
@@ -714,6 +715,7 @@ class SharedTaskService:
 
         db.commit()
         db.refresh(shared_task)
+        invalidate_task_access(share_info.task_id)
 
         return JoinSharedTaskResponse(
             message="Successfully copied shared task to your task list",
@@ -752,6 +754,7 @@ class SharedTaskService:
         shared_task.is_active = False
         shared_task.updated_at = datetime.now()
         db.commit()
+        invalidate_task_access(original_task_id)
 
         return True
 
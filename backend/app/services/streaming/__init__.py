@@ -12,6 +12,8 @@ The streaming infrastructure is designed to be protocol-agnostic and can be
 used by different services (chat, executor, etc.).
 """
 
+from .buffer import StreamBuffer
+from .coalescer import CoalescingEmitter
 from .core import StreamingConfig, StreamingCore, StreamingState
 from .emitters import SSEEmitter, StreamEmitter, WebSocketEmitter
 from .utils import truncate_list_keep_ends
@@ -21,8 +23,10 @@ __all__ = [
     "StreamingCore",
     "StreamingConfig",
     "StreamingState",
+    "StreamBuffer",
     # Emitters
     "StreamEmitter",
+    "CoalescingEmitter",
     "SSEEmitter",
     "WebSocketEmitter",
     # Utilities
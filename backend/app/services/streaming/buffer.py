@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Append-only text buffer for streaming responses.
+
+Repeated ``str +=`` on a growing response copies the whole string for every
+token. StreamBuffer keeps appended pieces in a list and only joins them when
+the full value is actually needed; the joined value is cached and collapsed
+back into a single piece, so each character is copied a bounded number of
+times regardless of how often the value is read.
+"""
+
+
+class StreamBuffer:
+    """Chunked text buffer with offset-based reads."""
+
+    __slots__ = ("_chunks", "_length", "_joined")
+
+    def __init__(self, initial: str = ""):
+        self._chunks: list[str] = [initial] if initial else []
+        self._length = len(initial)
+        self._joined: str | None = initial
+
+    def append(self, text: str) -> None:
+        """Append text to the buffer."""
+        if not text:
+            return
+        self._chunks.append(text)
+        self._length += len(text)
+        self._joined = None
+
+    def getvalue(self) -> str:
+        """Return the full buffered text."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+            self._chunks = [self._joined] if self._joined else []
+        return self._joined
+
+    def since(self, offset: int) -> str:
+        """Return text appended after the given character offset."""
+        if offset <= 0:
+            return self.getvalue()
+        if offset >= self._length:
+            return ""
+
+        # Walk back from the tail so recent deltas avoid joining everything
+        pieces: list[str] = []
+        remaining = self._length - offset
+        for chunk in reversed(self._chunks):
+            if remaining <= 0:
+                break
+            if len(chunk) <= remaining:
+                pieces.append(chunk)
+                remaining -= len(chunk)
+            else:
+                pieces.append(chunk[len(chunk) - remaining :])
+                remaining = 0
+        pieces.reverse()
+        return "".join(pieces)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.getvalue()
@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Chunk coalescing for stream emitters.
+
+Emitting one frame per model token means one Socket.IO emit (and one Redis
+pub/sub message) per token per task room. CoalescingEmitter wraps another
+emitter and merges consecutive text chunks, or consecutive reasoning chunks,
+into a single frame. A frame is flushed when:
+
+- the time window since its first chunk has elapsed,
+- its buffered content reaches the byte threshold,
+- a chunk of a different kind arrives (text vs. reasoning vs. control), or
+- a tool event, done, error or cancel event is emitted.
+
+Offsets stay correct because a merged frame carries the offset of its first
+chunk and the concatenated content. A text chunk that also carries a
+reasoning chunk keeps both: the reasoning parts of a text frame are merged
+into its result.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from .emitters import StreamEmitter
+
+logger = logging.getLogger(__name__)
+
+_CONTENT = "content"
+_REASONING = "reasoning"
+
+
+@dataclass
+class _PendingFrame:
+    """A chunk frame being accumulated."""
+
+    kind: str
+    subtask_id: int
+    offset: int
+    parts: list[str] = field(default_factory=list)
+    reasoning_parts: list[str] = field(default_factory=list)
+    length: int = 0  # Content characters, for offset arithmetic
+    size: int = 0  # UTF-8 bytes of content and reasoning, for the flush threshold
+    result: dict[str, Any] | None = None
+
+
+class CoalescingEmitter(StreamEmitter):
+    """StreamEmitter wrapper that merges consecutive chunk events."""
+
+    def __init__(
+        self,
+        inner: StreamEmitter,
+        window: float = 0.05,
+        max_bytes: int = 4096,
+    ):
+        """Initialize coalescing emitter.
+
+        Args:
+            inner: Emitter that actually sends frames
+            window: Maximum time (seconds) a chunk may wait before being sent
+            max_bytes: Flush as soon as buffered content reaches this size
+        """
+        self.inner = inner
+        self.window = window
+        self.max_bytes = max_bytes
+        self._pending: _PendingFrame | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        # Flushes started by the timer, referenced until they finish
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+        # Counters: chunks received vs. frames sent to the inner emitter
+        self.tokens_in = 0
+        self.frames_out = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return emitted frame vs. token counters."""
+        return {"tokens": self.tokens_in, "frames": self.frames_out}
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose protocol-specific helpers of the wrapped emitter (e.g. emit_json)
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    # ------------------------------------------------------------------
+    # Chunk handling
+    # ------------------------------------------------------------------
+
+    async def emit_chunk(
+        self,
+        content: str,
+        offset: int,
+        subtask_id: int,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer text/reasoning chunks; flush and forward everything else."""
+        reasoning = result.get("reasoning_chunk") if result else None
+        if content:
+            kind = _CONTENT
+        elif reasoning:
+            kind = _REASONING
+        else:
+            # Control frame (tool start/end, status): keep ordering, send now
+            async with self._lock:
+                await self._flush_locked()
+                self.tokens_in += 1
+                await self._send(content, offset, subtask_id, result)
+            return
+
+        async with self._lock:
+            self.tokens_in += 1
+            pending = self._pending
+            if pending is not None and not self._can_merge(
+                pending, kind, subtask_id, offset
+            ):
+                await self._flush_locked()
+                pending = None
+
+            if pending is None:
+                pending = _PendingFrame(kind=kind, subtask_id=subtask_id, offset=offset)
+                self._pending = pending
+
+            if content:
+                pending.parts.append(content)
+                pending.length += len(content)
+                pending.size += len(content.encode("utf-8"))
+            if reasoning:
+                pending.reasoning_parts.append(reasoning)
+                pending.size += len(reasoning.encode("utf-8"))
+            # Result payloads are cumulative snapshots; the latest one wins
+            pending.result = result
+
+            if self.window <= 0 or pending.size >= self.max_bytes:
+                await self._flush_locked()
+            elif self._timer is None:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(self.window, self._on_timer)
+
+    @staticmethod
+    def _can_merge(
+        pending: _PendingFrame, kind: str, subtask_id: int, offset: int
+    ) -> bool:
+        if pending.kind != kind or pending.subtask_id != subtask_id:
+            return False
+        if kind == _CONTENT:
+            # Content chunks must be contiguous to keep offsets valid
+            return pending.offset + pending.length == offset
+        return True
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "[STREAMING] Coalesced chunk flush failed: %s", task.exception()
+            )
+
+    async def flush(self) -> None:
+        """Send any buffered frame immediately."""
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+
+        result = pending.result
+        if pending.reasoning_parts:
+            result = dict(result or {})
+            result["reasoning_chunk"] = "".join(pending.reasoning_parts)
+        await self._send(
+            "".join(pending.parts), pending.offset, pending.subtask_id, result
+        )
+
+    async def _send(
+        self,
+        content: str,
+        offset: int,
+        subtask_id: int,
+        result: dict[str, Any] | None,
+    ) -> None:
+        self.frames_out += 1
+        await self.inner.emit_chunk(content, offset, subtask_id, result=result)
+
+    # ------------------------------------------------------------------
+    # Terminal / lifecycle events: flush first, then forward
+    # ------------------------------------------------------------------
+
+    async def emit_start(
+        self, task_id: int, subtask_id: int, shell_type: str = "Chat"
+    ) -> None:
+        await self.flush()
+        await self.inner.emit_start(task_id, subtask_id, shell_type)
+
+    async def emit_done(
+        self,
+        task_id: int,
+        subtask_id: int,
+        offset: int,
+        result: dict[str, Any],
+        message_id: int | None = None,
+    ) -> None:
+        await self.flush()
+        logger.debug(
+            "[STREAMING] Coalesced subtask=%d: tokens=%d, frames=%d",
+            subtask_id,
+            self.tokens_in,
+            self.frames_out,
+        )
+        await self.inner.emit_done(
+            task_id, subtask_id, offset, result, message_id=message_id
+        )
+
+    async def emit_error(self, subtask_id: int, error: str) -> None:
+        await self.flush()
+        await self.inner.emit_error(subtask_id, error)
+
+    async def emit_cancelled(self, subtask_id: int) -> None:
+        await self.flush()
+        await self.inner.emit_cancelled(subtask_id)
@@ -24,6 +24,8 @@ from typing import Any, Protocol
 
 from app.core.config import settings
 
+from .buffer import StreamBuffer
+from .coalescer import CoalescingEmitter
 from .emitters import StreamEmitter
 
 logger = logging.getLogger(__name__)
@@ -59,14 +61,30 @@ class StorageHandlerProtocol(Protocol):
         """Unregister a stream."""
         ...
 
-    async def save_streaming_content(self, subtask_id: int, content: str) -> None:
+    async def save_streaming_content(self, subtask_id: int, content: str) -> bool:
         """Save streaming content to cache."""
         ...
 
+    async def append_streaming_content(
+        self, subtask_id: int, delta: str, offset: int
+    ) -> bool:
+        """Append new content starting at offset to the cached streaming content."""
+        ...
+
     async def delete_streaming_content(self, subtask_id: int) -> None:
         """Delete streaming content from cache."""
         ...
 
+    async def save_streaming_checkpoint(
+        self,
+        subtask_id: int,
+        delta: str,
+        offset: int,
+        result: dict[str, Any],
+    ) -> bool:
+        """Append a content delta to the subtask's persisted result."""
+        ...
+
     async def publish_streaming_done(
         self, subtask_id: int, result: dict[str, Any]
     ) -> None:
@@ -109,19 +127,27 @@ class StreamingState:
     )
 
     # Runtime state
-    full_response: str = ""
+    buffer: StreamBuffer = field(default_factory=StreamBuffer)
     offset: int = 0
     last_redis_save: float = 0.0
     last_db_save: float = 0.0
+    # Character offsets already persisted; periodic saves only write the delta
+    redis_saved_offset: int = 0
+    db_saved_offset: int = 0
     thinking: list[dict[str, Any]] = field(default_factory=list)  # Tool call steps
     sources: list[dict[str, Any]] = field(
         default_factory=list
     )  # Knowledge base sources for citation
     reasoning_content: str = ""  # Reasoning/thinking content from DeepSeek R1 etc.
 
+    @property
+    def full_response(self) -> str:
+        """Accumulated response text."""
+        return self.buffer.getvalue()
+
     def append_content(self, token: str) -> None:
         """Append token to accumulated response."""
-        self.full_response += token
+        self.buffer.append(token)
         self.offset += len(token)
 
     def append_reasoning(self, content: str) -> None:
@@ -276,6 +302,12 @@ class StreamingConfig:
         default_factory=lambda: settings.STREAMING_DB_SAVE_INTERVAL
     )
     semaphore_timeout: float = 5.0
+    coalesce_window: float = field(
+        default_factory=lambda: settings.STREAMING_COALESCE_WINDOW
+    )
+    coalesce_max_bytes: int = field(
+        default_factory=lambda: settings.STREAMING_COALESCE_MAX_BYTES
+    )
 
 
 class StreamingCore:
@@ -315,10 +347,21 @@ class StreamingCore:
             storage_handler: Storage handler for persistence operations.
                            If None, uses the default chat storage handler.
         """
-        self.emitter = emitter
         self.state = state
         self.config = config or StreamingConfig()
 
+        # Merge per-token chunks into fewer frames when the emitter allows it.
+        # Callers emitting tool events should use core.emitter to keep ordering.
+        if self.config.coalesce_window > 0 and getattr(
+            emitter, "supports_coalescing", True
+        ):
+            emitter = CoalescingEmitter(
+                emitter,
+                window=self.config.coalesce_window,
+                max_bytes=self.config.coalesce_max_bytes,
+            )
+        self.emitter = emitter
+
         # Use provided storage handler or import default
         if storage_handler is None:
             from app.services.chat.storage import storage_handler as default_handler
@@ -426,6 +469,16 @@ class StreamingCore:
             )
             await session_manager.clear_task_streaming_status(self.state.task_id)
 
+            if isinstance(self.emitter, CoalescingEmitter):
+                await self.emitter.flush()
+                stats = self.emitter.stats
+                logger.info(
+                    "[STREAMING] subtask=%d emitted %d frames for %d chunks",
+                    self.state.subtask_id,
+                    stats["frames"],
+                    stats["tokens"],
+                )
+
             # Disconnect MCP client if present
             if self._mcp_client:
                 await self._mcp_client.disconnect()
@@ -549,35 +602,60 @@ class StreamingCore:
         return True
 
     async def _periodic_save(self) -> None:
-        """Perform periodic saves to Redis and DB."""
+        """Perform periodic saves to Redis and DB.
+
+        Both saves are incremental: only content appended since the previous
+        save is written, so the cost per save does not grow with the length
+        of the response.
+        """
         current_time = asyncio.get_event_loop().time()
 
-        # Save to Redis
+        # Append new content to Redis
         if current_time - self.state.last_redis_save >= self.config.redis_save_interval:
-            await self._storage.save_streaming_content(
-                self.state.subtask_id,
-                self.state.full_response,
-            )
+            await self._save_redis_delta()
             self.state.last_redis_save = current_time
 
-        # Save to DB with thinking data
+        # Checkpoint new content to DB with thinking data
         if current_time - self.state.last_db_save >= self.config.db_save_interval:
             # For Chat mode with tools, use slim_thinking to reduce payload size
             is_chat_mode = self.state.shell_type == "Chat"
             result = self.state.get_current_result(
-                include_value=True,
+                include_value=False,
                 include_thinking=True,  # Always include thinking (may have tool calls)
                 slim_thinking=is_chat_mode,  # Slim down for Chat mode
             )
-            result["streaming"] = True
-            # Use update_subtask_status to save the complete result
-            await self._storage.update_subtask_status(
+            start = self.state.db_saved_offset
+            end = len(self.state.buffer)
+            saved = await self._storage.save_streaming_checkpoint(
                 self.state.subtask_id,
-                "RUNNING",
-                result=result,
+                self.state.buffer.since(start),
+                start,
+                result,
             )
+            # On mismatch the stored value is unusable; resend everything next time
+            self.state.db_saved_offset = end if saved else 0
             self.state.last_db_save = current_time
 
+    async def _save_redis_delta(self) -> None:
+        """Append content produced since the last Redis save."""
+        start = self.state.redis_saved_offset
+        end = len(self.state.buffer)
+        if end == start:
+            return
+        if start == 0:
+            # First save (or recovery): write the whole value and reset the TTL
+            saved = await self._storage.save_streaming_content(
+                self.state.subtask_id,
+                self.state.full_response,
+            )
+        else:
+            saved = await self._storage.append_streaming_content(
+                self.state.subtask_id,
+                self.state.buffer.since(start),
+                start,
+            )
+        self.state.redis_saved_offset = end if saved else 0
+
     async def finalize(self) -> dict[str, Any]:
         """Finalize streaming and save results.
 
@@ -593,11 +671,8 @@ class StreamingCore:
             slim_thinking=is_chat_mode,  # Slim down for Chat mode
         )
 
-        # Save final content to Redis for streaming recovery
-        await self._storage.save_streaming_content(
-            self.state.subtask_id,
-            self.state.full_response,
-        )
+        # Flush remaining content to Redis for streaming recovery
+        await self._save_redis_delta()
 
         # Publish done signal
         await self._storage.publish_streaming_done(
@@ -41,6 +41,9 @@ class StreamEmitter(ABC):
     transport mechanisms (SSE, WebSocket, etc.).
     """
 
+    # Whether StreamingCore may wrap this emitter with a CoalescingEmitter
+    supports_coalescing: bool = True
+
     @abstractmethod
     async def emit_start(
         self, task_id: int, subtask_id: int, shell_type: str = "Chat"
@@ -95,6 +98,9 @@ class SSEEmitter(StreamEmitter):
     Formats events as SSE data lines for HTTP streaming responses.
     """
 
+    # Events are drained synchronously by the caller after each token
+    supports_coalescing = False
+
     def __init__(self):
         """Initialize SSE emitter."""
         self._events: list[str] = []
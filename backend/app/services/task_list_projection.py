@@ -0,0 +1,397 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Maintenance of the task_list_items projection.
+
+The sidebar task list needs a handful of fields that live inside the Task
+JSON (status, labels, title) or in other resources (team id, workspace git
+repo, group chat membership). Instead of parsing JSON and resolving those
+references for every listed task on every request, the values are computed
+once when a task or task member is written and stored in task_list_items.
+
+Rows are written from SQLAlchemy mapper events on the same connection, so
+the projection commits or rolls back together with the task itself. Rows
+keep the task's team and workspace references: a task update whose
+references are unchanged is a single UPDATE that keeps the resolved team id
+and git repo, and writes to a Team or Workspace refresh the rows that
+reference it. Tasks written before the projection existed are filled in by
+backfill_task_list_items() at startup.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    and_,
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.models.task import TaskResource
+from app.models.task_list_item import TaskListItem
+from app.models.task_member import MemberStatus, TaskMember
+
+logger = logging.getLogger(__name__)
+
+# Labels marking tasks that are hidden from user task lists
+_BACKGROUND_TASK_TYPES = {"summary"}
+_BACKGROUND_SOURCES = {"background_executor"}
+_BACKGROUND_TYPES = {"background"}
+
+
+def is_background_task(labels: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check if task labels mark a background task hidden from user task lists.
+
+    Background tasks include summary generation tasks (taskType=summary),
+    tasks created by background_executor and tasks of type background.
+    """
+    if not labels:
+        return False
+    return (
+        labels.get("taskType") in _BACKGROUND_TASK_TYPES
+        or labels.get("source") in _BACKGROUND_SOURCES
+        or labels.get("type") in _BACKGROUND_TYPES
+    )
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _resolve_team_id(
+    connection: Connection, user_id: int, name: Optional[str], namespace: str
+) -> Optional[int]:
+    """Resolve the owner's team (own teams first, then shared teams)."""
+    if not name:
+        return None
+    row = connection.execute(
+        text(
+            """
+            SELECT k.id FROM kinds k
+            WHERE k.kind = 'Team'
+            AND k.name = :name
+            AND k.namespace = :namespace
+            AND k.is_active = true
+            AND (
+                k.user_id = :user_id
+                OR k.user_id IN (
+                    SELECT st.original_user_id FROM shared_teams st
+                    WHERE st.user_id = :user_id AND st.is_active = true
+                )
+            )
+            ORDER BY k.user_id = :user_id DESC
+            LIMIT 1
+        """
+        ),
+        {"user_id": user_id, "name": name, "namespace": namespace},
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _resolve_git_repo(
+    connection: Connection, user_id: int, name: Optional[str], namespace: str
+) -> Optional[str]:
+    """Get the git repo of the task's workspace."""
+    if not name:
+        return None
+    workspace_json = connection.execute(
+        select(TaskResource.json)
+        .where(
+            TaskResource.user_id == user_id,
+            TaskResource.kind == "Workspace",
+            TaskResource.name == name,
+            TaskResource.namespace == namespace,
+            TaskResource.is_active.is_(True),
+        )
+        .limit(1)
+    ).scalar()
+    return _workspace_git_repo(workspace_json)
+
+
+def _workspace_git_repo(workspace_json: Any) -> Optional[str]:
+    if not isinstance(workspace_json, dict):
+        return None
+    repository = (workspace_json.get("spec") or {}).get("repository") or {}
+    return repository.get("gitRepo") or None
+
+
+def _has_active_members(connection: Connection, task_id: int) -> bool:
+    count = connection.execute(
+        select(func.count(TaskMember.id)).where(
+            TaskMember.task_id == task_id,
+            TaskMember.status == MemberStatus.ACTIVE.value,
+        )
+    ).scalar()
+    return bool(count)
+
+
+def build_task_list_values(task: TaskResource) -> Dict:
+    """
+    Compute the projection row for a Task resource from the task alone.
+
+    team_id and git_repo need lookups and are resolved separately from the
+    stored team and workspace references. is_group_chat only reflects the
+    task spec here; active members are checked in SQL when the row is written.
+
+    Args:
+        task: Task resource
+
+    Returns:
+        Column values for TaskListItem
+    """
+    task_json = task.json or {}
+    metadata = task_json.get("metadata") or {}
+    labels = metadata.get("labels") or {}
+    spec = task_json.get("spec") or {}
+    status = task_json.get("status") or {}
+    team_ref = spec.get("teamRef") or {}
+    workspace_ref = spec.get("workspaceRef") or {}
+
+    status_value = status.get("status") or "PENDING"
+    is_visible = (
+        bool(task.is_active)
+        and task.namespace != "system"
+        and status_value != "DELETE"
+        and not is_background_task(labels)
+    )
+
+    return {
+        "user_id": task.user_id,
+        "title": (spec.get("title") or "")[:512],
+        "status": status_value,
+        "type": labels.get("type") or "online",
+        "task_type": labels.get("taskType") or "chat",
+        "source": labels.get("source") or "",
+        "team_name": team_ref.get("name") or "",
+        "team_namespace": team_ref.get("namespace") or "default",
+        "workspace_name": workspace_ref.get("name") or "",
+        "workspace_namespace": workspace_ref.get("namespace") or "default",
+        "is_group_chat": bool(spec.get("is_group_chat", False)),
+        "is_visible": is_visible,
+        "created_at": task.created_at or datetime.now(),
+        "status_created_at": _parse_datetime(status.get("createdAt")),
+        "updated_at": _parse_datetime(status.get("updatedAt")) or task.updated_at,
+        "completed_at": _parse_datetime(status.get("completedAt")),
+    }
+
+
+def refresh_task_list_item(
+    connection: Connection, task: TaskResource, is_new: bool = False
+) -> None:
+    """
+    Insert or update the projection row of a Task resource.
+
+    An update whose team and workspace references match the stored row is a
+    single UPDATE keeping the resolved team_id and git_repo. Otherwise the
+    references are resolved and the row is rewritten or inserted.
+
+    Args:
+        connection: Connection of the task write
+        task: Task resource
+        is_new: The task has no projection row yet
+    """
+    values = build_task_list_values(task)
+    if not values["is_group_chat"]:
+        values["is_group_chat"] = exists().where(
+            TaskMember.task_id == task.id,
+            TaskMember.status == MemberStatus.ACTIVE.value,
+        )
+
+    if not is_new:
+        result = connection.execute(
+            update(TaskListItem)
+            .where(
+                TaskListItem.task_id == task.id,
+                TaskListItem.team_name == values["team_name"],
+                TaskListItem.team_namespace == values["team_namespace"],
+                TaskListItem.workspace_name == values["workspace_name"],
+                TaskListItem.workspace_namespace == values["workspace_namespace"],
+            )
+            .values(**values)
+        )
+        if result.rowcount:
+            return
+
+    values["team_id"] = _resolve_team_id(
+        connection, task.user_id, values["team_name"], values["team_namespace"]
+    )
+    values["git_repo"] = _resolve_git_repo(
+        connection,
+        task.user_id,
+        values["workspace_name"],
+        values["workspace_namespace"],
+    )
+    if not is_new:
+        result = connection.execute(
+            update(TaskListItem).where(TaskListItem.task_id == task.id).values(**values)
+        )
+        if result.rowcount:
+            return
+    connection.execute(insert(TaskListItem).values(task_id=task.id, **values))
+
+
+def _refresh_team_references(connection: Connection, team: Kind) -> None:
+    """Re-resolve team_id of rows referencing a written Team by name or id."""
+    references = connection.execute(
+        select(
+            TaskListItem.user_id, TaskListItem.team_name, TaskListItem.team_namespace
+        )
+        .where(
+            or_(
+                and_(
+                    TaskListItem.team_name == team.name,
+                    TaskListItem.team_namespace == team.namespace,
+                ),
+                TaskListItem.team_id == team.id,
+            )
+        )
+        .distinct()
+    ).fetchall()
+    for user_id, name, namespace in references:
+        connection.execute(
+            update(TaskListItem)
+            .where(
+                TaskListItem.user_id == user_id,
+                TaskListItem.team_name == name,
+                TaskListItem.team_namespace == namespace,
+            )
+            .values(team_id=_resolve_team_id(connection, user_id, name, namespace))
+        )
+
+
+def _refresh_workspace_references(
+    connection: Connection, workspace: TaskResource, deleted: bool = False
+) -> None:
+    """Update git_repo of the owner's rows referencing a written Workspace."""
+    git_repo = (
+        None
+        if deleted or not workspace.is_active
+        else _workspace_git_repo(workspace.json)
+    )
+    connection.execute(
+        update(TaskListItem)
+        .where(
+            TaskListItem.user_id == workspace.user_id,
+            TaskListItem.workspace_name == workspace.name,
+            TaskListItem.workspace_namespace == workspace.namespace,
+        )
+        .values(git_repo=git_repo)
+    )
+
+
+def backfill_task_list_items(db: Session, batch_size: int = 500) -> int:
+    """
+    Project Task resources that have no task_list_items row yet.
+
+    Idempotent; run at startup to cover tasks created before the projection
+    existed or written by code paths that bypass the ORM.
+
+    Returns:
+        Number of rows created
+    """
+    total = 0
+    while True:
+        tasks = (
+            db.query(TaskResource)
+            .outerjoin(TaskListItem, TaskListItem.task_id == TaskResource.id)
+            .filter(TaskResource.kind == "Task", TaskListItem.task_id.is_(None))
+            .order_by(TaskResource.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not tasks:
+            break
+        connection = db.connection()
+        for task in tasks:
+            refresh_task_list_item(connection, task, is_new=True)
+        db.commit()
+        total += len(tasks)
+    if total:
+        logger.info(f"Backfilled {total} task list items")
+    return total
+
+
+def _on_resource_written(
+    connection: Connection, target: TaskResource, is_new: bool
+) -> None:
+    try:
+        if target.kind == "Task":
+            refresh_task_list_item(connection, target, is_new=is_new)
+        elif target.kind == "Workspace":
+            _refresh_workspace_references(connection, target)
+    except Exception as e:
+        # Never fail the resource write because of the projection
+        logger.warning(
+            f"Failed to refresh task list items for {target.kind} {target.id}: {e}"
+        )
+
+
+def _on_resource_inserted(mapper, connection: Connection, target: TaskResource) -> None:
+    _on_resource_written(connection, target, is_new=True)
+
+
+def _on_resource_updated(mapper, connection: Connection, target: TaskResource) -> None:
+    _on_resource_written(connection, target, is_new=False)
+
+
+def _on_resource_deleted(mapper, connection: Connection, target: TaskResource) -> None:
+    if target.kind == "Task":
+        connection.execute(
+            delete(TaskListItem).where(TaskListItem.task_id == target.id)
+        )
+    elif target.kind == "Workspace":
+        _refresh_workspace_references(connection, target, deleted=True)
+
+
+def _on_team_written(mapper, connection: Connection, target: Kind) -> None:
+    if target.kind != "Team":
+        return
+    try:
+        _refresh_team_references(connection, target)
+    except Exception as e:
+        logger.warning(f"Failed to refresh task list items for team {target.id}: {e}")
+
+
+def _on_member_written(mapper, connection: Connection, target: TaskMember) -> None:
+    """Keep is_group_chat in sync with task membership."""
+    task_json = connection.execute(
+        select(TaskResource.json).where(TaskResource.id == target.task_id)
+    ).scalar()
+    spec = task_json.get("spec") or {} if isinstance(task_json, dict) else {}
+    is_group_chat = bool(spec.get("is_group_chat", False)) or _has_active_members(
+        connection, target.task_id
+    )
+    connection.execute(
+        update(TaskListItem)
+        .where(TaskListItem.task_id == target.task_id)
+        .values(is_group_chat=is_group_chat)
+    )
+
+
+event.listen(TaskResource, "after_insert", _on_resource_inserted)
+event.listen(TaskResource, "after_update", _on_resource_updated)
+event.listen(TaskResource, "after_delete", _on_resource_deleted)
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(TaskMember, _event_name, _on_member_written)
+    event.listen(Kind, _event_name, _on_team_written)
@@ -220,6 +220,7 @@ class TaskMemberService:
             )  # Reset to default epoch time for not removed
             existing.updated_at = datetime.utcnow()
             db.commit()
+            self._invalidate_access(task_id)
             db.refresh(existing)
             return existing
 
@@ -232,6 +233,7 @@ class TaskMemberService:
         )
         db.add(new_member)
         db.commit()
+        self._invalidate_access(task_id)
         db.refresh(new_member)
         return new_member
 
@@ -264,9 +266,16 @@ class TaskMemberService:
         member.removed_at = datetime.utcnow()
         member.updated_at = datetime.utcnow()
         db.commit()
+        self._invalidate_access(task_id)
 
         return True
 
+    def _invalidate_access(self, task_id: int) -> None:
+        """Drop cached chat access decisions after a membership change"""
+        from app.services.chat.access import invalidate_task_access
+
+        invalidate_task_access(task_id)
+
     def get_team_id(self, db: Session, task_id: int) -> Optional[int]:
         """Get the team ID associated with a task"""
         task = self.get_task(db, task_id)
@@ -4,6 +4,7 @@
 
 import hashlib
 import os
+import sys
 import tempfile
 import uuid
 from datetime import datetime, timedelta
@@ -162,6 +163,26 @@ def test_db(test_engine, test_session_factory) -> Generator[Session, None, None]
         connection.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_kind_caches() -> Generator[None, None, None]:
+    """
+    Drop cached kinds, team snapshots and API keys after each test.
+
+    test_db discards data by rolling back the outer transaction, which the
+    kind reader's and API key cache's session hooks never see.
+    """
+    yield
+    from app.services.api_key_cache import api_key_auth_cache
+    from app.services.readers.kinds import kindReader
+
+    kindReader.on_bulk_change()
+    api_key_auth_cache.invalidate()
+
+    snapshot_module = sys.modules.get("app.services.chat.config.team_snapshot")
+    if snapshot_module is not None:
+        snapshot_module.team_snapshot_cache.clear()
+
+
 @pytest.fixture(scope="function")
 def test_settings() -> Settings:
     """
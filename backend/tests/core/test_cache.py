@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for RedisCache connection pooling and multi-key helpers.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.core.cache import RedisCache
+
+
+@pytest.fixture
+def mock_pool():
+    with patch("app.core.cache.BlockingConnectionPool") as pool_cls:
+        pool_cls.from_url.side_effect = lambda *args, **kwargs: MagicMock(
+            disconnect=AsyncMock()
+        )
+        yield pool_cls
+
+
+class TestRedisCachePooling:
+    """Tests for per-event-loop client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self, mock_pool):
+        cache = RedisCache("redis://localhost:6379/0")
+
+        first = await cache._get_client()
+        second = await cache._get_client()
+
+        assert first is second
+        assert mock_pool.from_url.call_count == 1
+
+    def test_separate_client_per_loop(self, mock_pool):
+        cache = RedisCache("redis://localhost:6379/0")
+
+        first = asyncio.run(cache._get_client())
+        second = asyncio.run(cache._get_client())
+
+        assert first is not second
+
+    def test_sync_client_reused(self):
+        cache = RedisCache("redis://localhost:6379/0")
+        with patch("app.core.cache.SyncConnectionPool") as pool_cls:
+            first = cache._get_sync_client()
+            second = cache._get_sync_client()
+
+        assert first is second
+        assert pool_cls.from_url.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_close_disconnects_pools(self, mock_pool):
+        cache = RedisCache("redis://localhost:6379/0")
+        client = await cache._get_client()
+        pool = client.connection_pool
+
+        await cache.close()
+
+        pool.disconnect.assert_awaited_once()
+        assert await cache._get_client() is not client
+
+
+class TestRedisCacheMultiKey:
+    """Tests for mget/mset helpers."""
+
+    @pytest.mark.asyncio
+    async def test_mget_decodes_values(self):
+        cache = RedisCache("redis://localhost:6379/0")
+        client = MagicMock()
+        client.mget = AsyncMock(return_value=[orjson.dumps({"a": 1}), None, b"raw"])
+        cache._get_client = AsyncMock(return_value=client)
+
+        values = await cache.mget(["k1", "k2", "k3"])
+
+        assert values == [{"a": 1}, None, b"raw"]
+        client.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+
+    @pytest.mark.asyncio
+    async def test_mget_empty(self):
+        cache = RedisCache("redis://localhost:6379/0")
+        assert await cache.mget([]) == []
+
+    @pytest.mark.asyncio
+    async def test_mset_uses_single_pipeline(self):
+        cache = RedisCache("redis://localhost:6379/0")
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        pipe_cm = MagicMock()
+        pipe_cm.__aenter__ = AsyncMock(return_value=pipe)
+        pipe_cm.__aexit__ = AsyncMock(return_value=False)
+        client = MagicMock()
+        client.pipeline.return_value = pipe_cm
+        cache._get_client = AsyncMock(return_value=client)
+
+        ok = await cache.mset({"k1": 1, "k2": [2]}, expire=30)
+
+        assert ok is True
+        assert pipe.set.call_count == 2
+        pipe.set.assert_any_call("k1", orjson.dumps(1), ex=30)
+        pipe.execute.assert_awaited_once()
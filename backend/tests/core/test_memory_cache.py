@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the in-process TTL + LRU cache.
+"""
+
+from unittest.mock import patch
+
+from app.core.memory_cache import TTLLRUCache
+
+
+class TestTTLLRUCache:
+    """Tests for TTLLRUCache class."""
+
+    def test_get_and_set(self):
+        cache = TTLLRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLLRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_ttl_expiry(self):
+        cache = TTLLRUCache(maxsize=10, ttl=5)
+        with patch("app.core.memory_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.memory_cache.time.monotonic", return_value=104.0):
+            assert cache.get("a") == 1
+        with patch("app.core.memory_cache.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_get_or_create_builds_once(self):
+        cache = TTLLRUCache(maxsize=10, ttl=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = cache.get_or_create("key", factory)
+        second = cache.get_or_create("key", factory)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_invalidate_where(self):
+        cache = TTLLRUCache(maxsize=10, ttl=60)
+        cache.set(("ns", "a"), 1)
+        cache.set(("ns", "b"), 2)
+        cache.set(("other", "a"), 3)
+
+        removed = cache.invalidate_where(lambda key: key[1] == "a")
+
+        assert removed == 2
+        assert cache.get(("ns", "b")) == 2
+
+    def test_stats(self):
+        cache = TTLLRUCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
@@ -8,6 +8,7 @@ Tests for GerritProvider authentication type handling
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 import requests
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
@@ -325,7 +326,7 @@ class TestGerritProviderAsyncMethods:
 
     @pytest.mark.asyncio
     async def test_make_request_async_uses_basic_auth(self, gerrit_provider, mocker):
-        """Test that _make_request_async uses HTTPBasicAuth when auth_type='basic'"""
+        """Test that _make_request_async uses basic auth when auth_type='basic'"""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = ")]}'{}".encode("utf-8").decode()
@@ -338,8 +339,8 @@ class TestGerritProviderAsyncMethods:
             return mock_response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: capture_request(**kwargs),
+            "app.repository.gerrit_provider.git_api_client.request",
+            new=AsyncMock(side_effect=capture_request),
         )
 
         await gerrit_provider._make_request_async(
@@ -350,13 +351,13 @@ class TestGerritProviderAsyncMethods:
             auth_type="basic",
         )
 
-        assert isinstance(captured_auth[0], HTTPBasicAuth)
+        assert isinstance(captured_auth[0], httpx.BasicAuth)
 
     @pytest.mark.asyncio
     async def test_make_request_async_uses_digest_auth_by_default(
         self, gerrit_provider, mocker
     ):
-        """Test that _make_request_async uses HTTPDigestAuth by default"""
+        """Test that _make_request_async uses digest auth by default"""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = ")]}'{}".encode("utf-8").decode()
@@ -369,8 +370,8 @@ class TestGerritProviderAsyncMethods:
             return mock_response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: capture_request(**kwargs),
+            "app.repository.gerrit_provider.git_api_client.request",
+            new=AsyncMock(side_effect=capture_request),
         )
 
         await gerrit_provider._make_request_async(
@@ -381,7 +382,7 @@ class TestGerritProviderAsyncMethods:
             # No auth_type specified - should default to digest
         )
 
-        assert isinstance(captured_auth[0], HTTPDigestAuth)
+        assert isinstance(captured_auth[0], httpx.DigestAuth)
 
 
 @pytest.mark.unit
@@ -393,7 +394,7 @@ class TestGerritProviderGetBranches:
         self, gerrit_provider, mock_user_basic_auth, mocker
     ):
         """Test that get_branches uses auth_type from git_info"""
-        # Mock the _make_request method to capture auth_type
+        # Mock the _make_request_async method to capture auth_type
         captured_auth_type = [None]
 
         def mock_make_request(*args, **kwargs):
@@ -407,15 +408,19 @@ class TestGerritProviderGetBranches:
             return mock_response
 
         mocker.patch.object(
-            gerrit_provider, "_make_request", side_effect=mock_make_request
+            gerrit_provider,
+            "_make_request_async",
+            new=AsyncMock(side_effect=mock_make_request),
+        )
+        mocker.patch.object(
+            gerrit_provider, "_get_default_branch", new=AsyncMock(return_value="main")
         )
-        mocker.patch.object(gerrit_provider, "_get_default_branch", return_value="main")
 
         await gerrit_provider.get_branches(
             mock_user_basic_auth, "test-project", "gerrit.example.com"
         )
 
-        # Verify auth_type="basic" was passed to _make_request
+        # Verify auth_type="basic" was passed to _make_request_async
         assert captured_auth_type[0] == "basic"
 
 
@@ -439,7 +444,9 @@ class TestGerritProviderCreateChange:
             return mock_response
 
         mocker.patch.object(
-            gerrit_provider, "_make_request", side_effect=mock_make_request
+            gerrit_provider,
+            "_make_request_async",
+            new=AsyncMock(side_effect=mock_make_request),
         )
 
         await gerrit_provider.create_change(
@@ -450,7 +457,7 @@ class TestGerritProviderCreateChange:
             "gerrit.example.com",
         )
 
-        # Verify auth_type="basic" was passed to _make_request
+        # Verify auth_type="basic" was passed to _make_request_async
         assert captured_auth_type[0] == "basic"
 
 
@@ -458,8 +465,9 @@ class TestGerritProviderCreateChange:
 class TestGerritProviderGetDefaultBranch:
     """Test GerritProvider _get_default_branch with auth_type"""
 
-    def test_get_default_branch_passes_auth_type(self, gerrit_provider, mocker):
-        """Test that _get_default_branch passes auth_type to _make_request"""
+    @pytest.mark.asyncio
+    async def test_get_default_branch_passes_auth_type(self, gerrit_provider, mocker):
+        """Test that _get_default_branch passes auth_type to _make_request_async"""
         captured_auth_type = [None]
 
         def mock_make_request(*args, **kwargs):
@@ -471,10 +479,12 @@ class TestGerritProviderGetDefaultBranch:
             return mock_response
 
         mocker.patch.object(
-            gerrit_provider, "_make_request", side_effect=mock_make_request
+            gerrit_provider,
+            "_make_request_async",
+            new=AsyncMock(side_effect=mock_make_request),
         )
 
-        result = gerrit_provider._get_default_branch(
+        result = await gerrit_provider._get_default_branch(
             "test-project",
             "gerrit.example.com",
             "testuser",
@@ -485,7 +495,8 @@ class TestGerritProviderGetDefaultBranch:
         assert result == "main"
         assert captured_auth_type[0] == "basic"
 
-    def test_get_default_branch_defaults_to_digest(self, gerrit_provider, mocker):
+    @pytest.mark.asyncio
+    async def test_get_default_branch_defaults_to_digest(self, gerrit_provider, mocker):
         """Test that _get_default_branch defaults to digest auth"""
         captured_auth_type = [None]
 
@@ -498,10 +509,12 @@ class TestGerritProviderGetDefaultBranch:
             return mock_response
 
         mocker.patch.object(
-            gerrit_provider, "_make_request", side_effect=mock_make_request
+            gerrit_provider,
+            "_make_request_async",
+            new=AsyncMock(side_effect=mock_make_request),
         )
 
-        result = gerrit_provider._get_default_branch(
+        result = await gerrit_provider._get_default_branch(
             "test-project",
             "gerrit.example.com",
             "testuser",
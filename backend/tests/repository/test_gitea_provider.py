@@ -50,8 +50,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Create mock responses for 3 pages (total 120 repos, 50 per page)
         def create_mock_response(page, repos_count, total_count):
@@ -85,8 +87,8 @@ class TestGiteaProviderPagination:
             return response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: mock_request(),
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(side_effect=mock_request),
         )
 
         await gitea_provider._fetch_all_repositories_async(
@@ -94,9 +96,9 @@ class TestGiteaProviderPagination:
         )
 
         # Verify cache was set with all 120 repos
-        mock_cache.set.assert_called_once()
-        call_args = mock_cache.set.call_args
-        cached_repos = call_args[0][1]
+        mock_index.store.assert_called_once()
+        call_args = mock_index.store.call_args
+        cached_repos = call_args[0][2]
         assert len(cached_repos) == 120
 
     @pytest.mark.asyncio
@@ -107,8 +109,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Mock response with exactly 50 repos and X-Total-Count = 50
         response = Mock()
@@ -133,8 +137,8 @@ class TestGiteaProviderPagination:
             return response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: mock_request(),
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(side_effect=mock_request),
         )
 
         await gitea_provider._fetch_all_repositories_async(
@@ -152,8 +156,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Create responses without X-Total-Count header
         def create_mock_response(repos_count):
@@ -186,8 +192,8 @@ class TestGiteaProviderPagination:
             return response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: mock_request(),
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(side_effect=mock_request),
         )
 
         await gitea_provider._fetch_all_repositories_async(
@@ -198,9 +204,9 @@ class TestGiteaProviderPagination:
         assert call_count[0] == 2
 
         # Verify cache was set with 80 repos
-        mock_cache.set.assert_called_once()
-        call_args = mock_cache.set.call_args
-        cached_repos = call_args[0][1]
+        mock_index.store.assert_called_once()
+        call_args = mock_index.store.call_args
+        cached_repos = call_args[0][2]
         assert len(cached_repos) == 80
 
     @pytest.mark.asyncio
@@ -211,8 +217,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Create response with malformed X-Total-Count header
         def create_mock_response(repos_count):
@@ -245,8 +253,8 @@ class TestGiteaProviderPagination:
             return response
 
         mocker.patch(
-            "asyncio.to_thread",
-            side_effect=lambda func, *args, **kwargs: mock_request(),
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(side_effect=mock_request),
         )
 
         # Should not raise an exception
@@ -265,8 +273,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Mock _get_all_repositories_from_cache to return None (no cache)
         mocker.patch.object(
@@ -291,7 +301,10 @@ class TestGiteaProviderPagination:
         ]
         response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=response)
+        mocker.patch(
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(return_value=response),
+        )
 
         # Mock asyncio.create_task to capture the call
         mock_create_task = mocker.patch("asyncio.create_task")
@@ -312,8 +325,10 @@ class TestGiteaProviderPagination:
         mock_cache = mocker.patch("app.repository.gitea_provider.cache_manager")
         mock_cache.is_building = AsyncMock(return_value=False)
         mock_cache.set_building = AsyncMock()
-        mock_cache.generate_full_cache_key = Mock(return_value="test_cache_key")
-        mock_cache.set = AsyncMock()
+        mock_index = mocker.patch(
+            "app.repository.gitea_provider.repository_search_index"
+        )
+        mock_index.store = AsyncMock()
 
         # Mock _get_all_repositories_from_cache to return None (no cache)
         mocker.patch.object(
@@ -338,7 +353,10 @@ class TestGiteaProviderPagination:
         ]
         response.raise_for_status = Mock()
 
-        mocker.patch("requests.get", return_value=response)
+        mocker.patch(
+            "app.repository.gitea_provider.git_api_client.get",
+            new=AsyncMock(return_value=response),
+        )
 
         # Mock asyncio.create_task
         mock_create_task = mocker.patch("asyncio.create_task")
@@ -349,7 +367,7 @@ class TestGiteaProviderPagination:
         mock_create_task.assert_not_called()
 
         # Should cache directly
-        mock_cache.set.assert_called_once()
+        mock_index.store.assert_called_once()
 
         # Should return 30 repos
         assert len(repos) == 30
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the shared async git provider HTTP client against a local stub server
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from app.repository.http_client import GitApiClient, fetch_all_pages, total_pages
+
+
+class _StubGitApi(BaseHTTPRequestHandler):
+    """Minimal git provider API recording the requests it receives."""
+
+    requests_seen: list = []
+    rate_limited_once: set = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.requests_seen.append((url.path, query, dict(self.headers)))
+
+        if url.path == "/repo":
+            etag = f'"{self.headers.get("Authorization")}-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, headers={"ETag": etag})
+            return self._send(200, {"default_branch": "main"}, {"ETag": etag})
+
+        if url.path in ("/linked", "/unlinked"):
+            page, per_page = int(query["page"]), int(query["per_page"])
+            total = 5
+            items = list(range((page - 1) * per_page, min(page * per_page, total)))
+            headers = {}
+            if url.path == "/linked":
+                last = f"http://stub{url.path}?per_page={per_page}&page=3"
+                headers["Link"] = f'<{last}>; rel="last"'
+            return self._send(200, items, headers)
+
+        if url.path == "/limited":
+            if "/limited" not in self.rate_limited_once:
+                self.rate_limited_once.add("/limited")
+                return self._send(429, {"message": "slow down"}, {"Retry-After": "0"})
+            return self._send(200, {"ok": True})
+
+        if url.path == "/exhausted":
+            return self._send(
+                403,
+                {"message": "API rate limit exceeded"},
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9999999999"},
+            )
+
+        self._send(404, {"message": "Not Found"})
+
+
+class _MemoryCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get_raw(self, key):
+        return self.data.get(key)
+
+    async def set_raw(self, key, value, expire=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def stub_server():
+    _StubGitApi.requests_seen = []
+    _StubGitApi.rate_limited_once = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def memory_cache(mocker):
+    cache = _MemoryCache()
+    mocker.patch("app.repository.http_client.cache_manager", cache)
+    return cache
+
+
+@pytest.fixture
+async def client():
+    git_client = GitApiClient()
+    yield git_client
+    await git_client.close()
+
+
+@pytest.mark.unit
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    async def test_not_modified_response_is_served_from_cache(
+        self, client, stub_server, memory_cache
+    ):
+        headers = {"Authorization": "token a"}
+
+        first = await client.get(f"{stub_server}/repo", headers=headers)
+        second = await client.get(f"{stub_server}/repo", headers=headers)
+
+        assert first.json() == second.json() == {"default_branch": "main"}
+        assert not first.from_cache
+        assert second.from_cache
+        assert _StubGitApi.requests_seen[1][2]["If-None-Match"] == '"token a-v1"'
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_are_not_shared_between_tokens(
+        self, client, stub_server, memory_cache
+    ):
+        await client.get(f"{stub_server}/repo", headers={"Authorization": "token a"})
+        other = await client.get(
+            f"{stub_server}/repo", headers={"Authorization": "token b"}
+        )
+
+        assert not other.from_cache
+        assert "If-None-Match" not in _StubGitApi.requests_seen[1][2]
+
+
+@pytest.mark.unit
+class TestPagination:
+    @pytest.mark.asyncio
+    async def test_pages_announced_by_link_header_are_all_fetched(
+        self, client, stub_server, memory_cache
+    ):
+        items = await fetch_all_pages(
+            lambda page: client.get(
+                f"{stub_server}/linked", params={"per_page": 2, "page": page}
+            ),
+            per_page=2,
+            max_pages=50,
+        )
+
+        assert items == [0, 1, 2, 3, 4]
+        assert sorted(q["page"] for _, q, _ in _StubGitApi.requests_seen) == [
+            "1",
+            "2",
+            "3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pages_without_total_are_read_until_short_page(
+        self, client, stub_server, memory_cache
+    ):
+        items = await fetch_all_pages(
+            lambda page: client.get(
+                f"{stub_server}/unlinked", params={"per_page": 2, "page": page}
+            ),
+            per_page=2,
+            max_pages=50,
+        )
+
+        assert items == [0, 1, 2, 3, 4]
+        assert len(_StubGitApi.requests_seen) == 3
+
+    def test_total_pages_from_headers(self):
+        assert total_pages({"X-Total-Pages": "4"}, 100) == 4
+        assert total_pages({"X-Total-Count": "120"}, 50) == 3
+        assert total_pages({"X-Total-Count": "not_a_number"}, 50) is None
+        assert total_pages({}, 50) is None
+
+
+@pytest.mark.unit
+class TestRateLimits:
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(
+        self, client, stub_server, memory_cache
+    ):
+        response = await client.get(f"{stub_server}/limited")
+
+        assert response.status_code == 200
+        assert len(_StubGitApi.requests_seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_long_rate_limit_wait_fails_fast(
+        self, client, stub_server, memory_cache
+    ):
+        response = await client.get(f"{stub_server}/exhausted")
+
+        assert response.status_code == 403
+        assert len(_StubGitApi.requests_seen) == 1
+        with pytest.raises(requests.exceptions.HTTPError, match="403"):
+            response.raise_for_status()
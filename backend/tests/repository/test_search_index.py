@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the per-user repository search index
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.repository.search_index import (
+    RepositorySearchIndex,
+    UserRepositoryIndex,
+    filter_repositories,
+)
+
+
+def _repo(full_name):
+    return {"id": full_name, "name": full_name.split("/")[-1], "full_name": full_name}
+
+
+REPOS = [
+    _repo("team/service-api"),
+    _repo("api/client"),
+    _repo("team/api"),
+    _repo("infra/rapid-deploy"),
+    _repo("team/apidocs"),
+]
+
+
+def _names(repos):
+    return [repo["full_name"] for repo in repos]
+
+
+@pytest.mark.unit
+class TestUserRepositoryIndex:
+    def test_results_ranked_by_match_then_recency(self):
+        index = UserRepositoryIndex()
+        index.update(REPOS, "v1")
+
+        assert _names(index.search("api")) == [
+            "team/api",
+            "team/apidocs",
+            "api/client",
+            "team/service-api",
+            "infra/rapid-deploy",
+        ]
+
+    def test_matches_linear_filter(self):
+        index = UserRepositoryIndex()
+        index.update(REPOS, "v1")
+
+        for query in ("a", "AP", "api", "rapid", "team/", "missing", "team/api"):
+            for fullmatch in (False, True):
+                assert index.search(query, fullmatch) == filter_repositories(
+                    REPOS, query, fullmatch
+                )
+
+    def test_update_reindexes_changed_repositories_only(self):
+        index = UserRepositoryIndex()
+        index.update(REPOS, "v1")
+
+        renamed = dict(REPOS[1], name="sdk", full_name="api/sdk")
+        index.update([renamed, REPOS[0], REPOS[2]], "v2")
+
+        assert index.version == "v2"
+        assert len(index) == 3
+        assert _names(index.search("client")) == []
+        assert _names(index.search("sdk")) == ["api/sdk"]
+        assert _names(index.search("apidocs")) == []
+        assert _names(index.search("api", fullmatch=True)) == ["team/api"]
+
+
+@pytest.mark.unit
+class TestRepositorySearchIndex:
+    @pytest.fixture
+    def mock_cache(self, mocker):
+        cache = mocker.patch("app.repository.search_index.cache_manager")
+        cache.generate_full_cache_key = Mock(return_value="git_repos:1:example.com")
+        cache.get_user_repositories_version = AsyncMock(return_value="v1")
+        cache.get = AsyncMock(return_value=REPOS)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_list_is_loaded_once_per_version(self, mock_cache):
+        search_index = RepositorySearchIndex(max_entries=8)
+
+        await search_index.search(1, "example.com", "api")
+        results = await search_index.search(1, "example.com", "deploy")
+
+        assert _names(results) == ["infra/rapid-deploy"]
+        mock_cache.get.assert_awaited_once()
+
+        mock_cache.get_user_repositories_version.return_value = "v2"
+        mock_cache.get.return_value = REPOS[:1]
+        results = await search_index.search(1, "example.com", "api")
+
+        assert _names(results) == ["team/service-api"]
+        assert mock_cache.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_cache_returns_none(self, mock_cache):
+        search_index = RepositorySearchIndex(max_entries=8)
+        mock_cache.get_user_repositories_version.return_value = None
+        mock_cache.get.return_value = None
+
+        assert await search_index.search(1, "example.com", "api") is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_index_is_evicted(self, mock_cache):
+        search_index = RepositorySearchIndex(max_entries=1)
+
+        await search_index.search(1, "example.com", "api")
+        await search_index.search(2, "example.com", "api")
+        await search_index.search(1, "example.com", "api")
+
+        assert mock_cache.get.await_count == 3
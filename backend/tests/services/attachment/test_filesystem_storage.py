@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the content-addressed filesystem storage backend.
+"""
+
+import hashlib
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.attachment.filesystem_storage import FilesystemStorageBackend
+from app.services.attachment.storage_backend import StorageError
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FilesystemStorageBackend(MagicMock(), root=str(tmp_path))
+
+
+def _blob_files(root):
+    # Blob data files, excluding the per-reference marker files
+    return [
+        name
+        for dir_path, _, files in os.walk(os.path.join(root, "blobs"))
+        for name in files
+        if not dir_path.endswith(".refs")
+    ]
+
+
+class TestFilesystemStorageBackend:
+    """Test cases for the filesystem storage backend."""
+
+    def test_save_stream_and_read_back(self, storage):
+        key = "attachments/abc_20250113_1_100"
+        chunks = [b"hello ", b"world"]
+
+        assert storage.save_stream(key, chunks, {}) == key
+
+        assert storage.exists(key)
+        assert storage.get(key) == b"hello world"
+        blob_name = hashlib.sha256(b"hello world").hexdigest()
+        assert os.path.exists(storage._blob_path(blob_name))
+
+    def test_range_read(self, storage):
+        key = "attachments/abc_20250113_1_100"
+        storage.save(key, bytes(range(256)) * 10, {})
+
+        assert b"".join(storage.open_stream(key, 10, 20)) == bytes(range(10, 20))
+        assert b"".join(storage.open_stream(key, 2550)) == bytes(range(246, 256))
+
+    def test_identical_content_is_stored_once(self, storage, tmp_path):
+        data = b"same file"
+        content_id = hashlib.sha256(data).hexdigest()
+        storage.save("attachments/a_1_1_1", data, {"content_id": content_id})
+
+        def unexpected_read():
+            raise AssertionError("deduplicated upload must not be consumed")
+            yield b""
+
+        storage.save_stream(
+            "attachments/b_1_2_2", unexpected_read(), {"content_id": content_id}
+        )
+
+        assert storage.get("attachments/b_1_2_2") == data
+        assert len(_blob_files(str(tmp_path))) == 1
+
+    def test_blob_removed_with_last_reference(self, storage, tmp_path):
+        storage.save("attachments/a_1_1_1", b"shared", {})
+        storage.save("attachments/b_1_2_2", b"shared", {})
+
+        assert storage.delete("attachments/a_1_1_1")
+        assert not storage.exists("attachments/a_1_1_1")
+        assert storage.get("attachments/b_1_2_2") == b"shared"
+
+        assert storage.delete("attachments/b_1_2_2")
+        assert _blob_files(str(tmp_path)) == []
+        assert not storage.delete("attachments/b_1_2_2")
+
+    def test_get_missing_key_returns_none(self, storage):
+        assert storage.get("attachments/missing_1_1_1") is None
+        assert storage.open_stream("attachments/missing_1_1_1") is None
+
+    def test_rejects_path_traversal(self, storage):
+        with pytest.raises(StorageError):
+            storage.save("attachments/../../etc/passwd", b"x", {})
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the attachment parse pipeline.
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.attachment import parse_pipeline as pipeline_module
+from app.services.attachment.parse_pipeline import ParsePipeline
+from app.services.attachment.parser import DocumentParseError, ParseResult
+
+
+@pytest.fixture
+def cache():
+    store = {}
+    mock = MagicMock()
+    mock.get_sync.side_effect = store.get
+    mock.set_sync.side_effect = lambda key, value, expire: store.__setitem__(key, value)
+    with patch.object(pipeline_module, "cache_manager", mock):
+        yield mock
+
+
+class TestParsePipeline:
+    """Test cases for ParsePipeline."""
+
+    def test_result_is_cached_by_content_hash(self, cache):
+        pipeline = ParsePipeline(max_workers=0)
+
+        first = pipeline.parse(b"hello world", ".txt")
+        with patch.object(pipeline._parser, "parse") as parse:
+            second = pipeline.parse(b"hello world", ".txt")
+
+        parse.assert_not_called()
+        assert second == first
+        assert second.text == "hello world"
+
+    def test_images_are_not_cached(self, cache):
+        pipeline = ParsePipeline(max_workers=0)
+        with patch.object(
+            pipeline._parser, "parse", return_value=ParseResult("img", 3, "b64")
+        ):
+            pipeline.parse(b"\x89PNG", ".png")
+
+        cache.get_sync.assert_not_called()
+        cache.set_sync.assert_not_called()
+
+    def test_pages_are_extracted_in_ranges_and_kept_in_order(self, cache):
+        pipeline = ParsePipeline(max_workers=3)
+        reader = MagicMock()
+        reader.pages = [None] * 100
+        ranges = []
+
+        def extract(binary_data, extension, start, end):
+            ranges.append((start, end))
+            return [f"page {i}" for i in range(start, end)]
+
+        with (
+            patch.object(
+                pipeline_module.DocumentParser, "open_pdf", return_value=reader
+            ),
+            patch.object(pipeline_module, "_extract_page_range", extract),
+            patch.object(
+                pipeline_module.settings, "ATTACHMENT_PARSE_PAGES_PER_TASK", 10
+            ),
+            ThreadPoolExecutor(max_workers=3) as executor,
+        ):
+            result = pipeline._parse_paged(executor, b"%PDF", ".pdf")
+
+        assert sorted(ranges) == [(0, 34), (34, 68), (68, 100)]
+        assert result.text.startswith("--- Page 1 ---\npage 0")
+        assert result.text.endswith("--- Page 100 ---\npage 99")
+
+    def test_parse_error_keeps_code_across_processes(self):
+        error = DocumentParseError("encrypted", DocumentParseError.ENCRYPTED_PDF)
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert str(restored) == "encrypted"
+        assert restored.error_code == DocumentParseError.ENCRYPTED_PDF
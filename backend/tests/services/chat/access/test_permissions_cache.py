@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for cached task access checks."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.chat.access import permissions
+
+
+@pytest.fixture
+def mock_cache(mocker):
+    cache = mocker.patch.object(permissions, "cache_manager")
+    cache.hget_raw = AsyncMock(return_value=None)
+    cache.hset_raw = AsyncMock(return_value=True)
+    cache.delete_sync = Mock(return_value=True)
+    return cache
+
+
+@pytest.fixture
+def mock_check(mocker):
+    return mocker.patch.object(
+        permissions, "_can_access_task_in_new_session", return_value=True
+    )
+
+
+@pytest.mark.unit
+class TestCanAccessTaskCache:
+    """Tests for the Redis cache in front of can_access_task."""
+
+    @pytest.mark.asyncio
+    async def test_miss_queries_database_and_caches_decision(
+        self, mock_cache, mock_check
+    ):
+        assert await permissions.can_access_task(7, 42) is True
+
+        mock_check.assert_called_once_with(7, 42)
+        mock_cache.hset_raw.assert_awaited_once()
+        key, field, value = mock_cache.hset_raw.call_args[0]
+        assert (key, field, value) == ("chat:task_access:42", "7", b"1")
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_database(self, mock_cache, mock_check):
+        mock_cache.hget_raw.return_value = b"0"
+
+        assert await permissions.can_access_task(7, 42) is False
+
+        mock_check.assert_not_called()
+        mock_cache.hset_raw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_queries_database(
+        self, mock_cache, mock_check, mocker
+    ):
+        mocker.patch.object(permissions.settings, "CHAT_TASK_ACCESS_CACHE_TTL", 0)
+
+        assert await permissions.can_access_task(7, 42) is True
+
+        mock_cache.hget_raw.assert_not_called()
+        mock_cache.hset_raw.assert_not_called()
+        mock_check.assert_called_once_with(7, 42)
+
+    def test_invalidate_drops_all_users_of_task(self, mock_cache):
+        permissions.invalidate_task_access(42)
+
+        mock_cache.delete_sync.assert_called_once_with("chat:task_access:42")
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for compiled team snapshots.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.chat.config import team_snapshot as snapshot_module
+from app.services.chat.config.team_snapshot import TeamSnapshot, TeamSnapshotCache
+
+
+def make_snapshot(prompt: str = "You are helpful") -> TeamSnapshot:
+    return TeamSnapshot.create(
+        team_id=1,
+        bot_name="bot",
+        bot_namespace="default",
+        bot_json={"spec": {}},
+        shell_type="Chat",
+        ghost_system_prompt=prompt,
+        member_prompt=None,
+        mcp_servers={},
+        skills=[],
+        preload_skills=[],
+        model_name=None,
+        model_spec=None,
+        dependencies=[
+            ("Team", "default", "team"),
+            ("Bot", "default", "bot"),
+            ("Ghost", "default", "ghost"),
+        ],
+    )
+
+
+@pytest.fixture
+def redis():
+    store = {}
+    revisions = {}
+    mock = MagicMock()
+    mock.get_sync.side_effect = store.get
+    mock.set_sync.side_effect = lambda key, value, expire: store.__setitem__(key, value)
+    mock.hmget_sync.side_effect = lambda key, fields: [revisions.get(f) for f in fields]
+    mock.revisions = revisions
+    with patch.object(snapshot_module, "cache_manager", mock):
+        yield mock
+
+
+class TestTeamSnapshotCache:
+    """Test cases for TeamSnapshotCache."""
+
+    def test_version_is_content_hash(self):
+        assert make_snapshot().version == make_snapshot().version
+        assert make_snapshot().version != make_snapshot("changed").version
+
+    def test_in_process_hit_skips_compile(self, redis):
+        cache = TeamSnapshotCache()
+        compile = MagicMock(return_value=make_snapshot())
+
+        first = cache.get_or_compile(1, 7, compile)
+        second = cache.get_or_compile(1, 7, compile)
+
+        assert second is first
+        compile.assert_called_once()
+
+    def test_dependency_change_invalidates_in_process_entry(self, redis):
+        cache = TeamSnapshotCache()
+        compile = MagicMock(return_value=make_snapshot())
+        cache.get_or_compile(1, 7, compile)
+
+        cache._on_kinds_changed({("Ghost", "default", "other")})
+        cache.get_or_compile(1, 7, compile)
+        assert compile.call_count == 1
+
+        # Committing the change also bumps its revision counter
+        redis.revisions["Ghost/default/ghost"] = 1
+        cache._on_kinds_changed({("Ghost", "default", "ghost")})
+        cache.get_or_compile(1, 7, compile)
+        assert compile.call_count == 2
+
+    def test_redis_entry_is_shared_until_revision_moves(self, redis):
+        compile = MagicMock(return_value=make_snapshot())
+        TeamSnapshotCache().get_or_compile(1, 7, compile)
+
+        # Another worker reuses the Redis entry
+        other = TeamSnapshotCache()
+        assert other.get_or_compile(1, 7, compile) == make_snapshot()
+        compile.assert_called_once()
+
+        # A dependency was updated elsewhere
+        redis.revisions["Bot/default/bot"] = 1
+        TeamSnapshotCache().get_or_compile(1, 7, compile)
+        assert compile.call_count == 2
+
+    def test_decrypted_model_config_is_not_written_to_redis(self, redis):
+        spec = {"modelConfig": {"env": {"api_key": "secret"}}}
+        with patch(
+            "app.services.chat.config.model_resolver.extract_model_config",
+            return_value={"api_key": "decrypted"},
+        ):
+            fields = make_snapshot().to_cache()
+            del fields["version"]
+            fields.update(model_name="gpt", model_spec=spec)
+            snapshot = TeamSnapshot.create(**fields)
+            TeamSnapshotCache().get_or_compile(1, 7, lambda: snapshot)
+
+        assert snapshot.model_config == {"api_key": "decrypted"}
+        stored = redis.set_sync.call_args.args[1]["snapshot"]
+        assert "model_config" not in stored
+        assert "decrypted" not in str(stored)
+
+    def test_saving_entry_keeps_revisions_alive(self, redis):
+        with patch.object(snapshot_module.settings, "KIND_REVISIONS_TTL_SECONDS", 600):
+            cache = TeamSnapshotCache(ttl=3600)
+            cache.get_or_compile(1, 7, lambda: make_snapshot())
+
+        redis.expire_sync.assert_called_once_with(
+            snapshot_module.KIND_REVISIONS_KEY, 600
+        )
+        assert redis.set_sync.call_args.kwargs["expire"] == 600
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the batched CustomEmbedding client.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from llama_index.core.callbacks import CallbackManager, CBEventType, LlamaDebugHandler
+
+from app.services.rag.embedding.custom import CustomEmbedding
+
+
+def _make_response(inputs):
+    """Build a fake OpenAI-compatible embeddings response for inputs."""
+    response = MagicMock()
+    response.raise_for_status.return_value = None
+    # Return items in reverse order to verify index-based reordering
+    response.json.return_value = {
+        "data": [
+            {"index": i, "embedding": [float(len(text)), float(i)]}
+            for i, text in reversed(list(enumerate(inputs)))
+        ]
+    }
+    return response
+
+
+@pytest.fixture
+def embedding():
+    return CustomEmbedding(
+        api_url="http://embedding.local/v1/embeddings",
+        model="test-model",
+        api_key="secret",
+        embed_batch_size=3,
+        max_concurrency=2,
+    )
+
+
+class TestCustomEmbeddingBatching:
+    """Test batched request handling."""
+
+    def test_batch_sends_array_input(self, embedding):
+        session = MagicMock()
+        session.post.side_effect = lambda url, json, timeout: _make_response(
+            json["input"]
+        )
+
+        with patch.object(embedding, "_get_session", return_value=session):
+            result = embedding.get_text_embedding_batch(["a", "bb", "ccc", "dddd"])
+
+        # 4 texts with batch size 3 -> 2 requests
+        assert session.post.call_count == 2
+        sent_inputs = sorted(
+            (c.kwargs["json"]["input"] for c in session.post.call_args_list), key=len
+        )
+        assert sent_inputs == [["dddd"], ["a", "bb", "ccc"]]
+        # Order of the output matches the order of the input texts
+        assert [vec[0] for vec in result] == [1.0, 2.0, 3.0, 4.0]
+
+    def test_batch_emits_embedding_events(self, embedding):
+        handler = LlamaDebugHandler()
+        embedding.callback_manager = CallbackManager([handler])
+        session = MagicMock()
+        session.post.side_effect = lambda url, json, timeout: _make_response(
+            json["input"]
+        )
+
+        texts = [str(i) * (i + 1) for i in range(8)]
+        with patch.object(embedding, "_get_session", return_value=session):
+            result = embedding.get_text_embedding_batch(texts)
+
+        assert [vec[0] for vec in result] == [float(i + 1) for i in range(8)]
+        # Batch size 3 and concurrency 2 -> 6 texts per event, 3 per request
+        pairs = handler.get_event_pairs(CBEventType.EMBEDDING)
+        assert len(pairs) == 2
+        assert session.post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_async_batch_uses_batched_requests(self, embedding):
+        session = MagicMock()
+        session.post.side_effect = lambda url, json, timeout: _make_response(
+            json["input"]
+        )
+
+        with patch.object(embedding, "_get_session", return_value=session):
+            result = await embedding.aget_text_embedding_batch(["a", "bb", "ccc"])
+
+        assert [vec[0] for vec in result] == [1.0, 2.0, 3.0]
+        assert session.post.call_args.kwargs["json"]["input"] == ["a", "bb", "ccc"]
+
+    def test_empty_batch_makes_no_request(self, embedding):
+        session = MagicMock()
+        with patch.object(embedding, "_get_session", return_value=session):
+            assert embedding.get_text_embedding_batch([]) == []
+        session.post.assert_not_called()
+
+    def test_single_text_uses_batch_call(self, embedding):
+        session = MagicMock()
+        session.post.side_effect = lambda url, json, timeout: _make_response(
+            json["input"]
+        )
+
+        with patch.object(embedding, "_get_session", return_value=session):
+            vector = embedding.get_query_embedding("hello")
+
+        assert vector == [5.0, 0.0]
+        assert session.post.call_args.kwargs["json"]["input"] == ["hello"]
+
+    def test_mismatched_response_length_raises(self, embedding):
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {"data": [{"index": 0, "embedding": [1.0]}]}
+
+        with patch.object(
+            CustomEmbedding._call_api_batch.retry, "sleep", lambda *_: None
+        ):
+            session = MagicMock()
+            session.post.return_value = response
+            with patch.object(embedding, "_get_session", return_value=session):
+                with pytest.raises(Exception):
+                    embedding._call_api_batch(["a", "b"])
+
+        # Failed batch is retried
+        assert session.post.call_count == 3
+
+    def test_session_carries_auth_header(self, embedding):
+        session = embedding._get_session()
+        assert session.headers["Authorization"] == "Bearer secret"
+        # Session is reused across calls
+        assert embedding._get_session() is session
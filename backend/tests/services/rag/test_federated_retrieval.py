@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for federated retrieval across knowledge bases.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.rag.retrieval.fusion import FUSION_SCORE, fuse_results
+from app.services.rag.retrieval.query_cache import (
+    SharedQueryEmbedding,
+    get_model_identity,
+)
+from app.services.rag.retrieval_service import RetrievalService
+
+
+def _records(*scores):
+    return [
+        {"content": f"c{score}", "title": "doc", "score": score} for score in scores
+    ]
+
+
+class TestFuseResults:
+    def test_rrf_interleaves_by_rank(self):
+        # KB 2 uses a different score scale; ranks decide, not raw scores
+        fused = fuse_results({1: _records(0.9, 0.8), 2: _records(12.0, 11.0)}, top_k=3)
+
+        assert [(r["knowledge_base_id"], r["score"]) for r in fused] == [
+            (1, 0.9),
+            (2, 12.0),
+            (1, 0.8),
+        ]
+        assert all("fusion_score" in r for r in fused)
+
+    def test_score_normalization(self):
+        fused = fuse_results(
+            {1: _records(0.9, 0.5, 0.1), 2: _records(0.7, 0.6)},
+            top_k=10,
+            method=FUSION_SCORE,
+        )
+
+        assert [r["fusion_score"] for r in fused] == [1.0, 1.0, 0.5, 0.0, 0.0]
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            fuse_results({}, top_k=5, method="unknown")
+
+
+class TestSharedQueryEmbedding:
+    def test_embedding_computed_once_across_threads(self):
+        embed_model = MagicMock()
+        embed_model.model = "m"
+        embed_model.get_query_embedding.side_effect = lambda q: time.sleep(0.05) or [
+            1.0
+        ]
+        shared = SharedQueryEmbedding(embed_model)
+
+        threads = [
+            threading.Thread(target=shared.get_query_embedding, args=("q",))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        embed_model.get_query_embedding.assert_called_once_with("q")
+        assert get_model_identity(shared) == get_model_identity(embed_model)
+
+
+class TestFederatedRetrieval:
+    @pytest.fixture
+    def db(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            SimpleNamespace(id=kb_id, user_id=1) for kb_id in (1, 2, 3)
+        ]
+        return db
+
+    @staticmethod
+    def _retriever(records=None, delay=0.0, error=None):
+        def retrieve(**kwargs):
+            time.sleep(delay)
+            if error:
+                raise error
+            return {"records": records or []}
+
+        return SimpleNamespace(retrieve=retrieve)
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_kbs_are_left_out(self, db):
+        retrievers = {
+            1: self._retriever(_records(0.9)),
+            2: self._retriever(_records(0.8), delay=1.0),
+            3: self._retriever(error=RuntimeError("down")),
+        }
+        service = RetrievalService()
+
+        with patch.object(
+            service,
+            "_build_kb_retriever",
+            side_effect=lambda kb, db, shared: (retrievers[kb.id], {}),
+        ):
+            result = await service.retrieve_from_knowledge_bases_internal(
+                query="q", knowledge_base_ids=[1, 2, 3, 4], db=db, timeout=0.2
+            )
+
+        assert [r["knowledge_base_id"] for r in result["records"]] == [1]
+        assert sorted(result["failed_knowledge_base_ids"]) == [2, 3, 4]
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for maintained knowledge base index statistics.
+"""
+
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
+from app.models.knowledge import KnowledgeBaseStats, KnowledgeDocument
+from app.services.rag.kb_stats import ChunkStats, KnowledgeBaseStatsService
+
+KB_ID = 42
+
+
+def _document(db: Session, **kwargs) -> KnowledgeDocument:
+    document = KnowledgeDocument(
+        kind_id=KB_ID,
+        name="doc.txt",
+        file_extension="txt",
+        file_size=1000,
+        user_id=1,
+        **kwargs,
+    )
+    db.add(document)
+    db.commit()
+    return document
+
+
+def _stats(db: Session) -> KnowledgeBaseStats:
+    db.expire_all()
+    return db.get(KnowledgeBaseStats, KB_ID)
+
+
+class TestChunkStats:
+    def test_from_texts(self):
+        stats = ChunkStats.from_texts(["hello", "wörld", None])
+
+        assert stats.chunk_count == 3
+        assert stats.text_bytes == len("hello") + len("wörld".encode("utf-8"))
+        assert stats.token_count > 0
+
+
+class TestKnowledgeBaseStatsService:
+    def test_index_reindex_and_delete_apply_deltas(self, test_db: Session):
+        first = _document(test_db)
+        second = _document(test_db)
+
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, first.id, ChunkStats(3, 300, 1200)
+        )
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, second.id, ChunkStats(2, 100, 400)
+        )
+        # Re-indexing replaces the previous statistics of the document
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, first.id, ChunkStats(4, 350, 1400)
+        )
+
+        stats = _stats(test_db)
+        assert (stats.document_count, stats.chunk_count, stats.token_count) == (
+            2,
+            6,
+            450,
+        )
+        assert stats.text_bytes == 1800
+        assert stats.is_complete
+
+        KnowledgeBaseStatsService.record_document_deleted(test_db, second)
+        test_db.delete(second)
+        test_db.commit()
+
+        stats = _stats(test_db)
+        assert (stats.document_count, stats.chunk_count, stats.token_count) == (
+            1,
+            4,
+            350,
+        )
+
+    def test_legacy_documents_make_stats_incomplete(self, test_db: Session):
+        # Indexed before statistics were recorded
+        _document(test_db, is_active=True)
+        fresh = _document(test_db)
+
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, fresh.id, ChunkStats(1, 10, 40)
+        )
+        assert not _stats(test_db).is_complete
+
+        with (
+            patch(
+                "app.services.knowledge.KnowledgeService.get_total_file_size",
+                return_value=2000,
+            ),
+            patch(
+                "app.services.knowledge.KnowledgeService.get_active_document_count",
+                return_value=2,
+            ),
+        ):
+            size_info = KnowledgeBaseStatsService.get_size_info(test_db, [KB_ID])
+        assert size_info["items"][0]["is_exact"] is False
+        assert size_info["total_estimated_tokens"] == 500
+
+    def test_rebuild_from_chunks(self, test_db: Session):
+        legacy = _document(test_db)
+        fresh = _document(test_db)
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, fresh.id, ChunkStats(1, 10, 40)
+        )
+
+        chunks = [
+            {"content": "alpha", "doc_ref": str(legacy.id)},
+            {"content": "beta", "doc_ref": str(legacy.id)},
+            {"content": "gamma", "doc_ref": str(fresh.id)},
+        ]
+        KnowledgeBaseStatsService.rebuild_from_chunks(test_db, KB_ID, chunks)
+
+        stats = _stats(test_db)
+        assert stats.is_complete
+        assert (stats.document_count, stats.chunk_count) == (2, 3)
+        assert stats.text_bytes == len("alphabetagamma")
+
+        size_info = KnowledgeBaseStatsService.get_size_info(test_db, [KB_ID])
+        item = size_info["items"][0]
+        assert item["is_exact"] is True
+        assert item["estimated_tokens"] == stats.token_count
+        assert size_info["total_estimated_tokens"] == stats.token_count
+
+    def test_unknown_document_is_ignored(self, test_db: Session):
+        KnowledgeBaseStatsService.record_document_indexed(
+            test_db, KB_ID, 999, ChunkStats(1, 1, 1)
+        )
+
+        assert _stats(test_db) is None
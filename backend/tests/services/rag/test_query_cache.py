@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the RAG query embedding / retrieval result cache.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.rag.retrieval.query_cache import (
+    CachedQueryEmbedding,
+    QueryCache,
+    normalize_query,
+)
+
+
+@pytest.fixture
+def cache():
+    # No Redis URL: only the in-process tier is used
+    return QueryCache(redis_url=None, maxsize=16)
+
+
+class TestNormalizeQuery:
+    def test_collapses_whitespace(self):
+        assert normalize_query("  what   is\nRAG ") == "what is RAG"
+
+    def test_handles_none(self):
+        assert normalize_query(None) == ""
+
+
+class TestQueryEmbeddingCache:
+    def test_embedding_computed_once_for_equivalent_queries(self, cache):
+        embed_model = MagicMock()
+        embed_model.model = "m"
+        embed_model.get_query_embedding.return_value = [0.1, 0.2]
+        cached = CachedQueryEmbedding(embed_model, cache)
+
+        assert cached.get_query_embedding("hello world") == [0.1, 0.2]
+        assert cached.get_query_embedding("  hello   world ") == [0.1, 0.2]
+
+        embed_model.get_query_embedding.assert_called_once()
+        stats = cache.get_stats()
+        assert stats["embedding_misses"] == 1
+        assert stats["embedding_l1_hits"] == 1
+        assert stats["embedding_hit_rate"] == 0.5
+
+    def test_proxy_delegates_other_attributes(self, cache):
+        embed_model = MagicMock()
+        embed_model.model_name = "text-embedding"
+        cached = CachedQueryEmbedding(embed_model, cache)
+        assert cached.model_name == "text-embedding"
+
+
+class TestRetrievalResultCache:
+    def test_results_cached_per_setting(self, cache):
+        retrieve = MagicMock(return_value={"records": [{"content": "a"}]})
+        setting = {"top_k": 5, "score_threshold": 0.5}
+
+        first = cache.get_or_retrieve("1", "q", setting, retrieve)
+        second = cache.get_or_retrieve("1", "q", setting, retrieve)
+        cache.get_or_retrieve("1", "q", {**setting, "top_k": 10}, retrieve)
+
+        assert first == second
+        assert retrieve.call_count == 2
+
+    def test_cached_result_is_not_shared(self, cache):
+        retrieve = MagicMock(return_value={"records": [{"content": "a"}]})
+        first = cache.get_or_retrieve("1", "q", {}, retrieve)
+        first["records"].append({"content": "mutated"})
+
+        second = cache.get_or_retrieve("1", "q", {}, retrieve)
+        assert second == {"records": [{"content": "a"}]}
+
+    def test_redis_hit_is_not_shared_with_l1(self, cache, monkeypatch):
+        monkeypatch.setattr(
+            cache, "_redis_get", lambda key: {"records": [{"content": "a"}]}
+        )
+        retrieve = MagicMock()
+        first = cache.get_or_retrieve("1", "q", {}, retrieve)
+        first["records"].append({"content": "mutated"})
+
+        second = cache.get_or_retrieve("1", "q", {}, retrieve)
+        assert second == {"records": [{"content": "a"}]}
+        assert cache.get_stats()["result_l1_hits"] == 1
+        retrieve.assert_not_called()
+
+    def test_invalidate_knowledge(self, cache):
+        retrieve = MagicMock(return_value={"records": []})
+        cache.get_or_retrieve("1", "q", {}, retrieve)
+        cache.get_or_retrieve("2", "q", {}, retrieve)
+
+        cache.invalidate_knowledge("1")
+        cache.get_or_retrieve("1", "q", {}, retrieve)
+        cache.get_or_retrieve("2", "q", {}, retrieve)
+
+        # KB 1 re-queried after invalidation, KB 2 still served from cache
+        assert retrieve.call_count == 3
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the append-only streaming buffer.
+"""
+
+from app.services.streaming.buffer import StreamBuffer
+
+
+class TestStreamBuffer:
+    """Tests for StreamBuffer class."""
+
+    def test_append_and_getvalue(self):
+        buffer = StreamBuffer()
+        for token in ["Hel", "lo", ", ", "world"]:
+            buffer.append(token)
+
+        assert buffer.getvalue() == "Hello, world"
+        assert len(buffer) == 12
+
+    def test_initial_value(self):
+        buffer = StreamBuffer("abc")
+        buffer.append("def")
+        assert str(buffer) == "abcdef"
+
+    def test_since_returns_delta(self):
+        buffer = StreamBuffer()
+        buffer.append("abc")
+        buffer.append("def")
+        buffer.append("ghi")
+
+        assert buffer.since(0) == "abcdefghi"
+        assert buffer.since(3) == "defghi"
+        assert buffer.since(4) == "efghi"
+        assert buffer.since(9) == ""
+        assert buffer.since(20) == ""
+
+    def test_since_after_getvalue(self):
+        buffer = StreamBuffer()
+        buffer.append("abc")
+        buffer.getvalue()
+        buffer.append("def")
+
+        assert buffer.since(2) == "cdef"
+        assert buffer.getvalue() == "abcdef"
+
+    def test_empty_append_is_noop(self):
+        buffer = StreamBuffer("x")
+        buffer.append("")
+        assert len(buffer) == 1
+        assert buffer.getvalue() == "x"
+
+    def test_multibyte_offsets_are_characters(self):
+        buffer = StreamBuffer()
+        buffer.append("你好")
+        buffer.append("世界")
+        assert buffer.since(2) == "世界"
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for chunk coalescing in stream emitters.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.streaming.coalescer import CoalescingEmitter
+
+
+@pytest.fixture
+def inner():
+    emitter = MagicMock()
+    emitter.emit_chunk = AsyncMock()
+    emitter.emit_done = AsyncMock()
+    emitter.emit_error = AsyncMock()
+    emitter.emit_cancelled = AsyncMock()
+    emitter.emit_start = AsyncMock()
+    return emitter
+
+
+def _sent_chunks(inner):
+    return [
+        (c.args[0], c.args[1], c.kwargs.get("result"))
+        for c in inner.emit_chunk.call_args_list
+    ]
+
+
+class TestCoalescingEmitter:
+    """Tests for CoalescingEmitter class."""
+
+    @pytest.mark.asyncio
+    async def test_merges_consecutive_chunks_on_done(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+        result = {"shell_type": "Chat"}
+
+        await emitter.emit_chunk("Hel", 0, 1, result=result)
+        await emitter.emit_chunk("lo", 3, 1, result=result)
+        await emitter.emit_chunk("!", 5, 1, result=result)
+        inner.emit_chunk.assert_not_called()
+
+        await emitter.emit_done(10, 1, 6, {"value": "Hello!"})
+
+        assert _sent_chunks(inner) == [("Hello!", 0, result)]
+        inner.emit_done.assert_awaited_once()
+        assert emitter.stats == {"tokens": 3, "frames": 1}
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_byte_threshold(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=4)
+
+        await emitter.emit_chunk("ab", 0, 1)
+        await emitter.emit_chunk("cd", 2, 1)
+        await emitter.emit_chunk("e", 4, 1)
+
+        assert _sent_chunks(inner) == [("abcd", 0, None)]
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_window(self, inner):
+        emitter = CoalescingEmitter(inner, window=0.01, max_bytes=1024)
+
+        await emitter.emit_chunk("a", 0, 1)
+        await emitter.emit_chunk("b", 1, 1)
+        await asyncio.sleep(0.05)
+
+        assert _sent_chunks(inner) == [("ab", 0, None)]
+
+    @pytest.mark.asyncio
+    async def test_control_frame_flushes_pending_first(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+        tool_result = {"shell_type": "Chat", "thinking": [{"title": "tool"}]}
+
+        await emitter.emit_chunk("text", 0, 1)
+        await emitter.emit_chunk("", 4, 1, result=tool_result)
+
+        assert _sent_chunks(inner) == [("text", 0, None), ("", 4, tool_result)]
+
+    @pytest.mark.asyncio
+    async def test_reasoning_chunks_merged_separately(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+
+        await emitter.emit_chunk("", 0, 1, result={"reasoning_chunk": "th"})
+        await emitter.emit_chunk("", 0, 1, result={"reasoning_chunk": "ink"})
+        await emitter.emit_chunk("answer", 0, 1)
+        await emitter.flush()
+
+        assert _sent_chunks(inner) == [
+            ("", 0, {"reasoning_chunk": "think"}),
+            ("answer", 0, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_content_chunk_keeps_its_reasoning(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+
+        await emitter.emit_chunk("an", 0, 1, result={"reasoning_chunk": "a"})
+        await emitter.emit_chunk("swer", 2, 1, result={"reasoning_chunk": "b"})
+        await emitter.emit_chunk("!", 6, 1, result={})
+        await emitter.flush()
+
+        assert _sent_chunks(inner) == [("answer!", 0, {"reasoning_chunk": "ab"})]
+
+    @pytest.mark.asyncio
+    async def test_failed_timer_flush_is_logged(self, inner, caplog):
+        inner.emit_chunk.side_effect = RuntimeError("socket closed")
+        emitter = CoalescingEmitter(inner, window=0.01, max_bytes=1024)
+
+        await emitter.emit_chunk("a", 0, 1)
+        assert emitter._flush_tasks == set()
+        await asyncio.sleep(0.05)
+
+        assert emitter._flush_tasks == set()
+        assert "socket closed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_non_contiguous_offsets_are_not_merged(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+
+        await emitter.emit_chunk("a", 0, 1)
+        await emitter.emit_chunk("b", 5, 1)
+        await emitter.flush()
+
+        assert _sent_chunks(inner) == [("a", 0, None), ("b", 5, None)]
+
+    @pytest.mark.asyncio
+    async def test_cancel_flushes_pending(self, inner):
+        emitter = CoalescingEmitter(inner, window=10, max_bytes=1024)
+
+        await emitter.emit_chunk("partial", 0, 1)
+        await emitter.emit_cancelled(1)
+
+        assert _sent_chunks(inner) == [("partial", 0, None)]
+        inner.emit_cancelled.assert_awaited_once_with(1)
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the append-only streaming content cache in SessionManager.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.services.chat.storage.session import SessionManager
+from app.services.chat.trigger.core import _save_streaming_delta
+from app.services.streaming.buffer import StreamBuffer
+
+
+class _FakePipeline:
+    def __init__(self, cache: "_FakeCache"):
+        self._cache = cache
+        self._ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        return [
+            self._cache.run(name, *args, **kwargs) for name, args, kwargs in self._ops
+        ]
+
+
+class _FakeCache:
+    """In-memory stand-in for the RedisCache methods the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+        self.getrange_calls = []
+
+    def run(self, name, *args, **kwargs):
+        if name == "set":
+            self.values[args[0]] = args[1]
+            return True
+        if name == "delete":
+            deleted = 0
+            for key in args:
+                deleted += int(self.values.pop(key, None) is not None)
+                deleted += int(self.sorted_sets.pop(key, None) is not None)
+            return deleted
+        if name == "zadd":
+            self.sorted_sets.setdefault(args[0], {}).update(args[1])
+            return 1
+        if name == "expire":
+            return True
+        raise AssertionError(f"unexpected command {name}")
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True):
+        yield _FakePipeline(self)
+
+    async def append(self, key, value, expire=None):
+        self.values[key] = self.values.get(key, b"") + value
+        return len(self.values[key])
+
+    async def get_raw(self, key):
+        return self.values.get(key)
+
+    async def getrange(self, key, start, end=-1):
+        self.getrange_calls.append(start)
+        return self.values.get(key, b"")[start:]
+
+    async def zfloor(self, key, score):
+        members = [
+            (member_score, member)
+            for member, member_score in self.sorted_sets.get(key, {}).items()
+            if member_score <= score
+        ]
+        return max(members)[1].encode() if members else None
+
+
+@pytest.fixture
+def manager():
+    session_manager = SessionManager()
+    session_manager._cache = _FakeCache()
+    return session_manager
+
+
+async def test_reads_from_offset_fetch_only_the_tail(manager):
+    assert await manager.save_streaming_content(1, "你好")
+    assert await manager.append_streaming_content(1, "，世界", 2)
+    assert await manager.append_streaming_content(1, "!", 5)
+
+    assert await manager.get_streaming_content(1) == "你好，世界!"
+    assert await manager.get_streaming_content(1, offset=3) == "世界!"
+    assert await manager.get_streaming_content(1, offset=5) == "!"
+    # Offsets 3 and 5 start at the checkpoints after "你好" and "你好，世界"
+    assert manager._cache.getrange_calls == [6, 15]
+
+
+async def test_append_after_expiry_asks_for_full_save(manager):
+    assert not await manager.append_streaming_content(1, "tail", 10)
+
+
+async def test_delete_removes_content_and_offsets(manager):
+    await manager.save_streaming_content(1, "abc")
+
+    assert await manager.delete_streaming_content(1)
+    assert manager._cache.values == {}
+    assert manager._cache.sorted_sets == {}
+
+
+async def test_http_stream_saves_only_new_content(manager, monkeypatch):
+    buffer = StreamBuffer("你好")
+    saved = await _save_streaming_delta(manager, 1, buffer, 0)
+    buffer.append("，世界")
+    appended = []
+    append = manager.append_streaming_content
+
+    async def record_append(subtask_id, delta, offset):
+        appended.append((delta, offset))
+        return await append(subtask_id, delta, offset)
+
+    monkeypatch.setattr(manager, "append_streaming_content", record_append)
+    saved = await _save_streaming_delta(manager, 1, buffer, saved)
+
+    assert saved == 5
+    assert appended == [("，世界", 2)]
+    assert await manager.get_streaming_content(1) == "你好，世界"
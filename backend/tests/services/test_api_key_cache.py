@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.api_key import APIKey
+from app.services import api_key_cache as cache_module
+from app.services.api_key_cache import APIKeyAuthCache
+
+
+@pytest.fixture
+def usage_cache(mocker, test_db: Session):
+    """A fresh cache flushing into the test session."""
+    mocker.patch.object(cache_module.cache_manager, "publish_sync")
+    mocker.patch.object(
+        cache_module.cache_manager, "hincrby_counts_sync", return_value=True
+    )
+    mocker.patch("app.db.session.SessionLocal", return_value=test_db)
+    mocker.patch.object(test_db, "close")
+    cache = APIKeyAuthCache(ttl_seconds=60, counter_window_seconds=60)
+    mocker.patch.object(cache_module, "api_key_auth_cache", cache)
+    return cache
+
+
+@pytest.mark.unit
+class TestAPIKeyAuthCache:
+    """Test cached API key lookups and write-behind usage"""
+
+    def test_lookup_is_cached(self, usage_cache, test_db, test_api_key, mocker):
+        raw_key, api_key = test_api_key
+        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+
+        first = usage_cache.get(test_db, key_hash)
+        query = mocker.spy(test_db, "query")
+        second = usage_cache.get(test_db, key_hash)
+
+        assert first == second
+        assert second.id == api_key.id
+        query.assert_not_called()
+
+    def test_disabling_key_revokes_cached_entry(
+        self, usage_cache, test_db, test_api_key
+    ):
+        raw_key, api_key = test_api_key
+        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        assert usage_cache.get(test_db, key_hash) is not None
+
+        api_key.is_active = False
+        test_db.commit()
+
+        assert usage_cache.get(test_db, key_hash) is None
+        cache_module.cache_manager.publish_sync.assert_called_once_with(
+            cache_module.API_KEY_REVOCATION_CHANNEL, {"key_hashes": [key_hash]}
+        )
+
+    def test_usage_is_flushed_in_batches(self, usage_cache, test_db, test_api_key):
+        _, api_key = test_api_key
+        api_key.last_used_at = datetime.utcnow() - timedelta(days=1)
+        test_db.commit()
+
+        for _ in range(3):
+            usage_cache.record_use(api_key.id)
+        assert usage_cache.request_count(api_key.id) >= 3
+
+        usage_cache.flush()
+
+        test_db.refresh(api_key)
+        assert api_key.last_used_at > datetime.utcnow() - timedelta(minutes=1)
+        cache_module.cache_manager.hincrby_counts_sync.assert_called_once()
+        _, counts = cache_module.cache_manager.hincrby_counts_sync.call_args[0]
+        assert counts == {str(api_key.id): 3}
+
+    def test_flush_never_moves_last_used_back(self, usage_cache, test_db, test_api_key):
+        _, api_key = test_api_key
+        newer = datetime.utcnow() + timedelta(hours=1)
+        api_key.last_used_at = newer
+        test_db.commit()
+
+        usage_cache.record_use(api_key.id)
+        usage_cache.flush()
+
+        test_db.refresh(api_key)
+        assert api_key.last_used_at == newer
+
+    def test_expired_lookup_queries_again(self, test_db, test_api_key, mocker):
+        raw_key, _ = test_api_key
+        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        cache = APIKeyAuthCache(ttl_seconds=0, counter_window_seconds=60)
+
+        cache.get(test_db, key_hash)
+        query = mocker.spy(test_db, "query")
+        cache.get(test_db, key_hash)
+
+        query.assert_called_once_with(APIKey)
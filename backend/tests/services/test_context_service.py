@@ -154,6 +154,68 @@ class TestContextServiceStorage:
         assert binary_data == original_data
         assert binary_data != encrypted_data
 
+    def test_open_attachment_stream_decrypts_requested_range(self):
+        """Test range reads of chunk-encrypted data only fetch covering chunks"""
+        import os
+        import sys
+
+        from shared.utils.crypto import (
+            ATTACHMENT_CHUNK_SIZE,
+            ATTACHMENT_ENCRYPTED_CHUNK_SIZE,
+            iter_encrypt_attachment,
+        )
+
+        from app.models.subtask_context import (
+            ContextStatus,
+            ContextType,
+            SubtaskContext,
+        )
+        from app.services.context.context_service import context_service as cs_instance
+
+        cs_module = sys.modules["app.services.context.context_service"]
+
+        # Arrange
+        storage_key = "attachments/test123_20250113_1_100"
+        original_data = os.urandom(2 * ATTACHMENT_CHUNK_SIZE + 100)
+        stored_data = b"".join(iter_encrypt_attachment([original_data]))
+        context = SubtaskContext(
+            subtask_id=0,
+            user_id=1,
+            context_type=ContextType.ATTACHMENT.value,
+            name="test.pdf",
+            status=ContextStatus.READY.value,
+            type_data={
+                "storage_backend": "filesystem",
+                "storage_key": storage_key,
+                "is_encrypted": True,
+                "encryption_version": 2,
+            },
+        )
+        context.id = 100
+
+        with patch.object(cs_module, "get_storage_backend") as mock_get_backend:
+            mock_backend = Mock()
+            mock_backend.open_stream.side_effect = lambda key, start, end: iter(
+                [stored_data[start:end]]
+            )
+            mock_backend.get.return_value = stored_data
+            mock_get_backend.return_value = mock_backend
+
+            # Act
+            start = ATTACHMENT_CHUNK_SIZE - 10
+            end = ATTACHMENT_CHUNK_SIZE + 10
+            ranged = b"".join(
+                cs_instance.open_attachment_stream(Mock(), context, start, end)
+            )
+            full = cs_instance.get_attachment_binary_data(Mock(), context)
+
+        # Assert - only the two chunks covering the range were read
+        assert ranged == original_data[start:end]
+        mock_backend.open_stream.assert_called_once_with(
+            storage_key, 0, 2 * ATTACHMENT_ENCRYPTED_CHUNK_SIZE
+        )
+        assert full == original_data
+
     def test_get_binary_data_returns_none_without_storage_key(self):
         """Test that get_binary_data returns None when storage_key is missing"""
         from app.models.subtask_context import (
@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+from app.models.user import User
+from app.services.adapters.dispatch_queue import dispatch_queue
+from app.services.adapters.executor_kinds import executor_kinds_service
+
+
+def _add_task(db: Session, user: User, name: str, labels: dict, status: str):
+    task = TaskResource(
+        user_id=user.id,
+        kind="Task",
+        name=name,
+        namespace="default",
+        json={
+            "kind": "Task",
+            "status": {"status": status},
+            "metadata": {"name": name, "namespace": "default", "labels": labels},
+        },
+        is_active=True,
+    )
+    db.add(task)
+    db.flush()
+    return task
+
+
+def _add_subtask(db: Session, user: User, task: TaskResource, message_id: int):
+    subtask = Subtask(
+        user_id=user.id,
+        task_id=task.id,
+        team_id=1,
+        title=f"{task.name}-{message_id}",
+        bot_ids=[1],
+        role=SubtaskRole.ASSISTANT,
+        status=SubtaskStatus.PENDING,
+        message_id=message_id,
+    )
+    db.add(subtask)
+    db.flush()
+    return subtask
+
+
+def _peek_from(queued: list) -> AsyncMock:
+    return AsyncMock(side_effect=lambda count, start=0: queued[start : start + count])
+
+
+@pytest.mark.asyncio
+async def test_get_first_subtasks_from_queue_filters_and_drops_stale(
+    test_db: Session, test_user: User
+) -> None:
+    with patch.object(dispatch_queue, "enqueue_sync"):
+        online = _add_task(test_db, test_user, "online", {}, "PENDING")
+        offline = _add_task(
+            test_db, test_user, "offline", {"type": "offline"}, "PENDING"
+        )
+        chat = _add_task(
+            test_db, test_user, "chat", {"source": "chat_shell"}, "PENDING"
+        )
+        running = _add_task(test_db, test_user, "running", {}, "RUNNING")
+        empty = _add_task(test_db, test_user, "empty", {}, "PENDING")
+        _add_subtask(test_db, test_user, online, message_id=4)
+        first = _add_subtask(test_db, test_user, online, message_id=2)
+        _add_subtask(test_db, test_user, offline, message_id=2)
+        test_db.commit()
+
+    queued = [chat.id, 999999, running.id, offline.id, empty.id, online.id]
+    with (
+        patch.object(dispatch_queue, "peek", _peek_from(queued)),
+        patch.object(dispatch_queue, "remove", AsyncMock()) as remove,
+    ):
+        subtasks = await executor_kinds_service._get_first_subtasks_from_queue(
+            test_db, "PENDING", limit=5, type="online"
+        )
+
+    assert [s.id for s in subtasks] == [first.id]
+    removed = set(remove.await_args.args[0])
+    # Offline tasks stay queued for the offline dispatcher
+    assert removed == {chat.id, 999999, running.id, empty.id}
+
+
+@pytest.mark.asyncio
+async def test_get_first_subtasks_from_queue_pages_past_other_types(
+    test_db: Session, test_user: User
+) -> None:
+    with patch.object(dispatch_queue, "enqueue_sync"):
+        offline = [
+            _add_task(
+                test_db, test_user, f"offline-{i}", {"type": "offline"}, "PENDING"
+            )
+            for i in range(5)
+        ]
+        unset = _add_task(test_db, test_user, "unset", {}, None)
+        online = _add_task(test_db, test_user, "online", {}, "PENDING")
+        for task in offline + [unset, online]:
+            _add_subtask(test_db, test_user, task, message_id=2)
+        test_db.commit()
+
+    queued = [task.id for task in offline] + [unset.id, online.id]
+    peek = _peek_from(queued)
+    with (
+        patch(
+            "app.services.adapters.executor_kinds.settings.TASK_DISPATCH_QUEUE_SCAN_SIZE",
+            2,
+        ),
+        patch.object(dispatch_queue, "peek", peek),
+        patch.object(dispatch_queue, "remove", AsyncMock()) as remove,
+    ):
+        subtasks = await executor_kinds_service._get_first_subtasks_from_queue(
+            test_db, "PENDING", limit=1, type="online"
+        )
+
+    assert [s.task_id for s in subtasks] == [online.id]
+    # Pages hold limit * 5 tasks, the offline tasks fill the first one
+    assert [call.kwargs["start"] for call in peek.await_args_list] == [0, 5]
+    # Tasks without a status are not treated as PENDING
+    remove.assert_awaited_once_with([unset.id])
+
+
+def test_pending_subtask_is_enqueued_after_commit(
+    test_db: Session, test_user: User
+) -> None:
+    with patch.object(dispatch_queue, "enqueue_sync") as enqueue:
+        task = _add_task(test_db, test_user, "task", {}, "PENDING")
+        _add_subtask(test_db, test_user, task, message_id=2)
+        enqueue.assert_not_called()
+        test_db.commit()
+
+    enqueue.assert_called_once_with({task.id})
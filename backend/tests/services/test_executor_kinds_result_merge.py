@@ -121,3 +121,75 @@ async def test_update_subtask_merges_codex_events_and_codex_event(
         "snapshot",
         "tail",
     ]
+
+
+@pytest.mark.asyncio
+async def test_update_subtask_rebuilds_delta_encoded_progress(
+    test_db: Session,
+) -> None:
+    subtask = Subtask(
+        user_id=1,
+        task_id=125,
+        team_id=1,
+        title="executor-subtask",
+        bot_ids=[1],
+        role=SubtaskRole.ASSISTANT,
+        status=ModelSubtaskStatus.RUNNING,
+        progress=0,
+        message_id=1,
+        result=None,
+    )
+    test_db.add(subtask)
+    test_db.commit()
+    test_db.refresh(subtask)
+
+    await executor_kinds_service.update_subtask(
+        test_db,
+        subtask_update=SubtaskExecutorUpdate(
+            subtask_id=subtask.id,
+            status="RUNNING",
+            progress=10,
+            result={
+                "progress_delta": {"seq": 1, "full": True},
+                "thinking": [{"title": "a"}],
+                "workbench": {"status": "running", "summary": "s"},
+            },
+        ),
+    )
+    response = await executor_kinds_service.update_subtask(
+        test_db,
+        subtask_update=SubtaskExecutorUpdate(
+            subtask_id=subtask.id,
+            status="RUNNING",
+            progress=20,
+            result={
+                "progress_delta": {"seq": 2, "base_seq": 1, "thinking_offset": 1},
+                "thinking": [{"title": "b"}],
+                "workbench": {"summary": "t"},
+            },
+        ),
+    )
+
+    test_db.refresh(subtask)
+    assert "resync" not in response
+    assert subtask.result["thinking"] == [{"title": "a"}, {"title": "b"}]
+    assert subtask.result["workbench"] == {"status": "running", "summary": "t"}
+    assert "progress_delta" not in subtask.result
+
+    # Seq 3 never arrived
+    response = await executor_kinds_service.update_subtask(
+        test_db,
+        subtask_update=SubtaskExecutorUpdate(
+            subtask_id=subtask.id,
+            status="RUNNING",
+            progress=30,
+            result={
+                "progress_delta": {"seq": 4, "base_seq": 3, "thinking_offset": 3},
+                "thinking": [{"title": "d"}],
+            },
+        ),
+    )
+
+    test_db.refresh(subtask)
+    assert response["resync"] is True
+    assert subtask.result["thinking"] == [{"title": "a"}, {"title": "b"}]
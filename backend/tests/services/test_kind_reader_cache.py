@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the caching kind reader.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.models.user import User
+from app.services.readers import kinds as kinds_module
+from app.services.readers.kinds import CachingKindReader, KindReader, KindType
+
+
+@pytest.fixture
+def reader(monkeypatch):
+    reader = CachingKindReader(KindReader())
+    # Route the session hooks to this instance
+    monkeypatch.setattr(kinds_module.kindReader, "_instance", reader)
+    with patch("app.core.cache.cache_manager.publish_sync") as publish:
+        reader.publish = publish
+        yield reader
+
+
+def _add_kind(
+    db: Session, user_id: int, kind: str, name: str, spec: dict | None = None
+) -> Kind:
+    resource = Kind(
+        user_id=user_id,
+        kind=kind,
+        name=name,
+        namespace="default",
+        json={"kind": kind, "spec": spec or {}},
+        is_active=True,
+    )
+    db.add(resource)
+    db.commit()
+    return resource
+
+
+class TestCachingKindReader:
+    """Test cases for CachingKindReader."""
+
+    def test_hit_does_not_query(self, reader, test_db: Session, test_user: User):
+        bot = _add_kind(test_db, test_user.id, "Bot", "bot")
+        test_db.expunge_all()
+
+        first = reader.get_personal(
+            test_db, test_user.id, KindType.BOT, "default", "bot"
+        )
+        with patch.object(test_db, "query", side_effect=AssertionError("queried")):
+            second = reader.get_personal(
+                test_db, test_user.id, KindType.BOT, "default", "bot"
+            )
+            by_id = reader.get_by_id(test_db, KindType.BOT, bot.id)
+
+        assert second is first
+        assert by_id is first
+        assert reader.stats()["hits"] == 2
+
+    def test_public_fallback_miss_is_invalidated_by_insert(
+        self, reader, test_db: Session, test_user: User
+    ):
+        assert (
+            reader.get_by_name_and_namespace(
+                test_db, test_user.id, KindType.MODEL, "default", "gpt"
+            )
+            is None
+        )
+
+        _add_kind(test_db, 0, "Model", "gpt", {"modelConfig": {"env": {}}})
+
+        model = reader.get_by_name_and_namespace(
+            test_db, test_user.id, KindType.MODEL, "default", "gpt"
+        )
+        assert model is not None
+        assert model.user_id == 0
+        reader.publish.assert_called_once()
+
+    def test_update_and_rename_invalidate_cached_rows(
+        self, reader, test_db: Session, test_user: User
+    ):
+        ghost = _add_kind(test_db, test_user.id, "Ghost", "ghost", {"v": 1})
+        reader.get_personal(test_db, test_user.id, KindType.GHOST, "default", "ghost")
+
+        ghost.json = {"kind": "Ghost", "spec": {"v": 2}}
+        ghost.name = "renamed"
+        test_db.commit()
+        test_db.expunge_all()
+
+        assert (
+            reader.get_personal(
+                test_db, test_user.id, KindType.GHOST, "default", "ghost"
+            )
+            is None
+        )
+        renamed = reader.get_personal(
+            test_db, test_user.id, KindType.GHOST, "default", "renamed"
+        )
+        assert renamed.json["spec"] == {"v": 2}
+
+    def test_cached_object_can_be_updated(
+        self, reader, test_db: Session, test_user: User
+    ):
+        _add_kind(test_db, test_user.id, "Shell", "shell", {"shellType": "Chat"})
+        reader.get_personal(test_db, test_user.id, KindType.SHELL, "default", "shell")
+        test_db.expunge_all()
+
+        shell = reader.get_personal(
+            test_db, test_user.id, KindType.SHELL, "default", "shell"
+        )
+        shell.json = {**shell.json, "spec": {"shellType": "Agno"}}
+        test_db.commit()
+        test_db.expunge_all()
+
+        stored = test_db.query(Kind).filter(Kind.id == shell.id).one()
+        assert stored.json["spec"]["shellType"] == "Agno"
+
+    def test_hit_keeps_unflushed_edits_of_session_instance(
+        self, reader, test_db: Session, test_user: User
+    ):
+        bot = _add_kind(test_db, test_user.id, "Bot", "bot", {"v": 1})
+        reader.get_by_id(test_db, KindType.BOT, bot.id)
+
+        bot.json = {**bot.json, "spec": {"v": 2}}
+        again = reader.get_by_id(test_db, KindType.BOT, bot.id)
+        by_name = reader.get_personal(
+            test_db, test_user.id, KindType.BOT, "default", "bot"
+        )
+        test_db.commit()
+        test_db.expunge_all()
+
+        assert again is bot and by_name is bot
+        stored = test_db.query(Kind).filter(Kind.id == bot.id).one()
+        assert stored.json["spec"] == {"v": 2}
+
+    def test_owned_lookup_matches_any_namespace(
+        self, reader, test_db: Session, test_user: User
+    ):
+        assert reader.get_owned(test_db, test_user.id, KindType.MODEL, "gpt") is None
+
+        model = _add_kind(test_db, test_user.id, "Model", "gpt", {"v": 1})
+        model.namespace = "team-a"
+        test_db.commit()
+
+        found = reader.get_owned(test_db, test_user.id, KindType.MODEL, "gpt")
+        assert found is not None and found.namespace == "team-a"
+
+    def test_bulk_update_clears_cache(self, reader, test_db: Session, test_user: User):
+        _add_kind(test_db, test_user.id, "Bot", "bot")
+        reader.get_personal(test_db, test_user.id, KindType.BOT, "default", "bot")
+
+        test_db.query(Kind).filter(Kind.name == "bot").update({"is_active": False})
+        test_db.commit()
+
+        assert (
+            reader.get_personal(test_db, test_user.id, KindType.BOT, "default", "bot")
+            is None
+        )
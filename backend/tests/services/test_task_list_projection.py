@@ -0,0 +1,205 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.models.task import TaskResource
+from app.models.task_list_item import TaskListItem
+from app.models.task_member import TaskMember
+from app.models.user import User
+from app.services.adapters.task_kinds import task_kinds_service
+from app.services.task_list_projection import backfill_task_list_items
+
+
+def _task_json(name: str, status: str = "COMPLETED", labels: dict | None = None):
+    return {
+        "kind": "Task",
+        "apiVersion": "agent.wecode.io/v1",
+        "metadata": {"name": name, "namespace": "default", "labels": labels or {}},
+        "spec": {
+            "title": f"title-{name}",
+            "prompt": "p",
+            "teamRef": {"name": "team", "namespace": "default"},
+            "workspaceRef": {"name": f"ws-{name}", "namespace": "default"},
+        },
+        "status": {"status": status},
+    }
+
+
+def _add_task(
+    db: Session, user: User, name: str, created_at: datetime, **kwargs
+) -> TaskResource:
+    task = TaskResource(
+        user_id=user.id,
+        kind="Task",
+        name=name,
+        namespace="default",
+        json=_task_json(name, **kwargs),
+        is_active=True,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    db.add(task)
+    db.flush()
+    return task
+
+
+def test_task_writes_maintain_projection(test_db: Session, test_user: User) -> None:
+    team = Kind(
+        user_id=test_user.id,
+        kind="Team",
+        name="team",
+        namespace="default",
+        json={"kind": "Team"},
+        is_active=True,
+    )
+    workspace = TaskResource(
+        user_id=test_user.id,
+        kind="Workspace",
+        name="ws-a",
+        namespace="default",
+        json={"spec": {"repository": {"gitRepo": "org/repo"}}},
+        is_active=True,
+    )
+    test_db.add_all([team, workspace])
+    test_db.flush()
+
+    task = _add_task(test_db, test_user, "a", datetime.now())
+    item = test_db.get(TaskListItem, task.id)
+    assert item.title == "title-a"
+    assert item.team_id == team.id
+    assert item.git_repo == "org/repo"
+    assert item.is_visible is True
+    assert item.is_group_chat is False
+
+    task.json = {**task.json, "status": {"status": "DELETE"}}
+    test_db.flush()
+    test_db.refresh(item)
+    assert item.is_visible is False
+
+    test_db.add(TaskMember(task_id=task.id, user_id=test_user.id + 1000))
+    test_db.flush()
+    test_db.refresh(item)
+    assert item.is_group_chat is True
+
+    # Status-only updates keep the resolved references and membership
+    task.json = {**task.json, "status": {"status": "COMPLETED"}}
+    test_db.flush()
+    test_db.refresh(item)
+    assert item.team_id == team.id
+    assert item.git_repo == "org/repo"
+    assert item.is_group_chat is True
+
+
+def test_team_and_workspace_writes_refresh_projection(
+    test_db: Session, test_user: User
+) -> None:
+    workspace = TaskResource(
+        user_id=test_user.id,
+        kind="Workspace",
+        name="ws-b",
+        namespace="default",
+        json={"spec": {"repository": {"gitRepo": "org/old"}}},
+        is_active=True,
+    )
+    test_db.add(workspace)
+    test_db.flush()
+    task = _add_task(test_db, test_user, "b", datetime.now())
+    item = test_db.get(TaskListItem, task.id)
+    assert item.team_id is None
+    assert item.git_repo == "org/old"
+
+    team = Kind(
+        user_id=test_user.id,
+        kind="Team",
+        name="team",
+        namespace="default",
+        json={"kind": "Team"},
+        is_active=True,
+    )
+    test_db.add(team)
+    workspace.json = {"spec": {"repository": {"gitRepo": "org/new"}}}
+    test_db.flush()
+    test_db.refresh(item)
+    assert item.team_id == team.id
+    assert item.git_repo == "org/new"
+
+    team.is_active = False
+    test_db.delete(workspace)
+    test_db.flush()
+    test_db.refresh(item)
+    assert item.team_id is None
+    assert item.git_repo is None
+
+
+def test_get_user_tasks_lite_reads_projection(
+    test_db: Session, test_user: User
+) -> None:
+    now = datetime.now()
+    oldest = _add_task(test_db, test_user, "oldest", now - timedelta(minutes=3))
+    middle = _add_task(test_db, test_user, "middle", now - timedelta(minutes=2))
+    _add_task(
+        test_db, test_user, "deleted", now - timedelta(minutes=1), status="DELETE"
+    )
+    _add_task(test_db, test_user, "summary", now, labels={"taskType": "summary"})
+    newest = _add_task(test_db, test_user, "newest", now + timedelta(minutes=1))
+    test_db.commit()
+
+    items, total = task_kinds_service.get_user_tasks_lite(
+        test_db, user_id=test_user.id, limit=2
+    )
+    assert total == 3
+    assert [i["id"] for i in items] == [newest.id, middle.id]
+
+    items, _ = task_kinds_service.get_user_tasks_lite(
+        test_db, user_id=test_user.id, limit=2, before_task_id=middle.id
+    )
+    assert [i["id"] for i in items] == [oldest.id]
+
+
+def test_get_user_tasks_lite_pages(test_db: Session, test_user: User) -> None:
+    now = datetime.now()
+    tasks = [
+        _add_task(test_db, test_user, f"t{i}", now - timedelta(minutes=i))
+        for i in range(5)
+    ]
+    test_db.commit()
+
+    # Offset paging: page 2 with 2 items per page
+    items, total = task_kinds_service.get_user_tasks_lite(
+        test_db, user_id=test_user.id, skip=2, limit=2
+    )
+    assert total == 5
+    assert [i["id"] for i in items] == [tasks[2].id, tasks[3].id]
+
+    # Keyset paging from the last item of page 1 gives the same page
+    items, _ = task_kinds_service.get_user_tasks_lite(
+        test_db, user_id=test_user.id, skip=2, limit=2, before_task_id=tasks[1].id
+    )
+    assert [i["id"] for i in items] == [tasks[2].id, tasks[3].id]
+
+
+def test_get_user_tasks_lite_rejects_missing_anchor(
+    test_db: Session, test_user: User
+) -> None:
+    task = _add_task(test_db, test_user, "gone", datetime.now())
+    test_db.commit()
+    test_db.delete(task)
+    test_db.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        task_kinds_service.get_user_tasks_lite(
+            test_db, user_id=test_user.id, before_task_id=task.id
+        )
+    assert exc_info.value.status_code == 400
+
+
+def test_backfill_projects_missing_tasks(test_db: Session, test_user: User) -> None:
+    task = _add_task(test_db, test_user, "legacy", datetime.now())
+    test_db.query(TaskListItem).filter(TaskListItem.task_id == task.id).delete()
+    test_db.commit()
+
+    assert backfill_task_list_items(test_db) >= 1
+    assert test_db.get(TaskListItem, task.id) is not None
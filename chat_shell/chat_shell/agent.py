@@ -172,6 +172,9 @@ class ChatAgent:
             tool_registry=tool_registry,
             max_iterations=config.max_iterations,
             enable_checkpointing=self.enable_checkpointing,
+            # Graphs can only be shared when the model instance is pooled
+            cache_graph=settings.CHAT_LLM_CLIENT_POOL_ENABLED
+            and settings.CHAT_AGENT_GRAPH_CACHE_MAX_SIZE > 0,
         )
         add_span_event("langgraph_agent_builder_created")
         return builder
@@ -20,6 +20,7 @@ from typing import Any, Callable
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.messages.utils import convert_to_messages
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools.base import BaseTool
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.errors import GraphRecursionError
@@ -27,16 +28,82 @@ from langgraph.prebuilt import create_react_agent
 from opentelemetry import trace as otel_trace
 from shared.telemetry.decorators import add_span_event, trace_sync
 
+from chat_shell.core.config import settings
+
 from ..tools.base import ToolRegistry
+from .graph_cache import (
+    REQUEST_BINDING_KEY,
+    AgentGraphCache,
+    RequestBinding,
+    get_request_binding,
+)
 
 logger = logging.getLogger(__name__)
 
+# Compiled graphs shared by builders with the same model and tool set
+_graph_cache = AgentGraphCache(max_size=settings.CHAT_AGENT_GRAPH_CACHE_MAX_SIZE)
+
 # Message to send to model when tool call limit is reached
 TOOL_LIMIT_REACHED_MESSAGE = """[SYSTEM NOTICE] Tool call limit reached. You have made too many tool calls in this conversation.
 
 Please provide your final response to the user based on the information you have gathered so far. Do NOT attempt to call any more tools - simply summarize your findings and provide a helpful response."""
 
 
+def _apply_prompt_modifications(
+    state: dict[str, Any], modifier_tools: list[Any]
+) -> list[BaseMessage]:
+    """Append the prompt modifications of modifier tools to the system message.
+
+    Args:
+        state: Agent state with the messages sent to the model
+        modifier_tools: PromptModifierTool instances
+
+    Returns:
+        Messages with the modifications applied
+    """
+    messages = state.get("messages", [])
+    if not messages:
+        return messages
+
+    # Collect prompt modifications from all modifier tools
+    combined_modification = ""
+    for tool in modifier_tools:
+        modification = tool.get_prompt_modification()
+        if modification:
+            combined_modification += modification
+
+    if not combined_modification:
+        # No modifications, return messages unchanged
+        return messages
+
+    # Find and update the system message
+    new_messages = []
+    system_updated = False
+
+    for msg in messages:
+        if isinstance(msg, SystemMessage) and not system_updated:
+            # Append modifications to existing system message
+            original_content = (
+                msg.content if isinstance(msg.content, str) else str(msg.content)
+            )
+            updated_content = original_content + combined_modification
+            new_messages.append(SystemMessage(content=updated_content))
+            system_updated = True
+
+        else:
+            new_messages.append(msg)
+
+    # If no system message found, prepend one with modifications
+    if not system_updated:
+        new_messages.insert(0, SystemMessage(content=combined_modification))
+        logger.debug(
+            "[prompt_modifier] Created new system message with modifications, len=%d",
+            len(combined_modification),
+        )
+
+    return new_messages
+
+
 class LangGraphAgentBuilder:
     """Builder for LangGraph-based agent workflows using prebuilt ReAct agent."""
 
@@ -46,6 +113,7 @@ class LangGraphAgentBuilder:
         tool_registry: ToolRegistry | None = None,
         max_iterations: int = 10,
         enable_checkpointing: bool = False,
+        cache_graph: bool = False,
     ):
         """Initialize agent builder.
 
@@ -54,11 +122,14 @@ class LangGraphAgentBuilder:
             tool_registry: Registry of available tools (optional)
             max_iterations: Maximum tool loop iterations
             enable_checkpointing: Enable state checkpointing for resumability
+            cache_graph: Share the compiled graph with other builders using the
+                same (pooled) model and tool set. Not used with checkpointing.
         """
         self.llm = llm
         self.tool_registry = tool_registry
         self.max_iterations = max_iterations
         self.enable_checkpointing = enable_checkpointing
+        self.cache_graph = cache_graph and not enable_checkpointing
         self._agent = None
 
         # Get all LangChain tools from registry
@@ -108,49 +179,7 @@ class LangGraphAgentBuilder:
             model invocation. It collects prompt modifications from all
             PromptModifierTool instances and appends them to the system message.
             """
-            messages = state.get("messages", [])
-            if not messages:
-                return messages
-
-            # Collect prompt modifications from all modifier tools
-            combined_modification = ""
-            for tool in modifier_tools:
-                modification = tool.get_prompt_modification()
-                if modification:
-                    combined_modification += modification
-
-            if not combined_modification:
-                # No modifications, return messages unchanged
-                return messages
-
-            # Find and update the system message
-            new_messages = []
-            system_updated = False
-
-            for msg in messages:
-                if isinstance(msg, SystemMessage) and not system_updated:
-                    # Append modifications to existing system message
-                    original_content = (
-                        msg.content
-                        if isinstance(msg.content, str)
-                        else str(msg.content)
-                    )
-                    updated_content = original_content + combined_modification
-                    new_messages.append(SystemMessage(content=updated_content))
-                    system_updated = True
-
-                else:
-                    new_messages.append(msg)
-
-            # If no system message found, prepend one with modifications
-            if not system_updated:
-                new_messages.insert(0, SystemMessage(content=combined_modification))
-                logger.debug(
-                    "[prompt_modifier] Created new system message with modifications, len=%d",
-                    len(combined_modification),
-                )
-
-            return new_messages
+            return _apply_prompt_modifications(state, modifier_tools)
 
         return prompt_modifier
 
@@ -169,6 +198,16 @@ class LangGraphAgentBuilder:
             add_span_event("agent_already_built")
             return self._agent
 
+        if self.cache_graph:
+            add_span_event("getting_cached_agent")
+            self._agent = _graph_cache.get_or_build(
+                self.llm,
+                self.tools,
+                bool(self._prompt_modifier_tools),
+                self._compile_shared_agent,
+            )
+            return self._agent
+
         add_span_event("building_new_agent")
 
         # Use LangGraph's prebuilt create_react_agent
@@ -195,6 +234,40 @@ class LangGraphAgentBuilder:
 
         return self._agent
 
+    def _compile_shared_agent(self, tools: list[BaseTool]):
+        """Compile a graph that runs the tools bound to each invocation.
+
+        Args:
+            tools: Stand-ins of this builder's tools (see graph_cache)
+        """
+        add_span_event("building_shared_agent")
+        prompt = None
+        if self._prompt_modifier_tools:
+            # Modifier tools are per request: read them from the run config
+            prompt = RunnableLambda(
+                lambda state, config: _apply_prompt_modifications(
+                    state, get_request_binding(config).prompt_modifier_tools
+                )
+            )
+        return create_react_agent(model=self.llm, tools=tools, prompt=prompt)
+
+    def _run_config(self, config: dict[str, Any] | None) -> RunnableConfig:
+        """Build the run config of one graph invocation.
+
+        Args:
+            config: Optional configuration (thread_id for checkpointing)
+        """
+        configurable = dict(config or {})
+        if self.cache_graph:
+            configurable[REQUEST_BINDING_KEY] = RequestBinding(
+                tools={tool.name: tool for tool in self.tools},
+                prompt_modifier_tools=self._prompt_modifier_tools,
+            )
+        run_config: RunnableConfig = {"recursion_limit": self.max_iterations * 2 + 1}
+        if configurable:
+            run_config["configurable"] = configurable
+        return run_config
+
     async def execute(
         self,
         messages: list[dict[str, Any]],
@@ -216,15 +289,10 @@ class LangGraphAgentBuilder:
         # Use LangChain's built-in convert_to_messages
         lc_messages = convert_to_messages(messages)
 
-        exec_config = {"configurable": config} if config else None
-
         # Execute with recursion limit for max iterations
         result = await agent.ainvoke(
             {"messages": lc_messages},
-            config={
-                **(exec_config or {}),
-                "recursion_limit": self.max_iterations * 2 + 1,
-            },
+            config=self._run_config(config),
         )
 
         return result
@@ -248,14 +316,9 @@ class LangGraphAgentBuilder:
         agent = self._build_agent()
         lc_messages = convert_to_messages(messages)
 
-        exec_config = {"configurable": config} if config else None
-
         async for event in agent.astream(
             {"messages": lc_messages},
-            config={
-                **(exec_config or {}),
-                "recursion_limit": self.max_iterations * 2 + 1,
-            },
+            config=self._run_config(config),
         ):
             # Check cancellation
             if cancel_event and cancel_event.is_set():
@@ -297,8 +360,6 @@ class LangGraphAgentBuilder:
             "convert_to_messages_completed", {"lc_message_count": len(lc_messages)}
         )
 
-        exec_config = {"configurable": config} if config else None
-
         event_count = 0
         streamed_content = False  # Track if we've streamed any content
         final_content = ""  # Store final content for non-streaming fallback
@@ -315,10 +376,7 @@ class LangGraphAgentBuilder:
         try:
             async for event in agent.astream_events(
                 {"messages": lc_messages},
-                config={
-                    **(exec_config or {}),
-                    "recursion_limit": self.max_iterations * 2 + 1,
-                },
+                config=self._run_config(config),
                 version="v2",
             ):
                 event_count += 1
@@ -657,18 +715,13 @@ class LangGraphAgentBuilder:
         agent = self._build_agent()
         lc_messages = convert_to_messages(messages)
 
-        exec_config = {"configurable": config} if config else None
-
         all_events: list[dict[str, Any]] = []
         final_state: dict[str, Any] = {}
 
         try:
             async for event in agent.astream_events(
                 {"messages": lc_messages},
-                config={
-                    **(exec_config or {}),
-                    "recursion_limit": self.max_iterations * 2 + 1,
-                },
+                config=self._run_config(config),
                 version="v2",
             ):
                 # Check cancellation
@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cache of compiled agent graphs shared across requests.
+
+create_react_agent binds the tool schemas to the model and compiles a new
+graph, which used to happen on every request. Tools, however, are created per
+request (they hold the request's database session, knowledge bases, skill
+state, ...), so a compiled graph cannot simply keep the tools it was built
+with.
+
+Cached graphs are therefore built with stand-in tools that have the same
+name, description and argument schema as the real ones. When the graph runs,
+each stand-in resolves the request's own tool from the run config (see
+RequestBinding) and delegates to it. The same applies to the prompt modifier,
+which reads the request's PromptModifierTool instances from the run config.
+
+Graphs are keyed by model instance (pooled, see models.client_pool) and a
+signature of the tool set, so requests with identical model configuration
+and tools share one compiled graph.
+"""
+
+import inspect
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools.base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Key of the RequestBinding in a run config's "configurable" section
+# (double underscore keeps it out of tracing metadata)
+REQUEST_BINDING_KEY = "__chat_shell_request_binding"
+
+
+@dataclass
+class RequestBinding:
+    """Per-request objects a cached graph resolves at run time."""
+
+    tools: dict[str, BaseTool] = field(default_factory=dict)
+    prompt_modifier_tools: list[Any] = field(default_factory=list)
+
+
+def get_request_binding(config: RunnableConfig | None) -> RequestBinding:
+    """Return the RequestBinding of a run config (empty if missing)."""
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get(REQUEST_BINDING_KEY) or RequestBinding()
+
+
+def _call_kwargs(
+    method: Callable, config: RunnableConfig, run_manager: Any
+) -> dict[str, Any]:
+    """Select the config/run_manager arguments a tool method accepts."""
+    parameters = inspect.signature(method).parameters
+    kwargs: dict[str, Any] = {}
+    if "config" in parameters:
+        kwargs["config"] = config
+    if "run_manager" in parameters and run_manager is not None:
+        kwargs["run_manager"] = run_manager
+    return kwargs
+
+
+class RequestBoundTool(BaseTool):
+    """Stand-in for a request's tool inside a cached agent graph."""
+
+    @classmethod
+    def mirror(cls, tool: BaseTool) -> "RequestBoundTool":
+        """Create a stand-in exposing the same interface as a tool."""
+        return cls(
+            name=tool.name,
+            description=tool.description,
+            # Tools without explicit schema infer it from their _run signature
+            args_schema=(
+                tool.args_schema
+                if tool.args_schema is not None
+                else tool.get_input_schema()
+            ),
+            return_direct=tool.return_direct,
+            response_format=tool.response_format,
+            handle_tool_error=tool.handle_tool_error,
+            handle_validation_error=tool.handle_validation_error,
+            tags=tool.tags,
+            metadata=tool.metadata,
+        )
+
+    def _resolve(self, config: RunnableConfig) -> BaseTool:
+        tool = get_request_binding(config).tools.get(self.name)
+        if tool is None:
+            raise RuntimeError(f"Tool {self.name} is not bound to this request")
+        return tool
+
+    def _run(self, *args: Any, config: RunnableConfig, run_manager=None, **kwargs):
+        tool = self._resolve(config)
+        return tool._run(
+            *args, **_call_kwargs(tool._run, config, run_manager), **kwargs
+        )
+
+    async def _arun(
+        self, *args: Any, config: RunnableConfig, run_manager=None, **kwargs
+    ):
+        tool = self._resolve(config)
+        return await tool._arun(
+            *args, **_call_kwargs(tool._arun, config, run_manager), **kwargs
+        )
+
+
+def tool_signature(tools: list[BaseTool]) -> tuple:
+    """Signature of a tool set as seen by the model and the tool node."""
+    return tuple(
+        (
+            tool.name,
+            tool.description,
+            json.dumps(tool.args, sort_keys=True, default=str),
+            tool.return_direct,
+            tool.response_format,
+        )
+        for tool in tools
+    )
+
+
+class AgentGraphCache:
+    """Size-bounded LRU cache of compiled agent graphs."""
+
+    def __init__(self, max_size: int):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of compiled graphs kept
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Entries keep the model alive, so id(model) stays unique while cached
+        self._entries: OrderedDict[tuple, tuple[BaseChatModel, Any]] = OrderedDict()
+
+    def get_or_build(
+        self,
+        llm: BaseChatModel,
+        tools: list[BaseTool],
+        with_prompt_modifier: bool,
+        build: Callable[[list[BaseTool]], Any],
+    ) -> Any:
+        """Return the compiled graph for a model and tool set.
+
+        Args:
+            llm: Model the graph runs
+            tools: The request's tools (only their signature is used)
+            with_prompt_modifier: Whether the graph needs the prompt modifier
+            build: Compiles a graph from the given (stand-in) tools
+
+        Returns:
+            Compiled graph; run it with a RequestBinding in its config
+        """
+        key = (id(llm), tool_signature(tools), with_prompt_modifier)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        graph = build([RequestBoundTool.mirror(tool) for tool in tools])
+
+        with self._lock:
+            self._entries[key] = (llm, graph)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        logger.debug(
+            "[AgentGraphCache] Compiled graph for %d tools (%d cached)",
+            len(tools),
+            len(self._entries),
+        )
+        return graph
+
+    def clear(self) -> None:
+        """Drop all cached graphs."""
+        with self._lock:
+            self._entries.clear()
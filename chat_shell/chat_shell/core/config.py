@@ -78,6 +78,18 @@ class Settings(BaseSettings):
     CHAT_HISTORY_MAX_MESSAGES: int = 50
     CHAT_API_TIMEOUT_SECONDS: int = 300
 
+    # Shared LLM client pool: model instances (and their keep-alive HTTP
+    # connections) are reused across requests with the same model configuration
+    CHAT_LLM_CLIENT_POOL_ENABLED: bool = True
+    CHAT_LLM_CLIENT_POOL_MAX_SIZE: int = 128  # Maximum pooled model instances
+    CHAT_LLM_CLIENT_POOL_TTL_SECONDS: int = 3600  # Instance lifetime (seconds)
+    CHAT_LLM_HTTP_MAX_CONNECTIONS: int = 200  # Per base URL
+    CHAT_LLM_HTTP_MAX_KEEPALIVE: int = 50  # Idle connections kept per base URL
+    CHAT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
+    # Compiled agent graphs cached by (model, tool signature); 0 disables
+    CHAT_AGENT_GRAPH_CACHE_MAX_SIZE: int = 256
+
     # Tool calling flow limits
     CHAT_TOOL_MAX_REQUESTS: int = 10
     CHAT_TOOL_MAX_TIME_SECONDS: float = 60.0
@@ -95,6 +107,12 @@ class Settings(BaseSettings):
     # MCP configuration for Chat Shell
     CHAT_MCP_ENABLED: bool = False
     CHAT_MCP_SERVERS: str = "{}"
+    # Persistent MCP sessions reused across chat turns (see tools/mcp/pool.py)
+    CHAT_MCP_SESSION_POOL_ENABLED: bool = True
+    CHAT_MCP_CONNECT_TIMEOUT: float = 30.0  # Session connect timeout (seconds)
+    CHAT_MCP_SERVER_MAX_CONCURRENCY: int = 8  # Concurrent tool calls per session
+    CHAT_MCP_HEALTH_CHECK_INTERVAL_SECONDS: float = 30.0  # Ping idle sessions
+    CHAT_MCP_SESSION_IDLE_TIMEOUT_SECONDS: float = 600.0  # Close unused sessions
 
     # Web search configuration
     WEB_SEARCH_ENABLED: bool = False
@@ -112,6 +130,12 @@ class Settings(BaseSettings):
     # Backend RAG service configuration (for knowledge base HTTP fallback)
     BACKEND_RAG_URL: str = "http://localhost:8000/api/knowledge/v1/retrieve"
 
+    # Knowledge base retrieval: query all KBs of a conversation concurrently
+    # and merge their results by rank fusion (federated retrieval)
+    KNOWLEDGE_FEDERATED_RETRIEVAL_ENABLED: bool = True
+    # Per-KB retrieval timeout; slower knowledge bases are left out
+    KNOWLEDGE_KB_TIMEOUT_SECONDS: float = 10.0
+
     # OpenTelemetry configuration
     OTEL_ENABLED: bool = False
 
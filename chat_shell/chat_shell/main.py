@@ -119,6 +119,11 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("No active streams, proceeding with shutdown")
 
+    # Close pooled MCP sessions (stops stdio servers)
+    from chat_shell.tools.mcp.pool import mcp_session_pool
+
+    await mcp_session_pool.close_all()
+
     # Shutdown OpenTelemetry
     from shared.telemetry.core import is_telemetry_enabled, shutdown_telemetry
 
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared pool of LangChain chat model instances.
+
+Creating a ChatOpenAI/ChatAnthropic instance builds a new SDK client with its
+own HTTP connection pool, so every request used to pay for connection setup
+and the TLS handshake before the first token. Model instances are stateless
+between invocations, so instances created from the same configuration are
+shared across requests instead.
+
+Instances are keyed by provider and the full set of constructor parameters
+(base URL, a hash of the API key, headers, sampling parameters). OpenAI
+compatible providers additionally share one keep-alive HTTP client (HTTP/2
+when the ``h2`` package is installed) per base URL. Async HTTP clients are
+bound to the event loop they were created on, so the pool is kept per loop.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+
+from chat_shell.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_secret(value: str | None) -> str:
+    """Return a short, non-reversible fingerprint of a secret."""
+    if not value:
+        return ""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def make_pool_key(provider: str, params: dict[str, Any]) -> str:
+    """Build the pool key for a provider and its constructor parameters.
+
+    API keys never appear in the key, only their hash.
+    """
+    keyed = {}
+    for name, value in params.items():
+        if "api_key" in name:
+            value = _hash_secret(value)
+        keyed[name] = value
+    return f"{provider}:" + json.dumps(keyed, sort_keys=True, default=str)
+
+
+class _LoopPool:
+    """Model instances and HTTP clients belonging to one event loop."""
+
+    def __init__(self):
+        self.models: OrderedDict[str, tuple[float, BaseChatModel]] = OrderedDict()
+        self.http_clients: dict[str, tuple[Any, Any]] = {}
+
+
+class LLMClientPool:
+    """Keyed, size-bounded pool of chat model instances."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of model instances kept per event loop
+            ttl_seconds: Lifetime of a pooled instance (seconds)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._loop_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._no_loop_pool = _LoopPool()
+        self._http2 = importlib.util.find_spec("h2") is not None
+
+    def _current_pool(self) -> _LoopPool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._no_loop_pool
+        pool = self._loop_pools.get(loop)
+        if pool is None:
+            pool = self._loop_pools[loop] = _LoopPool()
+        return pool
+
+    def get_or_create(
+        self, provider: str, model_class: type, params: dict[str, Any]
+    ) -> BaseChatModel:
+        """Return a pooled model instance, creating it on first use.
+
+        Args:
+            provider: Provider name ("openai", "anthropic", "google")
+            model_class: LangChain chat model class of the provider
+            params: Constructor parameters
+
+        Returns:
+            Shared model instance for these parameters
+        """
+        key = make_pool_key(provider, params)
+        now = time.monotonic()
+
+        with self._lock:
+            pool = self._current_pool()
+            entry = pool.models.get(key)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                pool.models.move_to_end(key)
+                return entry[1]
+
+            if provider == "openai":
+                params = {**params, **self._get_http_clients(pool, params)}
+
+            model = model_class(**params)
+            pool.models[key] = (now, model)
+            pool.models.move_to_end(key)
+            while len(pool.models) > self.max_size:
+                pool.models.popitem(last=False)
+
+        logger.debug(
+            "[LLMClientPool] Created %s model %s (%d pooled)",
+            provider,
+            params.get("model"),
+            len(pool.models),
+        )
+        return model
+
+    def _get_http_clients(self, pool: _LoopPool, params: dict[str, Any]) -> dict:
+        """Return shared keep-alive HTTP clients for an OpenAI compatible API."""
+        from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+        base_url = params.get("base_url") or ""
+        clients = pool.http_clients.get(base_url)
+        if clients is None:
+            import httpx
+
+            limits = httpx.Limits(
+                max_connections=settings.CHAT_LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.CHAT_LLM_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.CHAT_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            )
+            clients = (
+                DefaultHttpxClient(limits=limits, http2=self._http2),
+                DefaultAsyncHttpxClient(limits=limits, http2=self._http2),
+            )
+            pool.http_clients[base_url] = clients
+        return {"http_client": clients[0], "http_async_client": clients[1]}
+
+    def clear(self) -> None:
+        """Drop all pooled instances (their clients close once unreferenced)."""
+        with self._lock:
+            self._loop_pools = weakref.WeakKeyDictionary()
+            self._no_loop_pool = _LoopPool()
+
+
+llm_client_pool = LLMClientPool(
+    max_size=settings.CHAT_LLM_CLIENT_POOL_MAX_SIZE,
+    ttl_seconds=settings.CHAT_LLM_CLIENT_POOL_TTL_SECONDS,
+)
@@ -21,6 +21,10 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from shared.telemetry.decorators import add_span_event, trace_sync
 
+from chat_shell.core.config import settings
+
+from .client_pool import llm_client_pool
+
 logger = logging.getLogger(__name__)
 
 # Provider detection: (prefixes, provider_name)
@@ -175,7 +179,9 @@ class LangChainModelFactory:
             **kwargs: Additional parameters (temperature, max_tokens, streaming)
 
         Returns:
-            BaseChatModel instance ready for use with LangChain/LangGraph
+            BaseChatModel instance ready for use with LangChain/LangGraph.
+            Instances are shared between callers with the same configuration
+            (see client_pool), so callers must not mutate them.
         """
         # Extract config with defaults
         add_span_event("extracting_config")
@@ -214,6 +220,13 @@ class LangChainModelFactory:
         # Filter out None values to use defaults
         params = {k: v for k, v in params.items() if v is not None}
 
+        # Reuse the instance (and its HTTP connections) of an identical config
+        if settings.CHAT_LLM_CLIENT_POOL_ENABLED:
+            add_span_event("getting_pooled_model")
+            return llm_client_pool.get_or_create(
+                provider, provider_cfg["class"], params
+            )
+
         add_span_event(
             "instantiating_model_class", {"class": provider_cfg["class"].__name__}
         )
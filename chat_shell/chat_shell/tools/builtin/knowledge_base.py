@@ -8,6 +8,7 @@ This tool implements smart injection strategy that automatically chooses
 between direct injection and RAG retrieval based on context window capacity.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
@@ -289,23 +290,15 @@ class KnowledgeBaseTool(BaseTool):
         """
         # Try to import from backend if available
         try:
-            from app.services.knowledge_service import KnowledgeService
+            from app.services.rag.kb_stats import KnowledgeBaseStatsService
 
-            total_file_size = 0
-            total_estimated_tokens = 0
-
-            for kb_id in self.knowledge_base_ids:
-                try:
-                    file_size = KnowledgeService.get_total_file_size(
-                        self.db_session, kb_id
-                    )
-                    total_file_size += file_size
-                    # Estimate tokens: approximately 4 characters per token
-                    total_estimated_tokens += file_size // 4
-                except Exception as e:
-                    logger.warning(
-                        f"[KnowledgeBaseTool] Failed to get size for KB {kb_id}: {e}"
-                    )
+            # Maintained index statistics: exact token counts where available,
+            # file size based estimates otherwise
+            size_info = KnowledgeBaseStatsService.get_size_info(
+                self.db_session, self.knowledge_base_ids
+            )
+            total_file_size = size_info["total_file_size"]
+            total_estimated_tokens = size_info["total_estimated_tokens"]
 
             logger.info(
                 f"[KnowledgeBaseTool] KB size info: total_file_size={total_file_size} bytes, "
@@ -320,6 +313,9 @@ class KnowledgeBaseTool(BaseTool):
         except ImportError:
             # Backend not available, try HTTP fallback
             return await self._get_kb_size_info_via_http()
+        except Exception as e:
+            logger.warning(f"[KnowledgeBaseTool] Failed to get KB size info: {e}")
+            return {"total_file_size": 0, "total_estimated_tokens": 0}
 
     async def _get_kb_size_info_via_http(self) -> Dict[str, Any]:
         """Get KB size information via HTTP API.
@@ -490,13 +486,19 @@ class KnowledgeBaseTool(BaseTool):
     ) -> Dict[int, List[Dict[str, Any]]]:
         """Retrieve chunks from all knowledge bases.
 
+        With federated retrieval enabled, all knowledge bases are queried
+        concurrently and their results are merged by rank fusion; a KB that
+        fails or times out is left out. Chunks then carry a fusion_score.
+
         Args:
             query: Search query
-            max_results: Max results per KB
+            max_results: Max results per KB (in total for federated retrieval)
 
         Returns:
             Dictionary mapping KB IDs to their chunks
         """
+        from chat_shell.core.config import settings
+
         # Build metadata_condition for document filtering
         metadata_condition = self._build_document_filter()
 
@@ -508,6 +510,17 @@ class KnowledgeBaseTool(BaseTool):
 
             retrieval_service = RetrievalService()
 
+            if settings.KNOWLEDGE_FEDERATED_RETRIEVAL_ENABLED:
+                result = await retrieval_service.retrieve_from_knowledge_bases_internal(
+                    query=query,
+                    knowledge_base_ids=self.knowledge_base_ids,
+                    db=self.db_session,
+                    metadata_condition=metadata_condition,
+                    top_k=max_results,
+                    timeout=settings.KNOWLEDGE_KB_TIMEOUT_SECONDS,
+                )
+                return self._group_fused_records(result["records"])
+
             for kb_id in self.knowledge_base_ids:
                 try:
                     result = (
@@ -525,16 +538,7 @@ class KnowledgeBaseTool(BaseTool):
                     )
 
                     # Process records into chunks
-                    chunks = []
-                    for record in records:
-                        chunk = {
-                            "content": record.get("content", ""),
-                            "source": record.get("title", "Unknown"),
-                            "score": record.get("score", 0.0),
-                            "knowledge_base_id": kb_id,
-                        }
-                        chunks.append(chunk)
-
+                    chunks = [self._record_to_chunk(r, kb_id) for r in records]
                     if chunks:
                         kb_chunks[kb_id] = chunks
 
@@ -557,9 +561,13 @@ class KnowledgeBaseTool(BaseTool):
     ) -> Dict[int, List[Dict[str, Any]]]:
         """Retrieve chunks from RAG service via HTTP API.
 
+        Uses the federated endpoint when enabled and falls back to one
+        concurrent request per knowledge base otherwise (or if the backend
+        does not provide it).
+
         Args:
             query: Search query
-            max_results: Max results per KB
+            max_results: Max results per KB (in total for federated retrieval)
 
         Returns:
             Dictionary mapping KB IDs to their chunks
@@ -568,8 +576,6 @@ class KnowledgeBaseTool(BaseTool):
 
         from chat_shell.core.config import settings
 
-        kb_chunks = {}
-
         # Get backend API URL
         remote_url = getattr(settings, "REMOTE_STORAGE_URL", "")
         if remote_url:
@@ -577,55 +583,112 @@ class KnowledgeBaseTool(BaseTool):
         else:
             backend_url = getattr(settings, "BACKEND_API_URL", "http://localhost:8000")
 
+        kb_timeout = settings.KNOWLEDGE_KB_TIMEOUT_SECONDS
+
         async with httpx.AsyncClient(timeout=30.0) as client:
-            for kb_id in self.knowledge_base_ids:
-                try:
-                    payload = {
-                        "query": query,
-                        "knowledge_base_id": kb_id,
-                        "max_results": max_results,
-                    }
-                    if self.document_ids:
-                        payload["document_ids"] = self.document_ids
+            if settings.KNOWLEDGE_FEDERATED_RETRIEVAL_ENABLED:
+                payload = {
+                    "query": query,
+                    "knowledge_base_ids": self.knowledge_base_ids,
+                    "max_results": max_results,
+                }
+                if self.document_ids:
+                    payload["document_ids"] = self.document_ids
 
+                try:
+                    # The backend applies the per-KB timeout; allow for fusion
                     response = await client.post(
-                        f"{backend_url}/api/internal/rag/retrieve",
+                        f"{backend_url}/api/internal/rag/retrieve/federated",
                         json=payload,
+                        timeout=kb_timeout + 5.0,
+                    )
+                    if response.status_code == 200:
+                        data = response.json()
+                        if data.get("failed_knowledge_base_ids"):
+                            logger.warning(
+                                f"[KnowledgeBaseTool] Federated retrieval skipped KBs "
+                                f"{data['failed_knowledge_base_ids']}"
+                            )
+                        return self._group_fused_records(data.get("records", []))
+                    logger.warning(
+                        f"[KnowledgeBaseTool] Federated RAG returned {response.status_code}, "
+                        f"falling back to per-KB retrieval: {response.text}"
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"[KnowledgeBaseTool] Federated RAG failed, "
+                        f"falling back to per-KB retrieval: {e}"
                     )
 
-                    if response.status_code != 200:
-                        logger.warning(
-                            f"[KnowledgeBaseTool] HTTP RAG returned {response.status_code}: {response.text}"
-                        )
-                        continue
+            async def retrieve(kb_id: int) -> List[Dict[str, Any]]:
+                payload = {
+                    "query": query,
+                    "knowledge_base_id": kb_id,
+                    "max_results": max_results,
+                }
+                if self.document_ids:
+                    payload["document_ids"] = self.document_ids
 
-                    data = response.json()
-                    records = data.get("records", [])
+                response = await client.post(
+                    f"{backend_url}/api/internal/rag/retrieve",
+                    json=payload,
+                    timeout=kb_timeout,
+                )
 
-                    logger.info(
-                        f"[KnowledgeBaseTool] HTTP retrieved {len(records)} chunks from KB {kb_id}"
+                if response.status_code != 200:
+                    logger.warning(
+                        f"[KnowledgeBaseTool] HTTP RAG returned {response.status_code}: {response.text}"
                     )
+                    return []
 
-                    # Process records into chunks
-                    chunks = []
-                    for record in records:
-                        chunk = {
-                            "content": record.get("content", ""),
-                            "source": record.get("title", "Unknown"),
-                            "score": record.get("score", 0.0),
-                            "knowledge_base_id": kb_id,
-                        }
-                        chunks.append(chunk)
+                records = response.json().get("records", [])
+                logger.info(
+                    f"[KnowledgeBaseTool] HTTP retrieved {len(records)} chunks from KB {kb_id}"
+                )
+                return [self._record_to_chunk(r, kb_id) for r in records]
 
-                    if chunks:
-                        kb_chunks[kb_id] = chunks
+            results = await asyncio.gather(
+                *(retrieve(kb_id) for kb_id in self.knowledge_base_ids),
+                return_exceptions=True,
+            )
 
-                except Exception as e:
-                    logger.error(
-                        f"[KnowledgeBaseTool] HTTP RAG failed for KB {kb_id}: {e}"
-                    )
-                    continue
+        kb_chunks = {}
+        for kb_id, chunks in zip(self.knowledge_base_ids, results):
+            if isinstance(chunks, Exception):
+                logger.error(
+                    f"[KnowledgeBaseTool] HTTP RAG failed for KB {kb_id}: {chunks}"
+                )
+            elif chunks:
+                kb_chunks[kb_id] = chunks
+
+        return kb_chunks
+
+    @staticmethod
+    def _record_to_chunk(record: Dict[str, Any], kb_id: int) -> Dict[str, Any]:
+        """Convert a retrieval record into a chunk."""
+        chunk = {
+            "content": record.get("content", ""),
+            "source": record.get("title", "Unknown"),
+            "score": record.get("score", 0.0),
+            "knowledge_base_id": kb_id,
+        }
+        if "fusion_score" in record:
+            chunk["fusion_score"] = record["fusion_score"]
+        return chunk
+
+    def _group_fused_records(
+        self, records: List[Dict[str, Any]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Group fused retrieval records by knowledge base, keeping their order."""
+        kb_chunks: Dict[int, List[Dict[str, Any]]] = {}
+        for record in records:
+            kb_id = record["knowledge_base_id"]
+            kb_chunks.setdefault(kb_id, []).append(self._record_to_chunk(record, kb_id))
 
+        logger.info(
+            f"[KnowledgeBaseTool] Federated retrieval: {len(records)} chunks from "
+            f"{len(kb_chunks)}/{len(self.knowledge_base_ids)} KBs"
+        )
         return kb_chunks
 
     def _build_document_filter(self) -> Optional[dict[str, Any]]:
@@ -785,18 +848,24 @@ class KnowledgeBaseTool(BaseTool):
                     )
                     source_index += 1
 
+                # Federated results are ranked by fusion score
+                rank = chunk.get("fusion_score", chunk["score"]) or 0.0
                 all_chunks.append(
-                    {
-                        "content": chunk["content"],
-                        "source": source_file,
-                        "source_index": seen_sources[source_key],
-                        "score": chunk["score"],
-                        "knowledge_base_id": kb_id,
-                    }
+                    (
+                        rank,
+                        {
+                            "content": chunk["content"],
+                            "source": source_file,
+                            "source_index": seen_sources[source_key],
+                            "score": chunk["score"],
+                            "knowledge_base_id": kb_id,
+                        },
+                    )
                 )
 
         # Sort by score (descending)
-        all_chunks.sort(key=lambda x: x.get("score", 0.0) or 0.0, reverse=True)
+        all_chunks.sort(key=lambda x: x[0], reverse=True)
+        all_chunks = [chunk for _, chunk in all_chunks]
 
         # Limit total results
         all_chunks = all_chunks[:max_results]
@@ -13,6 +13,11 @@ Protection mechanisms:
 - Tool wrapping: All MCP tools are wrapped with timeout and exception handling
 - Graceful degradation: Failed tools return error messages instead of crashing
 
+Session pooling:
+- By default servers are connected through the shared session pool (pool.py),
+  so sessions and tool lists are reused across chat turns
+- disconnect() returns the pooled sessions instead of closing them
+
 Variable substitution:
 - Supports ${{path}} placeholders in MCP server configurations
 - Use task_data dict to provide replacement values (e.g., user.name, user.id)
@@ -23,7 +28,7 @@ import asyncio
 import concurrent.futures
 import inspect
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.tools.base import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
@@ -36,6 +41,11 @@ from shared.telemetry.decorators import add_span_event, trace_async
 from shared.utils.mcp_utils import replace_mcp_server_variables
 from shared.utils.sensitive_data_masker import mask_sensitive_data
 
+from chat_shell.core.config import settings
+
+if TYPE_CHECKING:
+    from .pool import PooledMCPServer
+
 logger = logging.getLogger(__name__)
 
 # Type alias for connection types
@@ -232,19 +242,27 @@ class MCPClient:
     """
 
     def __init__(
-        self, config: dict[str, dict[str, Any]], task_data: dict[str, Any] | None = None
+        self,
+        config: dict[str, dict[str, Any]],
+        task_data: dict[str, Any] | None = None,
+        pooled: bool | None = None,
     ):
         """Initialize MCP client.
 
         Args:
             config: MCP servers configuration dict. Supports ${{path}} placeholders.
             task_data: Optional dict for variable substitution in config.
+            pooled: Use the shared session pool (default: CHAT_MCP_SESSION_POOL_ENABLED)
         """
         self.config = config
         self.task_data = task_data
         self.connections = build_connections(config, task_data) if config else {}
+        self.pooled = (
+            settings.CHAT_MCP_SESSION_POOL_ENABLED if pooled is None else pooled
+        )
         self._client: MultiServerMCPClient | None = None
         self._tools: list[BaseTool] = []
+        self._leases: list["PooledMCPServer"] = []
 
     async def __aenter__(self) -> "MCPClient":
         """Async context manager entry - connect to servers."""
@@ -277,8 +295,13 @@ class MCPClient:
             add_span_event("no_connections_skipped")
             return
 
-        add_span_event("creating_multi_server_client")
-        self._client = MultiServerMCPClient(connections=self.connections)
+        from .pool import mcp_session_pool
+
+        if self.pooled:
+            add_span_event("using_session_pool")
+        else:
+            add_span_event("creating_multi_server_client")
+            self._client = MultiServerMCPClient(connections=self.connections)
 
         # Load tools from each server individually to handle failures gracefully
         # This avoids the issue where one failing server causes all tools to fail
@@ -292,7 +315,14 @@ class MCPClient:
         ) -> tuple[str, list[BaseTool], str | None]:
             """Load tools from a single server, returning (name, tools, error)."""
             try:
-                tools = await self._client.get_tools(server_name=server_name)
+                if self.pooled:
+                    # Tools of pooled sessions are already protected
+                    lease, tools = await mcp_session_pool.acquire(
+                        server_name, self.connections[server_name]
+                    )
+                    self._leases.append(lease)
+                else:
+                    tools = await self._client.get_tools(server_name=server_name)
                 return (server_name, tools, None)
             except Exception as e:
                 error_msg = str(e)
@@ -350,7 +380,10 @@ class MCPClient:
 
         # Wrap all tools with protection mechanisms
         add_span_event("wrapping_tools_started")
-        self._tools = [wrap_tool_with_protection(tool) for tool in raw_tools]
+        if self.pooled:
+            self._tools = raw_tools
+        else:
+            self._tools = [wrap_tool_with_protection(tool) for tool in raw_tools]
         add_span_event(
             "wrapping_tools_completed", {"protected_tools_count": len(self._tools)}
         )
@@ -370,7 +403,15 @@ class MCPClient:
         )
 
     async def disconnect(self) -> None:
-        """Disconnect from all MCP servers."""
+        """Disconnect from all MCP servers (pooled sessions stay open)."""
+        if self._leases:
+            from .pool import mcp_session_pool
+
+            for lease in self._leases:
+                mcp_session_pool.release(lease)
+            self._leases = []
+            self._tools = []
+            logger.debug("Released pooled MCP sessions")
         if self._client:
             self._client = None
             self._tools = []
@@ -0,0 +1,324 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pool of persistent MCP server sessions shared across chat turns.
+
+Without pooling, every chat request connects to its MCP servers (SSE /
+streamable-HTTP handshake or spawning a stdio server), lists their tools
+and drops everything afterwards; langchain-mcp-adapters additionally opens a
+new session for every single tool call. The pool keeps one initialized
+session per server configuration instead:
+
+- Sessions are keyed by a hash of the server name and its connection config
+  after variable substitution, which includes the auth headers. Users with
+  different credentials therefore never share a session.
+- Each session lives in its own owner task, as the MCP transports require
+  the session context to be entered and exited by the same task.
+- Tools are loaded once per session and bound to it. They are reloaded when
+  the server sends notifications/tools/list_changed.
+- Tool calls of one server are limited to a configurable concurrency.
+- A session idle for longer than the health check interval is pinged before
+  reuse and reconnected if the ping fails. Sessions without leases that stay
+  idle longer than the idle timeout are closed.
+
+Sessions hold asyncio objects of the event loop they were opened on, so the
+pool is kept per event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from typing import Any
+
+from langchain_core.tools.base import BaseTool
+from langchain_mcp_adapters.sessions import create_session
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import types as mcp_types
+
+from chat_shell.core.config import settings
+
+from .client import Connection, wrap_tool_with_protection
+
+logger = logging.getLogger(__name__)
+
+
+def connection_key(server_name: str, connection: Connection) -> str:
+    """Return the pool key of a server connection (auth headers are hashed)."""
+    payload = json.dumps(
+        {"name": server_name, "connection": dict(connection)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def limit_tool_concurrency(tool: BaseTool, semaphore: asyncio.Semaphore) -> BaseTool:
+    """Run the async calls of a tool under a semaphore.
+
+    Args:
+        tool: Tool to limit
+        semaphore: Semaphore shared by all tools of one server
+
+    Returns:
+        The same tool instance
+    """
+    original_arun = getattr(tool, "_arun", None)
+    if original_arun is None:
+        return tool
+
+    async def limited_arun(*args, **kwargs):
+        async with semaphore:
+            return await original_arun(*args, **kwargs)
+
+    tool._arun = limited_arun
+    return tool
+
+
+class PooledMCPServer:
+    """A persistent, initialized session to one MCP server."""
+
+    def __init__(self, key: str, server_name: str, connection: Connection):
+        """Initialize the pooled server (not connected yet).
+
+        Args:
+            key: Pool key of the connection
+            server_name: Configured server name
+            connection: Connection config
+        """
+        self.key = key
+        self.server_name = server_name
+        self.connection = connection
+        self.session = None
+        self.leases = 0
+        self.last_used = time.monotonic()
+        self.last_checked = time.monotonic()
+        self._tools: list[BaseTool] | None = None
+        self._tools_stale = False
+        self._tools_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(settings.CHAT_MCP_SERVER_MAX_CONCURRENCY)
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the owner task still holds an open session."""
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def open(self, timeout: float) -> None:
+        """Connect and initialize the session.
+
+        Args:
+            timeout: Connection timeout in seconds
+
+        Raises:
+            Exception: If the server cannot be connected
+        """
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(
+            self._run(ready), name=f"mcp-session-{self.server_name}"
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(ready), timeout=timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        """Owner task: keep the session open until close() is called."""
+        session_kwargs = dict(self.connection.get("session_kwargs") or {})
+        session_kwargs["message_handler"] = self._on_message
+        connection = {**self.connection, "session_kwargs": session_kwargs}
+        try:
+            async with create_session(connection) as session:
+                await session.initialize()
+                self.session = session
+                ready.set_result(None)
+                await self._stop.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.set_exception(ConnectionError("MCP session cancelled"))
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(
+                    "[MCP] Pooled session to '%s' failed: %s", self.server_name, e
+                )
+        finally:
+            self.session = None
+
+    async def _on_message(self, message: Any) -> None:
+        """Handle server notifications of the session."""
+        root = getattr(message, "root", None)
+        if isinstance(root, mcp_types.ToolListChangedNotification):
+            logger.info("[MCP] Tool list of '%s' changed", self.server_name)
+            self._tools_stale = True
+
+    async def check_health(self, timeout: float) -> bool:
+        """Ping the server if it was not checked recently.
+
+        Args:
+            timeout: Ping timeout in seconds
+
+        Returns:
+            True if the session is usable
+        """
+        if not self.is_alive:
+            return False
+        now = time.monotonic()
+        if now - self.last_checked < settings.CHAT_MCP_HEALTH_CHECK_INTERVAL_SECONDS:
+            return True
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=timeout)
+        except Exception as e:
+            logger.warning("[MCP] Health check of '%s' failed: %s", self.server_name, e)
+            return False
+        self.last_checked = now
+        return True
+
+    async def get_tools(self) -> list[BaseTool]:
+        """Return the server's tools, loading them if unknown or changed."""
+        if self._tools is not None and not self._tools_stale:
+            return self._tools
+        async with self._tools_lock:
+            if self._tools is None or self._tools_stale:
+                self._tools_stale = False
+                raw_tools = await load_mcp_tools(
+                    self.session, server_name=self.server_name
+                )
+                self._tools = [
+                    limit_tool_concurrency(
+                        wrap_tool_with_protection(tool), self._semaphore
+                    )
+                    for tool in raw_tools
+                ]
+                logger.debug(
+                    "[MCP] Loaded %d tools from pooled server '%s'",
+                    len(self._tools),
+                    self.server_name,
+                )
+        return self._tools
+
+    async def close(self) -> None:
+        """Close the session and wait for its owner task to finish."""
+        self._stop.set()
+        task = self._task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(task, timeout=settings.CHAT_MCP_CONNECT_TIMEOUT)
+        except BaseException:
+            task.cancel()
+
+
+class MCPSessionPool:
+    """Persistent MCP sessions, shared by all chats of an event loop."""
+
+    def __init__(self):
+        self._loop_servers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._loop_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _servers(self) -> dict[str, PooledMCPServer]:
+        loop = asyncio.get_running_loop()
+        servers = self._loop_servers.get(loop)
+        if servers is None:
+            servers = self._loop_servers[loop] = {}
+            self._loop_locks[loop] = {}
+        return servers
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        locks = self._loop_locks[asyncio.get_running_loop()]
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+        return lock
+
+    async def acquire(
+        self, server_name: str, connection: Connection
+    ) -> tuple[PooledMCPServer, list[BaseTool]]:
+        """Lease the pooled session of a server and return its tools.
+
+        Args:
+            server_name: Configured server name
+            connection: Connection config
+
+        Returns:
+            Tuple of (leased server for release(), tools bound to the session)
+
+        Raises:
+            Exception: If the server cannot be connected
+        """
+        servers = self._servers()
+        await self._evict_idle(servers)
+
+        key = connection_key(server_name, connection)
+        async with self._lock(key):
+            server = servers.get(key)
+            if server is not None and not await server.check_health(
+                settings.CHAT_MCP_CONNECT_TIMEOUT
+            ):
+                servers.pop(key, None)
+                await server.close()
+                server = None
+
+            if server is None:
+                server = PooledMCPServer(key, server_name, connection)
+                await server.open(settings.CHAT_MCP_CONNECT_TIMEOUT)
+                servers[key] = server
+                logger.info("[MCP] Opened pooled session to '%s'", server_name)
+
+            server.leases += 1
+            server.last_used = time.monotonic()
+
+        try:
+            return server, await server.get_tools()
+        except BaseException:
+            self.release(server)
+            raise
+
+    def release(self, server: PooledMCPServer) -> None:
+        """Return a lease taken by acquire().
+
+        The lease belongs to the server instance, not to its key: if the
+        session was replaced in the meantime, releasing the old instance
+        leaves the leases of the new one untouched.
+
+        Args:
+            server: Leased server returned by acquire()
+        """
+        server.leases = max(server.leases - 1, 0)
+        server.last_used = time.monotonic()
+
+    async def _evict_idle(self, servers: dict[str, PooledMCPServer]) -> None:
+        now = time.monotonic()
+        idle = [
+            server
+            for server in servers.values()
+            if server.leases == 0
+            and now - server.last_used > settings.CHAT_MCP_SESSION_IDLE_TIMEOUT_SECONDS
+        ]
+        for server in idle:
+            servers.pop(server.key, None)
+            logger.info("[MCP] Closing idle pooled session to '%s'", server.server_name)
+            await server.close()
+
+    async def close_all(self) -> None:
+        """Close all sessions of the current event loop."""
+        servers = self._servers()
+        pending = list(servers.values())
+        servers.clear()
+        await asyncio.gather(
+            *[server.close() for server in pending], return_exceptions=True
+        )
+
+
+mcp_session_pool = MCPSessionPool()
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the shared LLM client pool and the compiled agent graph cache."""
+
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools.base import BaseTool
+from pydantic import BaseModel
+
+from chat_shell.agents.graph_builder import LangGraphAgentBuilder
+from chat_shell.models.client_pool import LLMClientPool, make_pool_key
+from chat_shell.tools.base import ToolRegistry
+
+
+class _ToolCallingModel(BaseChatModel):
+    """Calls the lookup tool once, then answers with the tool result."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-calling-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        last = messages[-1]
+        if isinstance(last, ToolMessage):
+            system = next(
+                (m.content for m in messages if isinstance(m, SystemMessage)), ""
+            )
+            message = AIMessage(content=f"{system}|{last.content}")
+        else:
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "lookup", "args": {"query": "q"}, "id": "c1"}],
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class _LookupInput(BaseModel):
+    query: str
+
+
+class _LookupTool(BaseTool):
+    name: str = "lookup"
+    description: str = "Look something up"
+    args_schema: type[BaseModel] = _LookupInput
+    label: str = ""
+
+    def _run(self, query: str) -> str:
+        return f"{self.label}:{query}"
+
+    async def _arun(self, query: str) -> str:
+        return f"{self.label}:{query}"
+
+
+class _ModifierTool(_LookupTool):
+    name: str = "modifier"
+
+    def get_prompt_modification(self) -> str:
+        return f"[{self.label}]"
+
+
+def _builder(llm: BaseChatModel, *tools: BaseTool) -> LangGraphAgentBuilder:
+    registry = ToolRegistry()
+    for tool in tools:
+        registry.register(tool)
+    return LangGraphAgentBuilder(llm=llm, tool_registry=registry, cache_graph=True)
+
+
+class TestAgentGraphCache:
+    @pytest.mark.asyncio
+    async def test_cached_graph_runs_each_requests_tools(self):
+        llm = _ToolCallingModel()
+        first = _builder(llm, _LookupTool(label="a"), _ModifierTool(label="x"))
+        second = _builder(llm, _LookupTool(label="b"), _ModifierTool(label="y"))
+
+        messages = [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "hi"},
+        ]
+        first_state = await first.execute(messages)
+        second_state = await second.execute(messages)
+
+        assert first._agent is second._agent
+        assert first.get_final_content(first_state) == "sys[x]|a:q"
+        assert second.get_final_content(second_state) == "sys[y]|b:q"
+
+    def test_different_tool_sets_get_different_graphs(self):
+        llm = _ToolCallingModel()
+        first = _builder(llm, _LookupTool(label="a"))
+        second = _builder(llm, _LookupTool(label="a", description="Other"))
+
+        assert first._build_agent() is not second._build_agent()
+
+
+class _RecordingModel:
+    def __init__(self, **params: Any):
+        self.params = params
+
+
+class TestLLMClientPool:
+    def test_identical_configs_share_an_instance(self):
+        pool = LLMClientPool(max_size=2, ttl_seconds=60)
+        params = {"model": "claude-x", "api_key": "secret-1", "temperature": 1.0}
+
+        first = pool.get_or_create("anthropic", _RecordingModel, params)
+        second = pool.get_or_create("anthropic", _RecordingModel, dict(params))
+        other_key = pool.get_or_create(
+            "anthropic", _RecordingModel, {**params, "api_key": "secret-2"}
+        )
+
+        assert first is second
+        assert other_key is not first
+
+    def test_pool_is_bounded(self):
+        pool = LLMClientPool(max_size=1, ttl_seconds=60)
+
+        first = pool.get_or_create("anthropic", _RecordingModel, {"model": "a"})
+        pool.get_or_create("anthropic", _RecordingModel, {"model": "b"})
+
+        assert pool.get_or_create("anthropic", _RecordingModel, {"model": "a"}) is not (
+            first
+        )
+
+    def test_key_does_not_contain_api_key(self):
+        key = make_pool_key("openai", {"model": "gpt-x", "api_key": "sk-secret"})
+
+        assert "sk-secret" not in key
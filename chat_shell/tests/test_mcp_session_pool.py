@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the persistent MCP session pool."""
+
+import sys
+import textwrap
+
+import pytest
+from mcp import types as mcp_types
+
+from chat_shell.tools.mcp.client import MCPClient
+from chat_shell.tools.mcp.pool import MCPSessionPool, connection_key
+
+SERVER_SCRIPT = textwrap.dedent(
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("echo")
+
+    @server.tool()
+    def echo(text: str) -> str:
+        \"\"\"Echo the text.\"\"\"
+        return f"echo:{text}"
+
+    server.run()
+    """
+)
+
+
+@pytest.fixture
+def stdio_connection(tmp_path):
+    script = tmp_path / "echo_server.py"
+    script.write_text(SERVER_SCRIPT)
+    return {"transport": "stdio", "command": sys.executable, "args": [str(script)]}
+
+
+class TestConnectionKey:
+    def test_auth_headers_are_part_of_the_key(self):
+        base = {"transport": "streamable_http", "url": "http://mcp"}
+
+        assert connection_key("s", {**base, "headers": {"Authorization": "a"}}) != (
+            connection_key("s", {**base, "headers": {"Authorization": "b"}})
+        )
+        assert connection_key("s", base) == connection_key("s", dict(base))
+
+
+class TestMCPSessionPool:
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_leases(self, stdio_connection):
+        pool = MCPSessionPool()
+        try:
+            first, first_tools = await pool.acquire("echo", stdio_connection)
+            pool.release(first)
+            second, second_tools = await pool.acquire("echo", stdio_connection)
+
+            assert first is second
+            assert first_tools is second_tools
+            assert [tool.name for tool in second_tools] == ["echo"]
+
+            result = await second_tools[0].ainvoke({"text": "hi"})
+            assert "echo:hi" in str(result)
+            pool.release(second)
+        finally:
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_tool_list_change_reloads_tools(self, stdio_connection):
+        pool = MCPSessionPool()
+        try:
+            server, tools = await pool.acquire("echo", stdio_connection)
+
+            await server._on_message(
+                mcp_types.ServerNotification(
+                    mcp_types.ToolListChangedNotification(
+                        method="notifications/tools/list_changed"
+                    )
+                )
+            )
+
+            assert await server.get_tools() is not tools
+            pool.release(server)
+        finally:
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_dead_session_is_reconnected(self, stdio_connection):
+        pool = MCPSessionPool()
+        try:
+            first, _ = await pool.acquire("echo", stdio_connection)
+            pool.release(first)
+            await first.close()
+
+            second, tools = await pool.acquire("echo", stdio_connection)
+
+            assert second is not first
+            assert pool._servers()[second.key] is second
+            assert tools
+            pool.release(second)
+        finally:
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_late_release_does_not_touch_replacement(self, stdio_connection):
+        pool = MCPSessionPool()
+        try:
+            first, _ = await pool.acquire("echo", stdio_connection)
+            await first.close()
+            second, _ = await pool.acquire("echo", stdio_connection)
+
+            # The holder of the replaced session releases it late
+            pool.release(first)
+
+            assert second.leases == 1
+            pool.release(second)
+        finally:
+            await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_raises(self):
+        pool = MCPSessionPool()
+        connection = {
+            "transport": "stdio",
+            "command": sys.executable,
+            "args": ["-c", "raise SystemExit(1)"],
+        }
+
+        with pytest.raises(Exception):
+            await pool.acquire("broken", connection)
+        assert pool._servers() == {}
+
+
+class TestMCPClientPooling:
+    @pytest.mark.asyncio
+    async def test_disconnect_returns_leases(self, stdio_connection):
+        from chat_shell.tools.mcp.pool import mcp_session_pool
+
+        config = {
+            "echo": {
+                "type": "stdio",
+                "command": stdio_connection["command"],
+                "args": stdio_connection["args"],
+            }
+        }
+        try:
+            client = MCPClient(config, pooled=True)
+            await client.connect()
+            assert [tool.name for tool in client.get_tools()] == ["echo"]
+
+            await client.disconnect()
+
+            assert not client.is_connected
+            assert [s.leases for s in mcp_session_pool._servers().values()] == [0]
+        finally:
+            await mcp_session_pool.close_all()
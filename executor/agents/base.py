@@ -116,7 +116,7 @@ class Agent:
         status: Optional[str] = None,
         message: Optional[str] = None,
         result: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Report progress to the executor_manager
 
@@ -125,12 +125,15 @@ class Agent:
             status: Optional status string
             message: Optional message string
             result: Optional result data dictionary
+
+        Returns:
+            Result of the callback, None if it could not be sent
         """
         logger.info(
             f"Reporting progress: {progress}%, status: {status}, message: {message}, result: {result}, task_type: {self.task_type}"
         )
         try:
-            self.callback_client.send_callback(
+            return self.callback_client.send_callback(
                 task_id=self.task_id,
                 subtask_id=self.subtask_id,
                 task_title=self.task_title,
@@ -146,6 +149,7 @@ class Agent:
                 f"[CALLBACK_FAIL] task_id={self.task_id}, progress={progress}, "
                 f"status={status}, error={type(e).__name__}: {str(e)}"
             )
+            return None
 
     def pre_execute(self) -> TaskStatus:
         """
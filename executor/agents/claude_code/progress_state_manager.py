@@ -8,6 +8,14 @@
 
 """
 Progress State Manager - Unified management of thinking and workbench states
+
+Progress reports are delta encoded (only new thinking steps and changed
+workbench fields, see shared.utils.progress_delta) and RUNNING reports within
+PROGRESS_COALESCE_WINDOW are coalesced into one callback.
+
+Git changes are tracked incrementally: polls are skipped while HEAD, the
+index and the modified files are unchanged, commit info is computed once per
+commit, and line counts come from git's numstat instead of full patches.
 """
 import os
 import threading
@@ -22,9 +30,11 @@ try:
 except ImportError:
     GIT_AVAILABLE = False
 
+from executor.config import config
 from shared.logger import setup_logger
 from shared.models.task import ExecutionResult
 from shared.status import TaskStatus
+from shared.utils.progress_delta import RESYNC_KEY, ProgressDeltaEncoder
 
 logger = setup_logger("progress_state_manager")
 
@@ -65,6 +75,19 @@ class ProgressStateManager:
         )
         self._is_monitoring: bool = False  # Monitoring status flag
 
+        # Progress callbacks: delta encoding and coalescing
+        self._delta_encoder = ProgressDeltaEncoder()
+        self._pending_report: Optional[Dict[str, Any]] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending_lock = threading.Lock()  # Guards pending report and timer
+        self._send_lock = threading.Lock()  # One callback in flight at a time
+
+        # Git change tracking: repository opened once, info of already seen
+        # commits and the repository state of the last processed poll
+        self._repo: Optional["Repo"] = None
+        self._commit_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._last_git_state: Optional[tuple] = None
+
     def initialize_workbench(self, status: str = "running") -> None:
         """
         Initialize workbench data structure, save initial commit ID, and start periodic monitoring
@@ -115,6 +138,11 @@ class ProgressStateManager:
         """
         Unified progress reporting method, automatically includes thinking and workbench states
 
+        RUNNING reports are coalesced with the ones following within
+        PROGRESS_COALESCE_WINDOW and sent from a timer thread; while a callback
+        is in flight, new reports keep coalescing. Other statuses are sent
+        right away, after any pending report.
+
         Args:
             progress: Progress value (0-100)
             status: Task status
@@ -123,25 +151,125 @@ class ProgressStateManager:
             include_workbench: Whether to include workbench data (default True)
             extra_result: Additional result data (optional)
         """
-        # Build result dictionary
-        result = extra_result.copy() if extra_result else {}
+        report = {
+            "progress": progress,
+            "status": status,
+            "message": message,
+            "include_thinking": include_thinking,
+            "include_workbench": include_workbench,
+            "extra_result": extra_result.copy() if extra_result else {},
+        }
+
+        with self._pending_lock:
+            self._pending_report = self._coalesce_reports(self._pending_report, report)
+            window = config.PROGRESS_COALESCE_WINDOW
+            if status == TaskStatus.RUNNING.value and window > 0:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(window, self.flush_progress)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+
+        self.flush_progress()
 
-        # Automatically add thinking steps
-        if include_thinking and "thinking" not in result:
-            result["thinking"] = [
+    def flush_progress(self) -> None:
+        """
+        Send the pending progress report, if any
+        """
+        with self._send_lock:
+            with self._pending_lock:
+                report, self._pending_report = self._pending_report, None
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if report is None:
+                return
+
+            try:
+                response = self._send_report(report)
+                if self._resync_requested(response):
+                    logger.info("Backend requested a full progress resync")
+                    self._delta_encoder.reset()
+                    self._send_report(report)
+            except Exception as e:
+                logger.warning(f"Failed to send progress report: {str(e)}")
+                self._delta_encoder.reset()
+
+    @staticmethod
+    def _coalesce_reports(
+        pending: Optional[Dict[str, Any]], report: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Merge a report into the pending one, the newer report wins
+        """
+        if pending is None:
+            return report
+
+        extra_result = {**pending["extra_result"], **report["extra_result"]}
+        # Streamed Codex events are appended by the backend, keep all of them
+        events = [
+            event
+            for r in (pending, report)
+            if "codex_event" in r["extra_result"]
+            for event in (
+                r["extra_result"]["codex_event"]
+                if isinstance(r["extra_result"]["codex_event"], list)
+                else [r["extra_result"]["codex_event"]]
+            )
+        ]
+        if events:
+            extra_result["codex_event"] = events
+
+        return {
+            **report,
+            "include_thinking": pending["include_thinking"]
+            or report["include_thinking"],
+            "include_workbench": pending["include_workbench"]
+            or report["include_workbench"],
+            "extra_result": extra_result,
+        }
+
+    def _send_report(self, report: Dict[str, Any]) -> Any:
+        """
+        Delta encode a report and send it through the progress callback
+        """
+        result = report["extra_result"].copy()
+
+        # Automatically add thinking steps and workbench data
+        thinking = None
+        if report["include_thinking"] and "thinking" not in result:
+            thinking = [
                 step.dict() for step in self.thinking_manager.get_thinking_steps()
             ]
-
-        # Automatically add workbench data
+        workbench = None
         if (
-            include_workbench
+            report["include_workbench"]
             and self.workbench_data is not None
             and "workbench" not in result
         ):
-            result["workbench"] = self.workbench_data
+            workbench = self.workbench_data
+
+        if thinking is not None or workbench is not None:
+            result.update(self._delta_encoder.encode(thinking, workbench))
 
         # Call the original progress reporting callback
-        self.report_progress_callback(progress, status, message, result=result)
+        response = self.report_progress_callback(
+            report["progress"], report["status"], report["message"], result=result
+        )
+        if not (
+            isinstance(response, dict)
+            and response.get("status") == TaskStatus.SUCCESS.value
+        ):
+            # Unknown whether the backend applied it, send full state next time
+            self._delta_encoder.reset()
+        return response
+
+    @staticmethod
+    def _resync_requested(response: Any) -> bool:
+        if not isinstance(response, dict):
+            return False
+        data = response.get("data")
+        return isinstance(data, dict) and bool(data.get(RESYNC_KEY))
 
     def get_current_state(self) -> Dict[str, Any]:
         """
@@ -219,6 +347,14 @@ class ProgressStateManager:
 
         return workbench
 
+    def _get_repo(self) -> "Repo":
+        """
+        Get the Repo of project_path, opened once and reused across polls
+        """
+        if self._repo is None:
+            self._repo = Repo(self.project_path)
+        return self._repo
+
     def _save_initial_commit(self) -> None:
         """
         Save commit ID, message, and source branch information at task start to workbench
@@ -231,7 +367,7 @@ class ProgressStateManager:
             if not repo_path or not os.path.exists(repo_path):
                 return
 
-            repo = Repo(repo_path)
+            repo = self._get_repo()
             initial_commit = repo.head.commit
             self.initial_commit_id = initial_commit.hexsha
 
@@ -269,7 +405,7 @@ class ProgressStateManager:
             if not repo_path or not os.path.exists(repo_path):
                 return
 
-            repo = Repo(repo_path)
+            repo = self._get_repo()
             current_commit = repo.head.commit
 
             # Update target_branch (current branch)
@@ -297,23 +433,14 @@ class ProgressStateManager:
             # Use rev_list to get commit list (excluding initial commit itself)
             task_commits = []
             try:
-                # Iterate through all commits from next of initial commit to HEAD
-                for commit in repo.iter_commits(f"{self.initial_commit_id}..HEAD"):
-                    commit_info = {
-                        "commit_id": commit.hexsha,
-                        "short_id": commit.hexsha[:8],
-                        "message": commit.message.strip(),
-                        "author": commit.author.name,
-                        "author_email": commit.author.email,
-                        "committed_date": datetime.fromtimestamp(
-                            commit.committed_date
-                        ).isoformat(),
-                        "stats": {
-                            "files_changed": len(commit.stats.files),
-                            "insertions": commit.stats.total["insertions"],
-                            "deletions": commit.stats.total["deletions"],
-                        },
-                    }
+                # Iterate through all commits from next of initial commit to HEAD,
+                # only commits not seen by a previous poll are read and diffed
+                commit_ids = repo.git.rev_list(f"{self.initial_commit_id}..HEAD")
+                for commit_id in commit_ids.split():
+                    commit_info = self._commit_info_cache.get(commit_id)
+                    if commit_info is None:
+                        commit_info = self._build_commit_info(repo.commit(commit_id))
+                        self._commit_info_cache[commit_id] = commit_info
                     task_commits.append(commit_info)
 
                 # Reverse list to arrange in chronological order (earliest first)
@@ -348,6 +475,25 @@ class ProgressStateManager:
         except Exception as e:
             logger.warning(f"Failed to update task commits: {str(e)}")
 
+    @staticmethod
+    def _build_commit_info(commit) -> Dict[str, Any]:
+        """
+        Build the workbench entry of a commit, including its diff stats
+        """
+        return {
+            "commit_id": commit.hexsha,
+            "short_id": commit.hexsha[:8],
+            "message": commit.message.strip(),
+            "author": commit.author.name,
+            "author_email": commit.author.email,
+            "committed_date": datetime.fromtimestamp(commit.committed_date).isoformat(),
+            "stats": {
+                "files_changed": len(commit.stats.files),
+                "insertions": commit.stats.total["insertions"],
+                "deletions": commit.stats.total["deletions"],
+            },
+        }
+
     def _get_git_file_changes(self) -> List[Dict[str, Any]]:
         """
         Get file changes from git diff (using GitPython SDK)
@@ -382,7 +528,7 @@ class ProgressStateManager:
 
             # Initialize Git repository object
             try:
-                repo = Repo(repo_path)
+                repo = self._get_repo()
             except InvalidGitRepositoryError:
                 logger.warning(f"Not a valid git repository: {repo_path}")
                 return file_changes
@@ -401,49 +547,65 @@ class ProgressStateManager:
                     current_commit = repo.head.commit
 
                     # Get committed changes (initial_commit..HEAD)
-                    committed_diffs = initial_commit.diff(
-                        current_commit, create_patch=True
+                    committed_diffs = self._diffs_with_line_counts(
+                        repo,
+                        initial_commit.diff(current_commit),
+                        initial_commit.hexsha,
+                        current_commit.hexsha,
                     )
 
                     # Get unstaged changes (working tree vs index)
-                    unstaged_diffs = repo.index.diff(None, create_patch=True)
+                    unstaged_diffs = self._diffs_with_line_counts(
+                        repo, repo.index.diff(None)
+                    )
 
                     # Get staged but uncommitted changes (HEAD vs index)
-                    # Use diff(None) to get differences between index and working tree, then reverse
-                    staged_diffs = repo.index.diff(current_commit, create_patch=True)
+                    # index.diff(commit) is a reversed "git diff --cached commit"
+                    staged_diffs = self._diffs_with_line_counts(
+                        repo,
+                        repo.index.diff(current_commit),
+                        "--cached",
+                        "-R",
+                        current_commit.hexsha,
+                    )
 
                     # Merge all changes (use dictionary for deduplication with file path as key)
                     all_diffs_dict = {}
 
                     # First add committed changes
-                    for diff in committed_diffs:
+                    for diff, counts in committed_diffs:
                         path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
+                        all_diffs_dict[path] = (diff, counts)
 
                     # Then add staged changes (will override committed files with same name)
-                    for diff in staged_diffs:
+                    for diff, counts in staged_diffs:
                         path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
+                        all_diffs_dict[path] = (diff, counts)
 
                     # Finally add unstaged changes (highest priority)
-                    for diff in unstaged_diffs:
+                    for diff, counts in unstaged_diffs:
                         path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
+                        all_diffs_dict[path] = (diff, counts)
 
                     diffs = list(all_diffs_dict.values())
                 except Exception as e:
                     logger.warning(
                         f"Failed to compare with initial commit: {str(e)}, falling back to unstaged changes"
                     )
-                    diffs = repo.index.diff(None, create_patch=True)
+                    diffs = self._diffs_with_line_counts(repo, repo.index.diff(None))
             else:
                 # No initial commit ID, only get unstaged changes
-                diffs = repo.index.diff(None, create_patch=True)
+                diffs = self._diffs_with_line_counts(repo, repo.index.diff(None))
                 logger.info(
                     f"No initial commit ID, using unstaged changes only: {len(diffs)} files"
                 )
 
-            for diff in diffs:
+            max_files = config.GIT_CHANGES_MAX_FILES
+            if max_files > 0 and len(diffs) > max_files:
+                logger.info(f"Reporting {max_files} of {len(diffs)} changed files")
+                diffs = diffs[:max_files]
+
+            for diff, (added_lines, removed_lines) in diffs:
                 # Get file paths
                 old_path = diff.a_path if diff.a_path else diff.b_path
                 new_path = diff.b_path if diff.b_path else diff.a_path
@@ -453,19 +615,6 @@ class ProgressStateManager:
                 deleted_file = diff.deleted_file
                 renamed_file = diff.renamed_file
 
-                # Calculate added/removed lines
-                added_lines = 0
-                removed_lines = 0
-
-                if diff.diff:
-                    # Parse diff content to count lines
-                    diff_text = diff.diff.decode("utf-8", errors="ignore")
-                    for line in diff_text.split("\n"):
-                        if line.startswith("+") and not line.startswith("+++"):
-                            added_lines += 1
-                        elif line.startswith("-") and not line.startswith("---"):
-                            removed_lines += 1
-
                 # Generate diff title (filename without path)
                 diff_title = os.path.basename(new_path)
 
@@ -489,6 +638,93 @@ class ProgressStateManager:
 
         return file_changes
 
+    @staticmethod
+    def _diffs_with_line_counts(repo, diffs, *diff_args) -> List[tuple]:
+        """
+        Pair diffs with their (added, removed) line counts
+
+        The counts come from "git diff --numstat" with the same arguments the
+        diffs were computed with, so no patch text is generated or loaded no
+        matter how large the changes are. Binary files count as 0 lines.
+
+        Args:
+            repo: Repo the diffs belong to
+            diffs: Diff objects computed without create_patch
+            diff_args: Arguments of the equivalent "git diff" command
+
+        Returns:
+            List of (diff, (added_lines, removed_lines)) tuples
+        """
+        counts = {}
+        tokens = repo.git.diff("--numstat", "-z", "-M", *diff_args).split("\0")
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            i += 1
+            if not token:
+                continue
+            added, removed, path = token.split("\t", 2)
+            if not path:
+                # Renamed file: old and new path follow as separate tokens
+                path = tokens[i + 1]
+                i += 2
+            counts[path] = (
+                int(added) if added.isdigit() else 0,
+                int(removed) if removed.isdigit() else 0,
+            )
+
+        return [
+            (diff, counts.get(diff.b_path if diff.b_path else diff.a_path, (0, 0)))
+            for diff in diffs
+        ]
+
+    def _get_git_state(self) -> Optional[tuple]:
+        """
+        Get a cheap fingerprint of the repository state
+
+        Covers HEAD, the current branch, the index mtime and the stat of the
+        files that differ from the index. File changes and commits only need
+        to be recomputed when it changes.
+
+        Returns:
+            State tuple, or None if it could not be determined
+        """
+        if not GIT_AVAILABLE or not self.project_path:
+            return None
+
+        try:
+            repo = self._get_repo()
+            try:
+                branch = repo.active_branch.name
+            except Exception:
+                branch = ""
+
+            modified_files = []
+            for path in repo.git.diff("--name-only", "-z").split("\0"):
+                if not path:
+                    continue
+                try:
+                    stat = os.stat(os.path.join(repo.working_tree_dir, path))
+                    modified_files.append((path, stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    modified_files.append((path, None, None))
+
+            # Read after "git diff", which may rewrite the index when refreshing it
+            index_path = os.path.join(repo.git_dir, "index")
+            index_mtime = (
+                os.stat(index_path).st_mtime_ns if os.path.exists(index_path) else 0
+            )
+
+            return (
+                repo.head.commit.hexsha,
+                branch,
+                index_mtime,
+                tuple(modified_files),
+            )
+        except Exception as e:
+            logger.debug(f"Failed to get git state: {str(e)}")
+            return None
+
     def _start_monitoring(self) -> None:
         """
         Start periodic monitoring task, check git changes every 2 seconds
@@ -530,6 +766,11 @@ class ProgressStateManager:
             if not self._is_monitoring or self.workbench_data is None:
                 return
 
+            # Skip the poll if nothing changed since the last one
+            git_state = self._get_git_state()
+            if git_state is not None and git_state == self._last_git_state:
+                return
+
             # Detect file changes
             file_changes = self._get_git_file_changes()
             if file_changes:
@@ -540,6 +781,7 @@ class ProgressStateManager:
 
             # Update last check time
             self.workbench_data["lastUpdated"] = datetime.now().isoformat()
+            self._last_git_state = git_state
 
         except Exception as e:
             logger.warning(f"Error during git changes check: {str(e)}")
@@ -16,6 +16,7 @@ import time
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from executor.config import config
 from shared.logger import setup_logger
 from shared.status import TaskStatus
@@ -25,6 +26,11 @@ from shared.utils.sensitive_data_masker import mask_sensitive_data
 
 logger = setup_logger("callback_client")
 
+# Keep-alive connections shared by all callback clients of the process
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 class CallbackClient:
     """Callback client class, responsible for sending callbacks to executor_manager"""
@@ -181,8 +187,8 @@ class CallbackClient:
             if is_telemetry_enabled():
                 headers = inject_trace_context_to_headers(headers)
 
-        # Send original unmasked data
-        response = requests.post(
+        # Send original unmasked data over a pooled keep-alive connection
+        response = _session.post(
             self.callback_url, json=data, headers=headers, timeout=self.timeout
         )
         return self._handle_response(response)
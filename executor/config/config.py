@@ -36,6 +36,14 @@ CANCEL_RETRY_ATTEMPTS = int(os.environ.get("CANCEL_RETRY_ATTEMPTS", "3"))
 CANCEL_RETRY_DELAY = int(os.environ.get("CANCEL_RETRY_DELAY", "2"))
 GRACEFUL_SHUTDOWN_TIMEOUT = int(os.environ.get("GRACEFUL_SHUTDOWN_TIMEOUT", "10"))
 
+# Progress callbacks: RUNNING updates within this window (seconds) are coalesced
+# into one callback; 0 sends every update on its own
+PROGRESS_COALESCE_WINDOW = float(os.environ.get("PROGRESS_COALESCE_WINDOW", "0.3"))
+
+# Git change monitoring: maximum number of changed files reported in the
+# workbench; 0 reports all of them
+GIT_CHANGES_MAX_FILES = int(os.environ.get("GIT_CHANGES_MAX_FILES", "500"))
+
 # Custom instruction files configuration
 # These files will be automatically loaded from the project root and merged with systemPrompt
 # Supports relative paths from project root (e.g., ".cursorrules", ".cursor/rules", "docs/.ai-guidelines")
@@ -17,11 +17,11 @@ class TestDifyAgent:
         """
         Mock all HTTP requests to prevent actual network calls during tests.
         - requests.get: DifyAgent.__init__ calls _get_app_mode() which makes GET to /v1/info
-        - requests.post: CallbackClient.send_callback() makes POST to callback URL
+        - _session.post: CallbackClient.send_callback() makes POST to callback URL
         Without these mocks, tests would make real HTTP requests causing long timeouts.
         """
         with patch('executor.agents.dify.dify_agent.requests.get') as mock_get, \
-             patch('executor.callback.callback_client.requests.post') as mock_post:
+             patch('executor.callback.callback_client._session.post') as mock_post:
             # Mock GET response for _get_app_mode()
             mock_get_response = MagicMock()
             mock_get_response.status_code = 200
@@ -20,10 +20,10 @@ class TestAgentFactory:
         """
         Mock all HTTP requests to prevent actual network calls during tests.
         - requests.get: DifyAgent.__init__ calls _get_app_mode() which makes GET to /v1/info
-        - requests.post: CallbackClient.send_callback() makes POST to callback URL
+        - _session.post: CallbackClient.send_callback() makes POST to callback URL
         """
         with patch("executor.agents.dify.dify_agent.requests.get") as mock_get, patch(
-            "executor.callback.callback_client.requests.post"
+            "executor.callback.callback_client._session.post"
         ) as mock_post:
             # Mock GET response for _get_app_mode()
             mock_get_response = MagicMock()
@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+from unittest.mock import MagicMock
+
+from executor.agents.agno.thinking_step_manager import ThinkingStepManager
+from executor.agents.claude_code import progress_state_manager as psm_module
+from executor.agents.claude_code.progress_state_manager import ProgressStateManager
+from shared.status import TaskStatus
+
+RUNNING = TaskStatus.RUNNING.value
+COMPLETED = TaskStatus.COMPLETED.value
+
+
+class TestProgressStateManager:
+    """Test cases for delta-encoded, coalesced progress reporting"""
+
+    @pytest.fixture
+    def callback(self):
+        return MagicMock(return_value={"status": TaskStatus.SUCCESS.value, "data": {}})
+
+    @pytest.fixture
+    def manager(self, callback, monkeypatch):
+        # Coalescing is driven by flush_progress() in tests, not by timers
+        monkeypatch.setattr(psm_module.config, "PROGRESS_COALESCE_WINDOW", 60.0)
+        thinking_manager = ThinkingStepManager()
+        manager = ProgressStateManager(
+            thinking_manager=thinking_manager,
+            task_data={"task_id": 1, "prompt": "do it"},
+            report_progress_callback=callback,
+        )
+        thinking_manager.set_state_manager(manager)
+        manager.workbench_data = manager._build_workbench_structure("running")
+        yield manager
+        manager.flush_progress()
+
+    def test_running_reports_are_coalesced(self, manager, callback):
+        manager.thinking_manager.add_thinking_step("a")
+        manager.thinking_manager.add_thinking_step("b")
+        manager.report_progress(60, RUNNING, "msg", extra_result={"value": "hi"})
+
+        callback.assert_not_called()
+        manager.flush_progress()
+
+        callback.assert_called_once()
+        progress, status, message = callback.call_args[0]
+        result = callback.call_args.kwargs["result"]
+        assert (progress, message) == (60, "msg")
+        assert result["value"] == "hi"
+        assert [step["title"] for step in result["thinking"]] == ["a", "b"]
+
+    def test_codex_events_are_kept_when_coalescing(self, manager, callback):
+        manager.report_progress(70, RUNNING, "", extra_result={"codex_event": {"n": 1}})
+        manager.report_progress(70, RUNNING, "", extra_result={"codex_event": {"n": 2}})
+        manager.flush_progress()
+
+        result = callback.call_args.kwargs["result"]
+        assert result["codex_event"] == [{"n": 1}, {"n": 2}]
+
+    def test_later_reports_carry_only_changes(self, manager, callback):
+        manager.thinking_manager.add_thinking_step("a")
+        manager.flush_progress()
+        manager.thinking_manager.add_thinking_step("b")
+        manager.workbench_data["summary"] = "changed"
+        manager.flush_progress()
+
+        result = callback.call_args.kwargs["result"]
+        assert [step["title"] for step in result["thinking"]] == ["b"]
+        assert result["workbench"] == {"summary": "changed"}
+        assert result["progress_delta"] == {
+            "seq": 2,
+            "base_seq": 1,
+            "thinking_offset": 1,
+        }
+
+    def test_terminal_report_is_sent_immediately(self, manager, callback):
+        manager.report_progress(60, RUNNING, "running")
+        manager.report_progress(100, COMPLETED, "done", extra_result={"value": "v"})
+
+        callback.assert_called_once()
+        assert callback.call_args[0][1] == COMPLETED
+
+    def test_resync_request_resends_full_state(self, manager, callback):
+        manager.thinking_manager.add_thinking_step("a")
+        manager.flush_progress()
+        callback.side_effect = [
+            {"status": TaskStatus.SUCCESS.value, "data": {"resync": True}},
+            {"status": TaskStatus.SUCCESS.value, "data": {}},
+        ]
+        manager.thinking_manager.add_thinking_step("b")
+        manager.flush_progress()
+
+        result = callback.call_args.kwargs["result"]
+        assert result["progress_delta"]["full"] is True
+        assert [step["title"] for step in result["thinking"]] == ["a", "b"]
+
+    def test_failed_callback_sends_full_state_next(self, manager, callback):
+        manager.thinking_manager.add_thinking_step("a")
+        callback.return_value = {"status": TaskStatus.FAILED.value}
+        manager.flush_progress()
+        callback.return_value = {"status": TaskStatus.SUCCESS.value, "data": {}}
+        manager.thinking_manager.add_thinking_step("b")
+        manager.flush_progress()
+
+        result = callback.call_args.kwargs["result"]
+        assert result["progress_delta"]["full"] is True
+
+
+class TestProgressStateManagerGitTracking:
+    """Test cases for incremental git change tracking"""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        git = pytest.importorskip("git")
+        repo = git.Repo.init(tmp_path)
+        with repo.config_writer() as writer:
+            writer.set_value("user", "name", "Test")
+            writer.set_value("user", "email", "test@example.com")
+        (tmp_path / "a.txt").write_text("one\ntwo\n")
+        repo.index.add(["a.txt"])
+        repo.index.commit("initial")
+        return repo
+
+    @pytest.fixture
+    def manager(self, repo, monkeypatch):
+        monkeypatch.setattr(psm_module.config, "GIT_CHANGES_MAX_FILES", 500)
+        manager = ProgressStateManager(
+            thinking_manager=ThinkingStepManager(),
+            task_data={"task_id": 1, "branch_name": "main"},
+            report_progress_callback=MagicMock(),
+            project_path=repo.working_tree_dir,
+        )
+        monkeypatch.setattr(manager, "_schedule_next_check", MagicMock())
+        manager.workbench_data = manager._build_workbench_structure("running")
+        manager._save_initial_commit()
+        manager._is_monitoring = True
+        return manager
+
+    def _commit(self, repo, name, content, message):
+        path = os.path.join(repo.working_tree_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        repo.index.add([name])
+        repo.index.commit(message)
+
+    def test_file_changes_use_numstat_counts(self, repo, manager):
+        self._commit(repo, "b.txt", "x\ny\nz\n", "add b")
+        with open(os.path.join(repo.working_tree_dir, "a.txt"), "w") as f:
+            f.write("one\nthree\nfour\n")
+
+        changes = {
+            change["new_path"]: change for change in manager._get_git_file_changes()
+        }
+
+        assert changes["b.txt"]["new_file"] is True
+        assert (changes["b.txt"]["added_lines"], changes["b.txt"]["removed_lines"]) == (
+            3,
+            0,
+        )
+        assert (changes["a.txt"]["added_lines"], changes["a.txt"]["removed_lines"]) == (
+            2,
+            1,
+        )
+
+    def test_file_changes_are_bounded(self, repo, manager, monkeypatch):
+        monkeypatch.setattr(psm_module.config, "GIT_CHANGES_MAX_FILES", 2)
+        for i in range(4):
+            self._commit(repo, f"f{i}.txt", "x\n", f"add f{i}")
+
+        assert len(manager._get_git_file_changes()) == 2
+
+    def test_unchanged_repository_skips_poll(self, repo, manager, monkeypatch):
+        get_changes = MagicMock(wraps=manager._get_git_file_changes)
+        monkeypatch.setattr(manager, "_get_git_file_changes", get_changes)
+
+        manager._check_git_changes()
+        manager._check_git_changes()
+        assert get_changes.call_count == 1
+
+        with open(os.path.join(repo.working_tree_dir, "a.txt"), "a") as f:
+            f.write("more\n")
+        manager._check_git_changes()
+        assert get_changes.call_count == 2
+
+    def test_commit_info_is_computed_once_per_commit(self, repo, manager, monkeypatch):
+        self._commit(repo, "b.txt", "b\n", "add b")
+        build = MagicMock(wraps=manager._build_commit_info)
+        monkeypatch.setattr(manager, "_build_commit_info", build)
+
+        manager._check_git_changes()
+        self._commit(repo, "c.txt", "c\n", "add c")
+        manager._check_git_changes()
+
+        task_commits = manager.workbench_data["git_info"]["task_commits"]
+        assert [commit["message"] for commit in task_commits] == ["add b", "add c"]
+        assert task_commits[1]["stats"]["insertions"] == 1
+        assert build.call_count == 2
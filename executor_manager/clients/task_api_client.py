@@ -75,11 +75,18 @@ class TaskApiClient:
                 delay *= self.retry_backoff
         return None
 
-    def fetch_tasks(self):
-        """Fetch tasks from API"""
+    def fetch_tasks(self, wait=0):
+        """Fetch tasks from API
+
+        Args:
+            wait: Long-poll timeout in seconds; the backend holds the request
+                until a task is available or the timeout expires (0 = no wait)
+        """
         logger.info("Fetching tasks...")
         try:
-            return self._request_with_retry(self._do_fetch_tasks, max_retries=1)
+            return self._request_with_retry(
+                lambda: self._do_fetch_tasks(wait), max_retries=1
+            )
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse response data: {e}")
             return False, str(e)
@@ -87,11 +94,13 @@ class TaskApiClient:
             logger.error(f"Unexpected error during fetch_tasks: {e}")
             return False, str(e)
 
-    def _do_fetch_tasks(self):
+    def _do_fetch_tasks(self, wait=0):
         # Build URL with query parameters
         url = f"{self.fetch_task_api_base_url}?limit={self.limit}&task_status={self.task_status}"
+        if wait:
+            url += f"&wait={wait}"
         logger.info(f"Fetching tasks from: {url}")
-        response = requests.post(url, timeout=self.timeout)
+        response = requests.post(url, timeout=self.timeout + wait)
         return self._handle_response(
             response, expect_json=True, context="fetching tasks"
         )
@@ -48,7 +48,17 @@ class TimeoutConfig:
         default_factory=lambda: int(os.getenv("HEARTBEAT_TIMEOUT", "60"))
     )
     heartbeat_check_interval: int = field(
-        default_factory=lambda: int(os.getenv("HEARTBEAT_CHECK_INTERVAL", "30"))
+        default_factory=lambda: int(os.getenv("HEARTBEAT_CHECK_INTERVAL", "5"))
+    )
+    # Time a new sandbox gets to send its first heartbeat
+    heartbeat_grace_period: int = field(
+        default_factory=lambda: int(os.getenv("HEARTBEAT_GRACE_PERIOD", "30"))
+    )
+
+    # Sweep sharding: replicas that haven't swept for this long lose their
+    # shard (0 = derive from heartbeat_check_interval, see sweep_member_ttl)
+    sweep_member_ttl_override: int = field(
+        default_factory=lambda: int(os.getenv("SANDBOX_SWEEP_MEMBER_TTL", "0"))
     )
 
     # HTTP timeouts
@@ -56,9 +66,24 @@ class TimeoutConfig:
     http_execution_request: float = 30.0
     http_container_wait: float = 5.0
 
+    # Readiness wait: polls this often until the container's first heartbeat
+    container_ready_poll_interval: float = 2.0
+    # and this often once the container has sent it
+    container_ready_retry_interval: float = 0.25
+
     # Redis TTL
     redis_ttl: int = 86400  # 24 hours
 
+    @property
+    def sweep_member_ttl(self) -> int:
+        """Sweep membership TTL, at least three heartbeat check intervals.
+
+        Replicas renew their membership on every heartbeat check, so a shorter
+        TTL lets live replicas expire between two sweeps and shard ownership
+        flaps.
+        """
+        return max(self.sweep_member_ttl_override, 3 * self.heartbeat_check_interval)
+
 
 @dataclass(frozen=True)
 class RetryConfig:
@@ -96,6 +121,30 @@ class ExecutorConfig:
     )
 
 
+@dataclass(frozen=True)
+class ProxyConfig:
+    """Sandbox reverse proxy configuration."""
+
+    # Seconds a resolved sandbox route is reused before it is looked up again
+    route_cache_ttl: float = field(
+        default_factory=lambda: float(os.getenv("SANDBOX_PROXY_ROUTE_CACHE_TTL", "5"))
+    )
+    route_cache_size: int = 10000
+
+    # Upstream connection pool
+    max_connections: int = field(
+        default_factory=lambda: int(os.getenv("SANDBOX_PROXY_MAX_CONNECTIONS", "500"))
+    )
+    max_keepalive_connections: int = field(
+        default_factory=lambda: int(
+            os.getenv("SANDBOX_PROXY_MAX_KEEPALIVE_CONNECTIONS", "100")
+        )
+    )
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 60.0
+
+
 @dataclass
 class AppConfig:
     """Application-wide configuration container."""
@@ -104,6 +153,7 @@ class AppConfig:
     timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
     retry: RetryConfig = field(default_factory=RetryConfig)
     executor: ExecutorConfig = field(default_factory=ExecutorConfig)
+    proxy: ProxyConfig = field(default_factory=ProxyConfig)
 
 
 # Global configuration instance
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2025 WeCode, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sharding of periodic sweeps across service replicas.
+
+Instead of one replica sweeping everything behind a global lock, every
+replica registers itself in a Redis ZSet (score = last sweep time) and
+sweeps the items that hash to its position among the live members.
+Membership changes can briefly leave items unowned or owned twice, so
+callers claim an item before acting on it; unowned items are picked up
+by the next sweep.
+"""
+
+import os
+import socket
+import time
+import uuid
+import zlib
+from typing import List, Optional, Tuple
+
+import redis
+from shared.logger import setup_logger
+
+from executor_manager.common.distributed_lock import DistributedLock
+from executor_manager.common.redis_factory import RedisClientFactory
+
+logger = setup_logger(__name__)
+
+# Member ZSet key prefix
+SWEEP_MEMBERS_PREFIX = "wegent-sandbox:sweepers:"
+
+
+class SweepShard:
+    """A replica's share of a sweep."""
+
+    def __init__(
+        self,
+        name: str,
+        member_ttl: float,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        """Initialize the shard.
+
+        Args:
+            name: Sweep name, replicas sharing a name split its work
+            member_ttl: Seconds after which a replica that stopped sweeping
+                loses its share
+            redis_client: Optional Redis client. If not provided, will use
+                RedisClientFactory to get the shared client.
+        """
+        self._name = name
+        self._member_ttl = member_ttl
+        self._redis_client = redis_client
+        self._members_key = f"{SWEEP_MEMBERS_PREFIX}{name}"
+        self.member_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = DistributedLock(redis_client)
+        self.index = 0
+        self.count = 1
+
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """Lazy-load Redis client."""
+        if self._redis_client is None:
+            self._redis_client = RedisClientFactory.get_sync_client()
+        return self._redis_client
+
+    def refresh(self) -> Tuple[int, int]:
+        """Renew membership and recompute this replica's share.
+
+        Returns:
+            Tuple of (index, member count). (0, 1) if Redis is unavailable.
+        """
+        if self.redis_client is None:
+            self.index, self.count = 0, 1
+            return self.index, self.count
+
+        try:
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zadd(self._members_key, {self.member_id: now})
+            pipe.zremrangebyscore(self._members_key, 0, now - self._member_ttl)
+            pipe.zrange(self._members_key, 0, -1)
+            _, _, members = pipe.execute()
+            # Order by ID, not by score, so the layout is stable between sweeps
+            members = sorted(members)
+            self.index = members.index(self.member_id)
+            self.count = len(members)
+        except Exception as e:
+            logger.error(f"[SweepShard] Failed to refresh {self._name} members: {e}")
+            self.index, self.count = 0, 1
+        return self.index, self.count
+
+    def owns(self, item_id: str) -> bool:
+        """Check whether an item falls in this replica's share."""
+        return zlib.crc32(str(item_id).encode()) % self.count == self.index
+
+    def select(self, item_ids: List[str]) -> List[str]:
+        """Refresh membership and keep the items in this replica's share."""
+        self.refresh()
+        return [item_id for item_id in item_ids if self.owns(item_id)]
+
+    def claim(self, item_id: str, expire_seconds: int = 60) -> bool:
+        """Claim an item so no other replica acts on it concurrently.
+
+        The claim expires on its own; it isn't released.
+
+        Args:
+            item_id: Item to claim
+            expire_seconds: Claim lifetime
+
+        Returns:
+            True if claimed by this replica
+        """
+        return self._lock.acquire(f"{self._name}:{item_id}", expire_seconds)
+
+    def leave(self) -> None:
+        """Give up this replica's share right away (e.g. on shutdown)."""
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.zrem(self._members_key, self.member_id)
+        except Exception as e:
+            logger.warning(f"[SweepShard] Failed to leave {self._name}: {e}")
@@ -33,6 +33,10 @@ API_RETRY_BACKOFF = 2  # Backoff multiplier for retry delay
 TASK_FETCH_INTERVAL = 5  # Task fetch interval (seconds)
 TIME_LOG_INTERVAL = 5  # Time log interval (seconds)
 SCHEDULER_SLEEP_TIME = 1  # Scheduler sleep time (seconds)
+# Long-poll timeout for online task dispatch (seconds). When > 0, online tasks
+# are fetched in a dedicated loop that blocks on the backend dispatch queue
+# instead of polling every TASK_FETCH_INTERVAL seconds. Set to 0 to disable.
+TASK_DISPATCH_WAIT = int(os.getenv("TASK_DISPATCH_WAIT", "25"))
 
 # Offline task scheduling time configuration
 # Evening time range for offline tasks (default: 21-23)
@@ -46,6 +50,32 @@ OFFLINE_TASK_MORNING_HOURS = os.getenv("OFFLINE_TASK_MORNING_HOURS", "0-8")
 PORT_RANGE_MIN = int(os.getenv("EXECUTOR_PORT_RANGE_MIN", 10000))
 PORT_RANGE_MAX = int(os.getenv("EXECUTOR_PORT_RANGE_MAX", 10100))
 
+# Docker Engine API configuration
+# Unix socket of the Docker daemon, container operations are sent over a
+# persistent HTTP connection instead of forking the docker CLI
+DOCKER_API_SOCKET = os.getenv("DOCKER_API_SOCKET", "/var/run/docker.sock")
+# API version prefix (e.g. "v1.41"), empty uses the daemon's current version
+DOCKER_API_VERSION = os.getenv("DOCKER_API_VERSION", "")
+DOCKER_API_TIMEOUT = float(os.getenv("DOCKER_API_TIMEOUT", "30"))
+
+# Warm container pool configuration
+# Number of idle, pre-started executor containers kept per image (0 disables)
+EXECUTOR_WARM_POOL_SIZE = int(os.getenv("EXECUTOR_WARM_POOL_SIZE", "0"))
+# Comma-separated images to keep warm (default: EXECUTOR_IMAGE)
+EXECUTOR_WARM_POOL_IMAGES = os.getenv("EXECUTOR_WARM_POOL_IMAGES", "")
+# Seconds between pool checks; claims trigger a refill immediately
+EXECUTOR_WARM_POOL_REFILL_INTERVAL = int(
+    os.getenv("EXECUTOR_WARM_POOL_REFILL_INTERVAL", "30")
+)
+# Maximum containers started concurrently while refilling
+EXECUTOR_WARM_POOL_REFILL_CONCURRENCY = int(
+    os.getenv("EXECUTOR_WARM_POOL_REFILL_CONCURRENCY", "2")
+)
+# Seconds to wait for a warm container's API to come up before discarding it
+EXECUTOR_WARM_POOL_READY_TIMEOUT = int(
+    os.getenv("EXECUTOR_WARM_POOL_READY_TIMEOUT", "60")
+)
+
 # GitHub App Configuration
 GITHUB_APP_ID = os.getenv("GITHUB_APP_ID")
 GITHUB_PRIVATE_KEY_PATH = os.getenv("GITHUB_PRIVATE_KEY_PATH")
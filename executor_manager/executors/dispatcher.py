@@ -115,3 +115,15 @@ class ExecutorDispatcher:
 
         logger.info(f"Found executor for type '{task_type}': {executors[task_type]}")
         return executors[task_type]
+
+    @classmethod
+    def close_executors(cls) -> None:
+        """Release resources held by loaded executors (call on shutdown)."""
+        for executor_type, executor in (cls._executors or {}).items():
+            close = getattr(executor, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.error(f"Failed to close executor '{executor_type}': {e}")
@@ -15,6 +15,10 @@ import os
 
 CONTAINER_OWNER = "executor_manager"
 
+# Label of idle containers started ahead of tasks by the warm pool
+WARM_POOL_LABEL = "aigc.weibo.com/warm-pool"
+WARM_CONTAINER_NAME_PREFIX = "wegent-warm-"
+
 # Docker host configuration
 DEFAULT_DOCKER_HOST = os.getenv("DOCKER_HOST_ADDR","host.docker.internal")
 DOCKER_SOCKET_PATH = "/var/run/docker.sock"
@@ -13,8 +13,7 @@ Docker executor for running tasks in Docker containers
 import importlib
 import json
 import os
-import subprocess
-import time
+import threading
 from email import utils
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -25,8 +24,15 @@ from shared.logger import setup_logger
 from shared.status import TaskStatus
 from shared.telemetry.config import get_otel_config
 
-from executor_manager.config.config import EXECUTOR_ENV
+from executor_manager.config.config import (
+    EXECUTOR_ENV, EXECUTOR_WARM_POOL_IMAGES, EXECUTOR_WARM_POOL_READY_TIMEOUT,
+    EXECUTOR_WARM_POOL_REFILL_CONCURRENCY, EXECUTOR_WARM_POOL_REFILL_INTERVAL,
+    EXECUTOR_WARM_POOL_SIZE)
 from executor_manager.executors.base import Executor
+from executor_manager.executors.docker.api_client import (ContainerSpec,
+                                                          DockerAPIClient,
+                                                          DockerAPIError,
+                                                          get_docker_client)
 from executor_manager.executors.docker.constants import (
     CONTAINER_OWNER, DEFAULT_API_ENDPOINT, DEFAULT_DOCKER_HOST, DEFAULT_LOCALE,
     DEFAULT_PROGRESS_COMPLETE, DEFAULT_PROGRESS_RUNNING, DEFAULT_TASK_ID,
@@ -36,7 +42,9 @@ from executor_manager.executors.docker.utils import (build_callback_url,
                                                      delete_container,
                                                      find_available_port,
                                                      get_container_ports,
-                                                     get_running_task_details)
+                                                     get_running_task_details,
+                                                     release_port)
+from executor_manager.executors.docker.warm_pool import WarmContainerPool
 from executor_manager.utils.executor_name import generate_executor_name
 
 logger = setup_logger(__name__)
@@ -51,31 +59,66 @@ def _current_executor_module():
 class DockerExecutor(Executor):
     """Docker executor for running tasks in Docker containers"""
 
-    def __init__(self, subprocess_module=subprocess, requests_module=requests):
+    def __init__(
+        self,
+        docker_client: Optional[DockerAPIClient] = None,
+        requests_module=requests,
+    ):
         """
         Initialize Docker executor with dependency injection for better testability
 
         Args:
-            subprocess_module: Module for subprocess operations (default: subprocess)
+            docker_client: Docker Engine API client (default: shared socket client)
             requests_module: Module for HTTP requests (default: requests)
         """
-        self.subprocess = subprocess_module
+        self.docker = docker_client or get_docker_client()
         self.requests = requests_module
 
         # Check if Docker is available
         self._check_docker_availability()
 
+        self.warm_pool: Optional[WarmContainerPool] = None
+        if EXECUTOR_WARM_POOL_SIZE > 0:
+            self._start_warm_pool()
+
     def _check_docker_availability(self) -> None:
         """Check if Docker is available on the system"""
         try:
-            self.subprocess.run(
-                ["docker", "--version"], check=True, capture_output=True
-            )
+            self.docker.ping()
             logger.info("Docker is available")
-        except (subprocess.SubprocessError, FileNotFoundError) as e:
+        except Exception as e:
             logger.error(f"Docker is not available: {e}")
             raise RuntimeError("Docker is not available")
 
+    def _start_warm_pool(self) -> None:
+        """Start keeping idle executor containers for the configured images"""
+        images = [
+            image.strip()
+            for image in (EXECUTOR_WARM_POOL_IMAGES or os.getenv("EXECUTOR_IMAGE", "")).split(",")
+            if image.strip()
+        ]
+        if not images:
+            logger.warning("Warm container pool enabled but no executor image is set")
+            return
+
+        self.warm_pool = WarmContainerPool(
+            self.docker,
+            images,
+            size=EXECUTOR_WARM_POOL_SIZE,
+            spec_factory=self._prepare_warm_container_spec,
+            acquire_port=find_available_port,
+            release_port=release_port,
+            refill_interval=EXECUTOR_WARM_POOL_REFILL_INTERVAL,
+            refill_concurrency=EXECUTOR_WARM_POOL_REFILL_CONCURRENCY,
+            ready_timeout=EXECUTOR_WARM_POOL_READY_TIMEOUT,
+        )
+        self.warm_pool.start()
+
+    def close(self) -> None:
+        """Stop the warm pool and remove its idle containers (call on shutdown)"""
+        if self.warm_pool is not None:
+            self.warm_pool.stop()
+
     def submit_executor(
         self, task: Dict[str, Any], callback: Optional[callable] = None
     ) -> Dict[str, Any]:
@@ -131,7 +174,9 @@ class DockerExecutor(Executor):
                         )
                     )
                     self._create_new_container(task, task_info, execution_status)
-            else:
+            elif not self._execute_in_warm_container(
+                task, task_info, execution_status
+            ):
                 # Generate new container name
                 module_ref = _current_executor_module()
                 execution_status["executor_name"] = module_ref.generate_executor_name(
@@ -190,14 +235,76 @@ class DockerExecutor(Executor):
         if port_info is None:
             raise ValueError(f"Container {executor_name} has no ports mapped")
 
-        # Send HTTP request to container
-        response = self._send_task_to_container(task, DEFAULT_DOCKER_HOST, port_info)
+        self._execute_in_container(task, status, port_info)
+
+    def _execute_in_container(
+        self, task: Dict[str, Any], status: Dict[str, Any], port: int
+    ) -> None:
+        """Send task to a running executor container and record the response"""
+        response = self._send_task_to_container(task, DEFAULT_DOCKER_HOST, port)
 
         # Process response
         if response.json()["status"] == "success":
             status["progress"] = DEFAULT_PROGRESS_COMPLETE
             status["error_msg"] = response.json().get("error_msg", "")
 
+    def _execute_in_warm_container(
+        self, task: Dict[str, Any], task_info: Dict[str, Any], status: Dict[str, Any]
+    ) -> bool:
+        """
+        Execute task in an idle container from the warm pool.
+
+        Args:
+            task: Task information
+            task_info: Extracted task info
+            status: Execution status, executor_name is set on success
+
+        Returns:
+            bool: False if no warm container could take the task
+        """
+        if self.warm_pool is None or not self._can_use_warm_container(task):
+            return False
+
+        container = self.warm_pool.claim(
+            self._get_executor_image(task), self._get_task_labels(task, task_info)
+        )
+        if container is None:
+            return False
+
+        status["executor_name"] = container.name
+        try:
+            self._execute_in_container(task, status, container.port)
+        except requests.RequestException as e:
+            logger.warning(
+                f"Warm container {container.name} unavailable for task "
+                f"{task_info['task_id']}: {e}. Starting a new container."
+            )
+            self.warm_pool.discard(container)
+            return False
+        return True
+
+    def _can_use_warm_container(self, task: Dict[str, Any]) -> bool:
+        """
+        Check whether a task can run in a container started before it was known.
+
+        Warm containers are started with the default image and environment, so
+        tasks needing a custom base image, a per-task callback URL or
+        sandbox/validation specific setup are started cold.
+        """
+        if task.get("type") in ("sandbox", "validation"):
+            return False
+        if task.get("callback_url") or self._get_base_image_from_task(task):
+            return False
+
+        from shared.utils.persistent_repo import PERSIST_REPO_MOUNT_PATH
+
+        repo_dir = task.get("repo_dir")
+        needs_persist_mount = isinstance(repo_dir, str) and repo_dir.startswith(
+            PERSIST_REPO_MOUNT_PATH + "/"
+        )
+        persist_root_host = (os.getenv("WEGENT_PERSIST_REPO_ROOT_HOST") or "").strip()
+        return not needs_persist_mount or bool(persist_root_host)
+
     def _get_container_port(self, executor_name: str) -> int:
         """Get container port information"""
         module_ref = _current_executor_module()
@@ -254,23 +361,24 @@ class DockerExecutor(Executor):
         if base_image:
             self._ensure_executor_binary_updated(executor_image)
 
-        # Prepare Docker command with optional base_image support
-        cmd = self._prepare_docker_command(
+        # Prepare container spec with optional base_image support
+        spec = self._prepare_container_spec(
             task, task_info, executor_name, executor_image, base_image
         )
 
-        # Execute Docker command
+        # Create and start the container
         logger.info(
             f"Starting Docker container for task {task_id}: {executor_name} (base_image={base_image or 'default'})"
         )
 
         try:
-            result = self.subprocess.run(
-                cmd, check=True, capture_output=True, text=True
-            )
+            try:
+                container_id = self.docker.run_container(spec)
+            except Exception:
+                release_port(spec.port)
+                raise
 
             # Record container ID
-            container_id = result.stdout.strip()
             logger.info(
                 f"Started Docker container {executor_name} with ID {container_id}"
             )
@@ -287,13 +395,20 @@ class DockerExecutor(Executor):
 
             # Check if container is still running after a short delay
             # This catches cases where the container exits immediately (e.g., binary incompatibility)
-            if base_image:
+            if base_image and is_validation_task:
                 self._check_container_health(task, executor_name, is_validation_task)
-
-        except subprocess.CalledProcessError as e:
+            elif base_image:
+                # Only logged for regular tasks, so don't delay their callback
+                threading.Thread(
+                    target=self._check_container_health,
+                    args=(task, executor_name, is_validation_task),
+                    daemon=True,
+                ).start()
+
+        except DockerAPIError as e:
             # For validation tasks, report image pull or container start failure
             if is_validation_task:
-                error_msg = e.stderr or str(e)
+                error_msg = e.message or str(e)
                 stage = (
                     "pulling_image"
                     if "pull" in error_msg.lower() or "not found" in error_msg.lower()
@@ -326,91 +441,46 @@ class DockerExecutor(Executor):
             executor_name: Name of the container to check
             is_validation_task: Whether this is a validation task
         """
-        # Wait a short time for container to potentially fail
-        time.sleep(2)
-
         try:
-            # Check container status
-            inspect_result = self.subprocess.run(
-                ["docker", "inspect", "--format", "{{.State.Status}}", executor_name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if inspect_result.returncode != 0:
-                logger.warning(f"Failed to inspect container {executor_name}")
+            # Returns as soon as the container stops, or after a short grace period
+            exit_code = self.docker.wait_container(executor_name, timeout=2)
+            if exit_code is None:
                 return
 
-            container_status = inspect_result.stdout.strip()
-
-            if container_status == "exited":
-                # Container has exited, get logs to understand why
-                logs_result = self.subprocess.run(
-                    ["docker", "logs", "--tail", "50", executor_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-
-                # Get exit code
-                exit_code_result = self.subprocess.run(
-                    [
-                        "docker",
-                        "inspect",
-                        "--format",
-                        "{{.State.ExitCode}}",
-                        executor_name,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                exit_code = (
-                    exit_code_result.stdout.strip()
-                    if exit_code_result.returncode == 0
-                    else "unknown"
-                )
+            # Container has exited, get logs to understand why
+            container_logs = (
+                self.docker.container_logs(executor_name, tail=50)
+                or "No logs available"
+            )
 
-                # Combine stdout and stderr for logs
-                container_logs = (
-                    logs_result.stdout or logs_result.stderr or "No logs available"
-                )
+            # Detect common error patterns
+            error_msg = self._analyze_container_failure(container_logs, str(exit_code))
 
-                # Detect common error patterns
-                error_msg = self._analyze_container_failure(container_logs, exit_code)
+            logger.error(
+                f"Container {executor_name} exited immediately with code {exit_code}: {error_msg}"
+            )
 
-                logger.error(
-                    f"Container {executor_name} exited immediately with code {exit_code}: {error_msg}"
+            # Report failure for validation tasks
+            if is_validation_task:
+                self._report_validation_stage(
+                    task,
+                    stage="starting_container",
+                    status="failed",
+                    progress=100,
+                    message=f"Container exited immediately: {error_msg}",
+                    error_message=error_msg,
+                    valid=False,
                 )
 
-                # Report failure for validation tasks
-                if is_validation_task:
-                    self._report_validation_stage(
-                        task,
-                        stage="starting_container",
-                        status="failed",
-                        progress=100,
-                        message=f"Container exited immediately: {error_msg}",
-                        error_message=error_msg,
-                        valid=False,
-                    )
-
-                    # Clean up the failed container
-                    try:
-                        self.subprocess.run(
-                            ["docker", "rm", "-f", executor_name],
-                            capture_output=True,
-                            timeout=10,
-                        )
-                    except Exception:
-                        pass
+                # Clean up the failed container
+                try:
+                    self.docker.remove_container(executor_name, force=True)
+                except Exception:
+                    pass
 
-                    # Raise exception to mark task as failed
-                    raise RuntimeError(f"Container exited immediately: {error_msg}")
+                # Raise exception to mark task as failed
+                raise RuntimeError(f"Container exited immediately: {error_msg}")
 
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Timeout checking container health for {executor_name}")
         except RuntimeError:
             # Re-raise RuntimeError from container failure
             raise
@@ -494,16 +564,16 @@ class DockerExecutor(Executor):
             raise ValueError("Executor image not provided")
         return executor_image
 
-    def _prepare_docker_command(
+    def _prepare_container_spec(
         self,
         task: Dict[str, Any],
         task_info: Dict[str, Any],
         executor_name: str,
         executor_image: str,
         base_image: Optional[str] = None,
-    ) -> List[str]:
+    ) -> ContainerSpec:
         """
-        Prepare Docker run command.
+        Prepare the container to run for a task.
 
         If base_image is provided, uses the Init Container pattern:
         - Uses the custom base_image as container image
@@ -519,124 +589,139 @@ class DockerExecutor(Executor):
         """
         from executors.docker.binary_extractor import EXECUTOR_BINARY_VOLUME
 
-        task_id = task_info["task_id"]
-        subtask_id = task_info["subtask_id"]
-        user_name = task_info["user_name"]
-
-        # Convert task to JSON string
-        task_str = json.dumps(task)
-
-        # Basic command
-        cmd = [
-            "docker",
-            "run",
-            "-d",  # Run in background mode
-            "--name",
-            executor_name,
+        # Use base_image if provided, otherwise use default executor_image
+        spec = ContainerSpec(
+            name=executor_name,
+            image=base_image if base_image else executor_image,
             # Add labels for container management
-            "--label",
-            f"owner={CONTAINER_OWNER}",
-            "--label",
-            f"task_id={task_id}",
-            "--label",
-            f"subtask_id={subtask_id}",
-            "--label",
-            f"user={user_name}",
-            "--label",
-            f"aigc.weibo.com/team-mode={task.get('mode','default')}",
-            "--label",
-            f"aigc.weibo.com/task-type={task.get('type', 'online')}",
-            "--label",
-            f"subtask_next_id={task.get('subtask_next_id', '')}",
-        ]
+            labels={
+                "owner": CONTAINER_OWNER,
+                **self._get_task_labels(task, task_info),
+            },
+        )
 
         # Environment variables
         # For sandbox type, do NOT set TASK_INFO to prevent auto-execution
         # Sandbox containers should wait for execute requests via API
         is_sandbox = task.get("type") == "sandbox"
         if not is_sandbox:
-            cmd.extend(["-e", f"TASK_INFO={task_str}"])
+            spec.env.append(f"TASK_INFO={json.dumps(task)}")
 
-        cmd.extend(
-            [
-                "-e",
-                f"EXECUTOR_NAME={executor_name}",
-                "-e",
-                f"TZ={DEFAULT_TIMEZONE}",
-                "-e",
-                f"LANG={DEFAULT_LOCALE}",
-                "-e",
-                f"EXECUTOR_ENV={EXECUTOR_ENV}",
-                # Mount
-                "-v",
-                f"{DOCKER_SOCKET_PATH}:{DOCKER_SOCKET_PATH}",
-            ]
-        )
+        self._add_base_config(spec)
 
         # If using custom base_image, mount executor binary from Named Volume
         if base_image:
-            cmd.extend(
-                [
-                    "-v",
-                    f"{EXECUTOR_BINARY_VOLUME}:/app:ro",  # Mount executor binary as read-only
-                    "--entrypoint",
-                    "/app/executor",  # Override entrypoint
-                ]
-            )
+            # Mount executor binary as read-only and override entrypoint
+            spec.binds.append(f"{EXECUTOR_BINARY_VOLUME}:/app:ro")
+            spec.entrypoint = ["/app/executor"]
             logger.info(
                 f"Using custom base image mode: {base_image} with executor from {EXECUTOR_BINARY_VOLUME}"
             )
 
         # Add TASK_API_DOMAIN environment variable for executor to access backend API
-        self._add_task_api_domain(cmd)
+        self._add_task_api_domain(spec)
 
         # Add workspace mount
-        self._add_workspace_mount(cmd)
+        self._add_workspace_mount(spec)
 
         # Add persistent repo mount (host sibling of Wegent root)
-        self._add_persistent_repo_mount(cmd, task)
+        self._add_persistent_repo_mount(spec, task)
 
         # Add network configuration
-        self._add_network_config(cmd)
+        self._add_network_config(spec)
 
         # Add port mapping
         module_ref = _current_executor_module()
-        port = module_ref.find_available_port()
+        port = module_ref.find_available_port(executor_name)
         logger.info(f"Assigned port {port} for container {executor_name}")
-        cmd.extend(["-p", f"{port}:{port}", "-e", f"PORT={port}"])
+        self._add_port(spec, port)
 
         # Add callback URL
-        module_ref = _current_executor_module()
-        self._add_callback_url(cmd, task, module_ref=module_ref)
+        self._add_callback_url(spec, task, module_ref=module_ref)
 
         # Add sandbox-specific environment variables for heartbeat service
-        self._add_sandbox_env_vars(cmd, task)
+        self._add_sandbox_env_vars(spec, task)
 
         # Add OpenTelemetry trace context for distributed tracing
-        self._add_trace_context(cmd)
+        self._add_trace_context(spec)
+
+        return spec
+
+    def _prepare_warm_container_spec(
+        self, executor_image: str, executor_name: str, port: int
+    ) -> ContainerSpec:
+        """
+        Prepare an idle container for the warm pool.
 
-        # Add executor image (use base_image if provided, otherwise use default executor_image)
-        final_image = base_image if base_image else executor_image
-        cmd.append(final_image)
+        Same as a task container without anything task specific: no TASK_INFO,
+        so the executor waits for the task on its API, and no task labels.
+
+        Args:
+            executor_image: Executor image
+            executor_name: Container name
+            port: Reserved host port
+        """
+        spec = ContainerSpec(
+            name=executor_name,
+            image=executor_image,
+            labels={"owner": CONTAINER_OWNER},
+        )
+        self._add_base_config(spec)
+        self._add_task_api_domain(spec)
+        self._add_workspace_mount(spec)
+        self._add_persistent_repo_mount(spec, {})
+        self._add_network_config(spec)
+        self._add_port(spec, port)
+        self._add_callback_url(spec, {})
+        self._add_trace_context(spec)
+        return spec
+
+    def _get_task_labels(
+        self, task: Dict[str, Any], task_info: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """Labels attributing a container to its task"""
+        return {
+            "task_id": f"{task_info['task_id']}",
+            "subtask_id": f"{task_info['subtask_id']}",
+            "user": f"{task_info['user_name']}",
+            "aigc.weibo.com/team-mode": f"{task.get('mode', 'default')}",
+            "aigc.weibo.com/task-type": f"{task.get('type', 'online')}",
+            "subtask_next_id": f"{task.get('subtask_next_id', '')}",
+        }
+
+    def _add_base_config(self, spec: ContainerSpec) -> None:
+        """Add environment and mounts every executor container gets"""
+        spec.env.extend(
+            [
+                f"EXECUTOR_NAME={spec.name}",
+                f"TZ={DEFAULT_TIMEZONE}",
+                f"LANG={DEFAULT_LOCALE}",
+                f"EXECUTOR_ENV={EXECUTOR_ENV}",
+            ]
+        )
+        spec.binds.append(f"{DOCKER_SOCKET_PATH}:{DOCKER_SOCKET_PATH}")
 
-        return cmd
+    def _add_port(self, spec: ContainerSpec, port: int) -> None:
+        """Publish the executor API port on the same host port"""
+        spec.port = port
+        spec.env.append(f"PORT={port}")
 
-    def _add_task_api_domain(self, cmd: List[str]) -> None:
+    def _add_task_api_domain(self, spec: ContainerSpec) -> None:
         """Add TASK_API_DOMAIN environment variable for executor to access backend API"""
         task_api_domain = os.getenv("TASK_API_DOMAIN", "")
         if task_api_domain:
-            cmd.extend(["-e", f"TASK_API_DOMAIN={task_api_domain}"])
+            spec.env.append(f"TASK_API_DOMAIN={task_api_domain}")
             logger.debug(
                 f"Added TASK_API_DOMAIN environment variable: {task_api_domain}"
             )
 
-    def _add_workspace_mount(self, cmd: List[str]) -> None:
+    def _add_workspace_mount(self, spec: ContainerSpec) -> None:
         """Add workspace mount configuration"""
         executor_workspace = os.getenv("EXECUTOR_WORKSPACE", "")  # Fix spelling error
         if executor_workspace:
-            cmd.extend(["-v", f"{executor_workspace}:{WORKSPACE_MOUNT_PATH}"])
+            spec.binds.append(f"{executor_workspace}:{WORKSPACE_MOUNT_PATH}")
 
-    def _add_persistent_repo_mount(self, cmd: List[str], task: Dict[str, Any]) -> None:
+    def _add_persistent_repo_mount(self, spec: ContainerSpec, task: Dict[str, Any]) -> None:
         """
         Mount host persistent repo root into executor container.
 
@@ -658,24 +743,24 @@ class DockerExecutor(Executor):
                 )
             return
 
-        cmd.extend(["-v", f"{persist_root_host}:{PERSIST_REPO_MOUNT_PATH}"])
+        spec.binds.append(f"{persist_root_host}:{PERSIST_REPO_MOUNT_PATH}")
 
-    def _add_network_config(self, cmd: List[str]) -> None:
+    def _add_network_config(self, spec: ContainerSpec) -> None:
         """Add network configuration"""
         network = os.getenv("NETWORK", "")
         if network:
-            cmd.extend(["--network", network])
+            spec.network = network
 
     def _add_callback_url(
-        self, cmd: List[str], task: Dict[str, Any], module_ref=None
+        self, spec: ContainerSpec, task: Dict[str, Any], module_ref=None
     ) -> None:
         """Add callback URL configuration"""
         module_ref = module_ref or _current_executor_module()
         callback_url = module_ref.build_callback_url(task)
         if callback_url:
-            cmd.extend(["-e", f"CALLBACK_URL={callback_url}"])
+            spec.env.append(f"CALLBACK_URL={callback_url}")
 
-    def _add_sandbox_env_vars(self, cmd: List[str], task: Dict[str, Any]) -> None:
+    def _add_sandbox_env_vars(self, spec: ContainerSpec, task: Dict[str, Any]) -> None:
         """Add sandbox-specific environment variables for heartbeat service.
 
         For sandbox type tasks, this adds:
@@ -684,7 +769,7 @@ class DockerExecutor(Executor):
         - EXECUTOR_MANAGER_HEARTBEAT_BASE_URL: Used by heartbeat service for heartbeat endpoint
 
         Args:
-            cmd: Docker command list to extend
+            spec: Container spec to extend
             task: Task dictionary containing sandbox_metadata
         """
         is_sandbox = task.get("type") == "sandbox"
@@ -696,8 +781,8 @@ class DockerExecutor(Executor):
         sandbox_id = sandbox_metadata.get("sandbox_id")
 
         if sandbox_id:
-            cmd.extend(["-e", f"SANDBOX_ID={sandbox_id}"])
-            cmd.extend(["-e", "HEARTBEAT_ENABLED=true"])
+            spec.env.append(f"SANDBOX_ID={sandbox_id}")
+            spec.env.append("HEARTBEAT_ENABLED=true")
 
             # Build heartbeat base URL from callback URL
             callback_url = build_callback_url(task)
@@ -706,13 +791,13 @@ class DockerExecutor(Executor):
                 # From: http://host:port/executor-manager/callback
                 # To:   http://host:port/executor-manager
                 base_url = callback_url.replace("/callback", "")
-                cmd.extend(["-e", f"EXECUTOR_MANAGER_HEARTBEAT_BASE_URL={base_url}"])
+                spec.env.append(f"EXECUTOR_MANAGER_HEARTBEAT_BASE_URL={base_url}")
 
             logger.info(
                 f"Added sandbox env vars: SANDBOX_ID={sandbox_id}, HEARTBEAT_ENABLED=true"
             )
 
-    def _add_trace_context(self, cmd: List[str]) -> None:
+    def _add_trace_context(self, spec: ContainerSpec) -> None:
         """
         Add OpenTelemetry configuration and trace context environment variables.
 
@@ -728,27 +813,17 @@ class DockerExecutor(Executor):
         try:
             # Add OTEL configuration environment variables
             # These are needed for executor to initialize OpenTelemetry
-            cmd.extend(
+            spec.env.extend(
                 [
-                    "-e",
                     "OTEL_ENABLED=true",
-                    "-e",
                     f"OTEL_SERVICE_NAME=wegent-executor",  # Use executor-specific service name
-                    "-e",
                     f"OTEL_EXPORTER_OTLP_ENDPOINT={otel_config.otlp_endpoint}",
-                    "-e",
                     f"OTEL_TRACES_SAMPLER_ARG={otel_config.sampler_ratio}",
-                    "-e",
                     f"OTEL_METRICS_ENABLED={'true' if otel_config.metrics_enabled else 'false'}",
-                    "-e",
                     f"OTEL_CAPTURE_REQUEST_HEADERS={'true' if otel_config.capture_request_headers else 'false'}",
-                    "-e",
                     f"OTEL_CAPTURE_REQUEST_BODY={'true' if otel_config.capture_request_body else 'false'}",
-                    "-e",
                     f"OTEL_CAPTURE_RESPONSE_HEADERS={'true' if otel_config.capture_response_headers else 'false'}",
-                    "-e",
                     f"OTEL_CAPTURE_RESPONSE_BODY={'true' if otel_config.capture_response_body else 'false'}",
-                    "-e",
                     f"OTEL_MAX_BODY_SIZE={otel_config.max_body_size}",
                 ]
             )
@@ -759,7 +834,7 @@ class DockerExecutor(Executor):
 
             trace_env_vars = get_trace_context_env_vars()
             for key, value in trace_env_vars.items():
-                cmd.extend(["-e", f"{key}={value}"])
+                spec.env.append(f"{key}={value}")
                 logger.debug(f"Added trace context env var: {key}={value[:50]}...")
         except Exception as e:
             logger.warning(f"Failed to add trace context: {e}")
@@ -768,9 +843,9 @@ class DockerExecutor(Executor):
         self, exception: Exception, task_id: int, status: Dict[str, Any]
     ) -> None:
         """Handle exceptions during execution uniformly"""
-        if isinstance(exception, subprocess.CalledProcessError):
-            logger.error(f"Docker run error for task {task_id}: {exception.stderr}")
-            error_msg = f"Docker run error: {exception.stderr}"
+        if isinstance(exception, DockerAPIError):
+            logger.error(f"Docker run error for task {task_id}: {exception.message}")
+            error_msg = f"Docker run error: {exception.message}"
         else:
             logger.error(f"Error for task {task_id}: {str(exception)}")
             error_msg = f"Error: {str(exception)}"
@@ -808,6 +883,8 @@ class DockerExecutor(Executor):
                 }
 
             # Delete container
+            if self.warm_pool is not None:
+                self.warm_pool.release(executor_name)
             return delete_container(executor_name)
         except Exception as e:
             logger.error(f"Error deleting container {executor_name}: {e}")
@@ -826,23 +903,12 @@ class DockerExecutor(Executor):
             return {"status": "failed", "error_msg": "executor_name is required"}
 
         try:
-            if not check_container_ownership(executor_name):
+            info = self.docker.inspect_container(executor_name)
+            labels = ((info or {}).get("Config") or {}).get("Labels") or {}
+            if info is None or labels.get("owner") != CONTAINER_OWNER:
                 return {"status": "success", "exists": False, "state": None}
 
-            inspect_cmd = [
-                "docker",
-                "inspect",
-                "--format",
-                "{{.State.Status}}",
-                executor_name,
-            ]
-            inspect_result = subprocess.run(
-                inspect_cmd, check=False, capture_output=True, text=True
-            )
-            if inspect_result.returncode != 0:
-                return {"status": "success", "exists": False, "state": None}
-
-            state = inspect_result.stdout.strip() or None
+            state = (info.get("State") or {}).get("Status") or None
             return {"status": "success", "exists": True, "state": state}
         except Exception as e:
             logger.error(f"Error getting container status for {executor_name}: {e}")
@@ -860,7 +926,7 @@ class DockerExecutor(Executor):
         """
         try:
             # Find the container running this task
-            result = get_running_task_details()
+            result = self._get_running_task_details()
 
             logger.info(f"Running task details for cancellation: {result}")
 
@@ -969,7 +1035,7 @@ class DockerExecutor(Executor):
             Dict[str, Any]: Count result.
         """
         try:
-            result = get_running_task_details(label_selector)
+            result = self._get_running_task_details(label_selector)
 
             # Maintain API backward compatibility
             if result["status"] == "success":
@@ -996,7 +1062,7 @@ class DockerExecutor(Executor):
             Dict[str, Any]: Task details result.
         """
         try:
-            return get_running_task_details(label_selector)
+            return self._get_running_task_details(label_selector)
         except Exception as e:
             logger.error(f"Error getting current task IDs: {e}")
             return {
@@ -1004,6 +1070,13 @@ class DockerExecutor(Executor):
                 "error_msg": f"Error getting current task IDs: {str(e)}",
             }
 
+    def _get_running_task_details(
+        self, label_selector: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get running task details, attributing claimed warm containers to their tasks"""
+        label_overrides = self.warm_pool.assignments() if self.warm_pool else None
+        return get_running_task_details(label_selector, label_overrides)
+
     def get_container_address(self, executor_name: str) -> Dict[str, Any]:
         """Get container base URL for sandbox proxy.
 
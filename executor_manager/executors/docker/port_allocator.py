@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+In-memory host port allocation for Docker executor containers
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from shared.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class PortAllocator:
+    """
+    Hands out host ports from a fixed range without asking Docker each time.
+
+    Ports are reserved for the container they were acquired for until it is
+    released. The reservations are reconciled with the ports actually
+    published by Docker on first use, every resync_interval seconds, and when
+    the range looks exhausted, so containers removed outside this process
+    don't leak ports.
+    """
+
+    def __init__(
+        self,
+        port_min: int,
+        port_max: int,
+        load_used_ports: Callable[[], Set[int]],
+        resync_interval: float = 300,
+        grace_seconds: float = 60,
+    ):
+        """
+        Initialize the allocator
+
+        Args:
+            port_min: First port of the range
+            port_max: Last port of the range (inclusive)
+            load_used_ports: Returns ports published by running containers
+            resync_interval: Seconds between reconciliations with Docker
+            grace_seconds: Keep fresh reservations whose container Docker
+                doesn't report yet for this long when reconciling
+        """
+        self.port_min = port_min
+        self.port_max = port_max
+        self._load_used_ports = load_used_ports
+        self._resync_interval = resync_interval
+        self._grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        # port -> (owner container name, reserved at)
+        self._reserved: Dict[int, Tuple[str, float]] = {}
+        self._last_sync: Optional[float] = None
+        self._cursor = port_min
+
+    def acquire(self, owner: str = "") -> int:
+        """
+        Reserve a free port
+
+        Args:
+            owner: Name of the container the port is for
+
+        Returns:
+            int: Reserved port
+
+        Raises:
+            RuntimeError: If no ports are available in the range
+        """
+        with self._lock:
+            now = time.monotonic()
+            last_sync = self._last_sync
+            if last_sync is None or now - last_sync >= self._resync_interval:
+                self._sync(now)
+
+            port = self._next_free_port()
+            if port is None:
+                # Containers may have been removed behind our back
+                self._sync(now)
+                port = self._next_free_port()
+            if port is None:
+                raise RuntimeError(
+                    f"No available ports in range {self.port_min}-{self.port_max}"
+                )
+
+            self._reserved[port] = (owner, now)
+            # Round-robin so a just-released port isn't handed out again at once
+            self._cursor = port + 1 if port < self.port_max else self.port_min
+            return port
+
+    def release(self, port: int) -> None:
+        """Release a port"""
+        with self._lock:
+            self._reserved.pop(port, None)
+
+    def release_owner(self, owner: str) -> None:
+        """Release all ports reserved for a container"""
+        with self._lock:
+            for port in [p for p, (o, _) in self._reserved.items() if o == owner]:
+                del self._reserved[port]
+
+    def reserved_ports(self) -> Set[int]:
+        """Currently reserved ports"""
+        with self._lock:
+            return set(self._reserved)
+
+    def _next_free_port(self) -> Optional[int]:
+        size = self.port_max - self.port_min + 1
+        for offset in range(size):
+            port = self.port_min + (self._cursor - self.port_min + offset) % size
+            if port not in self._reserved:
+                return port
+        return None
+
+    def _sync(self, now: float) -> None:
+        used_ports = self._load_used_ports()
+        reserved = {
+            port: entry
+            for port, entry in self._reserved.items()
+            if port in used_ports or now - entry[1] < self._grace_seconds
+        }
+        for port in used_ports:
+            if port not in reserved:
+                reserved[port] = ("", now)
+        self._reserved = reserved
+        self._last_sync = now
+        logger.info(f"Docker ports in use by executor_manager: {sorted(used_ports)}")
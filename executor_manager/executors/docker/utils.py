@@ -11,13 +11,15 @@ Utility functions for Docker executor
 """
 
 import os
-import re
-import socket
-import subprocess
-from typing import Set
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from executor_manager.config.config import PORT_RANGE_MAX, PORT_RANGE_MIN
+from executor_manager.executors.docker.api_client import (DockerAPIError,
+                                                          get_docker_client)
+from executor_manager.executors.docker.constants import (CONTAINER_OWNER,
+                                                         WARM_POOL_LABEL)
+from executor_manager.executors.docker.port_allocator import PortAllocator
 from shared.logger import setup_logger
 from shared.utils.ip_util import get_host_ip, is_ip_address
 
@@ -72,11 +74,16 @@ def build_callback_url(task: dict) -> str:
     return callback_url
 
 
-def find_available_port() -> int:
+def find_available_port(owner: str = "") -> int:
     """
-    Find an available port in the defined range.
-    Only considers ports used by containers with label=owner=executor_manager
-    and ports in use by the host system.
+    Reserve an available port in the defined range.
+
+    Ports are tracked in memory and reconciled with the ports published by
+    containers with label=owner=executor_manager, so this doesn't query
+    Docker on every call.
+
+    Args:
+        owner (str): Name of the container the port is reserved for
 
     Returns:
         int: An available port number
@@ -84,43 +91,20 @@ def find_available_port() -> int:
     Raises:
         RuntimeError: If no ports are available in the defined range
     """
-    try:
-        # Get ports used by Docker containers with specific label
-        docker_used_ports = get_docker_used_ports()
-        logger.info(
-            "Docker ports in use by executor_manager: %s", sorted(docker_used_ports)
-        )
-
-        # Find first available port in range
-        return _get_first_available_port(docker_used_ports)
-
-    except subprocess.CalledProcessError as e:
-        logger.error("Error checking Docker ports: %s", e.stderr or e)
-        raise
-    except Exception:
-        logger.exception("Unexpected error while finding available port")
-        raise
+    port = _port_allocator.acquire(owner)
+    logger.info("Selected available port: %d", port)
+    return port
 
 
-def _get_first_available_port(used_ports: Set[int]) -> int:
+def release_port(port: int) -> None:
     """
-    Find the first available port in the defined range.
+    Release a port reserved by find_available_port for a container that
+    failed to start.
 
     Args:
-        used_ports: Set of ports already in use
-
-    Returns:
-        int: First available port
-
-    Raises:
-        RuntimeError: If no ports are available
+        port (int): Port to release
     """
-    for port in range(PORT_RANGE_MIN, PORT_RANGE_MAX + 1):
-        if port not in used_ports:
-            logger.info("Selected available port: %d", port)
-            return port
-
-    raise RuntimeError(f"No available ports in range {PORT_RANGE_MIN}-{PORT_RANGE_MAX}")
+    _port_allocator.release(port)
 
 
 def get_docker_used_ports() -> Set[int]:
@@ -130,26 +114,30 @@ def get_docker_used_ports() -> Set[int]:
     Returns:
         Set[int]: Set of port numbers in use
     """
-    docker_used_ports = set()
-    cmd = [
-        "docker",
-        "ps",
-        "--filter",
-        "label=owner=executor_manager",
-        "--format",
-        "{{.Ports}}",
-    ]
-    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-    port_pattern = r"0\.0\.0\.0:(\d+)->.*?/tcp"
-    for line in result.stdout.splitlines():
-        docker_used_ports.update(
-            int(p)
-            for p in re.findall(port_pattern, line)
-            if PORT_RANGE_MIN <= int(p) <= PORT_RANGE_MAX
-        )
+    containers = get_docker_client().list_containers(
+        labels=[f"owner={CONTAINER_OWNER}"]
+    )
+    return {
+        port["PublicPort"]
+        for container in containers
+        for port in container.get("Ports") or []
+        if port.get("Type") == "tcp"
+        and PORT_RANGE_MIN <= port.get("PublicPort", 0) <= PORT_RANGE_MAX
+    }
+
 
-    return docker_used_ports
+_port_allocator = PortAllocator(PORT_RANGE_MIN, PORT_RANGE_MAX, get_docker_used_ports)
+
+
+def _inspect_owned_container(container_name: str) -> Optional[dict]:
+    """Inspect a container, None if it doesn't exist or isn't owned by executor_manager"""
+    info = get_docker_client().inspect_container(container_name)
+    if info is None:
+        return None
+    labels = (info.get("Config") or {}).get("Labels") or {}
+    if labels.get("owner") != CONTAINER_OWNER:
+        return None
+    return info
 
 
 def check_container_ownership(container_name: str) -> bool:
@@ -163,23 +151,9 @@ def check_container_ownership(container_name: str) -> bool:
         bool: True if container exists and is owned by executor_manager, False otherwise
     """
     try:
-        check_cmd = [
-            "docker",
-            "ps",
-            "-a",
-            "--filter",
-            f"name={container_name}",
-            "--filter",
-            "label=owner=executor_manager",
-            "--format",
-            "{{.Names}}",
-        ]
-        check_result = subprocess.run(
-            check_cmd, check=True, capture_output=True, text=True
-        )
-        return container_name in check_result.stdout
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error checking container ownership: {e.stderr}")
+        return _inspect_owned_container(container_name) is not None
+    except DockerAPIError as e:
+        logger.error(f"Error checking container ownership: {e.message}")
         return False
     except Exception as e:
         logger.error(f"Unexpected error checking container ownership: {e}")
@@ -197,14 +171,15 @@ def delete_container(container_name: str) -> dict:
         dict: Result with status and optional error message
     """
     try:
-        # Stop and remove container in one command
-        cmd = f"docker stop {container_name} && docker rm {container_name}"
-        subprocess.run(cmd, shell=True, check=True, capture_output=True)
+        client = get_docker_client()
+        client.stop_container(container_name)
+        client.remove_container(container_name)
+        _port_allocator.release_owner(container_name)
         logger.info(f"Deleted Docker container '{container_name}'")
         return {"status": "success"}
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Docker error deleting container '{container_name}': {e.stderr}")
-        return {"status": "failed", "error_msg": f"Docker error: {e.stderr}"}
+    except DockerAPIError as e:
+        logger.error(f"Docker error deleting container '{container_name}': {e.message}")
+        return {"status": "failed", "error_msg": f"Docker error: {e.message}"}
     except Exception as e:
         logger.error(f"Error deleting Docker container '{container_name}': {e}")
         return {"status": "failed", "error_msg": f"Error: {e}"}
@@ -230,14 +205,12 @@ def pause_container(container_name: str) -> dict:
                 "error_msg": f"Container '{container_name}' not found or not owned by executor_manager",
             }
 
-        cmd = ["docker", "pause", container_name]
-        subprocess.run(cmd, check=True, capture_output=True)
+        get_docker_client().pause_container(container_name)
         logger.info(f"Paused Docker container '{container_name}'")
         return {"status": "success"}
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.decode() if hasattr(e.stderr, "decode") else str(e.stderr)
-        logger.error(f"Docker error pausing container '{container_name}': {error_msg}")
-        return {"status": "failed", "error_msg": f"Docker error: {error_msg}"}
+    except DockerAPIError as e:
+        logger.error(f"Docker error pausing container '{container_name}': {e.message}")
+        return {"status": "failed", "error_msg": f"Docker error: {e.message}"}
     except Exception as e:
         logger.error(f"Error pausing Docker container '{container_name}': {e}")
         return {"status": "failed", "error_msg": f"Error: {e}"}
@@ -261,38 +234,70 @@ def unpause_container(container_name: str) -> dict:
                 "error_msg": f"Container '{container_name}' not found or not owned by executor_manager",
             }
 
-        cmd = ["docker", "unpause", container_name]
-        subprocess.run(cmd, check=True, capture_output=True)
+        get_docker_client().unpause_container(container_name)
         logger.info(f"Unpaused Docker container '{container_name}'")
         return {"status": "success"}
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.decode() if hasattr(e.stderr, "decode") else str(e.stderr)
+    except DockerAPIError as e:
         logger.error(
-            f"Docker error unpausing container '{container_name}': {error_msg}"
+            f"Docker error unpausing container '{container_name}': {e.message}"
         )
-        return {"status": "failed", "error_msg": f"Docker error: {error_msg}"}
+        return {"status": "failed", "error_msg": f"Docker error: {e.message}"}
     except Exception as e:
         logger.error(f"Error unpausing Docker container '{container_name}': {e}")
         return {"status": "failed", "error_msg": f"Error: {e}"}
 
 
-def _build_docker_ps_command(label_selector: str = None) -> list:
+def _matches_label_selector(labels: Dict[str, str], label_selector: str) -> bool:
     """
-    Build docker ps command with appropriate filters.
+    Check labels against a selector with docker's label filter syntax.
 
     Args:
-        label_selector (str, optional): Additional label selector
+        labels: Container labels
+        label_selector: "key" or "key=value", comma-separated selectors must all match
 
     Returns:
-        list: Command arguments list
+        bool: True if all selectors match
     """
-    cmd = ["docker", "ps", "--filter", "label=owner=executor_manager"]
+    for selector in label_selector.split(","):
+        key, sep, value = selector.strip().partition("=")
+        if key not in labels or (sep and labels[key] != value):
+            return False
+    return True
 
-    if label_selector:
-        cmd.extend(["--filter", f"label={label_selector}"])
 
-    cmd.extend(["--format", "{{.Names}}"])
-    return cmd
+def _list_task_containers(
+    label_selector: str = None,
+    label_overrides: Optional[Dict[str, Dict[str, str]]] = None,
+) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    List running containers with owner=executor_manager label.
+
+    Idle warm pool containers are skipped. Claimed warm pool containers were
+    started before their task was known, so their task labels come from
+    label_overrides.
+
+    Args:
+        label_selector (str, optional): Additional label selector
+        label_overrides (dict, optional): Task labels by container name
+
+    Returns:
+        list: (container name, labels) tuples
+    """
+    label_overrides = label_overrides or {}
+    containers = []
+    for container in get_docker_client().list_containers(
+        labels=[f"owner={CONTAINER_OWNER}"]
+    ):
+        name = (container.get("Names") or ["/"])[0].lstrip("/")
+        labels = dict(container.get("Labels") or {})
+        if WARM_POOL_LABEL in labels:
+            if name not in label_overrides:
+                continue
+            labels.update(label_overrides[name])
+        if label_selector and not _matches_label_selector(labels, label_selector):
+            continue
+        containers.append((name, labels))
+    return containers
 
 
 def count_running_containers(label_selector: str = None) -> dict:
@@ -306,11 +311,7 @@ def count_running_containers(label_selector: str = None) -> dict:
         dict: Result with status, count and optional error message
     """
     try:
-        cmd = _build_docker_ps_command(label_selector)
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-        # Count non-empty lines in output
-        container_count = sum(1 for line in result.stdout.split("\n") if line.strip())
+        container_count = len(_list_task_containers(label_selector))
 
         logger.info(
             f"Found {container_count} running containers with owner=executor_manager"
@@ -318,12 +319,15 @@ def count_running_containers(label_selector: str = None) -> dict:
         return {"status": "success", "count": container_count}
 
     except Exception as e:
-        error_msg = getattr(e, "stderr", str(e))
+        error_msg = getattr(e, "message", str(e))
         logger.error(f"Error listing Docker containers: {error_msg}")
         return {"status": "failed", "error_msg": f"Error: {error_msg}", "count": 0}
 
 
-def get_running_task_details(label_selector: str = None) -> dict:
+def get_running_task_details(
+    label_selector: str = None,
+    label_overrides: Optional[Dict[str, Dict[str, str]]] = None,
+) -> dict:
     """
     Get detailed information about running tasks from Docker containers.
 
@@ -332,60 +336,35 @@ def get_running_task_details(label_selector: str = None) -> dict:
 
     Args:
         label_selector (str, optional): Additional label selector for filtering
+        label_overrides (dict, optional): Task labels of claimed warm pool
+            containers by container name
 
     Returns:
         dict: Result with status, task_details and optional error message
     """
     try:
-        # Base command with owner filter
-        cmd = ["docker", "ps", "--filter", "label=owner=executor_manager"]
-
-        # Add additional label selector if provided
-        if label_selector:
-            cmd.extend(["--filter", f"label={label_selector}"])
-
-        # Format to get task_id, subtask_id, subtask_next_id and container name
-        # Using go template formatting to get multiple fields
-        cmd.extend(
-            [
-                "--format",
-                '{{.Label "task_id"}}|{{.Label "subtask_id"}}|{{.Label "subtask_next_id"}}|{{.Label "aigc.weibo.com/task-type"}}|{{.Names}}',
-            ]
-        )
-
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-
         # Process container information
         containers = []
         task_map = {}
 
-        for line in result.stdout.split("\n"):
-            if not line.strip():
-                continue
-
-            parts = line.strip().split("|")
-
-            if len(parts) >= 5:
-                task_id = parts[0]
-                subtask_id = parts[1]
-                subtask_next_id = parts[2]
-                task_type = parts[3] if parts[3] else "online"
-                container_name = parts[4]
-
-                container_info = {
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "container_name": container_name,
-                    "subtask_next_id": subtask_next_id,
-                    "task_type": task_type,
-                }
+        for container_name, labels in _list_task_containers(
+            label_selector, label_overrides
+        ):
+            task_id = labels.get("task_id", "")
+            container_info = {
+                "task_id": task_id,
+                "subtask_id": labels.get("subtask_id", ""),
+                "container_name": container_name,
+                "subtask_next_id": labels.get("subtask_next_id", ""),
+                "task_type": labels.get("aigc.weibo.com/task-type") or "online",
+            }
 
-                containers.append(container_info)
+            containers.append(container_info)
 
-                # Group by task_id
-                if task_id not in task_map:
-                    task_map[task_id] = []
-                task_map[task_id].append(container_info)
+            # Group by task_id
+            if task_id not in task_map:
+                task_map[task_id] = []
+            task_map[task_id].append(container_info)
 
         # Determine which tasks are still running
         running_task_ids = []
@@ -410,7 +389,7 @@ def get_running_task_details(label_selector: str = None) -> dict:
         }
 
     except Exception as e:
-        error_msg = getattr(e, "stderr", str(e))
+        error_msg = getattr(e, "message", str(e))
         logger.error(f"Error getting task details from Docker containers: {error_msg}")
         return {
             "status": "failed",
@@ -432,54 +411,42 @@ def get_container_ports(container_name: str) -> dict:
     """
     try:
         # Check if container exists and is owned by executor_manager
-        if not check_container_ownership(container_name):
+        info = _inspect_owned_container(container_name)
+        if info is None:
             return {
                 "status": "failed",
                 "error_msg": f"Container '{container_name}' not found or not owned by executor_manager",
                 "ports": [],
             }
 
-        # Get ports information for the specific container
-        cmd = [
-            "docker",
-            "ps",
-            "--filter",
-            f"name={container_name}",
-            "--format",
-            "{{.Ports}}",
-        ]
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-
-        # Parse port information
+        # Parse port information, e.g. {"8080/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}
         ports = []
-        port_pattern = r"0\.0\.0\.0:(\d+)->(\d+)/(\w+)"
-
-        for line in result.stdout.splitlines():
-            if line.strip():
-                matches = re.findall(port_pattern, line)
-                for match in matches:
-                    host_port, container_port, protocol = match
-                    ports.append(
-                        {
-                            "host_port": int(host_port),
-                            "container_port": int(container_port),
-                            "protocol": protocol,
-                        }
-                    )
+        port_map = (info.get("NetworkSettings") or {}).get("Ports") or {}
+        for container_port, bindings in port_map.items():
+            port, _, protocol = container_port.partition("/")
+            for binding in bindings or []:
+                if binding.get("HostIp") not in ("", "0.0.0.0"):
+                    continue
+                ports.append(
+                    {
+                        "host_port": int(binding["HostPort"]),
+                        "container_port": int(port),
+                        "protocol": protocol or "tcp",
+                    }
+                )
 
         logger.info(
             f"Retrieved port mappings for container '{container_name}': {ports}"
         )
         return {"status": "success", "ports": ports}
 
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.decode() if hasattr(e, "stderr") else str(e)
+    except DockerAPIError as e:
         logger.error(
-            f"Docker error getting ports for container '{container_name}': {error_msg}"
+            f"Docker error getting ports for container '{container_name}': {e.message}"
         )
         return {
             "status": "failed",
-            "error_msg": f"Docker error: {error_msg}",
+            "error_msg": f"Docker error: {e.message}",
             "ports": [],
         }
     except Exception as e:
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Warm pool of pre-started executor containers
+
+Starting an executor container means creating it, booting the executor
+process and waiting for its API, which takes seconds. The pool keeps a
+number of idle containers per image that were started without TASK_INFO
+and are already answering on their port. A task claims one and is sent to
+its /api/tasks/execute endpoint, the same way tasks are sent to an existing
+executor. Claims wake a background thread that starts replacements.
+"""
+
+import secrets
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+
+import httpx
+from shared.logger import setup_logger
+
+from executor_manager.executors.docker.api_client import (ContainerSpec,
+                                                          DockerAPIClient)
+from executor_manager.executors.docker.constants import (
+    CONTAINER_OWNER, DEFAULT_DOCKER_HOST, WARM_CONTAINER_NAME_PREFIX,
+    WARM_POOL_LABEL)
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class WarmContainer:
+    """An idle executor container owned by the pool"""
+
+    name: str
+    image: str
+    port: int
+
+
+def _probe_ready(port: int) -> bool:
+    """Check whether the executor API of a container answers"""
+    try:
+        response = httpx.get(f"http://{DEFAULT_DOCKER_HOST}:{port}/", timeout=1.0)
+        return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def _count_sessions(port: int) -> Optional[int]:
+    """Number of agent sessions of an executor, None if it can't be reached"""
+    try:
+        response = httpx.get(
+            f"http://{DEFAULT_DOCKER_HOST}:{port}/api/tasks/sessions", timeout=2.0
+        )
+        response.raise_for_status()
+        return response.json().get("total", 0)
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+class WarmContainerPool:
+    """Keeps idle executor containers ready to be claimed by tasks"""
+
+    def __init__(
+        self,
+        client: DockerAPIClient,
+        images: List[str],
+        size: int,
+        spec_factory: Callable[[str, str, int], ContainerSpec],
+        acquire_port: Callable[[str], int],
+        release_port: Callable[[int], None],
+        refill_interval: float = 30,
+        refill_concurrency: int = 2,
+        ready_timeout: float = 60,
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            client: Docker API client
+            images: Executor images to keep warm
+            size: Idle containers kept per image
+            spec_factory: Builds the container spec from (image, name, port)
+            acquire_port: Reserves a host port for a container name
+            release_port: Releases a reserved host port
+            refill_interval: Seconds between health checks and refills
+            refill_concurrency: Containers started concurrently while refilling
+            ready_timeout: Seconds to wait for a started container's API
+        """
+        self._client = client
+        self.size = size
+        self._spec_factory = spec_factory
+        self._acquire_port = acquire_port
+        self._release_port = release_port
+        self.refill_interval = refill_interval
+        self.refill_concurrency = max(1, refill_concurrency)
+        self.ready_timeout = ready_timeout
+
+        self._lock = threading.Lock()
+        self._idle: Dict[str, Deque[WarmContainer]] = {
+            image: deque() for image in images
+        }
+        self._starting: Counter = Counter()
+        # Task labels of claimed containers by name; Docker labels are
+        # immutable, so this is how claimed containers are attributed to tasks
+        self._assignments: Dict[str, Dict[str, str]] = {}
+        self._refill_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def claim(self, image: str, labels: Dict[str, str]) -> Optional[WarmContainer]:
+        """
+        Take an idle container for a task
+
+        Args:
+            image: Executor image the task needs
+            labels: Task labels to attribute the container to the task
+
+        Returns:
+            Optional[WarmContainer]: The container, None if none is idle
+        """
+        with self._lock:
+            queue = self._idle.get(image)
+            if not queue:
+                return None
+            container = queue.popleft()
+            self._assignments[container.name] = dict(labels)
+        self._refill_event.set()
+        logger.info(f"Claimed warm container {container.name} for image {image}")
+        return container
+
+    def discard(self, container: WarmContainer) -> None:
+        """Remove a claimed container that turned out to be unusable"""
+        self.release(container.name)
+        self._remove(container)
+
+    def release(self, name: str) -> None:
+        """Forget the task of a claimed container (call when it is deleted)"""
+        with self._lock:
+            self._assignments.pop(name, None)
+
+    def assignments(self) -> Dict[str, Dict[str, str]]:
+        """Task labels of claimed containers by container name"""
+        with self._lock:
+            return {name: dict(labels) for name, labels in self._assignments.items()}
+
+    def idle_count(self, image: str) -> int:
+        """Number of idle containers of an image"""
+        with self._lock:
+            return len(self._idle.get(image, ()))
+
+    def start(self) -> None:
+        """Adopt idle containers left by a previous run and start refilling"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        try:
+            self._adopt_leftovers()
+        except Exception as e:
+            logger.error(f"Failed to adopt leftover warm containers: {e}")
+        self._thread = threading.Thread(
+            target=self._run, name="warm-container-pool", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Started warm container pool: {self.size} per image for {list(self._idle)}"
+        )
+
+    def stop(self) -> None:
+        """Stop refilling and remove idle containers"""
+        self._stop_event.set()
+        self._refill_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=self.ready_timeout)
+
+        with self._lock:
+            idle = [container for queue in self._idle.values() for container in queue]
+            for queue in self._idle.values():
+                queue.clear()
+        for container in idle:
+            self._remove(container)
+        logger.info(f"Stopped warm container pool, removed {len(idle)} idle containers")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.prune()
+                self.refill()
+            except Exception as e:
+                logger.error(f"Error maintaining warm container pool: {e}")
+            self._refill_event.wait(self.refill_interval)
+            self._refill_event.clear()
+
+    def refill(self) -> int:
+        """
+        Start containers until every image has `size` idle ones (blocking)
+
+        Returns:
+            int: Number of containers that became ready
+        """
+        jobs = []
+        with self._lock:
+            for image, queue in self._idle.items():
+                missing = self.size - len(queue) - self._starting[image]
+                for _ in range(max(0, missing)):
+                    self._starting[image] += 1
+                    jobs.append(image)
+        if not jobs:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=self.refill_concurrency) as executor:
+            return sum(executor.map(self._start_container, jobs))
+
+    def prune(self) -> None:
+        """Drop idle containers and assignments whose container stopped"""
+        running = {
+            (container.get("Names") or ["/"])[0].lstrip("/")
+            for container in self._client.list_containers(
+                labels=[f"owner={CONTAINER_OWNER}", WARM_POOL_LABEL]
+            )
+        }
+        dead = []
+        with self._lock:
+            for queue in self._idle.values():
+                alive = [c for c in queue if c.name in running]
+                dead.extend(c for c in queue if c.name not in running)
+                queue.clear()
+                queue.extend(alive)
+            for name in [n for n in self._assignments if n not in running]:
+                del self._assignments[name]
+        for container in dead:
+            logger.warning(f"Warm container {container.name} stopped while idle")
+            self._remove(container)
+
+    def _start_container(self, image: str) -> bool:
+        name = f"{WARM_CONTAINER_NAME_PREFIX}{secrets.token_hex(6)}"
+        container = None
+        try:
+            port = self._acquire_port(name)
+            container = WarmContainer(name=name, image=image, port=port)
+            spec = self._spec_factory(image, name, port)
+            spec.labels[WARM_POOL_LABEL] = "true"
+            self._client.run_container(spec)
+
+            if not self._wait_ready(port):
+                logger.warning(
+                    f"Warm container {name} not ready within {self.ready_timeout}s"
+                )
+                self._remove(container)
+                return False
+
+            with self._lock:
+                if not self._stop_event.is_set():
+                    self._idle[image].append(container)
+                    container = None
+            if container is not None:
+                self._remove(container)
+                return False
+            logger.info(f"Warm container {name} ready on port {port}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start warm container for image {image}: {e}")
+            if container is not None:
+                self._remove(container)
+            return False
+        finally:
+            with self._lock:
+                self._starting[image] -= 1
+
+    def _wait_ready(self, port: int) -> bool:
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            if _probe_ready(port):
+                return True
+            if self._stop_event.wait(0.2):
+                return False
+        return False
+
+    def _adopt_leftovers(self) -> None:
+        """
+        Reuse idle containers of a previous run
+
+        Claimed containers can't be told apart from idle ones by their labels,
+        so a container is only adopted if its executor has no agent session.
+        Others are left alone and removed with their task.
+        """
+        for summary in self._client.list_containers(
+            labels=[f"owner={CONTAINER_OWNER}", WARM_POOL_LABEL], all=True
+        ):
+            name = (summary.get("Names") or ["/"])[0].lstrip("/")
+            if summary.get("State") != "running":
+                self._remove_quietly(name)
+                continue
+
+            ports = [
+                p["PublicPort"]
+                for p in summary.get("Ports") or []
+                if p.get("PublicPort")
+            ]
+            image = summary.get("Image")
+            if not ports or _count_sessions(ports[0]) != 0:
+                continue
+            with self._lock:
+                queue = self._idle.get(image)
+                if queue is not None and len(queue) < self.size:
+                    queue.append(WarmContainer(name=name, image=image, port=ports[0]))
+                    logger.info(f"Adopted idle warm container {name}")
+                    continue
+            self._remove_quietly(name)
+
+    def _remove(self, container: WarmContainer) -> None:
+        self._remove_quietly(container.name)
+        self._release_port(container.port)
+
+    def _remove_quietly(self, name: str) -> None:
+        try:
+            self._client.remove_container(name, force=True)
+        except Exception as e:
+            logger.warning(f"Failed to remove warm container {name}: {e}")
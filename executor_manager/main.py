@@ -21,7 +21,11 @@ import uvicorn
 from shared.logger import setup_logger
 from shared.telemetry.config import get_otel_config
 
-from executor_manager.services.sandbox import get_sandbox_manager
+from executor_manager.config.config import (EXECUTOR_DISPATCHER_MODE,
+                                            EXECUTOR_WARM_POOL_SIZE)
+from executor_manager.executors.dispatcher import ExecutorDispatcher
+from executor_manager.services.sandbox import (get_sandbox_manager,
+                                               get_sandbox_proxy)
 from routers.routers import app  # Import the FastAPI app defined in routes.py
 from scheduler.scheduler import TaskScheduler
 
@@ -79,6 +83,13 @@ async def lifespan(app):
             f"Executor binary extraction error: {e}, custom base images may not work"
         )
 
+    # Load executors now so the warm container pool fills before the first task
+    if EXECUTOR_WARM_POOL_SIZE > 0:
+        try:
+            ExecutorDispatcher.get_executor(EXECUTOR_DISPATCHER_MODE)
+        except Exception as e:
+            logger.warning(f"Failed to start warm container pool: {e}")
+
     # Start the task scheduler
     logger.info("Initializing task scheduler...")
     scheduler_instance = TaskScheduler()
@@ -108,11 +119,17 @@ async def lifespan(app):
     if scheduler_instance:
         scheduler_instance.stop()
 
+    # Stop the warm container pool and remove its idle containers
+    ExecutorDispatcher.close_executors()
+
     # Stop SandboxManager garbage collection
     if sandbox_manager:
         logger.info("Stopping SandboxManager...")
         await sandbox_manager.stop_gc_task()
 
+    # Close pooled connections of the sandbox reverse proxy
+    await get_sandbox_proxy().aclose()
+
     # Shutdown OpenTelemetry
     if otel_config.enabled:
         from shared.telemetry.core import shutdown_telemetry
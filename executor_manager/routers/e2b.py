@@ -29,6 +29,7 @@ from shared.logger import setup_logger
 
 from executor_manager.models.sandbox import SandboxStatus
 from executor_manager.services.sandbox import get_sandbox_manager
+from executor_manager.services.sandbox.proxy import get_sandbox_proxy
 
 logger = setup_logger(__name__)
 
@@ -482,6 +483,9 @@ async def delete_sandbox(sandbox_id: str, http_request: Request):
             detail={"code": "termination_failed", "message": message},
         )
 
+    # Stop proxying to the terminated container right away
+    get_sandbox_proxy().route_cache.invalidate(sandbox_id)
+
     # Return 204 No Content
     return JSONResponse(status_code=204, content=None)
 
@@ -694,8 +698,8 @@ async def connect_to_sandbox(sandbox_id: str, http_request: Request):
 async def _find_sandbox_by_e2b_id(manager, e2b_sandbox_id: str):
     """Find sandbox by E2B sandbox ID in metadata.
 
-    Searches through active sandboxes for one with matching e2b_sandbox_id
-    in metadata.
+    Looks up the active sandbox with matching e2b_sandbox_id in the
+    repository's E2B index.
 
     Args:
         manager: SandboxManager instance
@@ -704,12 +708,4 @@ async def _find_sandbox_by_e2b_id(manager, e2b_sandbox_id: str):
     Returns:
         Sandbox if found, None otherwise
     """
-    repository = manager._repository
-    sandbox_ids = repository.get_active_sandbox_ids()
-
-    for sandbox_id in sandbox_ids:
-        sandbox = repository.load_sandbox(sandbox_id)
-        if sandbox and sandbox.metadata.get("e2b_sandbox_id") == e2b_sandbox_id:
-            return sandbox
-
-    return None
+    return manager._repository.find_sandbox_by_e2b_id(e2b_sandbox_id)
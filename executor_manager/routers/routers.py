@@ -23,6 +23,7 @@ from shared.models.task import TasksRequest
 from shared.telemetry.config import get_otel_config
 from shared.telemetry.context import (set_request_context, set_task_context,
                                       set_user_context)
+from shared.utils.progress_delta import RESYNC_KEY
 
 from executor_manager.common.config import ROUTE_PREFIX
 from executor_manager.config.config import EXECUTOR_DISPATCHER_MODE
@@ -322,10 +323,14 @@ async def callback_handler(request: CallbackRequest, http_request: Request):
                 detail=f"Failed to update backend task status for task {request.task_id}: {result}",
             )
         logger.info(f"Successfully processed callback for task {request.task_id}")
-        return {
+        response = {
             "status": "success",
             "message": f"Successfully processed callback for task {request.task_id}",
         }
+        # Pass the backend's request for a full progress resync to the executor
+        if isinstance(result, dict) and result.get(RESYNC_KEY):
+            response[RESYNC_KEY] = True
+        return response
     except HTTPException:
         raise
     except Exception as e:
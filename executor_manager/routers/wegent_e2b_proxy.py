@@ -14,6 +14,9 @@ This allows deployments without wildcard DNS and certificates.
 
 For subagent tasks (metadata.task_type == "subagent"), requests are forwarded
 to the existing executor task dispatch endpoint (/api/tasks/execute).
+
+Other requests go through the pooled streaming reverse proxy in
+services/sandbox/proxy.py, which also relays WebSocket connections.
 """
 
 import json
@@ -21,12 +24,13 @@ import os
 import time
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, WebSocket
 from fastapi.responses import StreamingResponse
 from shared.logger import setup_logger
 
 from executor_manager.common.config import ROUTE_PREFIX, get_config
 from executor_manager.services.sandbox import get_sandbox_manager
+from executor_manager.services.sandbox.proxy import get_sandbox_proxy
 
 logger = setup_logger(__name__)
 
@@ -36,8 +40,8 @@ router = APIRouter(tags=["sandbox-proxy"])
 async def _find_sandbox_by_e2b_id(manager, e2b_sandbox_id: str):
     """Find sandbox by E2B sandbox ID in metadata.
 
-    Searches through active sandboxes for one with matching e2b_sandbox_id
-    in metadata.
+    Looks up the active sandbox with matching e2b_sandbox_id in the
+    repository's E2B index.
 
     Args:
         manager: SandboxManager instance
@@ -46,26 +50,26 @@ async def _find_sandbox_by_e2b_id(manager, e2b_sandbox_id: str):
     Returns:
         Sandbox if found, None otherwise
     """
-    repository = manager._repository
-    sandbox_ids = repository.get_active_sandbox_ids()
-
-    for sandbox_id in sandbox_ids:
-        sandbox = repository.load_sandbox(sandbox_id)
-        if sandbox and sandbox.metadata.get("e2b_sandbox_id") == e2b_sandbox_id:
-            return sandbox
-
-    return None
+    return manager._repository.find_sandbox_by_e2b_id(e2b_sandbox_id)
 
 
 async def _get_sandbox_info(sandbox_id: str) -> tuple:
     """Get sandbox info including base_url and metadata.
 
+    Resolved sandboxes are cached for a few seconds so bursts of proxied
+    requests don't hit Redis each time.
+
     Args:
         sandbox_id: E2B sandbox UUID
 
     Returns:
         Tuple of (base_url, sandbox) for the container
     """
+    route_cache = get_sandbox_proxy().route_cache
+    sandbox = route_cache.get(sandbox_id)
+    if sandbox is not None:
+        return sandbox.base_url, sandbox
+
     manager = get_sandbox_manager()
 
     # Find sandbox by e2b_sandbox_id
@@ -91,9 +95,17 @@ async def _get_sandbox_info(sandbox_id: str) -> tuple:
             },
         )
 
+    route_cache.put(sandbox_id, sandbox)
     return base_url, sandbox
 
 
+def _build_target_url(base_url: str, path: str, query_string: str) -> str:
+    target_url = f"{base_url}/{path}"
+    if query_string:
+        target_url = f"{target_url}?{query_string}"
+    return target_url
+
+
 @router.api_route(
     "/{sandbox_id}/{port:int}/{path:path}",
     methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"],
@@ -138,83 +150,25 @@ async def proxy_to_sandbox(sandbox_id: str, port: int, path: str, request: Reque
             f"[SandboxProxy] Sandbox metadata: task_type={task_type}, is_subagent={is_subagent}"
         )
 
-        # Read request body
-        body = await request.body()
-
         # For subagent tasks, transform the request for executor's task dispatch endpoint
         if is_subagent and path == "execute" and request.method == "POST":
+            body = await request.body()
             return await _proxy_subagent_execute(base_url, sandbox, body, request)
 
         # Regular proxy for non-subagent tasks or non-execute paths
-        target_url = f"{base_url}/{path}"
-
-        # Get query string
-        query_string = str(request.query_params)
-        if query_string:
-            target_url = f"{target_url}?{query_string}"
+        target_url = _build_target_url(base_url, path, request.url.query)
 
         logger.info(f"[SandboxProxy] Proxying {request.method} {path} -> {target_url}")
 
-        # Forward headers (exclude hop-by-hop headers)
-        excluded_headers = {
-            "host",
-            "connection",
-            "keep-alive",
-            "proxy-authenticate",
-            "proxy-authorization",
-            "te",
-            "trailers",
-            "transfer-encoding",
-            "upgrade",
-        }
-        headers = {
-            key: value
-            for key, value in request.headers.items()
-            if key.lower() not in excluded_headers
-        }
-
-        # Make request to container
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-            )
-
-        # Check if response is streaming
-        content_type = response.headers.get("content-type", "")
-        is_streaming = (
-            "text/event-stream" in content_type
-            or "application/x-ndjson" in content_type
-            or response.headers.get("transfer-encoding") == "chunked"
-        )
-
-        if is_streaming:
-            # For streaming responses, return StreamingResponse
-            async def stream_response():
-                async for chunk in response.aiter_bytes():
-                    yield chunk
-
-            return StreamingResponse(
-                stream_response(),
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=content_type,
-            )
-        else:
-            # For regular responses, return directly
-            return StreamingResponse(
-                iter([response.content]),
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=content_type or "application/json",
-            )
+        # Stream request and response through pooled keep-alive connections
+        return await get_sandbox_proxy().forward(request, target_url)
 
     except HTTPException:
         raise
     except httpx.ConnectError as e:
         logger.error(f"[SandboxProxy] Connection failed to sandbox {sandbox_id}: {e}")
+        # The container may have moved or gone; resolve it again next time
+        get_sandbox_proxy().route_cache.invalidate(sandbox_id)
         raise HTTPException(
             status_code=503,
             detail={
@@ -236,6 +190,47 @@ async def proxy_to_sandbox(sandbox_id: str, port: int, path: str, request: Reque
         )
 
 
+@router.websocket("/{sandbox_id}/{port:int}/{path:path}")
+async def proxy_websocket_to_sandbox(
+    websocket: WebSocket, sandbox_id: str, port: int, path: str
+):
+    """Proxy WebSocket connections to sandbox container.
+
+    The connection is upgraded on the container side first and only
+    accepted if the container accepts it. Messages are then relayed both
+    ways until either side closes.
+
+    URL format: {ROUTE_PREFIX}/e2b/proxy/<sandboxID>/<port>/<path>
+
+    Args:
+        websocket: Incoming WebSocket connection
+        sandbox_id: E2B sandbox UUID
+        port: Target port inside container
+        path: Path to forward to container
+    """
+    logger.info(
+        f"[SandboxProxy] WebSocket request received: sandbox_id={sandbox_id}, port={port}, path={path}"
+    )
+
+    try:
+        base_url, _ = await _get_sandbox_info(sandbox_id)
+    except HTTPException as e:
+        logger.warning(f"[SandboxProxy] WebSocket rejected: {e.detail}")
+        await websocket.close(code=1008)
+        return
+
+    target_url = _build_target_url(base_url, path, websocket.url.query)
+    try:
+        await get_sandbox_proxy().forward_websocket(websocket, target_url)
+    except httpx.HTTPError as e:
+        logger.error(
+            f"[SandboxProxy] WebSocket connection failed to sandbox {sandbox_id}: {e}"
+        )
+        if isinstance(e, httpx.ConnectError):
+            get_sandbox_proxy().route_cache.invalidate(sandbox_id)
+        await websocket.close(code=1011)
+
+
 async def _proxy_subagent_execute(
     base_url: str, sandbox, body: bytes, _request: Request
 ):
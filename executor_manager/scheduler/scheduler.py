@@ -11,6 +11,7 @@ Scheduler module, responsible for periodic task execution
 """
 
 import os
+import threading
 import time
 
 import pytz
@@ -27,6 +28,7 @@ from executor_manager.config.config import (EXECUTOR_DISPATCHER_MODE,
                                             OFFLINE_TASK_EVENING_HOURS,
                                             OFFLINE_TASK_MORNING_HOURS,
                                             SCHEDULER_SLEEP_TIME,
+                                            TASK_DISPATCH_WAIT,
                                             TASK_FETCH_INTERVAL)
 from executor_manager.executors.dispatcher import ExecutorDispatcher
 from executor_manager.tasks.task_processor import TaskProcessor
@@ -42,6 +44,8 @@ class TaskScheduler:
         self.api_client = TaskApiClient()
         self.task_processor = TaskProcessor()
         self.running = False
+        self.online_dispatch_thread = None
+        self.online_slots_available = False
         self.max_concurrent_tasks = int(os.getenv("MAX_CONCURRENT_TASKS", "30"))
         self.max_offline_concurrent_tasks = int(os.getenv("MAX_OFFLINE_CONCURRENT_TASKS", "10"))
 
@@ -73,8 +77,16 @@ class TaskScheduler:
         tracer_name="executor_manager.scheduler",
         attributes={"task.type": "online", "scheduler.job": "fetch_online_tasks"},
     )
-    def fetch_online_and_process_tasks(self):
-        """Fetch and process online tasks"""
+    def fetch_online_and_process_tasks(self, wait=0):
+        """Fetch and process online tasks
+
+        Args:
+            wait: Long-poll timeout in seconds passed to the dispatch API
+
+        Returns:
+            bool: True if tasks were fetched successfully (or there was nothing to fetch)
+        """
+        self.online_slots_available = False
         executor_count_result = ExecutorDispatcher.get_executor(EXECUTOR_DISPATCHER_MODE).get_executor_count(
             "aigc.weibo.com/task-type=online"
         )
@@ -100,11 +112,13 @@ class TaskScheduler:
             set_span_attribute("task.skip_reason", "no_available_slots")
             return True
 
+        self.online_slots_available = True
         self.api_client.update_fetch_params(limit=available_slots)
         logger.info(f"Fetching up to {available_slots} online tasks")
         set_span_attribute("task.fetch_limit", available_slots)
+        set_span_attribute("task.fetch_wait", wait)
 
-        success, result = self.api_client.fetch_tasks()
+        success, result = self.api_client.fetch_tasks(wait=wait)
         logger.info(f"Online tasks fetch result: success={success}, data={result}")
 
         if success:
@@ -212,17 +226,36 @@ class TaskScheduler:
                         },
                     )
 
+    def online_dispatch_loop(self):
+        """Long-poll the dispatch API for online tasks
+
+        The backend holds each request until a task is queued, so new tasks are
+        picked up immediately instead of on the next polling interval. Without
+        free executor slots, or after a failed request, wait one interval.
+        """
+        logger.info(f"Online task dispatch loop started, long-poll wait {TASK_DISPATCH_WAIT} seconds")
+        while self.running:
+            try:
+                success = self.fetch_online_and_process_tasks(wait=TASK_DISPATCH_WAIT)
+            except Exception as e:
+                logger.error(f"Online task dispatch failed: {e}")
+                success = False
+
+            if not success or not self.online_slots_available:
+                time.sleep(TASK_FETCH_INTERVAL)
+
     def setup_schedule(self):
         """Setup schedule plan"""
         logger.info(f"Set task fetch interval to {TASK_FETCH_INTERVAL} seconds")
-        
-        self.scheduler.add_job(
-            self.fetch_online_and_process_tasks,
-            'interval',
-            seconds=TASK_FETCH_INTERVAL,
-            id='fetch_online_tasks',
-            name='fetch_online_tasks'
-        )
+
+        if TASK_DISPATCH_WAIT <= 0:
+            self.scheduler.add_job(
+                self.fetch_online_and_process_tasks,
+                'interval',
+                seconds=TASK_FETCH_INTERVAL,
+                id='fetch_online_tasks',
+                name='fetch_online_tasks'
+            )
         
         # Evening time range, execute every TASK_FETCH_INTERVAL seconds
         self.scheduler.add_job(
@@ -256,6 +289,14 @@ class TaskScheduler:
         
         try:
             self.scheduler.start()
+
+            if TASK_DISPATCH_WAIT > 0:
+                self.online_dispatch_thread = threading.Thread(
+                    target=self.online_dispatch_loop,
+                    name="online-task-dispatch",
+                    daemon=True,
+                )
+                self.online_dispatch_thread.start()
             
             while self.running:
                 time.sleep(SCHEDULER_SLEEP_TIME)
@@ -7,12 +7,16 @@
 This module handles executor heartbeat management:
 - Storing heartbeat timestamps in Redis
 - Checking heartbeat timeout to detect executor crashes
+- Tracking heartbeat deadlines so sweeps only read overdue sandboxes
+- Publishing a container's first heartbeat as a readiness signal
 """
 
+import asyncio
 import os
 import threading
 import time
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set
 
 import redis
 from shared.logger import setup_logger
@@ -23,6 +27,13 @@ logger = setup_logger(__name__)
 
 # Redis key pattern
 SANDBOX_HEARTBEAT_KEY = "sandbox:heartbeat:{sandbox_id}"  # Key for heartbeat timestamp
+# ZSet of running sandboxes, score = time by which the next heartbeat is due
+HEARTBEAT_DEADLINES_ZSET = "sandbox:heartbeat:deadlines"
+# Pub/Sub channel announcing the first heartbeat of a container
+SANDBOX_READY_CHANNEL = "sandbox:ready"
+
+# Keys read per pipeline round trip
+PIPELINE_BATCH_SIZE = 500
 
 # Heartbeat configuration
 # Key TTL should be slightly longer than heartbeat interval to avoid false positives
@@ -91,8 +102,21 @@ class HeartbeatManager:
             key = SANDBOX_HEARTBEAT_KEY.format(sandbox_id=sandbox_id)
             timestamp = time.time()
 
+            pipe = self._sync_client.pipeline(transaction=False)
+            pipe.get(key)
             # Set heartbeat timestamp with TTL
-            self._sync_client.setex(key, HEARTBEAT_KEY_TTL, str(timestamp))
+            pipe.setex(key, HEARTBEAT_KEY_TTL, str(timestamp))
+            # Push the deadline of sandboxes the sweep is tracking
+            pipe.zadd(
+                HEARTBEAT_DEADLINES_ZSET,
+                {sandbox_id: timestamp + HEARTBEAT_TIMEOUT},
+                xx=True,
+            )
+            previous, _, _ = pipe.execute()
+
+            if previous is None:
+                # First heartbeat (or first after a gap): the container is up
+                self._sync_client.publish(SANDBOX_READY_CHANNEL, sandbox_id)
 
             logger.debug(
                 f"[HeartbeatManager] Heartbeat updated: sandbox_id={sandbox_id}"
@@ -161,8 +185,81 @@ class HeartbeatManager:
             logger.error(f"[HeartbeatManager] Failed to get last heartbeat: {e}")
             return None
 
+    def get_last_heartbeats(self, sandbox_ids: List[str]) -> Dict[str, float]:
+        """Get the last heartbeat timestamps of many sandboxes.
+
+        Reads are pipelined, PIPELINE_BATCH_SIZE keys per round trip.
+
+        Args:
+            sandbox_ids: Sandbox IDs
+
+        Returns:
+            Dict of sandbox ID to last heartbeat timestamp, for sandboxes
+            that have one
+        """
+        if self._sync_client is None:
+            return {}
+
+        heartbeats = {}
+        try:
+            for start in range(0, len(sandbox_ids), PIPELINE_BATCH_SIZE):
+                batch = sandbox_ids[start : start + PIPELINE_BATCH_SIZE]
+                pipe = self._sync_client.pipeline(transaction=False)
+                for sandbox_id in batch:
+                    pipe.get(SANDBOX_HEARTBEAT_KEY.format(sandbox_id=sandbox_id))
+                for sandbox_id, timestamp_str in zip(batch, pipe.execute()):
+                    if timestamp_str is not None:
+                        heartbeats[sandbox_id] = float(timestamp_str)
+        except Exception as e:
+            logger.error(f"[HeartbeatManager] Failed to get last heartbeats: {e}")
+        return heartbeats
+
+    def track_deadlines(
+        self, deadlines: Dict[str, float], only_new: bool = False
+    ) -> bool:
+        """Set the times by which the next heartbeats of sandboxes are due.
+
+        Args:
+            deadlines: Dict of sandbox ID to Unix timestamp of the deadline
+            only_new: Only set deadlines of sandboxes that aren't tracked yet
+
+        Returns:
+            True if the command succeeded
+        """
+        if self._sync_client is None:
+            return False
+        if not deadlines:
+            return True
+
+        try:
+            self._sync_client.zadd(HEARTBEAT_DEADLINES_ZSET, deadlines, nx=only_new)
+            return True
+        except Exception as e:
+            logger.error(f"[HeartbeatManager] Failed to track deadlines: {e}")
+            return False
+
+    def get_overdue_sandbox_ids(self, now: Optional[float] = None) -> List[str]:
+        """Get sandboxes whose heartbeat deadline has passed.
+
+        Args:
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            List of sandbox IDs
+        """
+        if self._sync_client is None:
+            return []
+
+        try:
+            return self._sync_client.zrangebyscore(
+                HEARTBEAT_DEADLINES_ZSET, min=0, max=now or time.time()
+            )
+        except Exception as e:
+            logger.error(f"[HeartbeatManager] Failed to get overdue sandboxes: {e}")
+            return []
+
     def delete_heartbeat(self, sandbox_id: str) -> bool:
-        """Delete heartbeat key for a sandbox.
+        """Delete heartbeat key and deadline for a sandbox.
 
         Args:
             sandbox_id: Sandbox ID
@@ -175,15 +272,116 @@ class HeartbeatManager:
 
         try:
             key = SANDBOX_HEARTBEAT_KEY.format(sandbox_id=sandbox_id)
-            self._sync_client.delete(key)
+            pipe = self._sync_client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.zrem(HEARTBEAT_DEADLINES_ZSET, sandbox_id)
+            pipe.execute()
             return True
         except Exception as e:
             logger.error(f"[HeartbeatManager] Failed to delete heartbeat: {e}")
             return False
 
 
-# Global singleton instance
+class HeartbeatListener:
+    """Wakes up coroutines waiting for a container's first heartbeat.
+
+    Heartbeats may be received by any executor_manager replica, so the
+    first heartbeat is published on SANDBOX_READY_CHANNEL and every replica
+    listens to it with one Pub/Sub connection.
+    """
+
+    def __init__(self):
+        """Initialize the listener."""
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._subscribed: Optional[asyncio.Event] = None
+
+    @asynccontextmanager
+    async def watch(self, sandbox_id: str) -> AsyncIterator[asyncio.Event]:
+        """Watch for the first heartbeat of a sandbox.
+
+        The event is registered before the context is entered, so a
+        heartbeat arriving right after a readiness check isn't missed.
+
+        Args:
+            sandbox_id: Sandbox ID
+
+        Yields:
+            Event set when the heartbeat is published
+        """
+        event = asyncio.Event()
+        self._waiters.setdefault(sandbox_id, set()).add(event)
+        try:
+            await self._ensure_started()
+            yield event
+        finally:
+            waiters = self._waiters.get(sandbox_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[sandbox_id]
+
+    def notify(self, sandbox_id: str) -> None:
+        """Wake up waiters of a sandbox."""
+        for event in self._waiters.get(sandbox_id, ()):
+            event.set()
+
+    async def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._subscribed = asyncio.Event()
+            self._task = asyncio.create_task(self._listen())
+        if self._subscribed.is_set():
+            return
+
+        # Don't wait long if Redis is unavailable; callers fall back to polling
+        subscribed = asyncio.create_task(self._subscribed.wait())
+        await asyncio.wait(
+            {subscribed, self._task}, timeout=2.0, return_when=asyncio.FIRST_COMPLETED
+        )
+        subscribed.cancel()
+
+    async def _listen(self) -> None:
+        from executor_manager.common.redis_factory import RedisClientFactory
+
+        client = await RedisClientFactory.get_async_client()
+        if client is None:
+            logger.warning("[HeartbeatListener] Redis unavailable, not listening")
+            return
+
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(SANDBOX_READY_CHANNEL)
+            self._subscribed.set()
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    self.notify(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[HeartbeatListener] Listener stopped: {e}")
+        finally:
+            try:
+                await pubsub.reset()
+            except Exception:
+                pass
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+
+# Global singleton instances
 _heartbeat_manager: Optional[HeartbeatManager] = None
+_heartbeat_listener: Optional[HeartbeatListener] = None
 
 
 def get_heartbeat_manager() -> HeartbeatManager:
@@ -196,3 +394,15 @@ def get_heartbeat_manager() -> HeartbeatManager:
     if _heartbeat_manager is None:
         _heartbeat_manager = HeartbeatManager.get_instance()
     return _heartbeat_manager
+
+
+def get_heartbeat_listener() -> HeartbeatListener:
+    """Get the global HeartbeatListener instance.
+
+    Returns:
+        The HeartbeatListener singleton
+    """
+    global _heartbeat_listener
+    if _heartbeat_listener is None:
+        _heartbeat_listener = HeartbeatListener()
+    return _heartbeat_listener
@@ -14,6 +14,7 @@ Public API:
     - SandboxManager: Main service for sandbox operations
     - get_sandbox_manager(): Get the singleton SandboxManager instance
     - SandboxScheduler: Background scheduler for sandbox maintenance
+    - SandboxProxy: Pooled streaming reverse proxy to sandbox containers
 """
 
 from executor_manager.services.sandbox.execution_runner import (
@@ -22,6 +23,8 @@ from executor_manager.services.sandbox.health_checker import (
     ContainerHealthChecker, get_container_health_checker)
 from executor_manager.services.sandbox.manager import (SandboxManager,
                                                        get_sandbox_manager)
+from executor_manager.services.sandbox.proxy import (SandboxProxy,
+                                                     get_sandbox_proxy)
 from executor_manager.services.sandbox.repository import (
     SandboxRepository, get_sandbox_repository)
 from executor_manager.services.sandbox.scheduler import SandboxScheduler
@@ -36,4 +39,6 @@ __all__ = [
     "get_execution_runner",
     "SandboxRepository",
     "get_sandbox_repository",
+    "SandboxProxy",
+    "get_sandbox_proxy",
 ]
@@ -7,25 +7,25 @@
 This service handles:
 - Sandbox creation and termination
 - Execution management within sandboxes
-- Health monitoring and garbage collection
+- Health monitoring and garbage collection, sharded across replicas
 - Redis-based state persistence
 """
 
 import asyncio
-import os
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from shared.logger import setup_logger
 
 from executor_manager.common.config import get_config
-from executor_manager.common.distributed_lock import get_distributed_lock
 from executor_manager.common.singleton import SingletonMeta
+from executor_manager.common.sweep_shard import SweepShard
 from executor_manager.config.config import EXECUTOR_DISPATCHER_MODE
 from executor_manager.executors.dispatcher import ExecutorDispatcher
 from executor_manager.models.sandbox import (Execution, ExecutionStatus,
                                              Sandbox, SandboxStatus)
-from executor_manager.services.heartbeat_manager import get_heartbeat_manager
+from executor_manager.services.heartbeat_manager import (
+    HEARTBEAT_TIMEOUT, get_heartbeat_listener, get_heartbeat_manager)
 from executor_manager.services.sandbox.execution_runner import \
     get_execution_runner
 from executor_manager.services.sandbox.health_checker import \
@@ -60,6 +60,10 @@ class SandboxManager(metaclass=SingletonMeta):
         self._execution_runner = get_execution_runner()
         self._scheduler: Optional["SandboxScheduler"] = None
         self._shutting_down = False
+        # Heartbeat checks and GC are split across replicas by sandbox ID
+        self._sweep_shard = SweepShard(
+            "sandbox", self._config.timeout.sweep_member_ttl
+        )
 
     # =========================================================================
     # Sandbox Lifecycle
@@ -195,7 +199,9 @@ class SandboxManager(metaclass=SingletonMeta):
         sandbox.container_name = container_name
 
         # Wait for container to be ready and get base_url
-        base_url = await self._wait_for_container_ready(executor, container_name)
+        base_url = await self._wait_for_container_ready(
+            executor, container_name, sandbox_id=sandbox.sandbox_id
+        )
         if base_url is None:
             return f"Container {container_name} failed to become ready"
 
@@ -208,47 +214,81 @@ class SandboxManager(metaclass=SingletonMeta):
         self,
         executor,
         container_name: str,
-        max_retries: int = 30,
-        interval: float = 1.0,
+        sandbox_id: Optional[str] = None,
+        timeout: float = 30.0,
     ) -> Optional[str]:
         """Wait for container to be ready and return base_url.
 
+        The container announces itself with its first heartbeat. Until then
+        the address and health are only probed every
+        container_ready_poll_interval; once it has sent one they are
+        retried every container_ready_retry_interval.
+
         Args:
             executor: Executor instance
             container_name: Container/Pod name
-            max_retries: Maximum number of retries
-            interval: Interval between retries in seconds
+            sandbox_id: Sandbox ID the container sends heartbeats for
+            timeout: Maximum time to wait in seconds
 
         Returns:
             base_url if ready, None otherwise
         """
-        for i in range(max_retries):
-            result = await asyncio.to_thread(
-                executor.get_container_address, container_name
-            )
-            if result.get("status") == "success":
-                base_url = result.get("base_url")
+        timeout_config = self._config.timeout
+        deadline = time.monotonic() + timeout
+        heartbeat_mgr = get_heartbeat_manager()
+
+        async with get_heartbeat_listener().watch(sandbox_id or "") as heartbeat:
+            attempt = 0
+            while True:
+                attempt += 1
+                base_url = await self._probe_container(executor, container_name)
                 if base_url:
-                    # Check if container is healthy
-                    is_healthy = await self._check_container_health(base_url)
-                    if is_healthy:
-                        logger.info(
-                            f"[SandboxManager] Container ready: {container_name}, "
-                            f"base_url={base_url}"
-                        )
-                        return base_url
+                    logger.info(
+                        f"[SandboxManager] Container ready: {container_name}, "
+                        f"base_url={base_url}"
+                    )
+                    return base_url
 
-            logger.debug(
-                f"[SandboxManager] Waiting for container {container_name} to be ready "
-                f"(attempt {i + 1}/{max_retries})"
-            )
-            await asyncio.sleep(interval)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                logger.debug(
+                    f"[SandboxManager] Waiting for container {container_name} to be ready "
+                    f"(attempt {attempt})"
+                )
+                if not heartbeat.is_set() and sandbox_id:
+                    # The heartbeat may have been published before we subscribed
+                    if heartbeat_mgr.get_last_heartbeat(sandbox_id) is not None:
+                        heartbeat.set()
+                if heartbeat.is_set():
+                    await asyncio.sleep(
+                        min(timeout_config.container_ready_retry_interval, remaining)
+                    )
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        heartbeat.wait(),
+                        min(timeout_config.container_ready_poll_interval, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    pass
 
         logger.error(
             f"[SandboxManager] Container {container_name} failed to become ready"
         )
         return None
 
+    async def _probe_container(self, executor, container_name: str) -> Optional[str]:
+        """Return the container base_url if it is reachable and healthy."""
+        result = await asyncio.to_thread(executor.get_container_address, container_name)
+        if result.get("status") != "success":
+            return None
+        base_url = result.get("base_url")
+        if base_url and await self._check_container_health(base_url):
+            return base_url
+        return None
+
     async def _check_container_health(self, base_url: str) -> bool:
         """Check if container is healthy via HTTP.
 
@@ -710,27 +750,14 @@ class SandboxManager(metaclass=SingletonMeta):
                 f"[SandboxManager] sandbox_id is not numeric, trying e2b_sandbox_id lookup"
             )
 
-        # Fallback: search by e2b_sandbox_id in metadata
-        sandbox_ids = self._repository.get_active_sandbox_ids()
-        logger.info(
-            f"[SandboxManager] Searching in {len(sandbox_ids)} active sandboxes"
-        )
-
-        for sid in sandbox_ids:
-            sandbox = self._repository.load_sandbox(sid)
-            if sandbox:
-                e2b_id = sandbox.metadata.get("e2b_sandbox_id")
-                logger.debug(
-                    f"[SandboxManager] Checking sandbox sid={sid}, e2b_sandbox_id={e2b_id}"
-                )
-                if e2b_id == sandbox_id:
-                    # Found matching sandbox, load execution by its task_id
-                    task_id = sandbox.metadata.get("task_id")
-                    logger.info(
-                        f"[SandboxManager] Found matching sandbox, task_id={task_id}"
-                    )
-                    if task_id:
-                        return self._repository.load_execution(int(task_id), subtask_id)
+        # Fallback: look up by e2b_sandbox_id in metadata
+        sandbox = self._repository.find_sandbox_by_e2b_id(sandbox_id)
+        if sandbox:
+            # Found matching sandbox, load execution by its task_id
+            task_id = sandbox.metadata.get("task_id")
+            logger.info(f"[SandboxManager] Found matching sandbox, task_id={task_id}")
+            if task_id:
+                return self._repository.load_execution(int(task_id), subtask_id)
 
         logger.info(
             f"[SandboxManager] No matching sandbox found for sandbox_id={sandbox_id}"
@@ -758,15 +785,13 @@ class SandboxManager(metaclass=SingletonMeta):
         except ValueError:
             pass
 
-        # Fallback: search by e2b_sandbox_id in metadata
-        sandbox_ids = self._repository.get_active_sandbox_ids()
-        for sid in sandbox_ids:
-            sandbox = self._repository.load_sandbox(sid)
-            if sandbox and sandbox.metadata.get("e2b_sandbox_id") == sandbox_id:
-                # Found matching sandbox, list executions by its task_id
-                task_id = sandbox.metadata.get("task_id")
-                if task_id:
-                    return self._repository.list_executions(str(task_id))
+        # Fallback: look up by e2b_sandbox_id in metadata
+        sandbox = self._repository.find_sandbox_by_e2b_id(sandbox_id)
+        if sandbox:
+            # Found matching sandbox, list executions by its task_id
+            task_id = sandbox.metadata.get("task_id")
+            if task_id:
+                return self._repository.list_executions(str(task_id))
 
         return [], f"Sandbox {sandbox_id} not found"
 
@@ -793,6 +818,9 @@ class SandboxManager(metaclass=SingletonMeta):
         if self._scheduler is not None:
             await self._scheduler.stop()
             self._scheduler = None
+        await get_heartbeat_listener().stop()
+        # Let the other replicas take over this replica's sandboxes right away
+        self._sweep_shard.leave()
 
     # Legacy method names for backward compatibility
     async def start_gc_task(self) -> None:
@@ -808,44 +836,59 @@ class SandboxManager(metaclass=SingletonMeta):
     # =========================================================================
 
     async def _check_heartbeats(self) -> None:
-        """Check heartbeat status for all active sandboxes.
+        """Check heartbeats of running sandboxes past their heartbeat deadline.
 
-        If a sandbox has not received a heartbeat within timeout,
-        mark it as failed and update execution status.
+        Only sandboxes whose deadline passed are read, with pipelined reads,
+        and only those in this replica's shard. If a sandbox has not received
+        a heartbeat within timeout, mark it as failed and update execution
+        status.
         """
-        task_ids = self._repository.get_active_sandbox_ids()
+        if not self._repository.heartbeat_deadlines_rebuilt:
+            self._repository.rebuild_heartbeat_deadlines()
+
+        heartbeat_mgr = get_heartbeat_manager()
+        now = time.time()
+        task_ids = self._sweep_shard.select(heartbeat_mgr.get_overdue_sandbox_ids(now))
         if not task_ids:
             return
 
-        heartbeat_mgr = get_heartbeat_manager()
-        # Grace period from environment, default 30s (container startup time)
-        grace_period = int(os.getenv("HEARTBEAT_GRACE_PERIOD", "30"))
+        sandboxes = self._repository.load_sandboxes(task_ids)
+        heartbeats = heartbeat_mgr.get_last_heartbeats(task_ids)
+        grace_period = self._config.timeout.heartbeat_grace_period
+        # Sandboxes found alive get a new deadline, written in one command
+        deadlines: Dict[str, float] = {}
 
         for task_id_str in task_ids:
             try:
-                sandbox = self._repository.load_sandbox(task_id_str)
+                sandbox = sandboxes.get(task_id_str)
                 if sandbox is None or sandbox.status != SandboxStatus.RUNNING:
+                    heartbeat_mgr.delete_heartbeat(task_id_str)
                     continue
 
-                # Check heartbeat - returns False if key missing or expired
-                if not heartbeat_mgr.check_heartbeat(task_id_str):
-                    # Get last heartbeat time (may be None if key expired)
-                    last_heartbeat = heartbeat_mgr.get_last_heartbeat(task_id_str)
+                last_heartbeat = heartbeats.get(task_id_str)
+                if last_heartbeat is not None and now - last_heartbeat < HEARTBEAT_TIMEOUT:
+                    # Alive; the deadline lagged behind the heartbeat key
+                    deadlines[task_id_str] = last_heartbeat + HEARTBEAT_TIMEOUT
+                    continue
 
-                    # Check if sandbox has been running long enough to expect heartbeat
-                    # Grace period: sandbox needs some time to start sending heartbeats
-                    sandbox_age = time.time() - sandbox.created_at
+                # Grace period: sandbox needs some time to start sending heartbeats
+                sandbox_age = now - sandbox.created_at
+                if sandbox_age <= grace_period:
+                    deadlines[task_id_str] = sandbox.created_at + grace_period
+                    continue
 
-                    if sandbox_age > grace_period:
-                        # Sandbox is old enough - missing heartbeat means dead
-                        # Note: last_heartbeat may be None if key already expired from Redis
-                        logger.warning(
-                            f"[SandboxManager] Heartbeat timeout for sandbox {task_id_str}, "
-                            f"age={sandbox_age:.1f}s, last_heartbeat={last_heartbeat}"
-                        )
-                        await self._handle_executor_dead(
-                            task_id_str, last_heartbeat or sandbox.last_activity_at
-                        )
+                if not self._sweep_shard.claim(f"heartbeat:{task_id_str}"):
+                    continue
+
+                # Sandbox is old enough - missing heartbeat means dead
+                # Note: last_heartbeat may be None if key already expired from Redis
+                logger.warning(
+                    f"[SandboxManager] Heartbeat timeout for sandbox {task_id_str}, "
+                    f"age={sandbox_age:.1f}s, last_heartbeat={last_heartbeat}"
+                )
+                await self._handle_executor_dead(
+                    task_id_str, last_heartbeat or sandbox.last_activity_at
+                )
 
             except Exception as e:
                 logger.debug(
@@ -853,6 +896,8 @@ class SandboxManager(metaclass=SingletonMeta):
                 )
                 continue
 
+        heartbeat_mgr.track_deadlines(deadlines)
+
     async def _handle_executor_dead(
         self, sandbox_id: str, last_heartbeat: float
     ) -> None:
@@ -914,13 +959,17 @@ class SandboxManager(metaclass=SingletonMeta):
             except Exception as e:
                 logger.warning(f"[SandboxManager] Error deleting container: {e}")
 
-    async def _terminate_expired_sandbox(self, task_id_str: str) -> None:
+    async def _terminate_expired_sandbox(
+        self, task_id_str: str, sandbox: Optional[Sandbox] = None
+    ) -> None:
         """Terminate a single expired sandbox.
 
         Args:
             task_id_str: Task ID as string
+            sandbox: Already loaded sandbox, loaded from Redis if not given
         """
-        sandbox = self._repository.load_sandbox(task_id_str)
+        if sandbox is None:
+            sandbox = self._repository.load_sandbox(task_id_str)
         if sandbox is None:
             # Clean up orphaned ZSet entry
             self._repository.remove_from_active_set(task_id_str)
@@ -934,41 +983,42 @@ class SandboxManager(metaclass=SingletonMeta):
         await self.terminate_sandbox(task_id_str)
 
     async def _collect_expired_sandboxes(self) -> None:
-        """Terminate expired sandboxes.
+        """Terminate expired sandboxes in this replica's shard.
 
         Uses repository to efficiently find sandboxes whose last_activity_timestamp
-        is older than the configured TTL.
+        is older than the configured TTL. Each sandbox is claimed before it is
+        terminated, so replicas that disagree on the shard layout while one
+        joins or leaves don't terminate it twice.
         """
-        lock = get_distributed_lock()
-        if not lock.acquire("sandbox_gc", expire_seconds=300):
-            logger.info(
-                "[SandboxManager] Sandbox GC already running on another instance, skipping"
-            )
-            return
+        logger.info("[SandboxManager] Running sandbox GC...")
+        expired_task_ids = self._sweep_shard.select(
+            self._repository.get_expired_sandbox_ids(self._config.timeout.redis_ttl)
+        )
 
-        try:
-            logger.info("[SandboxManager] Running sandbox GC...")
-            expired_task_ids = self._repository.get_expired_sandbox_ids(
-                self._config.timeout.redis_ttl
-            )
+        if not expired_task_ids:
+            logger.info("[SandboxManager] No expired sandboxes found")
+            return
 
-            if not expired_task_ids:
-                logger.info("[SandboxManager] No expired sandboxes found")
-                return
+        logger.info(
+            f"[SandboxManager] Found {len(expired_task_ids)} expired sandboxes to clean up"
+        )
 
-            logger.info(
-                f"[SandboxManager] Found {len(expired_task_ids)} expired sandboxes to clean up"
-            )
+        claimed = [
+            task_id_str
+            for task_id_str in expired_task_ids
+            if self._sweep_shard.claim(f"gc:{task_id_str}", expire_seconds=300)
+        ]
+        sandboxes = self._repository.load_sandboxes(claimed)
 
-            for task_id_str in expired_task_ids:
-                try:
-                    await self._terminate_expired_sandbox(task_id_str)
-                except Exception as e:
-                    logger.warning(
-                        f"[SandboxManager] Failed to terminate expired sandbox {task_id_str}: {e}"
-                    )
-        finally:
-            lock.release("sandbox_gc")
+        for task_id_str in claimed:
+            try:
+                await self._terminate_expired_sandbox(
+                    task_id_str, sandboxes.get(task_id_str)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[SandboxManager] Failed to terminate expired sandbox {task_id_str}: {e}"
+                )
 
 
 def get_sandbox_manager() -> SandboxManager:
@@ -0,0 +1,414 @@
+# SPDX-FileCopyrightText: 2025 WeCode, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Reverse proxy for sandbox containers.
+
+This module forwards HTTP and WebSocket traffic from the E2B private
+protocol proxy router to sandbox containers:
+- A shared HTTP/1.1 keep-alive connection pool, so requests don't pay for
+  a new TCP connection each time
+- Request and response bodies are streamed instead of buffered
+- WebSocket connections are upgraded on the container side and relayed
+  frame by frame
+- Resolved sandbox routes are cached in-process for a short TTL
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import httpx
+from shared.logger import setup_logger
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from executor_manager.common.config import get_config
+from executor_manager.common.singleton import SingletonMeta
+
+logger = setup_logger(__name__)
+
+# Headers that apply to a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "host",
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# WebSocket opcodes (RFC 6455)
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class RouteCache:
+    """Small TTL + LRU cache for resolved sandbox routes."""
+
+    def __init__(self, ttl: float, max_size: int):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_size: Maximum number of entries
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a value."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached value."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+def filter_headers(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Drop hop-by-hop headers, including those listed in Connection."""
+    connection_tokens = set()
+    for key, value in headers:
+        if key.lower() == b"connection":
+            connection_tokens.update(
+                token.strip().lower().decode("latin-1") for token in value.split(b",")
+            )
+    excluded = HOP_BY_HOP_HEADERS | connection_tokens
+    return [
+        (key, value)
+        for key, value in headers
+        if key.lower().decode("latin-1") not in excluded
+    ]
+
+
+class SandboxProxy(metaclass=SingletonMeta):
+    """Pooled streaming reverse proxy to sandbox containers."""
+
+    def __init__(self):
+        """Initialize the proxy."""
+        config = get_config().proxy
+        self._config = config
+        self.route_cache = RouteCache(config.route_cache_ttl, config.route_cache_size)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazy-load the pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._config.max_connections,
+                    max_keepalive_connections=self._config.max_keepalive_connections,
+                    keepalive_expiry=self._config.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    self._config.read_timeout, connect=self._config.connect_timeout
+                ),
+                follow_redirects=False,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.route_cache.clear()
+
+    async def forward(self, request: Request, target_url: str) -> StreamingResponse:
+        """Forward an HTTP request and stream the response back.
+
+        Args:
+            request: Incoming request
+            target_url: Full container URL including query string
+
+        Returns:
+            StreamingResponse relaying the container response
+
+        Raises:
+            httpx.HTTPError: If the container can't be reached
+        """
+        headers = filter_headers(request.headers.raw)
+        has_body = "content-length" in request.headers or (
+            "transfer-encoding" in request.headers
+        )
+        upstream_request = self.client.build_request(
+            request.method,
+            target_url,
+            headers=headers,
+            content=request.stream() if has_body else None,
+        )
+        response = await self.client.send(upstream_request, stream=True)
+
+        async def body():
+            try:
+                # Raw bytes keep Content-Encoding/Content-Length valid
+                async for chunk in response.aiter_raw():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        streaming_response = StreamingResponse(
+            body(),
+            status_code=response.status_code,
+            background=BackgroundTask(response.aclose),
+        )
+        streaming_response.raw_headers = filter_headers(response.headers.raw)
+        return streaming_response
+
+    async def forward_websocket(self, websocket: WebSocket, target_url: str) -> None:
+        """Upgrade a WebSocket connection to the container and relay frames.
+
+        Args:
+            websocket: Incoming WebSocket, not accepted yet
+            target_url: Full container http:// URL including query string
+        """
+        key = base64.b64encode(os.urandom(16)).decode()
+        headers = [
+            (k, v)
+            for k, v in filter_headers(websocket.headers.raw)
+            if not k.lower().startswith(b"sec-websocket-")
+            or k.lower() == b"sec-websocket-protocol"
+        ]
+        headers += [
+            (b"connection", b"Upgrade"),
+            (b"upgrade", b"websocket"),
+            (b"sec-websocket-version", b"13"),
+            (b"sec-websocket-key", key.encode()),
+        ]
+
+        upstream_request = self.client.build_request(
+            "GET", target_url, headers=headers
+        )
+        response = await self.client.send(upstream_request, stream=True)
+        try:
+            expected_accept = base64.b64encode(
+                hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()
+            ).decode()
+            if (
+                response.status_code != 101
+                or response.headers.get("sec-websocket-accept") != expected_accept
+            ):
+                logger.warning(
+                    f"[SandboxProxy] WebSocket upgrade rejected by {target_url}: "
+                    f"status={response.status_code}"
+                )
+                await websocket.close(code=1011)
+                return
+
+            upstream = _WebSocketConnection(response.extensions["network_stream"])
+            await websocket.accept(
+                subprotocol=response.headers.get("sec-websocket-protocol")
+            )
+            await _relay_websocket(websocket, upstream)
+        finally:
+            await response.aclose()
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    if not payload:
+        return payload
+    size = len(payload)
+    key = (mask * (size // 4 + 1))[:size]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(
+        size, "big"
+    )
+
+
+class _WebSocketConnection:
+    """Client side of an upgraded WebSocket connection (RFC 6455 framing)."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer = bytearray()
+        self._write_lock = asyncio.Lock()
+        self.closed = False
+
+    async def _read_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            data = await self._stream.read(65536)
+            if not data:
+                raise ConnectionError("WebSocket connection closed by sandbox")
+            self._buffer.extend(data)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    async def _read_frame(self) -> Tuple[bool, int, bytes]:
+        first, second = await self._read_exact(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self._read_exact(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self._read_exact(8))
+        mask = await self._read_exact(4) if second & 0x80 else None
+        payload = await self._read_exact(length)
+        if mask:
+            payload = _apply_mask(payload, mask)
+        return bool(first & 0x80), first & 0x0F, payload
+
+    async def send(self, opcode: int, payload: bytes) -> None:
+        """Send a single masked frame."""
+        header = bytearray([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header.append(0x80 | length)
+        elif length < 1 << 16:
+            header.append(0x80 | 126)
+            header += struct.pack("!H", length)
+        else:
+            header.append(0x80 | 127)
+            header += struct.pack("!Q", length)
+        mask = os.urandom(4)
+        header += mask
+        async with self._write_lock:
+            await self._stream.write(bytes(header) + _apply_mask(payload, mask))
+
+    async def close(self, code: int = 1000) -> None:
+        """Send a close frame once."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self.send(OP_CLOSE, struct.pack("!H", code))
+        except Exception:
+            pass
+
+    async def receive(self) -> Tuple[int, bytes]:
+        """Receive the next data or close message, answering pings.
+
+        Returns:
+            Tuple of (opcode, payload) where opcode is OP_TEXT, OP_BINARY
+            or OP_CLOSE
+        """
+        message_opcode = None
+        fragments = []
+        while True:
+            fin, opcode, payload = await self._read_frame()
+            if opcode == OP_PING:
+                await self.send(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                return OP_CLOSE, payload
+            if opcode != OP_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(payload)
+            if fin:
+                return message_opcode, b"".join(fragments)
+
+
+def _close_code(code: Optional[int]) -> int:
+    # 1005/1006 are reserved for reporting and can't be sent in a close frame
+    if code is None or code in (1005, 1006) or not 1000 <= code < 5000:
+        return 1000
+    return code
+
+
+async def _relay_websocket(websocket: WebSocket, upstream: _WebSocketConnection):
+    """Relay messages both ways until either side closes."""
+
+    async def client_to_sandbox():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                await upstream.close(_close_code(message.get("code")))
+                return
+            if message.get("text") is not None:
+                await upstream.send(OP_TEXT, message["text"].encode())
+            elif message.get("bytes") is not None:
+                await upstream.send(OP_BINARY, message["bytes"])
+
+    async def sandbox_to_client():
+        while True:
+            opcode, payload = await upstream.receive()
+            if opcode == OP_CLOSE:
+                code = struct.unpack("!H", payload[:2])[0] if len(payload) >= 2 else None
+                await upstream.close(_close_code(code))
+                await websocket.close(code=_close_code(code))
+                return
+            if opcode == OP_TEXT:
+                await websocket.send_text(payload.decode("utf-8"))
+            else:
+                await websocket.send_bytes(payload)
+
+    tasks = [
+        asyncio.create_task(client_to_sandbox()),
+        asyncio.create_task(sandbox_to_client()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(
+                error, (WebSocketDisconnect, ConnectionError)
+            ):
+                logger.warning(f"[SandboxProxy] WebSocket relay error: {error}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if not upstream.closed:
+            await upstream.close()
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+
+def get_sandbox_proxy() -> SandboxProxy:
+    """Get the SandboxProxy singleton instance.
+
+    Returns:
+        SandboxProxy instance
+    """
+    return SandboxProxy()
@@ -12,6 +12,9 @@ Redis Data Structure:
   - __sandbox__ field: Sandbox metadata JSON
   - {subtask_id} fields: Execution data JSON
 - Active Sandboxes ZSet: wegent-sandbox:active (score = last_activity timestamp)
+- E2B Index Hash: wegent-sandbox:e2b-index ({e2b_sandbox_id} -> task_id)
+- Heartbeat Deadlines ZSet: see HEARTBEAT_DEADLINES_ZSET in heartbeat_manager;
+  running sandboxes are tracked from the first save in RUNNING status
 """
 
 import json
@@ -26,6 +29,8 @@ from executor_manager.common.redis_factory import RedisClientFactory
 from executor_manager.common.singleton import SingletonMeta
 from executor_manager.models.sandbox import (Execution, ExecutionStatus,
                                              Sandbox, SandboxStatus)
+from executor_manager.services.heartbeat_manager import (
+    HEARTBEAT_DEADLINES_ZSET, PIPELINE_BATCH_SIZE)
 
 logger = setup_logger(__name__)
 
@@ -33,6 +38,7 @@ logger = setup_logger(__name__)
 SESSION_HASH_PREFIX = "wegent-sandbox-session:"
 SANDBOX_FIELD_NAME = "__sandbox__"
 ACTIVE_SANDBOXES_ZSET = "wegent-sandbox:active"
+E2B_INDEX_HASH = "wegent-sandbox:e2b-index"
 
 
 class SandboxRepository(metaclass=SingletonMeta):
@@ -46,6 +52,8 @@ class SandboxRepository(metaclass=SingletonMeta):
         """Initialize the repository."""
         self._config = get_config()
         self._redis_client: Optional[redis.Redis] = None
+        self._e2b_index_rebuilt = False
+        self._heartbeat_deadlines_rebuilt = False
 
     @property
     def redis_client(self) -> Optional[redis.Redis]:
@@ -102,11 +110,29 @@ class SandboxRepository(metaclass=SingletonMeta):
             # Update active sandboxes ZSet with current timestamp
             self.redis_client.zadd(ACTIVE_SANDBOXES_ZSET, {str(task_id): time.time()})
 
+            e2b_sandbox_id = sandbox.metadata.get("e2b_sandbox_id")
+            if e2b_sandbox_id:
+                self.redis_client.hset(E2B_INDEX_HASH, e2b_sandbox_id, str(task_id))
+
+            # Heartbeat sweeps only look at running sandboxes past their deadline
+            if sandbox.status == SandboxStatus.RUNNING:
+                self.redis_client.zadd(
+                    HEARTBEAT_DEADLINES_ZSET,
+                    {str(task_id): self._initial_heartbeat_deadline(sandbox)},
+                    nx=True,
+                )
+            else:
+                self.redis_client.zrem(HEARTBEAT_DEADLINES_ZSET, str(task_id))
+
             return True
         except Exception as e:
             logger.error(f"[SandboxRepository] Failed to save sandbox: {e}")
             return False
 
+    def _initial_heartbeat_deadline(self, sandbox: Sandbox) -> float:
+        # A new sandbox gets the grace period to send its first heartbeat
+        return sandbox.created_at + self._config.timeout.heartbeat_grace_period
+
     def load_sandbox(self, sandbox_id: str) -> Optional[Sandbox]:
         """Load sandbox by sandbox_id from session Hash.
 
@@ -128,45 +154,89 @@ class SandboxRepository(metaclass=SingletonMeta):
             if sandbox_data_str is None:
                 return None
 
-            sandbox_info = json.loads(sandbox_data_str)
-
-            container_name = sandbox_info["container_name"]
-            base_url = sandbox_info.get("base_url")
-
-            # Determine status: use saved status if available, otherwise infer from base_url
-            saved_status = sandbox_info.get("status")
-            if saved_status:
-                status = SandboxStatus(saved_status)
-            elif base_url:
-                status = SandboxStatus.RUNNING
-            else:
-                status = SandboxStatus.PENDING
-
-            sandbox = Sandbox(
-                sandbox_id=sandbox_id,
-                container_name=container_name,
-                shell_type=sandbox_info["shell_type"],
-                status=status,
-                user_id=sandbox_info["user_id"],
-                user_name=sandbox_info["user_name"],
-                base_url=base_url,
-                created_at=sandbox_info["created_at"],
-                started_at=sandbox_info.get("started_at"),
-                last_activity_at=sandbox_info.get(
-                    "last_activity_at", sandbox_info["created_at"]
-                ),
-                expires_at=sandbox_info.get("expires_at"),
-                error_message=sandbox_info.get("error_message"),
-                metadata=sandbox_info.get("metadata", {}),
-            )
-
-            return sandbox
+            return self._parse_sandbox(sandbox_id, sandbox_data_str)
         except Exception as e:
             logger.error(
                 f"[SandboxRepository] Failed to load sandbox: {e}", exc_info=True
             )
             return None
 
+    def load_sandboxes(self, sandbox_ids: List[str]) -> Dict[str, Sandbox]:
+        """Load many sandboxes with pipelined reads.
+
+        Args:
+            sandbox_ids: Sandbox IDs (task_id strings)
+
+        Returns:
+            Dict of sandbox ID to Sandbox, for sandboxes that exist
+        """
+        if self.redis_client is None:
+            return {}
+
+        sandboxes = {}
+        try:
+            for start in range(0, len(sandbox_ids), PIPELINE_BATCH_SIZE):
+                batch = sandbox_ids[start : start + PIPELINE_BATCH_SIZE]
+                pipe = self.redis_client.pipeline(transaction=False)
+                for sandbox_id in batch:
+                    pipe.hget(f"{SESSION_HASH_PREFIX}{sandbox_id}", SANDBOX_FIELD_NAME)
+                for sandbox_id, data_str in zip(batch, pipe.execute()):
+                    if data_str is None:
+                        continue
+                    try:
+                        sandboxes[sandbox_id] = self._parse_sandbox(sandbox_id, data_str)
+                    except Exception as e:
+                        logger.warning(
+                            f"[SandboxRepository] Failed to parse sandbox {sandbox_id}: {e}"
+                        )
+        except Exception as e:
+            logger.error(f"[SandboxRepository] Failed to load sandboxes: {e}")
+        return sandboxes
+
+    def _parse_sandbox(self, sandbox_id: str, sandbox_data_str: str) -> Sandbox:
+        """Convert the __sandbox__ field to a Sandbox object.
+
+        Args:
+            sandbox_id: Sandbox ID
+            sandbox_data_str: JSON stored in the __sandbox__ field
+
+        Returns:
+            Sandbox object
+        """
+        sandbox_info = json.loads(sandbox_data_str)
+
+        container_name = sandbox_info["container_name"]
+        base_url = sandbox_info.get("base_url")
+
+        # Determine status: use saved status if available, otherwise infer from base_url
+        saved_status = sandbox_info.get("status")
+        if saved_status:
+            status = SandboxStatus(saved_status)
+        elif base_url:
+            status = SandboxStatus.RUNNING
+        else:
+            status = SandboxStatus.PENDING
+
+        sandbox = Sandbox(
+            sandbox_id=sandbox_id,
+            container_name=container_name,
+            shell_type=sandbox_info["shell_type"],
+            status=status,
+            user_id=sandbox_info["user_id"],
+            user_name=sandbox_info["user_name"],
+            base_url=base_url,
+            created_at=sandbox_info["created_at"],
+            started_at=sandbox_info.get("started_at"),
+            last_activity_at=sandbox_info.get(
+                "last_activity_at", sandbox_info["created_at"]
+            ),
+            expires_at=sandbox_info.get("expires_at"),
+            error_message=sandbox_info.get("error_message"),
+            metadata=sandbox_info.get("metadata", {}),
+        )
+
+        return sandbox
+
     def delete_sandbox(self, sandbox_id: str) -> bool:
         """Delete sandbox data from Redis.
 
@@ -181,12 +251,21 @@ class SandboxRepository(metaclass=SingletonMeta):
 
         try:
             task_id = int(sandbox_id)
+            hash_key = f"{SESSION_HASH_PREFIX}{task_id}"
+
+            # Remove from E2B index
+            sandbox_data_str = self.redis_client.hget(hash_key, SANDBOX_FIELD_NAME)
+            if sandbox_data_str:
+                metadata = json.loads(sandbox_data_str).get("metadata") or {}
+                e2b_sandbox_id = metadata.get("e2b_sandbox_id")
+                if e2b_sandbox_id:
+                    self.redis_client.hdel(E2B_INDEX_HASH, e2b_sandbox_id)
 
-            # Remove from active sandboxes ZSet
+            # Remove from active sandboxes and heartbeat deadlines ZSets
             self.redis_client.zrem(ACTIVE_SANDBOXES_ZSET, str(task_id))
+            self.redis_client.zrem(HEARTBEAT_DEADLINES_ZSET, str(task_id))
 
             # Delete entire session Hash
-            hash_key = f"{SESSION_HASH_PREFIX}{task_id}"
             self.redis_client.delete(hash_key)
 
             logger.debug(
@@ -212,6 +291,105 @@ class SandboxRepository(metaclass=SingletonMeta):
             logger.error(f"[SandboxRepository] Failed to get active sandboxes: {e}")
             return []
 
+    def find_sandbox_by_e2b_id(self, e2b_sandbox_id: str) -> Optional[Sandbox]:
+        """Find an active sandbox by the E2B sandbox ID in its metadata.
+
+        Uses the E2B index Hash instead of scanning active sandboxes. The index
+        is rebuilt once per process on the first miss, so sandboxes saved
+        before the index existed are still found.
+
+        Args:
+            e2b_sandbox_id: E2B format sandbox UUID
+
+        Returns:
+            Sandbox if found, None otherwise
+        """
+        if self.redis_client is None:
+            return None
+
+        try:
+            sandbox = self._load_indexed_sandbox(e2b_sandbox_id)
+            if sandbox is None and not self._e2b_index_rebuilt:
+                self.rebuild_e2b_index()
+                sandbox = self._load_indexed_sandbox(e2b_sandbox_id)
+            return sandbox
+        except Exception as e:
+            logger.error(f"[SandboxRepository] Failed to find sandbox by E2B id: {e}")
+            return None
+
+    def _load_indexed_sandbox(self, e2b_sandbox_id: str) -> Optional[Sandbox]:
+        task_id = self.redis_client.hget(E2B_INDEX_HASH, e2b_sandbox_id)
+        if task_id is None:
+            return None
+
+        # Only active sandboxes are addressable by their E2B id
+        if self.redis_client.zscore(ACTIVE_SANDBOXES_ZSET, task_id) is None:
+            return None
+
+        sandbox = self.load_sandbox(task_id)
+        if sandbox is None:
+            # Session Hash expired without delete_sandbox being called
+            self.redis_client.hdel(E2B_INDEX_HASH, e2b_sandbox_id)
+            return None
+        if sandbox.metadata.get("e2b_sandbox_id") != e2b_sandbox_id:
+            return None
+        return sandbox
+
+    def rebuild_e2b_index(self) -> int:
+        """Index the E2B sandbox IDs of all active sandboxes.
+
+        Returns:
+            Number of indexed sandboxes
+        """
+        if self.redis_client is None:
+            return 0
+
+        self._e2b_index_rebuilt = True
+        indexed = 0
+        for sandbox_id in self.get_active_sandbox_ids():
+            sandbox = self.load_sandbox(sandbox_id)
+            e2b_sandbox_id = sandbox.metadata.get("e2b_sandbox_id") if sandbox else None
+            if e2b_sandbox_id:
+                self.redis_client.hset(E2B_INDEX_HASH, e2b_sandbox_id, str(sandbox_id))
+                indexed += 1
+
+        logger.info(f"[SandboxRepository] Rebuilt E2B index: {indexed} sandboxes")
+        return indexed
+
+    def rebuild_heartbeat_deadlines(self) -> int:
+        """Track the heartbeat deadlines of running sandboxes not tracked yet.
+
+        Sandboxes saved before deadlines were tracked are otherwise never
+        checked for heartbeats.
+
+        Returns:
+            Number of newly tracked sandboxes
+        """
+        if self.redis_client is None:
+            return 0
+
+        self._heartbeat_deadlines_rebuilt = True
+        sandboxes = self.load_sandboxes(self.get_active_sandbox_ids())
+        pipe = self.redis_client.pipeline(transaction=False)
+        for sandbox_id, sandbox in sandboxes.items():
+            if sandbox.status == SandboxStatus.RUNNING:
+                pipe.zadd(
+                    HEARTBEAT_DEADLINES_ZSET,
+                    {sandbox_id: self._initial_heartbeat_deadline(sandbox)},
+                    nx=True,
+                )
+        tracked = sum(pipe.execute())
+
+        logger.info(
+            f"[SandboxRepository] Rebuilt heartbeat deadlines: {tracked} sandboxes"
+        )
+        return tracked
+
+    @property
+    def heartbeat_deadlines_rebuilt(self) -> bool:
+        """Whether rebuild_heartbeat_deadlines ran in this process."""
+        return self._heartbeat_deadlines_rebuilt
+
     def get_expired_sandbox_ids(self, max_age_seconds: int) -> List[str]:
         """Get sandbox IDs that have been inactive for longer than max_age.
 
@@ -251,7 +429,10 @@ class SandboxRepository(metaclass=SingletonMeta):
             return False
 
         try:
-            self.redis_client.zrem(ACTIVE_SANDBOXES_ZSET, sandbox_id)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrem(ACTIVE_SANDBOXES_ZSET, sandbox_id)
+            pipe.zrem(HEARTBEAT_DEADLINES_ZSET, sandbox_id)
+            pipe.execute()
             return True
         except Exception as e:
             logger.error(f"[SandboxRepository] Failed to remove from active set: {e}")
@@ -19,6 +19,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from shared.logger import setup_logger
 
+from executor_manager.common.config import get_config
+
 if TYPE_CHECKING:
     from executor_manager.services.sandbox.manager import SandboxManager
 
@@ -26,14 +28,13 @@ logger = setup_logger(__name__)
 
 # Configuration from environment variables
 GC_INTERVAL = int(os.getenv("GC_INTERVAL", "3600"))  # 1 hour default
-HEARTBEAT_CHECK_INTERVAL = int(os.getenv("HEARTBEAT_CHECK_INTERVAL", "5"))  # seconds
 
 
 class SandboxScheduler:
     """Scheduler for sandbox background tasks.
 
     Manages two periodic jobs:
-    - Heartbeat check: Runs every HEARTBEAT_CHECK_INTERVAL (default 10s)
+    - Heartbeat check: Runs every timeout.heartbeat_check_interval (default 5s)
     - Sandbox GC: Runs every GC_INTERVAL (default 1 hour)
     """
 
@@ -61,9 +62,10 @@ class SandboxScheduler:
         )
 
         # Add heartbeat check job
+        heartbeat_check_interval = get_config().timeout.heartbeat_check_interval
         self._scheduler.add_job(
             self._sandbox_manager._check_heartbeats,
-            IntervalTrigger(seconds=HEARTBEAT_CHECK_INTERVAL),
+            IntervalTrigger(seconds=heartbeat_check_interval),
             id="heartbeat_check",
             name="Heartbeat Check",
             replace_existing=True,
@@ -81,7 +83,7 @@ class SandboxScheduler:
         self._scheduler.start()
         logger.info(
             f"[SandboxScheduler] Started with jobs: "
-            f"heartbeat_check (every {HEARTBEAT_CHECK_INTERVAL}s), "
+            f"heartbeat_check (every {heartbeat_check_interval}s), "
             f"sandbox_gc (every {GC_INTERVAL}s)"
         )
 
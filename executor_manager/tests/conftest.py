@@ -26,6 +26,116 @@ def mock_redis_client(mocker):
     return client
 
 
+class FakeRedis:
+    """In-memory subset of the redis-py client used by sandbox services"""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    def _zset(self, key):
+        return self.data.setdefault(key, {})
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    def setex(self, key, ttl, value):
+        self.data[key] = str(value)
+        return True
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+        return 1
+
+    def hdel(self, key, *fields):
+        hash_ = self.data.get(key, {})
+        return sum(hash_.pop(field, None) is not None for field in fields)
+
+    def hkeys(self, key):
+        return list(self.data.get(key, {}))
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def zadd(self, key, mapping, nx=False, xx=False):
+        zset = self._zset(key)
+        added = 0
+        for member, score in mapping.items():
+            exists = member in zset
+            if (nx and exists) or (xx and not exists):
+                continue
+            added += not exists
+            zset[member] = float(score)
+        return added
+
+    def zrem(self, key, *members):
+        zset = self._zset(key)
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    def zscore(self, key, member):
+        return self._zset(key).get(member)
+
+    def zrange(self, key, start, end):
+        members = sorted(self._zset(key), key=lambda m: (self._zset(key)[m], m))
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    def zrangebyscore(self, key, min, max):
+        return [m for m in self.zrange(key, 0, -1) if min <= self._zset(key)[m] <= max]
+
+    def zremrangebyscore(self, key, min, max):
+        return self.zrem(key, *self.zrangebyscore(key, min, max))
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((getattr(self._client, name), args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+@pytest.fixture
+def fake_redis(mocker):
+    """In-memory Redis returned by RedisClientFactory.get_sync_client"""
+    client = FakeRedis()
+    mocker.patch(
+        "executor_manager.common.redis_factory.RedisClientFactory.get_sync_client",
+        return_value=client,
+    )
+    return client
+
+
 @pytest.fixture
 def sample_sandbox_metadata():
     """Sample sandbox metadata stored in Redis."""
@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import re
+import shutil
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from executor_manager.executors.docker.api_client import DockerAPIClient
+
+
+class FakeDockerDaemon:
+    """In-memory subset of the Docker Engine API served on a unix socket"""
+
+    def __init__(self, images=("test/executor:latest",)):
+        self.images = set(images)
+        self.containers = {}
+        self.requests = []
+        self.client = None
+
+    @staticmethod
+    def frame_logs(text, stream=1):
+        """Encode log output the way non-TTY containers stream it"""
+        data = text.encode()
+        return struct.pack(">BxxxI", stream, len(data)) + data
+
+    def find(self, name_or_id):
+        for container in self.containers.values():
+            if name_or_id in (container["Id"], container["Name"]):
+                return container
+        return None
+
+    def add_container(self, name, labels, port=None, state="running", image=None):
+        """Create a container directly, as if started by a previous run"""
+        body = {"Image": image or next(iter(self.images)), "Labels": labels}
+        if port:
+            body["HostConfig"] = {
+                "PortBindings": {f"{port}/tcp": [{"HostPort": str(port)}]}
+            }
+        container = self._create(name, body)
+        container["State"] = state
+        return container
+
+    def _create(self, name, body):
+        container = {
+            "Id": uuid.uuid4().hex,
+            "Name": name,
+            "Image": body["Image"],
+            "Labels": body.get("Labels") or {},
+            "Env": body.get("Env") or [],
+            "HostConfig": body.get("HostConfig") or {},
+            "State": "created",
+            "ExitCode": 0,
+            "Logs": b"",
+        }
+        self.containers[container["Id"]] = container
+        return container
+
+    def _ports(self, container):
+        bindings = container["HostConfig"].get("PortBindings") or {}
+        if container["State"] not in ("running", "paused"):
+            return {}
+        return {
+            key: [{"HostIp": "0.0.0.0", "HostPort": b["HostPort"]} for b in value]
+            for key, value in bindings.items()
+        }
+
+    def _summary(self, container):
+        ports = []
+        for key, bindings in self._ports(container).items():
+            private, _, proto = key.partition("/")
+            for binding in bindings:
+                ports.append(
+                    {
+                        "IP": binding["HostIp"],
+                        "PrivatePort": int(private),
+                        "PublicPort": int(binding["HostPort"]),
+                        "Type": proto,
+                    }
+                )
+        return {
+            "Id": container["Id"],
+            "Names": [f"/{container['Name']}"],
+            "Image": container["Image"],
+            "Labels": container["Labels"],
+            "State": container["State"],
+            "Ports": ports,
+        }
+
+    def _inspect(self, container):
+        return {
+            "Id": container["Id"],
+            "Name": f"/{container['Name']}",
+            "Config": {
+                "Image": container["Image"],
+                "Labels": container["Labels"],
+                "Env": container["Env"],
+            },
+            "State": {
+                "Status": container["State"],
+                "Running": container["State"] == "running",
+                "ExitCode": container["ExitCode"],
+            },
+            "NetworkSettings": {"Ports": self._ports(container)},
+        }
+
+    def handle(self, method, path, query, body):
+        """Return (status, payload) for a request"""
+        path = re.sub(r"^/v[0-9.]+", "", path)
+        self.requests.append((method, path))
+
+        if path == "/_ping":
+            return 200, "OK"
+        if path == "/containers/json":
+            filters = json.loads(query.get("filters", ["{}"])[0])
+            show_all = query.get("all", ["0"])[0] == "1"
+            result = []
+            for container in self.containers.values():
+                if not show_all and container["State"] != "running":
+                    continue
+                if all(
+                    _label_matches(container["Labels"], f)
+                    for f in filters.get("label", [])
+                ):
+                    result.append(self._summary(container))
+            return 200, result
+        if path == "/containers/create":
+            name = query["name"][0]
+            if body["Image"] not in self.images:
+                return 404, {"message": f"No such image: {body['Image']}"}
+            if self.find(name):
+                return 409, {"message": f"Conflict: name {name} is in use"}
+            return 201, {"Id": self._create(name, body)["Id"], "Warnings": []}
+        if path == "/images/create":
+            image = f"{query['fromImage'][0]}:{query['tag'][0]}"
+            self.images.add(image)
+            return 200, [{"status": f"Pulling {image}"}, {"status": "Done"}]
+
+        match = re.match(r"^/containers/([^/]+)(?:/(\w+))?$", path)
+        container = self.find(match.group(1)) if match else None
+        if container is None:
+            return 404, {"message": "No such container"}
+        action = match.group(2)
+        if method == "DELETE":
+            if container["State"] == "running" and query.get("force") != ["1"]:
+                return 409, {"message": "container is running"}
+            del self.containers[container["Id"]]
+            return 204, None
+        if action == "json":
+            return 200, self._inspect(container)
+        if action == "logs":
+            return 200, container["Logs"]
+        if action == "start":
+            container["State"] = "running"
+            return 204, None
+        if action == "stop":
+            if container["State"] != "running":
+                return 304, None
+            container["State"] = "exited"
+            return 204, None
+        if action == "pause":
+            container["State"] = "paused"
+            return 204, None
+        if action == "unpause":
+            container["State"] = "running"
+            return 204, None
+        if action == "wait":
+            deadline = time.monotonic() + 5
+            while container["State"] == "running" and time.monotonic() < deadline:
+                time.sleep(0.05)
+            return 200, {"StatusCode": container["ExitCode"]}
+        return 404, {"message": f"page not found: {path}"}
+
+
+def _label_matches(labels, selector):
+    key, sep, value = selector.partition("=")
+    return key in labels and (not sep or labels[key] == value)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _dispatch(self, method):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        status, payload = self.server.fake_docker.handle(
+            method, parsed.path, parse_qs(parsed.query), body
+        )
+
+        if isinstance(payload, bytes):
+            data = payload
+        elif isinstance(payload, str):
+            data = payload.encode()
+        elif isinstance(payload, list) and parsed.path.endswith("/images/create"):
+            data = b"".join(json.dumps(line).encode() + b"\r\n" for line in payload)
+        elif payload is None:
+            data = b""
+        else:
+            data = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        request, _ = super().get_request()
+        return request, ("docker", 0)
+
+
+@pytest.fixture
+def fake_docker():
+    """Fake Docker daemon and a DockerAPIClient connected to it"""
+    socket_dir = tempfile.mkdtemp(prefix="docker", dir="/tmp")
+    socket_path = str(Path(socket_dir) / "docker.sock")
+    daemon = FakeDockerDaemon()
+    server = _UnixServer(socket_path, _Handler)
+    server.fake_docker = daemon
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+
+    client = DockerAPIClient(socket_path=socket_path, timeout=5)
+    daemon.client = client
+    try:
+        yield daemon
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(socket_dir, ignore_errors=True)
@@ -45,8 +45,8 @@ class TestExecutorDispatcher:
                 ExecutorDispatcher
 
             with patch(
-                "executor_manager.executors.docker.executor.subprocess.run",
-                return_value=MagicMock(returncode=0),
+                "executor_manager.executors.docker.executor.get_docker_client",
+                return_value=MagicMock(),
             ):
                 executors = ExecutorDispatcher._load_executors()
             assert "docker" in executors
@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from executor_manager.executors.docker import utils
+from executor_manager.executors.docker.api_client import (ContainerSpec,
+                                                          DockerAPIError)
+from executor_manager.executors.docker.constants import (CONTAINER_OWNER,
+                                                         WARM_POOL_LABEL)
+
+
+class TestDockerAPIClient:
+    """Test cases for DockerAPIClient against a fake Docker socket"""
+
+    def test_ping(self, fake_docker):
+        assert fake_docker.client.ping() is True
+
+    def test_run_container_publishes_port(self, fake_docker):
+        spec = ContainerSpec(
+            name="executor-1",
+            image="test/executor:latest",
+            labels={"owner": CONTAINER_OWNER},
+            env=["PORT=10001"],
+            port=10001,
+        )
+
+        container_id = fake_docker.client.run_container(spec)
+
+        info = fake_docker.client.inspect_container("executor-1")
+        assert info["Id"] == container_id
+        assert info["State"]["Status"] == "running"
+        assert info["Config"]["Env"] == ["PORT=10001"]
+        assert info["NetworkSettings"]["Ports"]["10001/tcp"][0]["HostPort"] == "10001"
+
+    def test_run_container_pulls_missing_image(self, fake_docker):
+        spec = ContainerSpec(name="executor-1", image="other/image:1.0")
+
+        fake_docker.client.run_container(spec)
+
+        assert "other/image:1.0" in fake_docker.images
+        assert ("POST", "/images/create") in fake_docker.requests
+        assert fake_docker.find("executor-1")["State"] == "running"
+
+    def test_run_container_name_conflict(self, fake_docker):
+        fake_docker.add_container("executor-1", {})
+
+        with pytest.raises(DockerAPIError) as exc_info:
+            fake_docker.client.run_container(
+                ContainerSpec(name="executor-1", image="test/executor:latest")
+            )
+        assert exc_info.value.status_code == 409
+
+    def test_inspect_missing_container(self, fake_docker):
+        assert fake_docker.client.inspect_container("missing") is None
+
+    def test_list_containers_filters_labels(self, fake_docker):
+        fake_docker.add_container("a", {"owner": CONTAINER_OWNER, "task_id": "1"})
+        fake_docker.add_container("b", {"owner": CONTAINER_OWNER, "task_id": "2"})
+        fake_docker.add_container("c", {"owner": "someone-else"})
+
+        containers = fake_docker.client.list_containers(
+            labels=[f"owner={CONTAINER_OWNER}", "task_id=2"]
+        )
+
+        assert [c["Names"] for c in containers] == [["/b"]]
+
+    def test_wait_container(self, fake_docker):
+        container = fake_docker.add_container("exited", {}, state="exited")
+        container["ExitCode"] = 127
+        fake_docker.add_container("running", {})
+
+        assert fake_docker.client.wait_container("exited", timeout=1) == 127
+        assert fake_docker.client.wait_container("running", timeout=0.2) is None
+
+    def test_container_logs_are_demultiplexed(self, fake_docker):
+        container = fake_docker.add_container("executor-1", {})
+        container["Logs"] = fake_docker.frame_logs("exec failed\n") + (
+            fake_docker.frame_logs("no such file or directory\n", stream=2)
+        )
+
+        logs = fake_docker.client.container_logs("executor-1")
+
+        assert logs == "exec failed\nno such file or directory\n"
+
+
+class TestDockerUtilsWithSocket:
+    """Test Docker utility functions over the API client"""
+
+    @pytest.fixture(autouse=True)
+    def use_fake_docker(self, fake_docker, mocker):
+        mocker.patch.object(utils, "get_docker_client", return_value=fake_docker.client)
+
+    def test_get_container_ports(self, fake_docker):
+        fake_docker.add_container("executor-1", {"owner": CONTAINER_OWNER}, port=10005)
+
+        result = utils.get_container_ports("executor-1")
+
+        assert result == {
+            "status": "success",
+            "ports": [{"host_port": 10005, "container_port": 10005, "protocol": "tcp"}],
+        }
+
+    def test_get_container_ports_not_owned(self, fake_docker):
+        fake_docker.add_container("other", {"owner": "someone-else"}, port=10005)
+
+        result = utils.get_container_ports("other")
+
+        assert result["status"] == "failed"
+        assert "not found or not owned" in result["error_msg"]
+
+    def test_delete_container(self, fake_docker):
+        fake_docker.add_container("executor-1", {"owner": CONTAINER_OWNER})
+
+        assert utils.delete_container("executor-1") == {"status": "success"}
+        assert fake_docker.find("executor-1") is None
+
+    def test_delete_missing_container(self, fake_docker):
+        result = utils.delete_container("missing")
+
+        assert result["status"] == "failed"
+        assert "Docker error" in result["error_msg"]
+
+    def test_pause_and_unpause_container(self, fake_docker):
+        fake_docker.add_container("executor-1", {"owner": CONTAINER_OWNER})
+
+        assert utils.pause_container("executor-1")["status"] == "success"
+        assert fake_docker.find("executor-1")["State"] == "paused"
+        assert utils.unpause_container("executor-1")["status"] == "success"
+        assert fake_docker.find("executor-1")["State"] == "running"
+
+    def test_get_docker_used_ports(self, fake_docker):
+        fake_docker.add_container("a", {"owner": CONTAINER_OWNER}, port=10001)
+        fake_docker.add_container("b", {"owner": CONTAINER_OWNER}, port=20000)
+        fake_docker.add_container("c", {"owner": "someone-else"}, port=10002)
+
+        assert utils.get_docker_used_ports() == {10001}
+
+    def test_running_task_details_attribute_warm_containers(self, fake_docker):
+        task_labels = {"owner": CONTAINER_OWNER, "subtask_next_id": "9"}
+        fake_docker.add_container("task", {**task_labels, "task_id": "1"})
+        fake_docker.add_container(
+            "warm-idle", {"owner": CONTAINER_OWNER, WARM_POOL_LABEL: "true"}
+        )
+        fake_docker.add_container(
+            "warm-claimed", {"owner": CONTAINER_OWNER, WARM_POOL_LABEL: "true"}
+        )
+
+        result = utils.get_running_task_details(
+            label_overrides={
+                "warm-claimed": {"task_id": "2", "subtask_id": "3", "subtask_next_id": "4"}
+            }
+        )
+
+        assert result["status"] == "success"
+        assert sorted(result["task_ids"]) == ["1", "2"]
+        assert {c["container_name"] for c in result["containers"]} == {
+            "task",
+            "warm-claimed",
+        }
+
+        selected = utils.get_running_task_details(
+            "task_id=2",
+            label_overrides={"warm-claimed": {"task_id": "2", "subtask_next_id": "4"}},
+        )
+        assert selected["task_ids"] == ["2"]
@@ -2,7 +2,6 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import subprocess
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
@@ -10,21 +9,45 @@ import requests
 from executor_manager.executors.docker.executor import DockerExecutor
 from shared.status import TaskStatus
 
+from executor_manager.executors.docker import utils as docker_utils
+from executor_manager.executors.docker.api_client import DockerAPIError
 from executor_manager.executors.docker.executor import DockerExecutor
 
 
+def _task_container(task_id, subtask_id, subtask_next_id, name):
+    """Container summary as returned by GET /containers/json"""
+    return {
+        "Names": [f"/{name}"],
+        "Labels": {
+            "owner": "executor_manager",
+            "task_id": task_id,
+            "subtask_id": subtask_id,
+            "subtask_next_id": subtask_next_id,
+            "aigc.weibo.com/task-type": "online",
+        },
+        "State": "running",
+        "Ports": [],
+    }
+
+
 class TestDockerExecutor:
     """Test cases for DockerExecutor"""
 
     @pytest.fixture
-    def mock_subprocess(self):
-        """Mock subprocess module"""
+    def mock_docker(self):
+        """Mock Docker API client"""
         mock = MagicMock()
-        mock.run = MagicMock()
-        mock.CalledProcessError = subprocess.CalledProcessError
-        mock.SubprocessError = subprocess.SubprocessError
+        mock.ping.return_value = True
         return mock
 
+    @pytest.fixture
+    def mock_utils_client(self):
+        """Mock Docker API client used by the utility functions"""
+        client = MagicMock()
+        client.list_containers.return_value = []
+        with patch.object(docker_utils, "get_docker_client", return_value=client):
+            yield client
+
     @pytest.fixture
     def mock_requests(self):
         """Mock requests module"""
@@ -32,13 +55,9 @@ class TestDockerExecutor:
         return mock
 
     @pytest.fixture
-    def executor(self, mock_subprocess, mock_requests):
+    def executor(self, mock_docker, mock_requests):
         """Create DockerExecutor instance with mocked dependencies"""
-        # Mock docker availability check
-        mock_subprocess.run.return_value = MagicMock(returncode=0)
-        return DockerExecutor(
-            subprocess_module=mock_subprocess, requests_module=mock_requests
-        )
+        return DockerExecutor(docker_client=mock_docker, requests_module=mock_requests)
 
     @pytest.fixture
     def sample_task(self):
@@ -52,22 +71,18 @@ class TestDockerExecutor:
             "type": "online",
         }
 
-    def test_init_docker_available(self, mock_subprocess, mock_requests):
+    def test_init_docker_available(self, mock_docker, mock_requests):
         """Test initialization when Docker is available"""
-        mock_subprocess.run.return_value = MagicMock(returncode=0)
-        executor = DockerExecutor(
-            subprocess_module=mock_subprocess, requests_module=mock_requests
-        )
+        executor = DockerExecutor(docker_client=mock_docker, requests_module=mock_requests)
         assert executor is not None
-        mock_subprocess.run.assert_called_once()
+        assert executor.warm_pool is None
+        mock_docker.ping.assert_called_once()
 
-    def test_init_docker_not_available(self, mock_subprocess, mock_requests):
+    def test_init_docker_not_available(self, mock_docker, mock_requests):
         """Test initialization when Docker is not available"""
-        mock_subprocess.run.side_effect = FileNotFoundError("docker not found")
+        mock_docker.ping.side_effect = FileNotFoundError("docker.sock not found")
         with pytest.raises(RuntimeError, match="Docker is not available"):
-            DockerExecutor(
-                subprocess_module=mock_subprocess, requests_module=mock_requests
-            )
+            DockerExecutor(docker_client=mock_docker, requests_module=mock_requests)
 
     def test_extract_task_info(self, executor, sample_task):
         """Test extracting task information"""
@@ -109,10 +124,10 @@ class TestDockerExecutor:
 
     @patch("executor_manager.executors.docker.executor.find_available_port")
     @patch("executor_manager.executors.docker.executor.build_callback_url")
-    def test_prepare_docker_command(
+    def test_prepare_container_spec(
         self, mock_callback, mock_port, executor, sample_task
     ):
-        """Test preparing Docker run command"""
+        """Test preparing the container spec"""
         mock_port.return_value = 8080
         mock_callback.return_value = "http://callback.url"
 
@@ -120,22 +135,28 @@ class TestDockerExecutor:
         executor_name = "test-executor"
         executor_image = "test/executor:latest"
 
-        cmd = executor._prepare_docker_command(
+        spec = executor._prepare_container_spec(
             sample_task, task_info, executor_name, executor_image
         )
 
-        assert "docker" in cmd
-        assert "run" in cmd
-        assert "-d" in cmd
-        assert "--name" in cmd
-        assert executor_name in cmd
-        assert executor_image in cmd
-        assert any("task_id=123" in str(item) for item in cmd)
-        assert any("subtask_id=456" in str(item) for item in cmd)
+        assert spec.name == executor_name
+        assert spec.image == executor_image
+        assert spec.port == 8080
+        assert spec.labels["owner"] == "executor_manager"
+        assert spec.labels["task_id"] == "123"
+        assert spec.labels["subtask_id"] == "456"
+        assert "PORT=8080" in spec.env
+        assert "CALLBACK_URL=http://callback.url" in spec.env
+        assert any(item.startswith("TASK_INFO=") for item in spec.env)
+        mock_port.assert_called_once_with(executor_name)
+        body = spec.to_create_body()
+        assert body["HostConfig"]["PortBindings"] == {
+            "8080/tcp": [{"HostPort": "8080"}]
+        }
 
-    @patch("executor_manager.executors.docker.utils.subprocess.run")
+    @patch("executor_manager.executors.docker.executor.get_container_ports")
     def test_submit_executor_existing_container_success(
-        self, mock_run, executor, mock_requests
+        self, mock_ports, executor, mock_requests
     ):
         """Test submitting executor to existing container successfully"""
         task = {
@@ -145,13 +166,10 @@ class TestDockerExecutor:
             "executor_name": "existing-executor",
         }
 
-        # Mock subprocess.run calls:
-        # 1. check_container_ownership
-        # 2. get_container_ports
-        mock_run.side_effect = [
-            MagicMock(stdout="existing-executor\n", returncode=0),  # ownership check
-            MagicMock(stdout="0.0.0.0:8080->8080/tcp\n", returncode=0),  # get ports
-        ]
+        mock_ports.return_value = {
+            "status": "success",
+            "ports": [{"host_port": 8080, "container_port": 8080, "protocol": "tcp"}],
+        }
 
         mock_response = MagicMock()
         mock_response.json.return_value = {"status": "success"}
@@ -182,9 +200,7 @@ class TestDockerExecutor:
         mock_name.return_value = "new-executor"
         mock_port.return_value = 8080
         mock_callback.return_value = "http://callback.url"
-        executor.subprocess.run.return_value = MagicMock(
-            stdout="container-id\n", returncode=0
-        )
+        executor.docker.run_container.return_value = "container-id"
 
         result = executor.submit_executor(task)
 
@@ -216,14 +232,15 @@ class TestDockerExecutor:
         mock_name.return_value = "new-executor"
         mock_port.return_value = 8081
         mock_callback.return_value = "http://callback.url"
-        executor.subprocess.run.return_value = MagicMock(
-            stdout="container-id\n", returncode=0
-        )
+        executor.docker.run_container.return_value = "container-id"
 
         result = executor.submit_executor(task)
 
         assert result["status"] == "success"
         assert result["executor_name"] == "new-executor"
+        spec = executor.docker.run_container.call_args[0][0]
+        assert spec.name == "new-executor"
+        assert spec.port == 8081
 
     @patch("executor_manager.executors.docker.executor.build_callback_url")
     @patch("executor_manager.executors.docker.executor.find_available_port")
@@ -235,57 +252,48 @@ class TestDockerExecutor:
         mock_callback,
         executor,
         sample_task,
-        mock_subprocess,
+        mock_docker,
     ):
         """Test submitting executor with Docker error"""
         mock_name.return_value = "new-executor"
         mock_port.return_value = 8080
         mock_callback.return_value = "http://callback.url"
 
-        # Reset mock and simulate error
-        mock_subprocess.run.reset_mock()
-        mock_subprocess.run.side_effect = subprocess.CalledProcessError(
-            1, "docker run", stderr="Docker error"
-        )
+        mock_docker.run_container.side_effect = DockerAPIError(500, "Docker error")
 
         result = executor.submit_executor(sample_task)
 
         assert result["status"] == "failed"
         assert "Docker run error" in result["error_msg"]
 
-    @patch("executor_manager.executors.docker.utils.subprocess.run")
-    def test_delete_executor_success(self, mock_run, executor):
+    def test_delete_executor_success(self, executor, mock_utils_client):
         """Test deleting executor successfully"""
-        # Mock subprocess.run calls:
-        # 1. check_container_ownership
-        # 2. delete_container (shell command)
-        mock_run.side_effect = [
-            MagicMock(stdout="test-executor\n", returncode=0),  # ownership check
-            MagicMock(returncode=0),  # delete command
-        ]
+        mock_utils_client.inspect_container.return_value = {
+            "Config": {"Labels": {"owner": "executor_manager"}}
+        }
 
         result = executor.delete_executor("test-executor")
 
         assert result["status"] == "success"
+        mock_utils_client.stop_container.assert_called_once_with("test-executor")
+        mock_utils_client.remove_container.assert_called_once_with("test-executor")
 
-    @patch("executor_manager.executors.docker.utils.check_container_ownership")
-    def test_delete_executor_unauthorized(self, mock_check, executor):
+    def test_delete_executor_unauthorized(self, executor, mock_utils_client):
         """Test deleting executor without ownership"""
-        mock_check.return_value = False
+        mock_utils_client.inspect_container.return_value = None
 
         result = executor.delete_executor("test-executor")
 
         assert result["status"] == "unauthorized"
         assert "not owned by" in result["error_msg"]
 
-    @patch("executor_manager.executors.docker.utils.subprocess.run")
-    def test_get_executor_count_success(self, mock_run, executor):
+    def test_get_executor_count_success(self, executor, mock_utils_client):
         """Test getting executor count successfully"""
-        # Mock docker ps output with two running tasks
-        mock_run.return_value = MagicMock(
-            stdout="123|456|789|online|container1\n124|457|790|online|container2\n",
-            returncode=0,
-        )
+        # Two running tasks
+        mock_utils_client.list_containers.return_value = [
+            _task_container("123", "456", "789", "container1"),
+            _task_container("124", "457", "790", "container2"),
+        ]
 
         result = executor.get_executor_count()
 
@@ -294,13 +302,12 @@ class TestDockerExecutor:
         assert "123" in result["task_ids"]
         assert "124" in result["task_ids"]
 
-    @patch("executor_manager.executors.docker.utils.subprocess.run")
-    def test_get_executor_count_with_label_selector(self, mock_run, executor):
+    def test_get_executor_count_with_label_selector(self, executor, mock_utils_client):
         """Test getting executor count with label selector"""
-        # Mock docker ps output with one running task
-        mock_run.return_value = MagicMock(
-            stdout="123|456|789|online|container1\n", returncode=0
-        )
+        mock_utils_client.list_containers.return_value = [
+            _task_container("123", "456", "789", "container1"),
+            _task_container("124", "457", "790", "container2"),
+        ]
 
         result = executor.get_executor_count(label_selector="task_id=123")
 
@@ -308,14 +315,12 @@ class TestDockerExecutor:
         assert result["running"] == 1
         assert "123" in result["task_ids"]
 
-    @patch("executor_manager.executors.docker.utils.subprocess.run")
-    def test_get_current_task_ids_success(self, mock_run, executor):
+    def test_get_current_task_ids_success(self, executor, mock_utils_client):
         """Test getting current task IDs successfully"""
-        # Mock docker ps output
-        mock_run.return_value = MagicMock(
-            stdout="123|1|789|online|container1\n456|2|790|online|container2\n",
-            returncode=0,
-        )
+        mock_utils_client.list_containers.return_value = [
+            _task_container("123", "1", "789", "container1"),
+            _task_container("456", "2", "790", "container2"),
+        ]
 
         result = executor.get_current_task_ids()
 
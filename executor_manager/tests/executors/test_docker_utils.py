@@ -4,7 +4,8 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-import subprocess
+from executor_manager.executors.docker import utils as docker_utils
+from executor_manager.executors.docker.api_client import DockerAPIError
 from executor_manager.executors.docker.utils import (
     build_callback_url,
     find_available_port,
@@ -17,9 +18,38 @@ from executor_manager.executors.docker.utils import (
 )
 
 
+def _container(name, labels, port=None):
+    """Container summary as returned by GET /containers/json"""
+    ports = []
+    if port:
+        ports.append({"IP": "0.0.0.0", "PrivatePort": port, "PublicPort": port, "Type": "tcp"})
+    return {"Names": [f"/{name}"], "Labels": labels, "State": "running", "Ports": ports}
+
+
+def _task_container(task_id, subtask_id, subtask_next_id, name):
+    return _container(
+        name,
+        {
+            "owner": "executor_manager",
+            "task_id": task_id,
+            "subtask_id": subtask_id,
+            "subtask_next_id": subtask_next_id,
+            "aigc.weibo.com/task-type": "online",
+        },
+    )
+
+
 class TestDockerUtils:
     """Test cases for Docker utility functions"""
 
+    @pytest.fixture
+    def mock_client(self):
+        """Mock Docker API client used by the utility functions"""
+        client = MagicMock()
+        client.list_containers.return_value = []
+        with patch.object(docker_utils, "get_docker_client", return_value=client):
+            yield client
+
     def test_build_callback_url_from_task(self):
         """Test building callback URL from task"""
         task = {"callback_url": "http://custom.callback.url"}
@@ -55,61 +85,66 @@ class TestDockerUtils:
         assert "example.com" in url
         assert "/executor-manager/callback" in url
 
-    @patch('subprocess.run')
-    def test_get_docker_used_ports_empty(self, mock_run):
+    def test_get_docker_used_ports_empty(self, mock_client):
         """Test getting Docker used ports when no containers running"""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
         ports = get_docker_used_ports()
         assert len(ports) == 0
 
-    @patch('subprocess.run')
-    def test_check_container_ownership_true(self, mock_run):
+    def test_get_docker_used_ports_in_range(self, mock_client):
+        """Test only ports in the executor range are reported"""
+        mock_client.list_containers.return_value = [
+            _container("a", {"owner": "executor_manager"}, port=10001),
+            _container("b", {"owner": "executor_manager"}, port=20000),
+        ]
+        assert get_docker_used_ports() == {10001}
+
+    def test_check_container_ownership_true(self, mock_client):
         """Test checking container ownership when owned"""
-        mock_run.return_value = MagicMock(
-            stdout="test-container\n",
-            returncode=0
-        )
+        mock_client.inspect_container.return_value = {
+            "Config": {"Labels": {"owner": "executor_manager"}}
+        }
         result = check_container_ownership("test-container")
         assert result is True
 
-    @patch('subprocess.run')
-    def test_check_container_ownership_false(self, mock_run):
+    def test_check_container_ownership_false(self, mock_client):
         """Test checking container ownership when not owned"""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+        mock_client.inspect_container.return_value = None
         result = check_container_ownership("test-container")
         assert result is False
 
-    @patch('subprocess.run')
-    def test_check_container_ownership_error(self, mock_run):
+    def test_check_container_ownership_error(self, mock_client):
         """Test checking container ownership with error"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "docker", stderr="error")
+        mock_client.inspect_container.side_effect = DockerAPIError(500, "error")
         result = check_container_ownership("test-container")
         assert result is False
 
-    @patch('subprocess.run')
-    def test_delete_container_success(self, mock_run):
+    def test_delete_container_success(self, mock_client):
         """Test deleting container successfully"""
-        mock_run.return_value = MagicMock(returncode=0)
         result = delete_container("test-container")
         assert result["status"] == "success"
+        mock_client.stop_container.assert_called_once_with("test-container")
+        mock_client.remove_container.assert_called_once_with("test-container")
 
-    @patch('subprocess.run')
-    def test_delete_container_error(self, mock_run):
+    def test_delete_container_error(self, mock_client):
         """Test deleting container with error"""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "docker", stderr="error")
+        mock_client.stop_container.side_effect = DockerAPIError(404, "error")
         result = delete_container("test-container")
         assert result["status"] == "failed"
         assert "error" in result["error_msg"]
 
-    @patch('subprocess.run')
-    def test_get_container_ports_success(self, mock_run):
+    def test_get_container_ports_success(self, mock_client):
         """Test getting container ports successfully"""
-        # First call: check_container_ownership
-        # Second call: get ports
-        mock_run.side_effect = [
-            MagicMock(stdout="test-container\n", returncode=0),  # ownership check
-            MagicMock(stdout="0.0.0.0:8080->8080/tcp\n", returncode=0)  # get ports
-        ]
+        mock_client.inspect_container.return_value = {
+            "Config": {"Labels": {"owner": "executor_manager"}},
+            "NetworkSettings": {
+                "Ports": {
+                    "8080/tcp": [
+                        {"HostIp": "0.0.0.0", "HostPort": "8080"},
+                        {"HostIp": "::", "HostPort": "8080"},
+                    ]
+                }
+            },
+        }
         result = get_container_ports("test-container")
         assert result["status"] == "success"
         assert len(result["ports"]) == 1
@@ -117,106 +152,96 @@ class TestDockerUtils:
         assert result["ports"][0]["container_port"] == 8080
         assert result["ports"][0]["protocol"] == "tcp"
 
-    @patch('executor_manager.executors.docker.utils.check_container_ownership')
-    def test_get_container_ports_not_owned(self, mock_check):
+    def test_get_container_ports_not_owned(self, mock_client):
         """Test getting container ports when not owned"""
-        mock_check.return_value = False
+        mock_client.inspect_container.return_value = {
+            "Config": {"Labels": {"owner": "someone-else"}}
+        }
         result = get_container_ports("test-container")
         assert result["status"] == "failed"
         assert "not found or not owned" in result["error_msg"]
 
-    @patch('subprocess.run')
-    def test_count_running_containers_success(self, mock_run):
+    def test_count_running_containers_success(self, mock_client):
         """Test counting running containers successfully"""
-        mock_run.return_value = MagicMock(
-            stdout="container1\ncontainer2\ncontainer3\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("1", "1", "2", f"container{i}") for i in range(3)
+        ]
         result = count_running_containers()
         assert result["status"] == "success"
         assert result["count"] == 3
 
-    @patch('subprocess.run')
-    def test_count_running_containers_with_label_selector(self, mock_run):
+    def test_count_running_containers_with_label_selector(self, mock_client):
         """Test counting running containers with label selector"""
-        mock_run.return_value = MagicMock(
-            stdout="container1\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("123", "1", "2", "container1"),
+            _task_container("124", "1", "2", "container2"),
+        ]
         result = count_running_containers(label_selector="task_id=123")
         assert result["status"] == "success"
         assert result["count"] == 1
 
-    @patch('subprocess.run')
-    def test_count_running_containers_error(self, mock_run):
+    def test_count_running_containers_error(self, mock_client):
         """Test counting running containers with error"""
-        mock_run.side_effect = Exception("Docker error")
+        mock_client.list_containers.side_effect = Exception("Docker error")
         result = count_running_containers()
         assert result["status"] == "failed"
         assert result["count"] == 0
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_success(self, mock_run):
+    def test_get_running_task_details_success(self, mock_client):
         """Test getting running task details successfully"""
-        mock_run.return_value = MagicMock(
-            stdout="123|456|789|online|container1\n124|457||online|container2\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("123", "456", "789", "container1"),
+            _task_container("124", "457", "", "container2"),
+        ]
         result = get_running_task_details()
         assert result["status"] == "success"
         assert "123" in result["task_ids"]
         assert "124" not in result["task_ids"]  # Has empty subtask_next_id
         assert len(result["containers"]) == 2
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_with_label_selector(self, mock_run):
+    def test_get_running_task_details_with_label_selector(self, mock_client):
         """Test getting running task details with label selector"""
-        mock_run.return_value = MagicMock(
-            stdout="123|456|789|online|container1\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("123", "456", "789", "container1"),
+            _task_container("124", "457", "790", "container2"),
+        ]
         result = get_running_task_details(label_selector="task_id=123")
         assert result["status"] == "success"
         assert len(result["task_ids"]) == 1
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_empty(self, mock_run):
+    def test_get_running_task_details_empty(self, mock_client):
         """Test getting running task details when no containers"""
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
         result = get_running_task_details()
         assert result["status"] == "success"
         assert len(result["task_ids"]) == 0
         assert len(result["containers"]) == 0
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_error(self, mock_run):
+    def test_get_running_task_details_error(self, mock_client):
         """Test getting running task details with error"""
-        mock_run.side_effect = Exception("Docker error")
+        mock_client.list_containers.side_effect = Exception("Docker error")
         result = get_running_task_details()
         assert result["status"] == "failed"
         assert len(result["task_ids"]) == 0
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_multiple_containers_same_task(self, mock_run):
+    def test_get_running_task_details_multiple_containers_same_task(self, mock_client):
         """Test getting running task details with multiple containers for same task"""
-        mock_run.return_value = MagicMock(
-            stdout="123|456|789|online|container1\n123|457|790|online|container2\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("123", "456", "789", "container1"),
+            _task_container("123", "457", "790", "container2"),
+        ]
         result = get_running_task_details()
         assert result["status"] == "success"
         assert "123" in result["task_ids"]
         assert len(result["containers"]) == 2
 
-    @patch('subprocess.run')
-    def test_get_running_task_details_task_completed(self, mock_run):
+    def test_get_running_task_details_task_completed(self, mock_client):
         """Test getting running task details with completed task"""
         # Task 123 has one container with empty subtask_next_id (completed)
-        mock_run.return_value = MagicMock(
-            stdout="123|456||online|container1\n124|457|789|online|container2\n",
-            returncode=0
-        )
+        mock_client.list_containers.return_value = [
+            _task_container("123", "456", "", "container1"),
+            _task_container("124", "457", "789", "container2"),
+        ]
         result = get_running_task_details()
         assert result["status"] == "success"
         assert "123" not in result["task_ids"]  # Task 123 is completed
-        assert "124" in result["task_ids"]  # Task 124 is still running
\ No newline at end of file
+        assert "124" in result["task_ids"]  # Task 124 is still running
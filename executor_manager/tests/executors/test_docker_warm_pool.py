@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from executor_manager.executors.docker import utils as docker_utils
+from executor_manager.executors.docker import warm_pool as warm_pool_module
+from executor_manager.executors.docker.constants import (CONTAINER_OWNER,
+                                                         WARM_POOL_LABEL)
+from executor_manager.executors.docker.executor import DockerExecutor
+from executor_manager.executors.docker.port_allocator import PortAllocator
+from executor_manager.executors.docker.warm_pool import WarmContainerPool
+
+IMAGE = "test/executor:latest"
+
+
+class TestPortAllocator:
+    """Test cases for in-memory port allocation"""
+
+    def test_skips_ports_used_by_docker(self):
+        allocator = PortAllocator(10000, 10003, lambda: {10000, 10001})
+
+        assert allocator.acquire("a") == 10002
+        assert allocator.acquire("b") == 10003
+
+    def test_round_robin_after_release(self):
+        allocator = PortAllocator(10000, 10002, set)
+
+        first = allocator.acquire("a")
+        allocator.release(first)
+
+        assert allocator.acquire("b") == first + 1
+
+    def test_resyncs_when_exhausted(self):
+        used_ports = {10000, 10001}
+        allocator = PortAllocator(10000, 10001, lambda: set(used_ports), grace_seconds=0)
+        with pytest.raises(RuntimeError, match="No available ports"):
+            allocator.acquire("a")
+
+        # A container was removed outside this process
+        used_ports.discard(10001)
+
+        assert allocator.acquire("a") == 10001
+
+    def test_release_owner(self):
+        allocator = PortAllocator(10000, 10001, set)
+        port = allocator.acquire("executor-1")
+
+        allocator.release_owner("executor-1")
+
+        assert port not in allocator.reserved_ports()
+
+
+@pytest.fixture
+def allocator():
+    return PortAllocator(10000, 10100, set)
+
+
+@pytest.fixture
+def ready(mocker):
+    return mocker.patch.object(warm_pool_module, "_probe_ready", return_value=True)
+
+
+@pytest.fixture
+def make_pool(fake_docker, allocator):
+    pools = []
+
+    def factory(size=2, spec_factory=None):
+        def default_spec(image, name, port):
+            from executor_manager.executors.docker.api_client import ContainerSpec
+
+            return ContainerSpec(
+                name=name,
+                image=image,
+                labels={"owner": CONTAINER_OWNER},
+                env=[f"EXECUTOR_NAME={name}", f"PORT={port}"],
+                port=port,
+            )
+
+        pool = WarmContainerPool(
+            fake_docker.client,
+            [IMAGE],
+            size=size,
+            spec_factory=spec_factory or default_spec,
+            acquire_port=allocator.acquire,
+            release_port=allocator.release,
+            ready_timeout=1,
+        )
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool._stop_event.set()
+
+
+class TestWarmContainerPool:
+    """Test cases for WarmContainerPool against a fake Docker socket"""
+
+    def test_refill_starts_idle_containers(self, make_pool, fake_docker, ready):
+        pool = make_pool(size=2)
+
+        assert pool.refill() == 2
+
+        assert pool.idle_count(IMAGE) == 2
+        containers = list(fake_docker.containers.values())
+        assert all(c["Labels"][WARM_POOL_LABEL] == "true" for c in containers)
+        assert all(c["State"] == "running" for c in containers)
+        assert pool.refill() == 0
+
+    def test_claim_assigns_task_labels(self, make_pool, ready):
+        pool = make_pool(size=1)
+        pool.refill()
+
+        container = pool.claim(IMAGE, {"task_id": "7"})
+
+        assert container is not None
+        assert pool.idle_count(IMAGE) == 0
+        assert pool.assignments() == {container.name: {"task_id": "7"}}
+        assert pool.claim(IMAGE, {"task_id": "8"}) is None
+        assert pool.claim("other/image:latest", {"task_id": "8"}) is None
+
+    def test_container_not_ready_is_removed(
+        self, make_pool, fake_docker, allocator, mocker
+    ):
+        mocker.patch.object(warm_pool_module, "_probe_ready", return_value=False)
+        pool = make_pool(size=1)
+        pool.ready_timeout = 0.3
+
+        assert pool.refill() == 0
+
+        assert fake_docker.containers == {}
+        assert allocator.reserved_ports() == set()
+
+    def test_prune_drops_stopped_containers(self, make_pool, fake_docker, ready):
+        pool = make_pool(size=2)
+        pool.refill()
+        claimed = pool.claim(IMAGE, {"task_id": "7"})
+        for container in fake_docker.containers.values():
+            container["State"] = "exited"
+
+        pool.prune()
+
+        assert pool.idle_count(IMAGE) == 0
+        assert claimed.name not in pool.assignments()
+
+    def test_stop_removes_idle_containers(self, make_pool, fake_docker, ready):
+        pool = make_pool(size=2)
+        pool.refill()
+        claimed = pool.claim(IMAGE, {"task_id": "7"})
+
+        pool.stop()
+
+        assert [c["Name"] for c in fake_docker.containers.values()] == [claimed.name]
+
+    def test_start_adopts_idle_leftovers(self, make_pool, fake_docker, mocker):
+        labels = {"owner": CONTAINER_OWNER, WARM_POOL_LABEL: "true"}
+        fake_docker.add_container("wegent-warm-idle", labels, port=10010)
+        fake_docker.add_container("wegent-warm-busy", labels, port=10011)
+        fake_docker.add_container("wegent-warm-dead", labels, state="exited")
+        sessions = {10010: 0, 10011: 1}
+        mocker.patch.object(warm_pool_module, "_count_sessions", side_effect=sessions.get)
+        pool = make_pool(size=1)
+        pool.refill_interval = 60
+
+        pool._adopt_leftovers()
+
+        assert pool.idle_count(IMAGE) == 1
+        assert pool.claim(IMAGE, {}).name == "wegent-warm-idle"
+        assert fake_docker.find("wegent-warm-busy") is not None
+        assert fake_docker.find("wegent-warm-dead") is None
+
+
+class TestDockerExecutorWarmPool:
+    """Test DockerExecutor claiming warm containers"""
+
+    @pytest.fixture
+    def executor(self, fake_docker, allocator, mocker):
+        mocker.patch.object(
+            docker_utils, "get_docker_client", return_value=fake_docker.client
+        )
+        mocker.patch(
+            "executor_manager.executors.docker.executor.find_available_port",
+            side_effect=allocator.acquire,
+        )
+        mocker.patch(
+            "executor_manager.executors.docker.executor.build_callback_url",
+            return_value="http://callback.url",
+        )
+        executor = DockerExecutor(
+            docker_client=fake_docker.client, requests_module=MagicMock()
+        )
+        executor.warm_pool = WarmContainerPool(
+            fake_docker.client,
+            [IMAGE],
+            size=1,
+            spec_factory=executor._prepare_warm_container_spec,
+            acquire_port=allocator.acquire,
+            release_port=allocator.release,
+            ready_timeout=1,
+        )
+        yield executor
+        executor.warm_pool._stop_event.set()
+
+    @pytest.fixture
+    def task(self):
+        return {
+            "task_id": 123,
+            "subtask_id": 456,
+            "user": {"name": "test_user"},
+            "executor_image": IMAGE,
+            "type": "online",
+        }
+
+    def test_task_claims_warm_container(self, executor, fake_docker, task, ready):
+        executor.warm_pool.refill()
+        warm = next(iter(fake_docker.containers.values()))
+        assert not any(e.startswith("TASK_INFO=") for e in warm["Env"])
+        assert f"EXECUTOR_NAME={warm['Name']}" in warm["Env"]
+        fake_docker.requests.clear()
+        executor.requests.post.return_value.json.return_value = {"status": "running"}
+        callback = MagicMock()
+
+        result = executor.submit_executor(task, callback)
+
+        assert result == {"status": "success", "executor_name": warm["Name"]}
+        assert ("POST", "/containers/create") not in fake_docker.requests
+        port = warm["HostConfig"]["PortBindings"]
+        assert executor.requests.post.call_args[0][0].endswith(
+            f":{next(iter(port)).split('/')[0]}/api/tasks/execute"
+        )
+        assert callback.call_args.kwargs["executor_name"] == warm["Name"]
+
+        details = executor.get_current_task_ids()
+        assert details["containers"][0]["task_id"] == "123"
+
+    def test_unreachable_warm_container_falls_back_to_cold_start(
+        self, executor, fake_docker, task, ready
+    ):
+        executor.warm_pool.refill()
+        warm_name = next(iter(fake_docker.containers.values()))["Name"]
+        executor.requests.post.side_effect = requests.ConnectionError("boom")
+
+        result = executor.submit_executor(task)
+
+        assert result["status"] == "success"
+        assert result["executor_name"].startswith("wegent-task-")
+        assert fake_docker.find(warm_name) is None
+        cold = fake_docker.find(result["executor_name"])
+        assert cold["Labels"]["task_id"] == "123"
+        assert any(e.startswith("TASK_INFO=") for e in cold["Env"])
+
+    def test_custom_base_image_is_started_cold(self, executor, fake_docker, task, ready):
+        executor.warm_pool.refill()
+        fake_docker.images.add("custom/base:latest")
+        task["bot"] = [{"base_image": "custom/base:latest"}]
+        executor.requests.post.return_value.json.return_value = {"status": "running"}
+
+        result = executor.submit_executor(task)
+
+        assert result["executor_name"].startswith("wegent-task-")
+        assert executor.warm_pool.idle_count(IMAGE) == 1
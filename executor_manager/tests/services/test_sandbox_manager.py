@@ -558,6 +558,80 @@ class TestSandboxManager:
 
         assert result is False
 
+    def test_save_sandbox_indexes_e2b_id(
+        self, sandbox_manager_with_mock_redis, mock_redis_client, sample_sandbox
+    ):
+        """Test save_sandbox maps the E2B sandbox ID to the task_id."""
+        from executor_manager.services.sandbox.repository import E2B_INDEX_HASH
+
+        manager = sandbox_manager_with_mock_redis
+        sample_sandbox.metadata["e2b_sandbox_id"] = "e2b-uuid"
+
+        manager._repository.save_sandbox(sample_sandbox)
+
+        mock_redis_client.hset.assert_any_call(E2B_INDEX_HASH, "e2b-uuid", "12345")
+
+    def test_delete_sandbox_removes_e2b_index_entry(
+        self, sandbox_manager_with_mock_redis, mock_redis_client, sample_sandbox_metadata
+    ):
+        """Test delete_sandbox drops the E2B index entry."""
+        from executor_manager.services.sandbox.repository import E2B_INDEX_HASH
+
+        manager = sandbox_manager_with_mock_redis
+        mock_redis_client.hget.return_value = json.dumps(
+            {"metadata": {**sample_sandbox_metadata, "e2b_sandbox_id": "e2b-uuid"}}
+        )
+
+        assert manager._repository.delete_sandbox("12345") is True
+
+        mock_redis_client.hdel.assert_called_once_with(E2B_INDEX_HASH, "e2b-uuid")
+
+    def test_find_sandbox_by_e2b_id_uses_index(
+        self,
+        sandbox_manager_with_mock_redis,
+        mock_redis_client,
+        sample_sandbox_redis_data,
+    ):
+        """Test lookup by E2B ID reads the index instead of scanning."""
+        manager = sandbox_manager_with_mock_redis
+        sandbox_data = json.loads(sample_sandbox_redis_data)
+        sandbox_data["metadata"]["e2b_sandbox_id"] = "e2b-uuid"
+        mock_redis_client.hget.side_effect = lambda key, field: (
+            "12345" if field == "e2b-uuid" else json.dumps(sandbox_data)
+        )
+        mock_redis_client.zscore.return_value = 1704067200.0
+
+        sandbox = manager._repository.find_sandbox_by_e2b_id("e2b-uuid")
+
+        assert sandbox is not None
+        assert sandbox.sandbox_id == "12345"
+        mock_redis_client.zrange.assert_not_called()
+
+    def test_find_sandbox_by_e2b_id_rebuilds_index_once(
+        self,
+        sandbox_manager_with_mock_redis,
+        mock_redis_client,
+        sample_sandbox_redis_data,
+    ):
+        """Test sandboxes saved before the index existed are indexed on first miss."""
+        from executor_manager.services.sandbox.repository import E2B_INDEX_HASH
+
+        manager = sandbox_manager_with_mock_redis
+        sandbox_data = json.loads(sample_sandbox_redis_data)
+        sandbox_data["metadata"]["e2b_sandbox_id"] = "e2b-uuid"
+        mock_redis_client.zrange.return_value = ["12345"]
+        mock_redis_client.hget.side_effect = lambda key, field: (
+            None if key == E2B_INDEX_HASH else json.dumps(sandbox_data)
+        )
+
+        assert manager._repository.find_sandbox_by_e2b_id("unknown") is None
+        assert manager._repository.find_sandbox_by_e2b_id("unknown") is None
+
+        mock_redis_client.hset.assert_called_once_with(
+            E2B_INDEX_HASH, "e2b-uuid", "12345"
+        )
+        mock_redis_client.zrange.assert_called_once()
+
     def test_load_sandbox_success(
         self,
         sandbox_manager_with_mock_redis,
@@ -662,28 +736,46 @@ class TestSandboxManager:
 
     # ----- Background Task Tests -----
 
+    @pytest.fixture
+    def sandbox_manager_with_fake_redis(self, fake_redis):
+        """Create SandboxManager backed by an in-memory Redis."""
+        from executor_manager.services.sandbox import SandboxManager
+
+        return SandboxManager()
+
+    @staticmethod
+    def _store_running_sandbox(fake_redis, created_at, last_activity_at=None):
+        """Store a running sandbox whose heartbeat deadline has passed."""
+        from executor_manager.services.heartbeat_manager import \
+            HEARTBEAT_DEADLINES_ZSET
+
+        sandbox_info = {
+            "sandbox_id": "12345",
+            "container_name": "wegent-task-testuser-12345",
+            "base_url": "http://localhost:10001",
+            "status": "running",
+            "created_at": created_at,
+            "shell_type": "ClaudeCode",
+            "user_id": 100,
+            "user_name": "testuser",
+            "metadata": {"task_id": 12345, "subtask_id": 1},
+        }
+        if last_activity_at is not None:
+            sandbox_info["last_activity_at"] = last_activity_at
+        fake_redis.hset(
+            "wegent-sandbox-session:12345", "__sandbox__", json.dumps(sandbox_info)
+        )
+        fake_redis.zadd("wegent-sandbox:active", {"12345": time.time()})
+        fake_redis.zadd(HEARTBEAT_DEADLINES_ZSET, {"12345": time.time() - 1})
+
     @pytest.mark.asyncio
     async def test_check_heartbeats_detects_dead_executor(
-        self,
-        sandbox_manager_with_mock_redis,
-        mock_redis_client,
-        sample_sandbox_redis_data,
-        mocker,
+        self, sandbox_manager_with_fake_redis, fake_redis, mocker
     ):
         """Test heartbeat check detects dead executors."""
-        manager = sandbox_manager_with_mock_redis
-        mock_redis_client.zrange.return_value = ["12345"]
-        mock_redis_client.hget.return_value = sample_sandbox_redis_data
-
-        mock_heartbeat = MagicMock()
-        mock_heartbeat.check_heartbeat.return_value = False
-        mock_heartbeat.get_last_heartbeat.return_value = (
-            1704067000.0  # Has last heartbeat
-        )
-        mocker.patch(
-            "executor_manager.services.sandbox.manager.get_heartbeat_manager",
-            return_value=mock_heartbeat,
-        )
+        manager = sandbox_manager_with_fake_redis
+        self._store_running_sandbox(fake_redis, created_at=1704067200.0)
+        fake_redis.set("sandbox:heartbeat:12345", "1704067000.0")
 
         # Mock _handle_executor_dead
         mock_handle_dead = mocker.patch.object(
@@ -696,41 +788,14 @@ class TestSandboxManager:
 
     @pytest.mark.asyncio
     async def test_check_heartbeats_detects_dead_with_expired_heartbeat_key(
-        self,
-        sandbox_manager_with_mock_redis,
-        mock_redis_client,
-        sample_sandbox_metadata,
-        mocker,
+        self, sandbox_manager_with_fake_redis, fake_redis, mocker
     ):
         """Test heartbeat check detects dead executor even when heartbeat key expired."""
-        manager = sandbox_manager_with_mock_redis
-        mock_redis_client.zrange.return_value = ["12345"]
-
-        # Create sandbox data with old created_at (older than grace period)
-        old_created_at = 1704067200.0  # Much older than 60s grace period
+        manager = sandbox_manager_with_fake_redis
+        # Much older than the grace period; no heartbeat key left in Redis
+        old_created_at = 1704067200.0
         last_activity = old_created_at + 100
-        old_sandbox_data = json.dumps(
-            {
-                "sandbox_id": "12345",
-                "container_name": "wegent-task-testuser-12345",
-                "base_url": "http://localhost:10001",
-                "created_at": old_created_at,
-                "last_activity_at": last_activity,
-                "shell_type": "ClaudeCode",
-                "user_id": 100,
-                "user_name": "testuser",
-                "metadata": sample_sandbox_metadata,
-            }
-        )
-        mock_redis_client.hget.return_value = old_sandbox_data
-
-        mock_heartbeat = MagicMock()
-        mock_heartbeat.check_heartbeat.return_value = False
-        mock_heartbeat.get_last_heartbeat.return_value = None  # Key expired from Redis!
-        mocker.patch(
-            "executor_manager.services.sandbox.manager.get_heartbeat_manager",
-            return_value=mock_heartbeat,
-        )
+        self._store_running_sandbox(fake_redis, old_created_at, last_activity)
 
         # Mock _handle_executor_dead
         mock_handle_dead = mocker.patch.object(
@@ -740,59 +805,153 @@ class TestSandboxManager:
         await manager._check_heartbeats()
 
         # Should still detect dead executor using sandbox.last_activity_at as fallback
-        mock_handle_dead.assert_called_once()
-        call_args = mock_handle_dead.call_args[0]
-        assert call_args[0] == "12345"
-        assert call_args[1] == last_activity  # Uses last_activity_at as fallback
+        mock_handle_dead.assert_called_once_with("12345", last_activity)
 
     @pytest.mark.asyncio
     async def test_check_heartbeats_respects_grace_period(
-        self,
-        sandbox_manager_with_mock_redis,
-        mock_redis_client,
-        sample_sandbox_metadata,
-        mocker,
+        self, sandbox_manager_with_fake_redis, fake_redis, mocker
     ):
         """Test heartbeat check respects grace period for new sandboxes."""
-        import time
+        from executor_manager.services.heartbeat_manager import \
+            HEARTBEAT_DEADLINES_ZSET
 
-        manager = sandbox_manager_with_mock_redis
-        mock_redis_client.zrange.return_value = ["12345"]
+        manager = sandbox_manager_with_fake_redis
+        # Only 10s old, within 30s grace period
+        created_at = time.time() - 10
+        self._store_running_sandbox(fake_redis, created_at)
 
-        # Create sandbox data with recent created_at (within grace period)
-        current_time = time.time()
-        recent_sandbox_data = json.dumps(
-            {
-                "sandbox_id": "12345",
-                "container_name": "wegent-task-testuser-12345",
-                "base_url": "http://localhost:10001",
-                "created_at": current_time
-                - 10,  # Only 10s old, within 30s grace period
-                "shell_type": "ClaudeCode",
-                "user_id": 100,
-                "user_name": "testuser",
-                "metadata": sample_sandbox_metadata,
-            }
+        # Mock _handle_executor_dead
+        mock_handle_dead = mocker.patch.object(
+            manager, "_handle_executor_dead", new_callable=AsyncMock
         )
-        mock_redis_client.hget.return_value = recent_sandbox_data
 
-        mock_heartbeat = MagicMock()
-        mock_heartbeat.check_heartbeat.return_value = False  # No heartbeat yet
-        mock_heartbeat.get_last_heartbeat.return_value = None
-        mocker.patch(
-            "executor_manager.services.sandbox.manager.get_heartbeat_manager",
-            return_value=mock_heartbeat,
+        await manager._check_heartbeats()
+
+        # Should NOT detect dead executor - within grace period
+        mock_handle_dead.assert_not_called()
+        assert fake_redis.zscore(HEARTBEAT_DEADLINES_ZSET, "12345") == (
+            created_at + 30
         )
 
-        # Mock _handle_executor_dead
+    @pytest.mark.asyncio
+    async def test_check_heartbeats_pushes_deadline_of_live_sandbox(
+        self, sandbox_manager_with_fake_redis, fake_redis, mocker
+    ):
+        """Test a fresh heartbeat moves the deadline instead of failing the sandbox."""
+        from executor_manager.services.heartbeat_manager import (
+            HEARTBEAT_DEADLINES_ZSET, HEARTBEAT_TIMEOUT)
+
+        manager = sandbox_manager_with_fake_redis
+        self._store_running_sandbox(fake_redis, created_at=1704067200.0)
+        last_heartbeat = time.time()
+        fake_redis.set("sandbox:heartbeat:12345", str(last_heartbeat))
         mock_handle_dead = mocker.patch.object(
             manager, "_handle_executor_dead", new_callable=AsyncMock
         )
 
         await manager._check_heartbeats()
 
-        # Should NOT detect dead executor - within grace period
         mock_handle_dead.assert_not_called()
+        assert fake_redis.zscore(HEARTBEAT_DEADLINES_ZSET, "12345") == (
+            last_heartbeat + HEARTBEAT_TIMEOUT
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_heartbeats_skips_sandboxes_before_deadline(
+        self, sandbox_manager_with_fake_redis, fake_redis, sample_sandbox, mocker
+    ):
+        """Test sandboxes whose deadline hasn't passed are not read."""
+        manager = sandbox_manager_with_fake_redis
+        sample_sandbox.created_at = time.time()
+        manager._repository.save_sandbox(sample_sandbox)
+        load_sandboxes = mocker.spy(manager._repository, "load_sandboxes")
+
+        await manager._check_heartbeats()
+
+        # Only the one-off rebuild of untracked deadlines reads sandboxes
+        assert load_sandboxes.call_count == 1
+        await manager._check_heartbeats()
+        assert load_sandboxes.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_check_heartbeats_untracks_stopped_sandbox(
+        self, sandbox_manager_with_fake_redis, fake_redis, sample_sandbox
+    ):
+        """Test deadlines of sandboxes that are no longer running are dropped."""
+        from executor_manager.models.sandbox import SandboxStatus
+        from executor_manager.services.heartbeat_manager import \
+            HEARTBEAT_DEADLINES_ZSET
+
+        manager = sandbox_manager_with_fake_redis
+        sample_sandbox.status = SandboxStatus.FAILED
+        manager._repository.save_sandbox(sample_sandbox)
+        fake_redis.zadd(HEARTBEAT_DEADLINES_ZSET, {"12345": 0})
+
+        await manager._check_heartbeats()
+
+        assert fake_redis.zscore(HEARTBEAT_DEADLINES_ZSET, "12345") is None
+
+    @pytest.mark.asyncio
+    async def test_wait_for_container_ready_wakes_on_first_heartbeat(
+        self, sandbox_manager_with_fake_redis, mocker
+    ):
+        """Test readiness is probed again as soon as the container heartbeats."""
+        import asyncio
+        import dataclasses
+
+        from executor_manager.services.heartbeat_manager import (
+            HeartbeatListener, get_heartbeat_listener)
+
+        manager = sandbox_manager_with_fake_redis
+        config = manager._config
+        manager._config = dataclasses.replace(
+            config,
+            timeout=dataclasses.replace(
+                config.timeout, container_ready_poll_interval=10.0
+            ),
+        )
+        mocker.patch.object(HeartbeatListener, "_ensure_started", new=AsyncMock())
+        executor = MagicMock()
+        executor.get_container_address.side_effect = [
+            {"status": "failed"},
+            {"status": "success", "base_url": "http://localhost:10001"},
+        ]
+        mocker.patch.object(
+            manager, "_check_container_health", new=AsyncMock(return_value=True)
+        )
+
+        async def send_heartbeat():
+            await asyncio.sleep(0.05)
+            get_heartbeat_listener().notify("12345")
+
+        started = time.monotonic()
+        heartbeat = asyncio.create_task(send_heartbeat())
+        base_url = await manager._wait_for_container_ready(
+            executor, "wegent-task-testuser-12345", sandbox_id="12345", timeout=5
+        )
+        await heartbeat
+
+        assert base_url == "http://localhost:10001"
+        assert time.monotonic() - started < 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_container_ready_times_out(
+        self, sandbox_manager_with_fake_redis, mocker
+    ):
+        """Test returns None when the container never becomes ready."""
+        from executor_manager.services.heartbeat_manager import \
+            HeartbeatListener
+
+        manager = sandbox_manager_with_fake_redis
+        mocker.patch.object(HeartbeatListener, "_ensure_started", new=AsyncMock())
+        executor = MagicMock()
+        executor.get_container_address.return_value = {"status": "failed"}
+
+        base_url = await manager._wait_for_container_ready(
+            executor, "wegent-task-testuser-12345", sandbox_id="12345", timeout=0.1
+        )
+
+        assert base_url is None
 
     @pytest.mark.asyncio
     async def test_handle_executor_dead_terminates_sandbox(
@@ -830,21 +989,12 @@ class TestSandboxManager:
 
     @pytest.mark.asyncio
     async def test_collect_expired_sandboxes_terminates_old(
-        self,
-        sandbox_manager_with_mock_redis,
-        mock_redis_client,
-        sample_sandbox_redis_data,
-        mocker,
-        sample_sandbox,
+        self, sandbox_manager_with_fake_redis, fake_redis, sample_sandbox, mocker
     ):
         """Test terminates sandboxes older than 24 hours."""
-        manager = sandbox_manager_with_mock_redis
-        mock_redis_client.zrangebyscore.return_value = ["12345"]
-
-        # Mock repository.load_sandbox to return a sandbox
-        mocker.patch.object(
-            manager._repository, "load_sandbox", return_value=sample_sandbox
-        )
+        manager = sandbox_manager_with_fake_redis
+        manager._repository.save_sandbox(sample_sandbox)
+        fake_redis.zadd("wegent-sandbox:active", {"12345": 1704067200.0})
 
         # Mock terminate_sandbox
         mock_terminate = mocker.patch.object(
@@ -858,20 +1008,34 @@ class TestSandboxManager:
 
         mock_terminate.assert_called_once_with("12345")
 
+    @pytest.mark.asyncio
+    async def test_collect_expired_sandboxes_skips_claimed(
+        self, sandbox_manager_with_fake_redis, fake_redis, sample_sandbox, mocker
+    ):
+        """Test skips sandboxes another replica is already collecting."""
+        manager = sandbox_manager_with_fake_redis
+        manager._repository.save_sandbox(sample_sandbox)
+        fake_redis.zadd("wegent-sandbox:active", {"12345": 1704067200.0})
+        fake_redis.set("wegent-sandbox:lock:sandbox:gc:12345", "1")
+        mock_terminate = mocker.patch.object(
+            manager, "terminate_sandbox", new_callable=AsyncMock
+        )
+
+        await manager._collect_expired_sandboxes()
+
+        mock_terminate.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_collect_expired_sandboxes_cleans_orphaned(
-        self, sandbox_manager_with_mock_redis, mock_redis_client, mocker
+        self, sandbox_manager_with_fake_redis, fake_redis
     ):
         """Test cleans orphaned ZSet entries."""
-        manager = sandbox_manager_with_mock_redis
-        mock_redis_client.zrangebyscore.return_value = ["orphaned-id"]
-        mock_redis_client.hget.return_value = None  # No sandbox data
+        manager = sandbox_manager_with_fake_redis
+        fake_redis.zadd("wegent-sandbox:active", {"orphaned-id": 1704067200.0})
 
         await manager._collect_expired_sandboxes()
 
-        mock_redis_client.zrem.assert_called_with(
-            "wegent-sandbox:active", "orphaned-id"
-        )
+        assert fake_redis.zscore("wegent-sandbox:active", "orphaned-id") is None
 
     # ----- Scheduler Integration Tests -----
 
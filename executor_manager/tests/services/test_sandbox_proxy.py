@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: 2025 WeCode, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the sandbox reverse proxy."""
+
+import asyncio
+import base64
+import hashlib
+import struct
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.testclient import TestClient
+
+
+@pytest.fixture
+def sandbox_proxy():
+    """Fresh SandboxProxy instance."""
+    from executor_manager.common.singleton import SingletonMeta
+    from executor_manager.services.sandbox.proxy import SandboxProxy
+
+    SingletonMeta.reset_all_instances()
+    yield SandboxProxy()
+    SingletonMeta.reset_all_instances()
+
+
+class TestRouteCache:
+    """Test cases for RouteCache."""
+
+    def test_entries_expire(self, mocker):
+        from executor_manager.services.sandbox import proxy
+
+        now = mocker.patch.object(proxy.time, "monotonic", return_value=100.0)
+        cache = proxy.RouteCache(ttl=5, max_size=10)
+        cache.put("a", "sandbox-a")
+
+        assert cache.get("a") == "sandbox-a"
+        now.return_value = 105.0
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        from executor_manager.services.sandbox.proxy import RouteCache
+
+        cache = RouteCache(ttl=60, max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate(self):
+        from executor_manager.services.sandbox.proxy import RouteCache
+
+        cache = RouteCache(ttl=60, max_size=2)
+        cache.put("a", 1)
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+
+
+def test_filter_headers_drops_hop_by_hop():
+    from executor_manager.services.sandbox.proxy import filter_headers
+
+    headers = [
+        (b"host", b"proxy"),
+        (b"connection", b"keep-alive, X-Custom-Hop"),
+        (b"x-custom-hop", b"1"),
+        (b"transfer-encoding", b"chunked"),
+        (b"set-cookie", b"a=1"),
+        (b"set-cookie", b"b=2"),
+    ]
+
+    assert filter_headers(headers) == [(b"set-cookie", b"a=1"), (b"set-cookie", b"b=2")]
+
+
+class TestSandboxProxyForward:
+    """Test HTTP forwarding through the pooled client."""
+
+    @pytest.fixture
+    def client(self, sandbox_proxy):
+        async def echo(request):
+            body = await request.body()
+            return JSONResponse(
+                {
+                    "method": request.method,
+                    "query": request.url.query,
+                    "body": body.decode(),
+                    "host": request.headers["host"],
+                    "x-test": request.headers.get("x-test"),
+                },
+                headers={"x-sandbox": "1"},
+            )
+
+        async def stream(request):
+            async def lines():
+                for i in range(3):
+                    yield f"line {i}\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        sandbox = Starlette(
+            routes=[
+                Route("/echo", echo, methods=["GET", "POST"]),
+                Route("/stream", stream),
+            ]
+        )
+        sandbox_proxy._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=sandbox)
+        )
+
+        async def forward(request):
+            path = request.path_params["path"]
+            target_url = f"http://sandbox:8080/{path}"
+            if request.url.query:
+                target_url = f"{target_url}?{request.url.query}"
+            return await sandbox_proxy.forward(request, target_url)
+
+        app = Starlette(
+            routes=[Route("/{path:path}", forward, methods=["GET", "POST"])]
+        )
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_forwards_request_body_and_headers(self, client):
+        response = client.post(
+            "/echo?a=1&b=2", content=b"hello", headers={"X-Test": "yes"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["x-sandbox"] == "1"
+        assert response.json() == {
+            "method": "POST",
+            "query": "a=1&b=2",
+            "body": "hello",
+            "host": "sandbox:8080",
+            "x-test": "yes",
+        }
+
+    def test_get_without_body(self, client):
+        response = client.get("/echo")
+
+        assert response.json()["body"] == ""
+
+    def test_streams_response(self, client):
+        response = client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.text == "line 0\nline 1\nline 2\n"
+
+
+class _EchoWebSocketStream:
+    """Network stream of an upgraded connection to a WebSocket echo server."""
+
+    def __init__(self):
+        self._incoming = bytearray()
+        self._outgoing = asyncio.Queue()
+        self.received = []
+
+    async def read(self, max_bytes, timeout=None):
+        return await self._outgoing.get()
+
+    async def write(self, data, timeout=None):
+        self._incoming.extend(data)
+        while len(self._incoming) >= 2:
+            first, second = self._incoming[0], self._incoming[1]
+            length, offset = second & 0x7F, 2
+            if length == 126:
+                (length,) = struct.unpack("!H", self._incoming[2:4])
+                offset = 4
+            assert second & 0x80, "client frames must be masked"
+            if len(self._incoming) < offset + 4 + length:
+                return
+            mask = self._incoming[offset : offset + 4]
+            payload = bytes(
+                b ^ mask[i % 4]
+                for i, b in enumerate(self._incoming[offset + 4 : offset + 4 + length])
+            )
+            del self._incoming[: offset + 4 + length]
+            opcode = first & 0x0F
+            self.received.append((opcode, payload))
+            if opcode == 0x8:
+                await self._outgoing.put(bytes([0x88, len(payload)]) + payload)
+            elif opcode in (0x1, 0x2):
+                # Ping first, then echo the message split into two fragments
+                await self._outgoing.put(b"\x89\x02hi")
+                half = len(payload) // 2
+                await self._outgoing.put(
+                    bytes([opcode, half])
+                    + payload[:half]
+                    + bytes([0x80, len(payload) - half])
+                    + payload[half:]
+                )
+
+    async def aclose(self):
+        pass
+
+
+class _FakeUpgradeClient:
+    def __init__(self, stream, status_code=101):
+        self.stream = stream
+        self.status_code = status_code
+        self.requests = []
+
+    def build_request(self, method, url, headers):
+        return httpx.Request(method, url, headers=headers)
+
+    async def send(self, request, stream=False):
+        self.requests.append(request)
+        key = request.headers["sec-websocket-key"]
+        accept = base64.b64encode(
+            hashlib.sha1(
+                (key + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode()
+            ).digest()
+        ).decode()
+        return httpx.Response(
+            self.status_code,
+            headers={"sec-websocket-accept": accept},
+            extensions={"network_stream": self.stream},
+        )
+
+
+class TestSandboxProxyWebSocket:
+    """Test WebSocket relaying."""
+
+    @pytest.fixture
+    def upstream(self, sandbox_proxy, mocker):
+        upstream = _FakeUpgradeClient(_EchoWebSocketStream())
+        mocker.patch.object(
+            type(sandbox_proxy), "client", new_callable=mocker.PropertyMock
+        ).return_value = upstream
+        return upstream
+
+    @pytest.fixture
+    def client(self, sandbox_proxy):
+        async def forward(websocket):
+            await sandbox_proxy.forward_websocket(
+                websocket, "http://sandbox:8080/ws?token=1"
+            )
+
+        app = Starlette(routes=[WebSocketRoute("/ws", forward)])
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_relays_messages(self, client, upstream):
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_text("hello sandbox")
+            assert websocket.receive_text() == "hello sandbox"
+            websocket.send_bytes(b"\x00\x01\x02\x03")
+            assert websocket.receive_bytes() == b"\x00\x01\x02\x03"
+
+        request = upstream.requests[0]
+        assert str(request.url) == "http://sandbox:8080/ws?token=1"
+        assert request.headers["upgrade"] == "websocket"
+        received = upstream.stream.received
+        # Pings from the sandbox are answered
+        assert (0xA, b"hi") in received
+        assert received[-1][0] == 0x8
+
+    def test_rejected_upgrade_closes_connection(self, client, upstream):
+        from starlette.websockets import WebSocketDisconnect
+
+        upstream.status_code = 404
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/ws"):
+                pass
+        assert exc_info.value.code == 1011
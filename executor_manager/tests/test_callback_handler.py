@@ -34,6 +34,28 @@ def test_callback_handler_returns_200_on_success(monkeypatch) -> None:
     assert body["status"] == "success"
 
 
+def test_callback_handler_passes_resync_request_through(monkeypatch) -> None:
+    def _resync(*args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+        return True, {"subtask_id": 1, "resync": True}
+
+    monkeypatch.setattr(routers.api_client, "update_task_status_by_fields", _resync)
+
+    client = TestClient(routers.app)
+    resp = client.post(
+        "/executor-manager/callback",
+        json={
+            "task_id": 1,
+            "subtask_id": 1,
+            "progress": 50,
+            "status": "RUNNING",
+            "result": {"progress_delta": {"seq": 3, "base_seq": 2}},
+        },
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["resync"] is True
+
+
 def test_callback_handler_returns_502_when_backend_update_fails(monkeypatch) -> None:
     def _fail(*args, **kwargs):  # noqa: ANN001, ANN002, ANN003
         return False, {"error_msg": "backend unavailable"}
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 WeCode, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for sweep sharding across replicas."""
+
+import time
+
+from executor_manager.common.config import TimeoutConfig
+from executor_manager.common.sweep_shard import SWEEP_MEMBERS_PREFIX, SweepShard
+
+
+class TestSweepShard:
+    """Test cases for SweepShard."""
+
+    def test_replicas_split_items(self, fake_redis):
+        shards = [SweepShard("test", 30, redis_client=fake_redis) for _ in range(3)]
+        for shard in shards:
+            shard.refresh()
+        items = [str(i) for i in range(300)]
+
+        selected = [shard.select(items) for shard in shards]
+
+        assert sorted(sum(selected, [])) == sorted(items)
+        assert all(selected)
+
+    def test_stale_member_loses_share(self, fake_redis):
+        live = SweepShard("test", 30, redis_client=fake_redis)
+        fake_redis.zadd(f"{SWEEP_MEMBERS_PREFIX}test", {"gone": time.time() - 60})
+
+        assert live.refresh() == (0, 1)
+        assert live.select(["1", "2"]) == ["1", "2"]
+
+    def test_leave_hands_share_over(self, fake_redis):
+        first = SweepShard("test", 30, redis_client=fake_redis)
+        second = SweepShard("test", 30, redis_client=fake_redis)
+        first.refresh()
+        assert second.refresh()[1] == 2
+
+        first.leave()
+
+        assert second.refresh() == (0, 1)
+
+    def test_claim_is_exclusive(self, fake_redis):
+        first = SweepShard("test", 30, redis_client=fake_redis)
+        second = SweepShard("test", 30, redis_client=fake_redis)
+
+        assert first.claim("1") is True
+        assert second.claim("1") is False
+
+    def test_redis_error_falls_back_to_single_replica(self, mock_redis_client):
+        mock_redis_client.pipeline.side_effect = ConnectionError("down")
+        shard = SweepShard("test", 30, redis_client=mock_redis_client)
+
+        assert shard.select(["1", "2"]) == ["1", "2"]
+
+    def test_member_ttl_spans_several_sweeps(self, monkeypatch):
+        monkeypatch.setenv("HEARTBEAT_CHECK_INTERVAL", "20")
+        monkeypatch.setenv("SANDBOX_SWEEP_MEMBER_TTL", "30")
+        assert TimeoutConfig().sweep_member_ttl == 60
+
+        monkeypatch.setenv("SANDBOX_SWEEP_MEMBER_TTL", "120")
+        assert TimeoutConfig().sweep_member_ttl == 120
@@ -137,6 +137,8 @@ export interface TaskLeavePayload {
 export interface HistorySyncPayload {
   task_id: number
   after_message_id: number
+  /** Page size, capped by the server */
+  limit?: number
 }
 
 // ============================================================
@@ -419,6 +421,8 @@ export interface HistorySyncAck {
     status: string
     created_at: string | null
   }>
+  /** More messages follow; sync again after the last message_id */
+  has_more?: boolean
   error?: string
 }
 
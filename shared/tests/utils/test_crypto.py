@@ -19,7 +19,11 @@ from utils.crypto import (
     mask_api_key,
     encrypt_sensitive_data,
     decrypt_sensitive_data,
-    is_data_encrypted
+    is_data_encrypted,
+    ATTACHMENT_CHUNK_SIZE,
+    ATTACHMENT_ENCRYPTED_CHUNK_SIZE,
+    iter_encrypt_attachment,
+    iter_decrypt_attachment,
 )
 
 
@@ -299,3 +303,36 @@ class TestApiKeyEncryption:
         # Both should decrypt correctly
         assert decrypt_api_key(encrypted_as_api_key) == test_data
         assert decrypt_git_token(encrypted_as_git_token) == test_data
+
+
+@pytest.mark.unit
+class TestAttachmentChunkEncryption:
+    """Test chunked attachment encryption used for streaming and range reads"""
+
+    def test_round_trip_with_arbitrary_input_chunks(self):
+        """Test that any input split decrypts back to the original data"""
+        original = os.urandom(2 * ATTACHMENT_CHUNK_SIZE + 123)
+        pieces = [original[i:i + 7000] for i in range(0, len(original), 7000)]
+
+        encrypted = b"".join(iter_encrypt_attachment(pieces))
+
+        assert b"".join(iter_decrypt_attachment([encrypted])) == original
+
+    def test_chunks_decrypt_independently(self):
+        """Test that decryption can start at any encrypted chunk boundary"""
+        original = os.urandom(2 * ATTACHMENT_CHUNK_SIZE + 123)
+        encrypted = b"".join(iter_encrypt_attachment([original]))
+
+        tail = encrypted[ATTACHMENT_ENCRYPTED_CHUNK_SIZE:]
+
+        assert b"".join(iter_decrypt_attachment([tail])) == original[ATTACHMENT_CHUNK_SIZE:]
+
+    def test_same_chunk_encrypts_differently(self):
+        """Test that random per-chunk IVs hide repeated content"""
+        data = b"repeated content"
+
+        first = b"".join(iter_encrypt_attachment([data]))
+        second = b"".join(iter_encrypt_attachment([data]))
+
+        assert first != second
+        assert b"".join(iter_decrypt_attachment([first])) == data
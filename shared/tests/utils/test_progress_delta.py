@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+
+import pytest
+
+# Add shared directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utils.progress_delta import (
+    PROGRESS_DELTA_KEY,
+    PROGRESS_SEQ_KEY,
+    ProgressDeltaEncoder,
+    apply_progress_delta,
+)
+
+
+def _step(title):
+    return {"title": title, "details": None}
+
+
+@pytest.mark.unit
+class TestProgressDelta:
+    """Test cases for progress delta encoding and reassembly"""
+
+    def test_round_trip_rebuilds_full_state(self):
+        encoder = ProgressDeltaEncoder()
+        workbench = {"status": "running", "file_changes": [], "summary": "s"}
+        persisted = None
+
+        thinking = [_step("a")]
+        first = encoder.encode(thinking, workbench)
+        persisted, resync = apply_progress_delta(persisted, first)
+        assert resync is False
+        assert first[PROGRESS_DELTA_KEY]["full"] is True
+
+        thinking.append(_step("b"))
+        workbench["file_changes"] = [{"new_path": "x.py"}]
+        second = encoder.encode(thinking, workbench)
+        assert second["thinking"] == [_step("b")]
+        assert second["workbench"] == {"file_changes": [{"new_path": "x.py"}]}
+
+        persisted, resync = apply_progress_delta(persisted, second)
+        assert resync is False
+        assert persisted["thinking"] == thinking
+        assert persisted["workbench"] == workbench
+        assert persisted[PROGRESS_SEQ_KEY] == 2
+        assert PROGRESS_DELTA_KEY not in persisted
+
+    def test_unchanged_state_sends_no_thinking_or_workbench(self):
+        encoder = ProgressDeltaEncoder()
+        encoder.encode([_step("a")], {"status": "running"})
+
+        fields = encoder.encode([_step("a")], {"status": "running"})
+
+        assert set(fields) == {PROGRESS_DELTA_KEY}
+
+    def test_gap_requests_resync_and_keeps_persisted_state(self):
+        encoder = ProgressDeltaEncoder()
+        persisted, _ = apply_progress_delta(None, encoder.encode([_step("a")], None))
+        encoder.encode([_step("a"), _step("b")], None)  # lost on the way
+        third = encoder.encode([_step("a"), _step("b"), _step("c")], None)
+        third["value"] = "partial"
+
+        result, resync = apply_progress_delta(persisted, third)
+
+        assert resync is True
+        assert "thinking" not in result
+        assert result["value"] == "partial"
+
+        encoder.reset()
+        result, resync = apply_progress_delta(
+            persisted, encoder.encode([_step("a"), _step("b"), _step("c")], None)
+        )
+        assert resync is False
+        assert len(result["thinking"]) == 3
+
+    def test_retried_callback_is_ignored(self):
+        encoder = ProgressDeltaEncoder()
+        persisted, _ = apply_progress_delta(None, encoder.encode([_step("a")], None))
+        second = encoder.encode([_step("a"), _step("b")], None)
+        persisted, _ = apply_progress_delta(persisted, second)
+
+        result, resync = apply_progress_delta(persisted, second)
+
+        assert resync is False
+        assert "thinking" not in result
+
+    def test_cleared_thinking_sends_full_state(self):
+        encoder = ProgressDeltaEncoder()
+        encoder.encode([_step("a"), _step("b")], None)
+
+        fields = encoder.encode([_step("c")], None)
+
+        assert fields[PROGRESS_DELTA_KEY]["full"] is True
+        assert fields["thinking"] == [_step("c")]
+
+    def test_result_without_delta_is_unchanged(self):
+        incoming = {"value": "v", "thinking": [_step("a")]}
+
+        assert apply_progress_delta({"thinking": []}, incoming) == (incoming, False)
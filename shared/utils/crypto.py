@@ -9,7 +9,7 @@ Cryptography utilities for encrypting sensitive data like git tokens and API key
 import base64
 import logging
 import os
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
@@ -398,6 +398,104 @@ def decrypt_attachment(encrypted_data: bytes) -> bytes:
         raise
 
 
+# Plain text size of one independently encrypted attachment chunk. Must be a
+# multiple of the AES block size so that every full chunk encrypts to exactly
+# ATTACHMENT_ENCRYPTED_CHUNK_SIZE bytes, which allows seeking to any chunk.
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+# Per-chunk overhead: 16-byte random IV + one block of PKCS7 padding
+ATTACHMENT_CHUNK_OVERHEAD = 32
+ATTACHMENT_ENCRYPTED_CHUNK_SIZE = ATTACHMENT_CHUNK_SIZE + ATTACHMENT_CHUNK_OVERHEAD
+
+
+def encrypt_attachment_chunk(chunk: bytes) -> bytes:
+    """
+    Encrypt one attachment chunk using AES-256-CBC with a random IV.
+
+    The IV is prepended to the cipher text, so each chunk can be decrypted on
+    its own (used for streaming and range reads of large attachments).
+
+    Args:
+        chunk: Plain chunk, at most ATTACHMENT_CHUNK_SIZE bytes
+
+    Returns:
+        IV followed by the encrypted chunk
+    """
+    aes_key, _ = _get_attachment_encryption_key()
+    iv = os.urandom(16)
+    encryptor = Cipher(
+        algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend()
+    ).encryptor()
+    padder = padding.PKCS7(128).padder()
+    padded_data = padder.update(chunk) + padder.finalize()
+    return iv + encryptor.update(padded_data) + encryptor.finalize()
+
+
+def decrypt_attachment_chunk(encrypted_chunk: bytes) -> bytes:
+    """
+    Decrypt one chunk produced by encrypt_attachment_chunk().
+
+    Args:
+        encrypted_chunk: IV followed by the encrypted chunk
+
+    Returns:
+        Plain chunk
+    """
+    aes_key, _ = _get_attachment_encryption_key()
+    iv, cipher_text = encrypted_chunk[:16], encrypted_chunk[16:]
+    decryptor = Cipher(
+        algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend()
+    ).decryptor()
+    padded_data = decryptor.update(cipher_text) + decryptor.finalize()
+    unpadder = padding.PKCS7(128).unpadder()
+    return unpadder.update(padded_data) + unpadder.finalize()
+
+
+def _rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Regroup a byte stream into pieces of exactly size bytes (last may be shorter)."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer.extend(chunk)
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_encrypt_attachment(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Encrypt an attachment stream chunk by chunk.
+
+    The input may be split arbitrarily; it is regrouped into
+    ATTACHMENT_CHUNK_SIZE pieces that are encrypted independently.
+
+    Args:
+        chunks: Plain attachment data
+
+    Yields:
+        Encrypted chunks
+    """
+    for chunk in _rechunk(chunks, ATTACHMENT_CHUNK_SIZE):
+        yield encrypt_attachment_chunk(chunk)
+
+
+def iter_decrypt_attachment(encrypted_chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decrypt a stream produced by iter_encrypt_attachment().
+
+    The input may start at any chunk boundary, which is how range reads
+    decrypt only the chunks they need.
+
+    Args:
+        encrypted_chunks: Encrypted attachment data
+
+    Yields:
+        Plain chunks
+    """
+    for chunk in _rechunk(encrypted_chunks, ATTACHMENT_ENCRYPTED_CHUNK_SIZE):
+        yield decrypt_attachment_chunk(chunk)
+
+
 def is_attachment_encrypted(data: bytes) -> bool:
     """
     Check if attachment data appears to be encrypted.
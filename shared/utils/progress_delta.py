@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Delta encoding of executor progress callbacks.
+
+Progress callbacks carry the task's thinking steps and workbench. Instead of
+resending both in full on every update, the executor sends only the thinking
+steps added and the workbench fields changed since its previous callback,
+together with a sequence number. The backend rebuilds the full state from the
+persisted result and asks for a full resync when a callback is missing.
+
+Wire format, inside the callback ``result``::
+
+    "progress_delta": {"seq": 8, "base_seq": 7, "thinking_offset": 12}
+    "thinking": [<steps from index 12 on>],
+    "workbench": {<changed top-level fields>},
+
+A full resync is ``{"seq": 8, "full": true}`` with the complete thinking list
+and workbench. Results without ``progress_delta`` are full states from older
+executors.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+# Key of the delta header in the callback result
+PROGRESS_DELTA_KEY = "progress_delta"
+# Key the backend persists the last applied sequence number under
+PROGRESS_SEQ_KEY = "progress_seq"
+# Key in the callback response asking the executor for a full resync
+RESYNC_KEY = "resync"
+
+
+class ProgressDeltaEncoder:
+    """Executor side: tracks what was last sent and encodes the difference."""
+
+    def __init__(self):
+        self.seq = 0
+        self._sent_thinking_count = 0
+        self._sent_workbench: Optional[Dict[str, Any]] = None
+        self._full = True
+
+    def encode(
+        self,
+        thinking: Optional[List[Dict[str, Any]]],
+        workbench: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Encode the current state as a delta against the last encoded state
+
+        Args:
+            thinking: All thinking steps as dicts, None if not reported
+            workbench: Full workbench, None if not reported
+
+        Returns:
+            Result fields to add to the callback result
+        """
+        base_seq = self.seq
+        self.seq += 1
+        full = self._full or (
+            thinking is not None and len(thinking) < self._sent_thinking_count
+        )
+
+        fields: Dict[str, Any] = {}
+        if full:
+            fields[PROGRESS_DELTA_KEY] = {"seq": self.seq, "full": True}
+            if thinking is not None:
+                fields["thinking"] = list(thinking)
+            if workbench is not None:
+                fields["workbench"] = workbench
+        else:
+            offset = self._sent_thinking_count
+            fields[PROGRESS_DELTA_KEY] = {
+                "seq": self.seq,
+                "base_seq": base_seq,
+                "thinking_offset": offset,
+            }
+            if thinking is not None and len(thinking) > offset:
+                fields["thinking"] = list(thinking[offset:])
+            if workbench is not None:
+                sent = self._sent_workbench or {}
+                changed = {
+                    key: value
+                    for key, value in workbench.items()
+                    if key not in sent or sent[key] != value
+                }
+                if changed:
+                    fields["workbench"] = changed
+
+        self._full = False
+        if thinking is not None:
+            self._sent_thinking_count = len(thinking)
+        if workbench is not None:
+            self._sent_workbench = copy.deepcopy(workbench)
+        return fields
+
+    def reset(self) -> None:
+        """Send the full state next time (resync requested or delivery unknown)"""
+        self._full = True
+
+
+def apply_progress_delta(
+    existing: Any, incoming: Optional[Dict[str, Any]]
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Rebuild a full callback result from a delta and the persisted result
+
+    Args:
+        existing: Persisted result of the subtask
+        incoming: Callback result, possibly delta encoded
+
+    Returns:
+        Tuple of (result with full thinking and workbench, resync needed).
+        When a resync is needed the thinking and workbench of the callback
+        are dropped and the persisted ones are kept.
+    """
+    if not isinstance(incoming, dict) or not isinstance(
+        incoming.get(PROGRESS_DELTA_KEY), dict
+    ):
+        return incoming, False
+
+    result = dict(incoming)
+    delta = result.pop(PROGRESS_DELTA_KEY)
+    base = existing if isinstance(existing, dict) else {}
+    seq = delta.get("seq")
+
+    if delta.get("full"):
+        result[PROGRESS_SEQ_KEY] = seq
+        return result, False
+
+    persisted_seq = base.get(PROGRESS_SEQ_KEY)
+    persisted_thinking = base.get("thinking")
+    if not isinstance(persisted_thinking, list):
+        persisted_thinking = []
+    offset = delta.get("thinking_offset", 0)
+
+    if persisted_seq == seq:
+        # Retried callback that was already applied
+        result.pop("thinking", None)
+        result.pop("workbench", None)
+        return result, False
+    if persisted_seq != delta.get("base_seq") or offset != len(persisted_thinking):
+        result.pop("thinking", None)
+        result.pop("workbench", None)
+        return result, True
+
+    result["thinking"] = persisted_thinking + list(result.get("thinking") or [])
+    changed_workbench = result.get("workbench")
+    persisted_workbench = base.get("workbench")
+    if isinstance(changed_workbench, dict) and isinstance(persisted_workbench, dict):
+        result["workbench"] = {**persisted_workbench, **changed_workbench}
+    elif isinstance(persisted_workbench, dict):
+        result["workbench"] = persisted_workbench
+    result[PROGRESS_SEQ_KEY] = seq
+    return result, False